@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Heading Anchor Index for Denmark Living Documentation System
+
+This module maps documents to the anchors GitHub generates for their
+headings, so ``file.md#section`` links can be checked with a set lookup:
+- Slugs follow GitHub's rules: inline markdown is removed, text is
+  lowercased, punctuation dropped, spaces become hyphens and repeated
+  headings get ``-1``, ``-2``... suffixes
+- Danish letters (æ, ø, å) are kept, as on GitHub; headings and fragments
+  are NFC-normalized and fragments percent-decoded, so composed, decomposed
+  and encoded spellings all match
+- Headings inside fenced code blocks do not produce anchors
+- A fragment that only matches after transliteration (``boligstoette`` or
+  ``boligstotte`` for ``boligstøtte``) gets the real anchor as a suggestion
+
+Requirements: 1.5
+"""
+
+import re
+import unicodedata
+from urllib.parse import unquote
+from typing import List, Dict, Any, Optional, Set, Iterable, Iterator, Tuple
+
+
+# Inline markdown replaced by its rendered text before slugging
+IMAGE_OR_LINK_PATTERN = re.compile(r'!?\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])')
+CODE_SPAN_PATTERN = re.compile(r'`+([^`]*)`+')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+EMPHASIS_UNDERSCORE_PATTERN = re.compile(r'(?<!\w)_+|_+(?!\w)')
+CLOSING_HASHES_PATTERN = re.compile(r'\s+#+\s*$')
+
+FENCE_PATTERN = re.compile(r'^\s{0,3}(`{3,}|~{3,})')
+
+# Danish letters and their usual ASCII transliterations
+DANISH_TRANSLITERATION = str.maketrans({'æ': 'ae', 'ø': 'oe', 'å': 'aa'})
+# Transliterations folded further, so ``oe`` and ``o`` spellings compare equal
+LOOSE_FOLDS = (('aa', 'a'), ('ae', 'a'), ('oe', 'o'))
+
+
+def github_slug(text: str) -> str:
+    """
+    Convert heading text to the anchor GitHub generates for it.
+    
+    Does not add the ``-N`` suffix of repeated headings (see ``heading_anchors``).
+    
+    Args:
+        text: Heading text without the leading ``#`` marks
+        
+    Returns:
+        Anchor without the leading ``#``
+    """
+    text = CLOSING_HASHES_PATTERN.sub('', text)
+    text = IMAGE_OR_LINK_PATTERN.sub(r'\1', text)
+    text = CODE_SPAN_PATTERN.sub(r'\1', text)
+    text = HTML_TAG_PATTERN.sub('', text)
+    text = EMPHASIS_UNDERSCORE_PATTERN.sub('', text)
+    text = unicodedata.normalize('NFC', text.strip().lower())
+    
+    # Keep letters, marks, numbers, connector punctuation, hyphens and spaces
+    slug = ''.join(
+        char for char in text
+        if char in '- ' or unicodedata.category(char)[0] in 'LMN' or unicodedata.category(char) == 'Pc'
+    )
+    return slug.replace(' ', '-')
+
+
+def fenced_lines(lines: List[str]) -> Set[int]:
+    """
+    Find the lines inside fenced code blocks.
+    
+    Args:
+        lines: Document lines
+        
+    Returns:
+        1-based numbers of fence and code lines
+    """
+    fenced = set()
+    fence = None
+    for line_num, line in enumerate(lines, 1):
+        match = FENCE_PATTERN.match(line)
+        if fence is None:
+            if match:
+                fence = match.group(1)
+                fenced.add(line_num)
+        else:
+            fenced.add(line_num)
+            if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence):
+                fence = None
+    return fenced
+
+
+def heading_anchors(headings: Iterable[Dict[str, Any]], lines: Optional[List[str]] = None) -> List[str]:
+    """
+    Generate the anchors of a document's headings in order.
+    
+    Args:
+        headings: Headings as ``{'level', 'text', 'line'}`` dictionaries
+        lines: Document lines, used to skip headings inside code blocks
+        
+    Returns:
+        Anchors with ``-N`` suffixes for repeated headings
+    """
+    fenced = fenced_lines(lines) if lines else set()
+    occurrences = {}
+    anchors = []
+    
+    for heading in headings:
+        if heading.get('line') in fenced:
+            continue
+        
+        base = github_slug(heading['text'])
+        slug = base
+        while slug in occurrences:
+            occurrences[base] += 1
+            slug = f"{base}-{occurrences[base]}"
+        occurrences[slug] = 0
+        anchors.append(slug)
+    
+    return anchors
+
+
+def document_anchors(document) -> Set[str]:
+    """
+    Anchors of all headings in a parsed document.
+    
+    Args:
+        document: ParsedDocument whose headings have been parsed
+        
+    Returns:
+        Set of anchors
+    """
+    return set(heading_anchors(document.headings, document.lines))
+
+
+def normalize_fragment(fragment: str) -> str:
+    """
+    Normalize a link fragment for comparison with heading anchors.
+    
+    Args:
+        fragment: Fragment after ``#`` as written in the link
+        
+    Returns:
+        Percent-decoded, NFC-normalized, lowercase fragment
+    """
+    return unicodedata.normalize('NFC', unquote(fragment)).lower()
+
+
+def loose_anchor(anchor: str) -> str:
+    """
+    Fold Danish letters and accents so near-miss spellings compare equal.
+    
+    Args:
+        anchor: Anchor or normalized fragment
+        
+    Returns:
+        ASCII-only comparison key
+    """
+    folded = unicodedata.normalize('NFKD', anchor.translate(DANISH_TRANSLITERATION))
+    folded = ''.join(char for char in folded if not unicodedata.combining(char))
+    for spelling, replacement in LOOSE_FOLDS:
+        folded = folded.replace(spelling, replacement)
+    return folded
+
+
+class AnchorIndex:
+    """Heading anchors of every document, keyed by document path."""
+    
+    def __init__(self):
+        self._anchors = {}
+    
+    def add(self, key: str, document) -> Set[str]:
+        """
+        Index the headings of a document.
+        
+        Args:
+            key: Key to store the anchors under (e.g. the resolved file path)
+            document: ParsedDocument to take the headings from
+            
+        Returns:
+            The document's anchors
+        """
+        self._anchors[key] = document_anchors(document)
+        return self._anchors[key]
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._anchors
+    
+    def __len__(self) -> int:
+        return len(self._anchors)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._anchors)
+    
+    def get(self, key: str) -> Optional[Set[str]]:
+        """Return the anchors of a document, or None if it is not indexed."""
+        return self._anchors.get(key)
+    
+    def items(self) -> Iterator[Tuple[str, Set[str]]]:
+        """Iterate over ``(key, anchors)`` pairs."""
+        return iter(self._anchors.items())
+    
+    def has_anchor(self, key: str, fragment: str) -> bool:
+        """
+        Check whether a fragment names a heading of an indexed document.
+        
+        Args:
+            key: Document key
+            fragment: Fragment after ``#`` as written in the link
+            
+        Returns:
+            True if the document has a matching anchor
+        """
+        return normalize_fragment(fragment) in self._anchors.get(key, ())
+    
+    def suggest(self, key: str, fragment: str) -> Optional[str]:
+        """
+        Find the anchor a broken fragment was most likely meant to be.
+        
+        Args:
+            key: Document key
+            fragment: Fragment after ``#`` as written in the link
+            
+        Returns:
+            An anchor equal to the fragment after folding Danish letters and
+            accents, or None
+        """
+        target = loose_anchor(normalize_fragment(fragment))
+        for anchor in sorted(self._anchors.get(key, ())):
+            if loose_anchor(anchor) == target:
+                return anchor
+        return None
+
+
+__all__ = [
+    'AnchorIndex',
+    'github_slug',
+    'heading_anchors',
+    'document_anchors',
+    'normalize_fragment'
+]
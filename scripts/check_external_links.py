@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+External Link Checker for Denmark Living Documentation System
+
+This script verifies that external (http/https) links and frontmatter
+``source_url`` values still resolve:
+- URLs are resolved through a pluggable resolver: live HTTP requests, or
+  responses recorded in a JSON fixture for CI runs without network access
+- Unique URLs are checked concurrently with asyncio, with a limit on open
+  requests per host so official sites (borger.dk, skat.dk, ...) are not
+  flooded
+- Results are kept in a persistent cache with a time-to-live, so repeated
+  runs only re-check URLs whose result has expired
+
+Missing pages (404, 410 and other client errors) are reported as errors.
+Responses that do not prove a link broken (rate limits, server errors,
+timeouts, blocked requests) are reported as warnings.
+
+Requirements: 1.5, 6.4
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import asyncio
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable
+import argparse
+from abc import ABC, abstractmethod
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+
+
+# Markdown links to http(s) URLs: [text](url "optional title")
+EXTERNAL_LINK_PATTERN = re.compile(r'\[([^\]]*)\]\((https?://[^)\s]+)[^)]*\)')
+
+# Frontmatter field holding the official source of a document
+SOURCE_URL_FIELD = 'source_url'
+
+# Fixture used instead of live requests when set (e.g. in CI)
+FIXTURE_ENVIRONMENT_VARIABLE = 'EXTERNAL_LINKS_FIXTURE'
+
+DEFAULT_CACHE_FILE = Path('.external_links_cache.json')
+CACHE_FORMAT_VERSION = 1
+FIXTURE_FORMAT_VERSION = 1
+
+# Working links are re-checked weekly, failures after a few hours
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_FAILURE_TTL = 6 * 3600
+
+DEFAULT_PER_HOST = 2
+DEFAULT_CONCURRENCY = 16
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_USER_AGENT = 'DenmarkLivingDocs-LinkChecker/1.0'
+
+# Servers that reject HEAD requests answer with these; retry with GET
+HEAD_FALLBACK_STATUSES = {405, 501}
+
+# Client errors that do not show the page is gone (login walls, bot blocking, rate limits)
+UNVERIFIABLE_STATUSES = {401, 403, 429}
+
+
+def link_result(url: str, status: Optional[int] = None, error: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the result of checking one URL.
+    
+    Args:
+        url: URL that was checked
+        status: HTTP status code, or None if no response was received
+        error: Description of the failure, if any
+        
+    Returns:
+        Dictionary with the URL, status, error, ``ok`` flag and check time
+    """
+    return {
+        'url': url,
+        'ok': status is not None and status < 400 and error is None,
+        'status': status,
+        'error': error,
+        'checked_at': time.time()
+    }
+
+
+def is_broken(result: Dict[str, Any]) -> bool:
+    """Whether a failed result shows the link is broken rather than unverifiable."""
+    status = result.get('status')
+    return status is not None and 400 <= status < 500 and status not in UNVERIFIABLE_STATUSES
+
+
+class LinkResolver(ABC):
+    """Interface for resolving URLs; subclasses implement ``resolve``."""
+    
+    name = 'resolver'
+    
+    @abstractmethod
+    async def resolve(self, url: str) -> Dict[str, Any]:
+        """
+        Check one URL.
+        
+        Args:
+            url: URL to check
+            
+        Returns:
+            Result dictionary as built by ``link_result``
+        """
+
+
+class HttpResolver(LinkResolver):
+    """Resolves URLs with live HTTP requests (HEAD, falling back to GET)."""
+    
+    name = 'http'
+    
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, user_agent: str = DEFAULT_USER_AGENT):
+        self.timeout = timeout
+        self.user_agent = user_agent
+    
+    async def resolve(self, url: str) -> Dict[str, Any]:
+        # urllib is blocking; each request runs in a worker thread
+        return await asyncio.to_thread(self._request, url)
+    
+    def _request(self, url: str, method: str = 'HEAD') -> Dict[str, Any]:
+        """
+        Send one request, following redirects.
+        
+        Args:
+            url: URL to request
+            method: HTTP method
+            
+        Returns:
+            Result dictionary
+        """
+        request = urllib.request.Request(url, method=method, headers={'User-Agent': self.user_agent})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return link_result(url, status=response.status)
+        except urllib.error.HTTPError as e:
+            if method == 'HEAD' and e.code in HEAD_FALLBACK_STATUSES:
+                return self._request(url, method='GET')
+            return link_result(url, status=e.code, error=f"HTTP {e.code} {e.reason}")
+        except urllib.error.URLError as e:
+            return link_result(url, error=f"Request failed: {e.reason}")
+        except (OSError, ValueError) as e:
+            return link_result(url, error=f"Request failed: {str(e)}")
+
+
+class FixtureResolver(LinkResolver):
+    """Resolves URLs from recorded responses, without network access."""
+    
+    name = 'fixture'
+    
+    def __init__(self, responses: Dict[str, Dict[str, Any]]):
+        self.responses = responses
+    
+    @classmethod
+    def load(cls, fixture_file: Path) -> 'FixtureResolver':
+        """
+        Load recorded responses written by ``save_fixture``.
+        
+        Args:
+            fixture_file: Path to the JSON fixture
+            
+        Returns:
+            FixtureResolver answering with the recorded responses
+        """
+        with open(fixture_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get('responses', {}))
+    
+    async def resolve(self, url: str) -> Dict[str, Any]:
+        response = self.responses.get(url)
+        if response is None:
+            return link_result(url, error="No recorded response")
+        return link_result(url, status=response.get('status'), error=response.get('error'))
+
+
+def save_fixture(results: Dict[str, Dict[str, Any]], fixture_file: Path) -> None:
+    """
+    Record check results as a fixture for FixtureResolver.
+    
+    Args:
+        results: Results keyed by URL
+        fixture_file: Path to write the JSON fixture to
+    """
+    responses = {
+        url: {'status': result['status'], 'error': result['error']}
+        for url, result in sorted(results.items())
+    }
+    with open(fixture_file, 'w', encoding='utf-8') as f:
+        json.dump({'format_version': FIXTURE_FORMAT_VERSION, 'responses': responses}, f, indent=2, ensure_ascii=False)
+
+
+class LinkCheckCache:
+    """Persistent cache of URL check results with a time-to-live."""
+    
+    def __init__(self, cache_file: Optional[Path] = DEFAULT_CACHE_FILE, ttl: float = DEFAULT_TTL,
+                 failure_ttl: float = DEFAULT_FAILURE_TTL):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.results = self._load()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read cached results, ignoring a missing or outdated cache file."""
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if data.get('format_version') != CACHE_FORMAT_VERSION:
+            return {}
+        return data.get('results', {})
+    
+    def get(self, url: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached result for a URL if it has not expired.
+        
+        Args:
+            url: URL to look up
+            now: Current time (defaults to ``time.time()``)
+            
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        result = self.results.get(url)
+        if result is None:
+            return None
+        
+        ttl = self.ttl if result.get('ok') else self.failure_ttl
+        if (now if now is not None else time.time()) - result.get('checked_at', 0) > ttl:
+            return None
+        return result
+    
+    def put(self, result: Dict[str, Any]) -> None:
+        """Store a check result."""
+        self.results[result['url']] = result
+    
+    def save(self) -> None:
+        """Write the cache atomically, ignoring write errors."""
+        if self.cache_file is None:
+            return
+        
+        data = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'results': self.results
+        }
+        
+        temp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+        except OSError:
+            pass
+
+
+class ExternalLinkChecker:
+    """Checks batches of URLs concurrently through a resolver and a cache."""
+    
+    def __init__(self, resolver: LinkResolver, cache: Optional[LinkCheckCache] = None,
+                 per_host: int = DEFAULT_PER_HOST, concurrency: int = DEFAULT_CONCURRENCY):
+        self.resolver = resolver
+        self.cache = cache
+        self.per_host = max(1, per_host)
+        self.concurrency = max(1, concurrency)
+        # Counts of the last batch
+        self.stats = {'cache_hits': 0, 'checked': 0}
+    
+    def check(self, urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Check URLs, using cached results that have not expired.
+        
+        Args:
+            urls: URLs to check (duplicates are checked once)
+            
+        Returns:
+            Results keyed by URL
+        """
+        return asyncio.run(self.check_async(urls))
+    
+    async def check_async(self, urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Check URLs from within a running event loop.
+        
+        Args:
+            urls: URLs to check (duplicates are checked once)
+            
+        Returns:
+            Results keyed by URL, in first-seen order
+        """
+        urls = list(dict.fromkeys(urls))
+        self.stats = {'cache_hits': 0, 'checked': 0}
+        
+        results = {}
+        pending = []
+        for url in urls:
+            cached = self.cache.get(url) if self.cache is not None else None
+            if cached is not None:
+                results[url] = cached
+                self.stats['cache_hits'] += 1
+            else:
+                pending.append(url)
+        
+        # One semaphore bounds all requests, another bounds each host
+        limit = asyncio.Semaphore(self.concurrency)
+        host_limits = {}
+        
+        async def resolve(url: str) -> Dict[str, Any]:
+            host = (urlparse(url).hostname or '').lower()
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(self.per_host))
+            async with host_limit, limit:
+                try:
+                    return await self.resolver.resolve(url)
+                except Exception as e:
+                    return link_result(url, error=f"Resolver failed: {str(e)}")
+        
+        for result in await asyncio.gather(*(resolve(url) for url in pending)):
+            results[result['url']] = result
+            if self.cache is not None:
+                self.cache.put(result)
+        self.stats['checked'] = len(pending)
+        
+        return {url: results[url] for url in urls}
+
+
+class ExternalLinkValidator:
+    """Validates external links and source URLs of documentation files."""
+    
+    def __init__(self, resolver: Optional[LinkResolver] = None, cache_file: Optional[Path] = DEFAULT_CACHE_FILE,
+                 fixture: Optional[Path] = None, per_host: int = DEFAULT_PER_HOST,
+                 concurrency: int = DEFAULT_CONCURRENCY, ttl: float = DEFAULT_TTL):
+        if resolver is None:
+            fixture = fixture or os.environ.get(FIXTURE_ENVIRONMENT_VARIABLE)
+            resolver = FixtureResolver.load(Path(fixture)) if fixture else HttpResolver()
+        self.resolver = resolver
+        self.cache = LinkCheckCache(cache_file, ttl=ttl)
+        self.checker = ExternalLinkChecker(resolver, self.cache, per_host=per_host, concurrency=concurrency)
+    
+    def extract_links(self, document: ParsedDocument) -> List[Dict[str, Any]]:
+        """
+        Extract the external links and source URL of a document.
+        
+        Args:
+            document: Parsed document
+            
+        Returns:
+            List of ``{'url', 'text', 'line'}`` dictionaries
+        """
+        links = []
+        if document.content is None:
+            return links
+        
+        for line_num, line in enumerate(document.lines, 1):
+            for match in EXTERNAL_LINK_PATTERN.finditer(line):
+                links.append({'url': match.group(2), 'text': match.group(1), 'line': line_num})
+        
+        source_url = document.frontmatter.get(SOURCE_URL_FIELD)
+        if isinstance(source_url, str) and source_url.startswith(('http://', 'https://')):
+            line_num = next(
+                (i for i, line in enumerate(document.lines, 1) if line.startswith(f"{SOURCE_URL_FIELD}:")),
+                1
+            )
+            links.append({'url': source_url, 'text': SOURCE_URL_FIELD, 'line': line_num})
+        
+        return links
+    
+    def validate_file(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Validate the external links of a single markdown file.
+        
+        Args:
+            file_path: Path to the markdown file
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        return self.validate_corpus(DocumentCorpus.from_file(file_path))['files'][0]
+    
+    def validate_directory(self, directory: Path, recursive: bool = True) -> Dict[str, Any]:
+        """
+        Validate the external links of all markdown files in a directory.
+        
+        Args:
+            directory: Directory to validate
+            recursive: Whether to search subdirectories
+            
+        Returns:
+            Dictionary containing validation results for all files
+        """
+        return self.validate_corpus(DocumentCorpus.load(directory, recursive=recursive))
+    
+    def validate_corpus(self, corpus: DocumentCorpus) -> Dict[str, Any]:
+        """
+        Validate the external links of an already loaded corpus.
+        
+        All unique URLs of the corpus are checked in one concurrent batch.
+        
+        Args:
+            corpus: Shared document corpus
+            
+        Returns:
+            Dictionary containing validation results for all files
+        """
+        document_links = [(document, self.extract_links(document)) for document in corpus]
+        checks = self.checker.check(link['url'] for _, links in document_links for link in links)
+        self.cache.save()
+        
+        results = {
+            'directory': str(corpus.directory),
+            'resolver': self.resolver.name,
+            'files': [],
+            'summary': {
+                'total_files': 0,
+                'valid_files': 0,
+                'invalid_files': 0,
+                'total_errors': 0,
+                'total_warnings': 0,
+                'total_links': 0,
+                'unique_urls': len(checks),
+                'broken_links': 0,
+                'cache_hits': self.checker.stats['cache_hits'],
+                'checked': self.checker.stats['checked']
+            }
+        }
+        
+        for document, links in document_links:
+            file_result = {
+                'file': str(document.path),
+                'valid': True,
+                'errors': [],
+                'warnings': [],
+                'links': links
+            }
+            
+            for link in links:
+                check = checks[link['url']]
+                if check['ok']:
+                    continue
+                reason = check['error'] or f"HTTP {check['status']}"
+                if is_broken(check):
+                    file_result['errors'].append(f"Line {link['line']}: Broken external link {link['url']} ({reason})")
+                    results['summary']['broken_links'] += 1
+                else:
+                    file_result['warnings'].append(f"Line {link['line']}: Could not verify {link['url']} ({reason})")
+            
+            file_result['valid'] = not file_result['errors']
+            results['files'].append(file_result)
+            
+            results['summary']['total_files'] += 1
+            results['summary']['valid_files' if file_result['valid'] else 'invalid_files'] += 1
+            results['summary']['total_errors'] += len(file_result['errors'])
+            results['summary']['total_warnings'] += len(file_result['warnings'])
+            results['summary']['total_links'] += len(links)
+        
+        return results
+
+
+def print_results(results: Dict[str, Any], verbose: bool = False):
+    """
+    Print validation results in a readable format.
+    
+    Args:
+        results: Validation results dictionary
+        verbose: Whether to show warnings as well as errors
+    """
+    summary = results['summary']
+    
+    print(f"\n=== External Link Check Results ===")
+    print(f"Directory: {results['directory']}")
+    print(f"Resolver: {results['resolver']}")
+    print(f"Total files: {summary['total_files']}")
+    print(f"Total links: {summary['total_links']} ({summary['unique_urls']} unique URLs)")
+    print(f"Checked: {summary['checked']}, from cache: {summary['cache_hits']}")
+    print(f"Broken links: {summary['broken_links']}")
+    print(f"Unverified links: {summary['total_warnings']}")
+    
+    for file_result in results['files']:
+        messages = file_result['errors'] + (file_result['warnings'] if verbose else [])
+        if messages:
+            print(f"\nFile: {file_result['file']}")
+            for message in messages:
+                print(f"  {message}")
+
+
+def main():
+    """Main function to run the external link checker."""
+    parser = argparse.ArgumentParser(description='Check external links and source URLs in documentation files')
+    parser.add_argument('path', help='Path to markdown file or directory to check')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show unverifiable links as well as broken ones')
+    parser.add_argument('--no-recursive', action='store_true', help='Do not search subdirectories')
+    parser.add_argument('--fixture', type=Path,
+                       help=f'Answer from recorded responses instead of the network (default: ${FIXTURE_ENVIRONMENT_VARIABLE})')
+    parser.add_argument('--record', type=Path, help='Save the responses of this run as a fixture')
+    parser.add_argument('--cache', type=Path, default=DEFAULT_CACHE_FILE,
+                       help=f'Result cache file (default: {DEFAULT_CACHE_FILE})')
+    parser.add_argument('--no-cache', action='store_true', help='Check every URL and do not update the cache')
+    parser.add_argument('--ttl', type=float, default=DEFAULT_TTL,
+                       help=f'Seconds a working link stays cached (default: {DEFAULT_TTL})')
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST,
+                       help=f'Maximum concurrent requests per host (default: {DEFAULT_PER_HOST})')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                       help=f'Maximum concurrent requests in total (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                       help=f'Request timeout in seconds (default: {DEFAULT_TIMEOUT})')
+    
+    args = parser.parse_args()
+    
+    path = Path(args.path)
+    
+    if not path.exists():
+        print(f"Error: Path '{path}' does not exist")
+        sys.exit(1)
+    
+    fixture = args.fixture or os.environ.get(FIXTURE_ENVIRONMENT_VARIABLE)
+    resolver = FixtureResolver.load(Path(fixture)) if fixture else HttpResolver(timeout=args.timeout)
+    
+    validator = ExternalLinkValidator(
+        resolver=resolver,
+        cache_file=None if args.no_cache else args.cache,
+        per_host=args.per_host,
+        concurrency=args.concurrency,
+        ttl=args.ttl
+    )
+    
+    if path.is_file():
+        corpus = DocumentCorpus.from_file(path)
+    else:
+        corpus = DocumentCorpus.load(path, recursive=not args.no_recursive)
+    results = validator.validate_corpus(corpus)
+    
+    print_results(results, verbose=args.verbose)
+    
+    if args.record:
+        urls = {link['url'] for file_result in results['files'] for link in file_result['links']}
+        save_fixture({url: validator.cache.results[url] for url in urls}, args.record)
+        print(f"\nRecorded {len(urls)} responses to: {args.record}")
+    
+    # Exit with error code if there are broken links
+    if results['summary']['broken_links'] > 0:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -15,10 +15,17 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any, Set
+from typing import List, Dict, Tuple, Optional, Any, Set, Callable
 import argparse
 from collections import defaultdict, Counter
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from validation_cache import ValidatorCache
+from glossary_matcher import GlossaryMatcher
+from glossary_index import GlossaryIndex
+
 
 class TerminologyConsistencyChecker:
     """Checks terminology consistency across documentation."""
@@ -30,13 +37,17 @@ class TerminologyConsistencyChecker:
         self.errors = []
         self.warnings = []
         
+        # Term matcher, rebuilt only when a new glossary is loaded
+        self._glossary_matcher = None
+        self._matcher_glossary = None
+        
         # Load glossary if provided
         if glossary_path and glossary_path.exists():
             self.glossary_terms = self._load_glossary(glossary_path)
     
     def _load_glossary(self, glossary_path: Path) -> Dict[str, Dict[str, str]]:
         """
-        Load terms and their canonical definitions from the glossary.
+        Load terms and their canonical definitions from the shared glossary index.
         
         Args:
             glossary_path: Path to the glossary.md file
@@ -44,56 +55,20 @@ class TerminologyConsistencyChecker:
         Returns:
             Dictionary mapping canonical terms to their information
         """
-        glossary_terms = {}
-        
-        try:
-            with open(glossary_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse glossary entries
-            current_term = None
-            current_info = {}
-            
-            lines = content.split('\n')
-            for line in lines:
-                line = line.strip()
-                
-                # Check for term heading (### Term)
-                if line.startswith('### ') and not line.startswith('#### '):
-                    # Save previous term
-                    if current_term and current_info:
-                        # Store both the original term and lowercase version
-                        glossary_terms[current_term.lower()] = current_info
-                        glossary_terms[current_term] = current_info
-                    
-                    # Start new term
-                    current_term = line[4:].strip()
-                    current_info = {
-                        'canonical_term': current_term,
-                        'term_lower': current_term.lower()
-                    }
-                
-                # Check for English translation
-                elif line.startswith('**English**:'):
-                    english = line[12:].strip()
-                    current_info['english'] = english
-                    # Also store English term as a variation
-                    glossary_terms[english.lower()] = current_info
-                
-                # Check for definition
-                elif line.startswith('**Definition**:'):
-                    definition = line[15:].strip()
-                    current_info['definition'] = definition
-            
-            # Save last term
-            if current_term and current_info:
-                glossary_terms[current_term.lower()] = current_info
-                glossary_terms[current_term] = current_info
-        
-        except Exception as e:
-            print(f"Warning: Could not load glossary from {glossary_path}: {e}")
+        return GlossaryIndex.load(glossary_path).terminology_terms()
+    
+    def _get_glossary_matcher(self) -> Optional[GlossaryMatcher]:
+        """
+        Get the matcher for the loaded glossary terms, built once per glossary load.
         
-        return glossary_terms
+        Returns:
+            GlossaryMatcher over glossary terms longer than two characters, or None
+        """
+        if self._matcher_glossary is not self.glossary_terms:
+            glossary_keys = [term for term in self.glossary_terms.keys() if len(term) > 2]
+            self._glossary_matcher = GlossaryMatcher(glossary_keys) if glossary_keys else None
+            self._matcher_glossary = self.glossary_terms
+        return self._glossary_matcher
     
     def analyze_file(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -105,6 +80,19 @@ class TerminologyConsistencyChecker:
         Returns:
             Dictionary containing analysis results
         """
+        return self.analyze_document(ParsedDocument.from_file(file_path))
+    
+    def analyze_document(self, document: ParsedDocument) -> Dict[str, Any]:
+        """
+        Analyze terminology usage in an already parsed document.
+        
+        Args:
+            document: Parsed document from the shared corpus
+            
+        Returns:
+            Dictionary containing analysis results
+        """
+        file_path = document.path
         result = {
             'file': str(file_path),
             'terms_found': [],
@@ -113,8 +101,7 @@ class TerminologyConsistencyChecker:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = document.read()
             
             # Extract terms from content
             terms = self._extract_terms(content, file_path)
@@ -129,9 +116,6 @@ class TerminologyConsistencyChecker:
                 mismatches = self._check_glossary_consistency(terms)
                 result['glossary_mismatches'] = mismatches
             
-            # Update global term usage tracking
-            self._update_term_usage(terms, file_path)
-            
         except Exception as e:
             result['error'] = f"Failed to read file: {str(e)}"
         
@@ -159,18 +143,11 @@ class TerminologyConsistencyChecker:
             (re.compile(r'"([^"]+)"'), 'quoted'),
             # Terms with translations: Term (English)
             (re.compile(r'\b([A-ZÆØÅ][a-zæøå-]+(?:\s+[a-zæøå-]+)*)\s*\(([^)]+)\)'), 'with_translation'),
-            # Known glossary terms (if glossary is loaded)
         ]
         
-        # Add glossary terms pattern if available
-        if self.glossary_terms:
-            glossary_keys = [term for term in self.glossary_terms.keys() if len(term) > 2]
-            if glossary_keys:
-                # Sort by length (longest first) to avoid partial matches
-                glossary_keys.sort(key=len, reverse=True)
-                escaped_terms = [re.escape(term) for term in glossary_keys]
-                glossary_pattern = re.compile(r'\b(' + '|'.join(escaped_terms) + r')\b', re.IGNORECASE)
-                patterns.append((glossary_pattern, 'glossary_term'))
+        # Known glossary terms (if glossary is loaded), matched in one pass over the document
+        glossary_matcher = self._get_glossary_matcher()
+        glossary_matches = glossary_matcher.find_by_line(content) if glossary_matcher else {}
         
         for line_num, line in enumerate(lines, 1):
             # Skip code blocks, links, and metadata
@@ -180,37 +157,43 @@ class TerminologyConsistencyChecker:
                 line.strip().startswith('#')):
                 continue
             
-            for pattern, pattern_type in patterns:
-                for match in pattern.finditer(line):
-                    if pattern_type == 'with_translation':
-                        term = match.group(1).strip()
-                        translation = match.group(2).strip()
-                        
-                        terms.append({
-                            'term': term,
-                            'normalized_term': self._normalize_term(term),
-                            'translation': translation,
-                            'line': line_num,
-                            'context': line.strip(),
-                            'pattern_type': pattern_type,
-                            'file': str(file_path)
-                        })
-                    else:
-                        term = match.group(1).strip()
-                        
-                        # Filter out very short terms or common words
-                        if len(term) < 3 or term.lower() in {'the', 'and', 'for', 'you', 'are', 'can', 'will', 'this', 'that'}:
-                            continue
-                        
-                        terms.append({
-                            'term': term,
-                            'normalized_term': self._normalize_term(term),
-                            'translation': None,
-                            'line': line_num,
-                            'context': line.strip(),
-                            'pattern_type': pattern_type,
-                            'file': str(file_path)
-                        })
+            line_matches = [
+                (pattern_type, match.groups())
+                for pattern, pattern_type in patterns
+                for match in pattern.finditer(line)
+            ]
+            line_matches.extend(('glossary_term', (term,)) for term in glossary_matches.get(line_num, []))
+            
+            for pattern_type, groups in line_matches:
+                if pattern_type == 'with_translation':
+                    term = groups[0].strip()
+                    translation = groups[1].strip()
+                    
+                    terms.append({
+                        'term': term,
+                        'normalized_term': self._normalize_term(term),
+                        'translation': translation,
+                        'line': line_num,
+                        'context': line.strip(),
+                        'pattern_type': pattern_type,
+                        'file': str(file_path)
+                    })
+                else:
+                    term = groups[0].strip()
+                    
+                    # Filter out very short terms or common words
+                    if len(term) < 3 or term.lower() in {'the', 'and', 'for', 'you', 'are', 'can', 'will', 'this', 'that'}:
+                        continue
+                    
+                    terms.append({
+                        'term': term,
+                        'normalized_term': self._normalize_term(term),
+                        'translation': None,
+                        'line': line_num,
+                        'context': line.strip(),
+                        'pattern_type': pattern_type,
+                        'file': str(file_path)
+                    })
         
         return terms
     
@@ -272,7 +255,7 @@ class TerminologyConsistencyChecker:
                     # Multiple ways of referring to the same concept
                     inconsistencies.append({
                         'normalized_term': normalized_term,
-                        'variations': list(surface_forms),
+                        'variations': sorted(surface_forms),
                         'instances': instances,
                         'type': 'multiple_forms'
                     })
@@ -352,6 +335,23 @@ class TerminologyConsistencyChecker:
             recursive: Whether to search subdirectories
             glossary_path: Path to glossary file (if not provided in constructor)
             
+        Returns:
+            Dictionary containing analysis results
+        """
+        return self.analyze_corpus(DocumentCorpus.load(directory, recursive=recursive), glossary_path=glossary_path)
+    
+    def analyze_corpus(self, corpus: DocumentCorpus, glossary_path: Optional[Path] = None, cache: Optional[ValidatorCache] = None,
+                       sink: Optional[Callable[[Dict], None]] = None) -> Dict[str, Any]:
+        """
+        Analyze terminology consistency across all documents of an already loaded corpus.
+        
+        Args:
+            corpus: Shared document corpus
+            glossary_path: Path to glossary file (if not provided in constructor)
+            cache: Optional cache of per-file results from earlier runs
+            sink: Optional callable receiving each file result as it is produced,
+                instead of collecting them in ``files``
+            
         Returns:
             Dictionary containing analysis results
         """
@@ -364,7 +364,7 @@ class TerminologyConsistencyChecker:
         self.term_variations.clear()
         
         results = {
-            'directory': str(directory),
+            'directory': str(corpus.directory),
             'glossary_loaded': bool(self.glossary_terms),
             'glossary_terms_count': len(self.glossary_terms),
             'files': [],
@@ -380,24 +380,28 @@ class TerminologyConsistencyChecker:
             }
         }
         
-        # Find all markdown files
-        pattern = '**/*.md' if recursive else '*.md'
-        markdown_files = list(directory.glob(pattern))
-        
         # Analyze each file
-        for file_path in markdown_files:
-            if file_path.is_file():
-                file_result = self.analyze_file(file_path)
+        for document in corpus:
+            if cache is not None:
+                file_result = cache.lookup(document, self.analyze_document)
+            else:
+                file_result = self.analyze_document(document)
+            if sink is not None:
+                sink(file_result)
+            else:
                 results['files'].append(file_result)
-                
-                results['summary']['total_files'] += 1
-                
-                if file_result['terms_found']:
-                    results['summary']['files_with_terms'] += 1
-                    results['summary']['total_terms'] += len(file_result['terms_found'])
-                
-                results['summary']['total_file_inconsistencies'] += len(file_result.get('potential_inconsistencies', []))
-                results['summary']['total_glossary_mismatches'] += len(file_result.get('glossary_mismatches', []))
+            
+            # Update global term usage tracking (also for cached file results)
+            self._update_term_usage(file_result['terms_found'], document.path)
+            
+            results['summary']['total_files'] += 1
+            
+            if file_result['terms_found']:
+                results['summary']['files_with_terms'] += 1
+                results['summary']['total_terms'] += len(file_result['terms_found'])
+            
+            results['summary']['total_file_inconsistencies'] += len(file_result.get('potential_inconsistencies', []))
+            results['summary']['total_glossary_mismatches'] += len(file_result.get('glossary_mismatches', []))
         
         # Analyze global consistency
         global_inconsistencies = self._analyze_global_consistency()
@@ -438,18 +442,18 @@ class TerminologyConsistencyChecker:
                 # Check if there's a clear canonical form from glossary
                 canonical_term = None
                 if self.glossary_terms:
-                    for variation in variations:
+                    for variation in sorted(variations):
                         if variation.lower() in self.glossary_terms:
                             canonical_term = self.glossary_terms[variation.lower()].get('canonical_term')
                             break
                 
                 inconsistencies.append({
                     'normalized_term': normalized_term,
-                    'variations': list(variations),
+                    'variations': sorted(variations),
                     'usage_stats': dict(usage_stats),
                     'most_common': most_common_term,
                     'canonical_term': canonical_term,
-                    'file_usage': {term: list(files) for term, files in file_usage.items()},
+                    'file_usage': {term: sorted(files) for term, files in file_usage.items()},
                     'total_usage': sum(usage_stats.values()),
                     'type': 'global_variation'
                 })
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Chunk Manifest for Denmark Living Documentation System
+
+This script lists the chunks the documentation is embedded as, so only the
+chunks that changed since the last indexing run need new embeddings:
+- One chunk per H2 section, the unit TokenCounter keeps under the token limit
+- Stable chunk IDs (``path#anchor``) that survive edits elsewhere in the file
+- Heading path, line range, token count and frontmatter category per chunk
+- A SHA-256 content hash of the exact text that is embedded
+
+The manifest is deterministic: the same docs always produce the same file,
+so it can be stored and diffed. Comparing it with the previous manifest
+gives the added, changed and deleted chunks; added and changed chunks are
+written with their text, ready for the embedding API.
+
+With ``--max-tokens``, sections over the limit are split into smaller
+chunks by ``rechunk.py`` instead of being reported for manual splitting.
+
+Usage:
+    python scripts/chunk_manifest.py docs/denmark-living -o chunks.json
+    python scripts/chunk_manifest.py docs/denmark-living --previous chunks.json --delta delta.json -o chunks.json
+    python scripts/chunk_manifest.py docs/denmark-living --max-tokens 1000 --overlap 100 --stream chunks.jsonl
+
+Requirements: 1.4
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from count_tokens import TokenCounter
+from tokenizer import DEFAULT_ENCODING
+from search_index import document_sections
+from rechunk import rechunk
+
+
+MANIFEST_FORMAT_VERSION = 1
+
+# Separates the heading path from the section text in the embedded text
+HEADING_PATH_SEPARATOR = ' > '
+
+
+def heading_path(document: ParsedDocument, section: Dict[str, Any]) -> List[str]:
+    """
+    Headings leading to a section: the document's H1 and the section heading.
+    
+    Args:
+        document: Parsed document
+        section: Section entry with ``'start_line'`` and ``'heading'``
+        
+    Returns:
+        List of heading texts, outermost first
+    """
+    title = None
+    for heading in document.headings:
+        if heading['line'] >= section['start_line']:
+            break
+        if heading['level'] == 1:
+            title = heading['text']
+    return [title, section['heading']] if title else [section['heading']]
+
+
+def chunk_text(chunk: Dict[str, Any]) -> str:
+    """
+    Text sent to the embedding model for a chunk.
+    
+    The heading path is prepended so a section keeps its context.
+    
+    Args:
+        chunk: Chunk with ``'heading_path'`` and ``'content'``
+        
+    Returns:
+        Text to embed
+    """
+    return f"{HEADING_PATH_SEPARATOR.join(chunk['heading_path'])}\n\n{chunk['content']}"
+
+
+def document_chunks(document: ParsedDocument, relative_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Split a document into chunks, one per H2 section.
+    
+    Args:
+        document: Parsed document
+        relative_path: Document path relative to the documentation root
+        
+    Yields:
+        Chunks with id, source, document title, heading path, line range,
+        category and content
+    """
+    for section in document_sections(document, relative_path):
+        yield {
+            'id': section['id'],
+            'source': relative_path,
+            'title': section['title'],
+            'heading_path': heading_path(document, section),
+            'start_line': section['start_line'],
+            'end_line': section['end_line'],
+            'category': section['category'],
+            'content': section['text']
+        }
+
+
+class ChunkManifest:
+    """Chunks of the documentation with their content hashes."""
+    
+    def __init__(self, chunks: List[Dict[str, Any]], tokenizer: str):
+        self.chunks = chunks
+        self.tokenizer = tokenizer
+        self._by_id = {chunk['id']: chunk for chunk in chunks}
+    
+    @classmethod
+    def build(cls, corpus: DocumentCorpus, encoding: str = DEFAULT_ENCODING,
+              max_tokens: Optional[int] = None, overlap: int = 0) -> 'ChunkManifest':
+        """
+        Chunk every document of a corpus.
+        
+        Token counts come from the TokenCounter tokenizer, batch-encoded for
+        the whole corpus. With ``max_tokens``, sections over the limit are
+        split by ``rechunk``.
+        
+        Args:
+            corpus: Loaded documentation corpus
+            encoding: Tokenizer encoding for the token counts
+            max_tokens: Split sections with more tokens than this (optional)
+            overlap: Tokens repeated between the parts of a split section
+            
+        Returns:
+            ChunkManifest with chunks ordered by source path and position;
+            chunks keep their ``'content'`` in memory
+        """
+        documents = sorted(
+            ((document.path.relative_to(corpus.directory).as_posix(), document) for document in corpus),
+            key=lambda item: item[0]
+        )
+        
+        chunks = []
+        for relative_path, document in documents:
+            if document.content is not None:
+                chunks.extend(document_chunks(document, relative_path))
+        
+        tokenizer = TokenCounter(encoding=encoding).tokenizer
+        token_counts = tokenizer.count_batch(chunk['content'] for chunk in chunks)
+        for chunk, token_count in zip(chunks, token_counts):
+            chunk['token_count'] = token_count
+        
+        if max_tokens is not None:
+            chunks = list(rechunk(chunks, dict(documents), tokenizer, max_tokens, overlap))
+        
+        for chunk in chunks:
+            chunk['content_hash'] = hashlib.sha256(chunk_text(chunk).encode('utf-8')).hexdigest()
+        
+        return cls(chunks, tokenizer.name)
+    
+    @classmethod
+    def load(cls, manifest_file: Path) -> 'ChunkManifest':
+        """
+        Read a manifest written by ``save``.
+        
+        Args:
+            manifest_file: Path of the manifest file
+            
+        Returns:
+            ChunkManifest without chunk content
+            
+        Raises:
+            ValueError: If the file has an unsupported format version
+        """
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        if data.get('format_version') != MANIFEST_FORMAT_VERSION:
+            raise ValueError(f"Unsupported chunk manifest format: {data.get('format_version')}")
+        return cls(data['chunks'], data['tokenizer'])
+    
+    def save(self, manifest_file: Path) -> None:
+        """
+        Write the manifest atomically, without chunk content.
+        
+        Args:
+            manifest_file: Path of the manifest file
+        """
+        data = {
+            'format_version': MANIFEST_FORMAT_VERSION,
+            'tokenizer': self.tokenizer,
+            'manifest_hash': self.manifest_hash(),
+            'total_chunks': len(self.chunks),
+            'total_tokens': sum(chunk['token_count'] for chunk in self.chunks),
+            'chunks': [
+                {key: value for key, value in chunk.items() if key != 'content'}
+                for chunk in self.chunks
+            ]
+        }
+        
+        temp_file = manifest_file.with_name(manifest_file.name + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        os.replace(temp_file, manifest_file)
+    
+    def __len__(self) -> int:
+        return len(self.chunks)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.chunks)
+    
+    def get(self, chunk_id: str) -> Optional[Dict[str, Any]]:
+        """Return the chunk with an ID, or None."""
+        return self._by_id.get(chunk_id)
+    
+    def manifest_hash(self) -> str:
+        """
+        Hash identifying the chunk set, over chunk IDs and content hashes.
+        
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        for chunk in self.chunks:
+            digest.update(f"{chunk['id']}\0{chunk['content_hash']}\n".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def diff(self, previous: Optional['ChunkManifest']) -> Dict[str, Any]:
+        """
+        Compare with the manifest of the previous indexing run.
+        
+        A chunk whose text is unchanged but whose line range moved is not
+        re-embedded; its new location is listed under ``'moved'``.
+        
+        Args:
+            previous: Previous manifest, or None to treat every chunk as added
+            
+        Returns:
+            Dictionary with ``added`` and ``changed`` chunks (with content),
+            ``moved`` chunks (metadata only), ``deleted`` chunk IDs and a
+            summary of the counts
+        """
+        previous_chunks = previous._by_id if previous is not None else {}
+        added = []
+        changed = []
+        moved = []
+        
+        for chunk in self.chunks:
+            old = previous_chunks.get(chunk['id'])
+            if old is None:
+                added.append(chunk)
+            elif old['content_hash'] != chunk['content_hash']:
+                changed.append(chunk)
+            elif (old['start_line'], old['end_line']) != (chunk['start_line'], chunk['end_line']):
+                moved.append({key: value for key, value in chunk.items() if key != 'content'})
+        
+        deleted = sorted(chunk_id for chunk_id in previous_chunks if chunk_id not in self._by_id)
+        
+        return {
+            'format_version': MANIFEST_FORMAT_VERSION,
+            'previous_manifest_hash': previous.manifest_hash() if previous is not None else None,
+            'manifest_hash': self.manifest_hash(),
+            'summary': {
+                'added': len(added),
+                'changed': len(changed),
+                'moved': len(moved),
+                'deleted': len(deleted),
+                'unchanged': len(self.chunks) - len(added) - len(changed),
+                'tokens_to_embed': sum(chunk['token_count'] for chunk in added + changed)
+            },
+            'added': added,
+            'changed': changed,
+            'moved': moved,
+            'deleted': deleted
+        }
+
+
+def print_delta(delta: Dict[str, Any]):
+    """
+    Print a manifest delta in a readable format.
+    
+    Args:
+        delta: Result of ``ChunkManifest.diff``
+    """
+    summary = delta['summary']
+    print(f"Chunks: {summary['added']} added, {summary['changed']} changed, {summary['deleted']} deleted, "
+          f"{summary['unchanged']} unchanged ({summary['moved']} moved)")
+    print(f"Tokens to embed: {summary['tokens_to_embed']:,}")
+    
+    for label, chunks in (('+', delta['added']), ('~', delta['changed'])):
+        for chunk in chunks:
+            print(f"  {label} {chunk['id']} ({chunk['token_count']} tokens)")
+    for chunk_id in delta['deleted']:
+        print(f"  - {chunk_id}")
+
+
+def write_stream(chunks: Iterable[Dict[str, Any]], output) -> None:
+    """
+    Write chunks with their content as JSON Lines, one chunk per line.
+    
+    Args:
+        chunks: Chunks to write
+        output: File path, or an open text stream
+    """
+    if isinstance(output, Path):
+        with open(output, 'w', encoding='utf-8') as f:
+            write_stream(chunks, f)
+        return
+    
+    for chunk in chunks:
+        output.write(json.dumps(chunk, ensure_ascii=False) + '\n')
+
+
+def main():
+    """Main function to build the chunk manifest and its delta."""
+    parser = argparse.ArgumentParser(description='Build the chunk manifest of the documentation')
+    parser.add_argument('path', help='Documentation directory')
+    parser.add_argument('--output', '-o', help='Write the manifest to this file')
+    parser.add_argument('--previous', '-p', help='Manifest of the previous indexing run')
+    parser.add_argument('--delta', '-d', help='Write added, changed and deleted chunks to this file')
+    parser.add_argument('--encoding', '-e', default=DEFAULT_ENCODING,
+                        help=f'Tokenizer encoding for token counts (default: {DEFAULT_ENCODING})')
+    parser.add_argument('--max-tokens', '-m', type=int,
+                        help='Split sections over this many tokens at H3, paragraph or list boundaries')
+    parser.add_argument('--overlap', type=int, default=0,
+                        help='Tokens repeated between the parts of a split section (default: 0)')
+    parser.add_argument('--stream', '-s',
+                        help='Write the chunks with their content as JSON Lines to this file (- for stdout)')
+    
+    args = parser.parse_args()
+    
+    directory = Path(args.path)
+    if not directory.is_dir():
+        print(f"Error: Directory '{directory}' does not exist")
+        sys.exit(1)
+    
+    manifest = ChunkManifest.build(DocumentCorpus.load(directory), encoding=args.encoding,
+                                   max_tokens=args.max_tokens, overlap=args.overlap)
+    
+    if args.stream:
+        write_stream(manifest, sys.stdout if args.stream == '-' else Path(args.stream))
+        if args.stream == '-':
+            return
+    
+    previous = None
+    if args.previous and Path(args.previous).exists():
+        previous = ChunkManifest.load(Path(args.previous))
+    
+    delta = manifest.diff(previous)
+    print(f"Built {len(manifest)} chunks from {directory} ({manifest.tokenizer} tokenizer)")
+    print_delta(delta)
+    
+    if args.delta:
+        with open(args.delta, 'w', encoding='utf-8') as f:
+            json.dump(delta, f, indent=2, ensure_ascii=False)
+        print(f"\nDelta written to: {args.delta}")
+    
+    if args.output:
+        manifest.save(Path(args.output))
+        print(f"Manifest written to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""
+Shared Document Corpus for Denmark Living Documentation System
+
+This module reads and parses every markdown file in the documentation tree
+once per validation run and exposes the parsed views to all validators:
+- Raw text, split lines and line start offsets
+- Frontmatter block and its YAML fields (see frontmatter_loader.py)
+- Flat heading list and nested heading tree
+- H2 sections with line ranges (single pass, also streamed from files)
+
+``DocumentCorpus.load_cached`` keeps one corpus per directory for the whole
+process, reloaded only when the directory tree's modification times change.
+
+Requirements: All (Validation infrastructure)
+"""
+
+import os
+import re
+import sys
+import hashlib
+from bisect import bisect_right
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Iterator, Iterable
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from frontmatter_loader import find_frontmatter, parse_frontmatter
+
+
+class ParsedDocument:
+    """A single markdown file, read once and parsed lazily for all validators."""
+    
+    HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+    
+    def __init__(self, path: Path, content: Optional[str] = None, error: Optional[str] = None):
+        self.path = path
+        self.content = content
+        self.error = error
+        
+        # Lazily computed views
+        self._content_hash = None
+        self._lines = None
+        self._line_offsets = None
+        self._frontmatter_range = None
+        self._frontmatter = None
+        self._frontmatter_error = None
+        self._headings = None
+        self._heading_tree = None
+        self._h2_sections = None
+    
+    @classmethod
+    def from_file(cls, file_path: Path) -> 'ParsedDocument':
+        """
+        Read a markdown file into a parsed document.
+        
+        Args:
+            file_path: Path to the markdown file
+            
+        Returns:
+            ParsedDocument, with ``error`` set if the file could not be read
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return cls(file_path, content=f.read())
+        except Exception as e:
+            return cls(file_path, error=str(e))
+    
+    def read(self) -> str:
+        """
+        Return the document text, like reading the file from disk.
+        
+        Returns:
+            Full markdown content
+            
+        Raises:
+            OSError: If the file could not be read when the corpus was loaded
+        """
+        if self.error is not None:
+            raise OSError(self.error)
+        return self.content
+    
+    @property
+    def content_hash(self) -> Optional[str]:
+        """SHA-256 of the document text, or None if the file could not be read."""
+        if self._content_hash is None and self.content is not None:
+            self._content_hash = hashlib.sha256(self.content.encode('utf-8')).hexdigest()
+        return self._content_hash
+    
+    @property
+    def lines(self) -> List[str]:
+        """Content split on newlines (same as ``content.split('\\n')``)."""
+        if self._lines is None:
+            self._lines = self.content.split('\n') if self.content is not None else []
+        return self._lines
+    
+    @property
+    def line_offsets(self) -> List[int]:
+        """Character offset of the start of each line in ``content``."""
+        if self._line_offsets is None:
+            offsets = []
+            position = 0
+            for line in self.lines:
+                offsets.append(position)
+                position += len(line) + 1
+            self._line_offsets = offsets
+        return self._line_offsets
+    
+    def line_number(self, offset: int) -> int:
+        """
+        Convert a character offset in ``content`` to a 1-based line number.
+        
+        Args:
+            offset: Character offset into the content
+            
+        Returns:
+            1-based line number containing the offset
+        """
+        return bisect_right(self.line_offsets, offset)
+    
+    @property
+    def frontmatter_range(self) -> Optional[tuple]:
+        """
+        Line indices ``(start, end)`` of the frontmatter delimiters, or None.
+        
+        The block may open on the first line or right after the H1 title.
+        """
+        if self._frontmatter_range is None:
+            self._frontmatter_range = find_frontmatter(self.lines) or ()
+        return self._frontmatter_range or None
+    
+    @property
+    def has_frontmatter(self) -> bool:
+        """Whether the document has a closed frontmatter block."""
+        return self.frontmatter_range is not None
+    
+    @property
+    def frontmatter_text(self) -> str:
+        """Raw text between the frontmatter delimiters."""
+        frontmatter_range = self.frontmatter_range
+        if not frontmatter_range:
+            return ''
+        start, end = frontmatter_range
+        return '\n'.join(self.lines[start + 1:end])
+    
+    @property
+    def frontmatter(self) -> Dict[str, Any]:
+        """YAML frontmatter fields, parsed once (empty if missing or invalid)."""
+        if self._frontmatter is None:
+            frontmatter_range = self.frontmatter_range
+            if frontmatter_range:
+                self._frontmatter, self._frontmatter_error = parse_frontmatter(
+                    self.frontmatter_text, first_line=frontmatter_range[0] + 2
+                )
+            else:
+                self._frontmatter, self._frontmatter_error = {}, None
+        return self._frontmatter
+    
+    @property
+    def frontmatter_error(self) -> Optional[str]:
+        """Error message if the frontmatter block is not valid YAML."""
+        self.frontmatter
+        return self._frontmatter_error
+    
+    @property
+    def headings(self) -> List[Dict[str, Any]]:
+        """All ATX headings as ``{'level', 'text', 'line'}`` dictionaries."""
+        if self._headings is None:
+            headings = []
+            if self.content is not None:
+                for match in self.HEADING_PATTERN.finditer(self.content):
+                    headings.append({
+                        'level': len(match.group(1)),
+                        'text': match.group(2).strip(),
+                        'line': self.line_number(match.start())
+                    })
+            self._headings = headings
+        return self._headings
+    
+    @property
+    def title(self) -> Optional[str]:
+        """Document title: the frontmatter ``title``, else the first H1 (None without either)."""
+        title = self.frontmatter.get('title')
+        if isinstance(title, str) and title.strip():
+            return title.strip()
+        return next((heading['text'] for heading in self.headings if heading['level'] == 1), None)
+    
+    @property
+    def heading_tree(self) -> List[Dict[str, Any]]:
+        """Headings nested by level; each node has a ``children`` list."""
+        if self._heading_tree is None:
+            roots = []
+            stack = []
+            for heading in self.headings:
+                node = dict(heading, children=[])
+                while stack and stack[-1]['level'] >= node['level']:
+                    stack.pop()
+                if stack:
+                    stack[-1]['children'].append(node)
+                else:
+                    roots.append(node)
+                stack.append(node)
+            self._heading_tree = roots
+        return self._heading_tree
+    
+    @property
+    def h2_sections(self) -> List[Dict[str, Any]]:
+        """H2 sections with heading, body content and 1-based line range."""
+        if self._h2_sections is None:
+            self._h2_sections = extract_h2_sections(self.lines, self.content, self.line_offsets)
+        return self._h2_sections
+
+
+# Start of an H1 or H2 heading line (matched against the stripped line)
+SECTION_BREAK_PATTERN = re.compile(r'(#{1,2})\s')
+
+
+def _section_break_level(line: str) -> int:
+    """Return 1 or 2 for H1/H2 heading lines that end a section, otherwise 0."""
+    match = SECTION_BREAK_PATTERN.match(line.strip())
+    return len(match.group(1)) if match else 0
+
+
+def _make_section(heading_line: str, start_index: int, end_index: int, content: str) -> Dict[str, Any]:
+    """Build a section dictionary from a heading line and its 0-based line range."""
+    return {
+        'heading': heading_line.strip()[2:].strip(),
+        'line': start_index + 1,
+        'content': content.strip(),
+        'start_line': start_index + 1,
+        'end_line': end_index
+    }
+
+
+def extract_h2_sections(lines: List[str], content: Optional[str] = None,
+                        line_offsets: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+    """
+    Extract all H2 sections from markdown lines in a single pass.
+    
+    A section runs from its H2 heading to the next H1 or H2 heading, or to
+    the end of the document. Heading positions are recorded in one scan; when
+    the full content and line offsets are given, section bodies are sliced
+    from the content instead of re-joining lines.
+    
+    Args:
+        lines: Markdown content split on newlines
+        content: The unsplit markdown content (optional)
+        line_offsets: Start offset of each line in ``content`` (optional)
+        
+    Returns:
+        List of section dictionaries with heading, content, and line numbers
+    """
+    # Record every H1/H2 heading once; H2 headings open sections
+    breaks = [(i, _section_break_level(line)) for i, line in enumerate(lines)]
+    breaks = [(i, level) for i, level in breaks if level]
+    
+    sections = []
+    for position, (start_index, level) in enumerate(breaks):
+        if level != 2:
+            continue
+        
+        # The section ends at the next H1 or H2 heading, or end of file
+        end_index = breaks[position + 1][0] if position + 1 < len(breaks) else len(lines)
+        
+        # Extract section content (excluding the heading line)
+        if start_index + 1 >= end_index:
+            section_content = ''
+        elif content is not None and line_offsets is not None:
+            body_end = line_offsets[end_index] - 1 if end_index < len(lines) else len(content)
+            section_content = content[line_offsets[start_index + 1]:body_end]
+        else:
+            section_content = '\n'.join(lines[start_index + 1:end_index])
+        
+        sections.append(_make_section(lines[start_index], start_index, end_index, section_content))
+    
+    return sections
+
+
+def _read_lines(file_path: Path) -> Iterator[str]:
+    """
+    Yield the lines of a file without newlines, like ``content.split('\\n')``.
+    
+    Args:
+        file_path: Path to the text file
+        
+    Yields:
+        Lines of the file, including a final empty line after a trailing newline
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        line = ''
+        for line in f:
+            yield line[:-1] if line.endswith('\n') else line
+        if not line or line.endswith('\n'):
+            yield ''
+
+
+def stream_h2_sections(file_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the H2 sections of a markdown file while reading it line by line.
+    
+    Only the lines of the current section are held in memory, so very large
+    files can be processed without reading and splitting the whole text.
+    Sections are identical to ``extract_h2_sections`` on the full content.
+    
+    Args:
+        file_path: Path to the markdown file
+        
+    Yields:
+        Section dictionaries with heading, content, and line numbers
+        
+    Raises:
+        OSError: If the file cannot be read
+    """
+    heading_line = None
+    start_index = 0
+    body = []
+    index = -1
+    
+    for index, line in enumerate(_read_lines(file_path)):
+        level = _section_break_level(line)
+        if level:
+            if heading_line is not None:
+                yield _make_section(heading_line, start_index, index, '\n'.join(body))
+            heading_line = line if level == 2 else None
+            start_index = index
+            body = []
+        elif heading_line is not None:
+            body.append(line)
+    
+    if heading_line is not None:
+        yield _make_section(heading_line, start_index, index + 1, '\n'.join(body))
+
+
+# Corpora loaded by DocumentCorpus.load_cached, with the directory signature
+# they were loaded at
+_CORPUS_CACHE = {}
+
+
+def directory_signature(directory: Path, recursive: bool = True) -> Optional[tuple]:
+    """
+    Modification times of a directory and its subdirectories.
+    
+    A directory's mtime changes when a file in it is added, removed or
+    renamed, which includes editors that save through a temporary file.
+    Files rewritten in place do not change it.
+    
+    Args:
+        directory: Directory to check
+        recursive: Whether to include subdirectories
+        
+    Returns:
+        Sorted ``(path, mtime_ns)`` tuples, or None if the directory does not exist
+    """
+    try:
+        signature = [(str(directory), os.stat(directory).st_mtime_ns)]
+    except OSError:
+        return None
+    
+    pending = [directory] if recursive else []
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    signature.append((entry.path, entry.stat().st_mtime_ns))
+                    pending.append(entry.path)
+    return tuple(sorted(signature))
+
+
+class DocumentCorpus:
+    """All markdown files of a documentation directory, parsed once per run."""
+    
+    def __init__(self, directory: Path, documents: List[ParsedDocument], recursive: bool = True):
+        self.directory = directory
+        self.documents = documents
+        self.recursive = recursive
+        self._by_path = {document.path: document for document in documents}
+    
+    @classmethod
+    def load(cls, directory: Path, recursive: bool = True) -> 'DocumentCorpus':
+        """
+        Read every markdown file under a directory.
+        
+        Args:
+            directory: Documentation directory
+            recursive: Whether to search subdirectories
+            
+        Returns:
+            DocumentCorpus containing one ParsedDocument per file
+        """
+        pattern = '**/*.md' if recursive else '*.md'
+        documents = [
+            ParsedDocument.from_file(file_path)
+            for file_path in directory.glob(pattern)
+            if file_path.is_file()
+        ]
+        return cls(directory, documents, recursive=recursive)
+    
+    @classmethod
+    def load_cached(cls, directory: Path, recursive: bool = True) -> 'DocumentCorpus':
+        """
+        Return the process-wide corpus of a directory, loading it on first use.
+        
+        The corpus is reloaded when the ``directory_signature`` changes.
+        Callers share the returned corpus and must not ``update`` it.
+        
+        Args:
+            directory: Documentation directory
+            recursive: Whether to search subdirectories
+            
+        Returns:
+            DocumentCorpus (empty if the directory does not exist)
+        """
+        key = (os.path.abspath(directory), str(directory), recursive)
+        signature = directory_signature(directory, recursive)
+        cached = _CORPUS_CACHE.get(key)
+        if cached is not None and signature is not None and cached[0] == signature:
+            return cached[1]
+        
+        corpus = cls.load(directory, recursive) if signature is not None else cls(directory, [], recursive)
+        _CORPUS_CACHE[key] = (signature, corpus)
+        return corpus
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all corpora loaded by ``load_cached``."""
+        _CORPUS_CACHE.clear()
+    
+    @classmethod
+    def from_file(cls, file_path: Path) -> 'DocumentCorpus':
+        """
+        Build a single-document corpus, used for validating one file.
+        
+        Args:
+            file_path: Path to the markdown file
+            
+        Returns:
+            DocumentCorpus rooted at the file's parent directory
+        """
+        return cls(file_path.parent, [ParsedDocument.from_file(file_path)], recursive=False)
+    
+    def __iter__(self) -> Iterator[ParsedDocument]:
+        return iter(self.documents)
+    
+    def __len__(self) -> int:
+        return len(self.documents)
+    
+    def get(self, file_path: Path) -> Optional[ParsedDocument]:
+        """Return the parsed document for a path, or None if not in the corpus."""
+        return self._by_path.get(file_path)
+    
+    def update(self, file_paths: Iterable[Path]) -> List[Path]:
+        """
+        Re-read changed files in place, keeping every other parsed document.
+        
+        The directory is listed again so added and removed files are picked
+        up; only the given paths and new files are read from disk.
+        
+        Args:
+            file_paths: Paths reported as changed (may include removed files)
+            
+        Returns:
+            Paths of documents that were added, removed or whose content changed
+        """
+        changed_paths = set(file_paths)
+        pattern = '**/*.md' if self.recursive else '*.md'
+        current_paths = [file_path for file_path in self.directory.glob(pattern) if file_path.is_file()]
+        
+        documents = []
+        updated = []
+        for file_path in current_paths:
+            document = self._by_path.get(file_path)
+            if document is None or file_path in changed_paths:
+                reloaded = ParsedDocument.from_file(file_path)
+                if document is None or reloaded.content != document.content or reloaded.error != document.error:
+                    updated.append(file_path)
+                    document = reloaded
+            documents.append(document)
+        
+        current = set(current_paths)
+        updated.extend(file_path for file_path in self._by_path if file_path not in current)
+        
+        self.documents = documents
+        self._by_path = {document.path: document for document in documents}
+        return updated
+    
+    @property
+    def paths(self) -> List[Path]:
+        """Paths of all documents in load order."""
+        return [document.path for document in self.documents]
+
+
+__all__ = [
+    'ParsedDocument',
+    'DocumentCorpus',
+    'directory_signature',
+    'extract_h2_sections',
+    'stream_h2_sections'
+]
@@ -3,7 +3,7 @@
 Token Counter for Denmark Living Documentation System
 
 This script counts tokens in H2 sections of markdown files and:
-- Counts tokens in each H2 section
+- Counts tokens in each H2 section (tiktoken, batched across the corpus)
 - Flags sections exceeding 1000 tokens
 - Generates report of violations
 
@@ -14,15 +14,25 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Callable
 import argparse
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument, extract_h2_sections
+from validation_cache import ValidatorCache
+from tokenizer import DEFAULT_ENCODING, SUPPORTED_ENCODINGS, get_tokenizer
+
 
 class TokenCounter:
     """Counts tokens in markdown sections for RAG optimization."""
     
-    def __init__(self, token_limit: int = 1000):
+    def __init__(self, token_limit: int = 1000, encoding: str = DEFAULT_ENCODING):
         self.token_limit = token_limit
+        self.tokenizer = get_tokenizer(encoding)
+        
+        # Section token counts encoded ahead of time by count_corpus_tokens
+        self._section_counts = {}
     
     def count_file_tokens(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -34,6 +44,19 @@ class TokenCounter:
         Returns:
             Dictionary containing token count results
         """
+        return self.count_document_tokens(ParsedDocument.from_file(file_path))
+    
+    def count_document_tokens(self, document: ParsedDocument) -> Dict[str, Any]:
+        """
+        Count tokens in all H2 sections of an already parsed document.
+        
+        Args:
+            document: Parsed document from the shared corpus
+            
+        Returns:
+            Dictionary containing token count results
+        """
+        file_path = document.path
         result = {
             'file': str(file_path),
             'sections': [],
@@ -45,20 +68,20 @@ class TokenCounter:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document.read()
             
-            # Extract H2 sections
-            sections = self._extract_h2_sections(content)
+            # Copy the shared H2 sections, token counts are added per validator
+            sections = [dict(section) for section in document.h2_sections]
             result['sections'] = sections
             result['total_sections'] = len(sections)
             
-            # Count tokens and check violations
-            token_counts = []
-            for section in sections:
-                token_count = self._count_tokens(section['content'])
+            # Count tokens (batch-encoded for the corpus if available) and check violations
+            token_counts = self._section_counts.pop(file_path, None)
+            if token_counts is None:
+                token_counts = self.tokenizer.count_batch(section['content'] for section in sections)
+            
+            for section, token_count in zip(sections, token_counts):
                 section['token_count'] = token_count
-                token_counts.append(token_count)
                 
                 if token_count > self.token_limit:
                     result['violations'].append({
@@ -79,6 +102,24 @@ class TokenCounter:
         
         return result
     
+    def _count_cacheable_tokens(self, document: ParsedDocument) -> Dict[str, Any]:
+        """
+        Count tokens in a document for the validation cache.
+        
+        Args:
+            document: Parsed document from the shared corpus
+            
+        Returns:
+            Token count results without section content, which repeats the
+            document text
+        """
+        result = self.count_document_tokens(document)
+        result['sections'] = [
+            {key: value for key, value in section.items() if key != 'content'}
+            for section in result['sections']
+        ]
+        return result
+    
     def _extract_h2_sections(self, content: str) -> List[Dict[str, Any]]:
         """
         Extract all H2 sections from markdown content.
@@ -89,114 +130,39 @@ class TokenCounter:
         Returns:
             List of section dictionaries with heading, content, and line number
         """
-        sections = []
-        lines = content.split('\n')
-        
-        # Find all H2 headings
-        h2_positions = []
-        for i, line in enumerate(lines):
-            if re.match(r'^##\s+', line.strip()):
-                h2_positions.append({
-                    'line': i + 1,
-                    'heading': line.strip()[2:].strip(),
-                    'start_index': i
-                })
-        
-        # Extract content for each H2 section
-        for i, h2_pos in enumerate(h2_positions):
-            start_line = h2_pos['start_index']
-            
-            # Find the end of this section (next H1 or H2, or end of file)
-            end_line = len(lines)
-            for j in range(start_line + 1, len(lines)):
-                if re.match(r'^#{1,2}\s+', lines[j].strip()):
-                    end_line = j
-                    break
-            
-            # Extract section content (excluding the heading line)
-            section_lines = lines[start_line + 1:end_line]
-            section_content = '\n'.join(section_lines).strip()
-            
-            sections.append({
-                'heading': h2_pos['heading'],
-                'line': h2_pos['line'],
-                'content': section_content,
-                'start_line': start_line + 1,
-                'end_line': end_line
-            })
-        
-        return sections
+        return extract_h2_sections(content.split('\n'))
     
     def _count_tokens(self, text: str) -> int:
         """
-        Count tokens in text using a simple approximation.
-        
-        This uses a rough approximation where:
-        - 1 token ≈ 4 characters for English text
-        - Adjusts for markdown formatting
+        Count tokens in text with the configured tokenizer.
         
         Args:
             text: Text to count tokens for
             
         Returns:
-            Approximate token count
+            Token count (exact with tiktoken, approximate otherwise)
         """
-        if not text:
-            return 0
-        
-        # Remove markdown formatting for more accurate count
-        clean_text = self._clean_markdown(text)
-        
-        # Simple token approximation: ~4 characters per token for English
-        # This is a rough estimate based on OpenAI's tokenization
-        char_count = len(clean_text)
-        token_estimate = char_count / 4
-        
-        # Adjust for word boundaries (more accurate for natural language)
-        words = len(clean_text.split())
-        word_based_estimate = words * 1.3  # Average ~1.3 tokens per word
-        
-        # Use the average of both methods for better accuracy
-        final_estimate = (token_estimate + word_based_estimate) / 2
-        
-        return int(round(final_estimate))
+        return self.tokenizer.count(text)
     
-    def _clean_markdown(self, text: str) -> str:
+    def _count_sections(self, documents: List[ParsedDocument]) -> Dict[Path, List[int]]:
         """
-        Remove markdown formatting to get clean text for token counting.
+        Count tokens in the H2 sections of many documents with one batched encode.
         
         Args:
-            text: Markdown text
+            documents: Documents whose sections should be counted
             
         Returns:
-            Clean text without markdown formatting
+            Dictionary mapping each document path to its section token counts
         """
-        # Remove markdown links but keep the text
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
-        
-        # Remove markdown emphasis
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Italic
-        text = re.sub(r'`([^`]+)`', r'\1', text)        # Inline code
-        
-        # Remove markdown headings (H3-H6 within sections)
-        text = re.sub(r'^#{3,6}\s+', '', text, flags=re.MULTILINE)
-        
-        # Remove list markers
-        text = re.sub(r'^\s*[-*+]\s+', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^\s*\d+\.\s+', '', text, flags=re.MULTILINE)
+        texts = []
+        spans = []
+        for document in documents:
+            start = len(texts)
+            texts.extend(section['content'] for section in document.h2_sections)
+            spans.append((document.path, start, len(texts)))
         
-        # Remove blockquote markers
-        text = re.sub(r'^\s*>\s*', '', text, flags=re.MULTILINE)
-        
-        # Remove horizontal rules
-        text = re.sub(r'^---+$', '', text, flags=re.MULTILINE)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = text.strip()
-        
-        return text
+        counts = self.tokenizer.count_batch(texts)
+        return {path: counts[start:end] for path, start, end in spans}
     
     def count_directory_tokens(self, directory: Path, recursive: bool = True) -> Dict[str, Any]:
         """
@@ -206,11 +172,27 @@ class TokenCounter:
             directory: Directory to process
             recursive: Whether to search subdirectories
             
+        Returns:
+            Dictionary containing results for all files
+        """
+        return self.count_corpus_tokens(DocumentCorpus.load(directory, recursive=recursive))
+    
+    def count_corpus_tokens(self, corpus: DocumentCorpus, cache: Optional[ValidatorCache] = None,
+                            sink: Optional[Callable[[Dict], None]] = None) -> Dict[str, Any]:
+        """
+        Count tokens in all documents of an already loaded corpus.
+        
+        Args:
+            corpus: Shared document corpus
+            cache: Optional cache of per-file results from earlier runs
+            sink: Optional callable receiving each file result as it is produced,
+                instead of collecting them in ``files``
+            
         Returns:
             Dictionary containing results for all files
         """
         results = {
-            'directory': str(directory),
+            'directory': str(corpus.directory),
             'files': [],
             'summary': {
                 'total_files': 0,
@@ -219,32 +201,48 @@ class TokenCounter:
                 'files_with_violations': 0,
                 'max_tokens_overall': 0,
                 'avg_tokens_overall': 0,
-                'token_limit': self.token_limit
+                'token_limit': self.token_limit,
+                'tokenizer': self.tokenizer.name
             }
         }
         
-        # Find all markdown files
-        pattern = '**/*.md' if recursive else '*.md'
-        markdown_files = list(directory.glob(pattern))
-        
         all_token_counts = []
         
-        for file_path in markdown_files:
-            if file_path.is_file():
-                file_result = self.count_file_tokens(file_path)
+        # Encode the sections of all documents that are not cached in one batch
+        pending = [
+            document for document in corpus
+            if document.content is not None and (cache is None or not cache.contains(document))
+        ]
+        self._section_counts = self._count_sections(pending)
+        
+        for document in corpus:
+            if cache is not None:
+                # Section content is restored from the document, not kept in the cache
+                file_result = cache.lookup(document, self._count_cacheable_tokens)
+                file_result = dict(file_result, sections=[
+                    dict(h2_section, **section)
+                    for section, h2_section in zip(file_result['sections'], document.h2_sections)
+                ])
+            else:
+                file_result = self.count_document_tokens(document)
+            if sink is not None:
+                sink(file_result)
+            else:
                 results['files'].append(file_result)
-                
-                results['summary']['total_files'] += 1
-                results['summary']['total_sections'] += file_result['total_sections']
-                results['summary']['sections_over_limit'] += file_result['sections_over_limit']
-                
-                if file_result['sections_over_limit'] > 0:
-                    results['summary']['files_with_violations'] += 1
-                
-                # Collect token counts for overall statistics
-                for section in file_result['sections']:
-                    if 'token_count' in section:
-                        all_token_counts.append(section['token_count'])
+            
+            results['summary']['total_files'] += 1
+            results['summary']['total_sections'] += file_result['total_sections']
+            results['summary']['sections_over_limit'] += file_result['sections_over_limit']
+            
+            if file_result['sections_over_limit'] > 0:
+                results['summary']['files_with_violations'] += 1
+            
+            # Collect token counts for overall statistics
+            for section in file_result['sections']:
+                if 'token_count' in section:
+                    all_token_counts.append(section['token_count'])
+        
+        self._section_counts = {}
         
         # Calculate overall statistics
         if all_token_counts:
@@ -268,6 +266,8 @@ def print_results(results: Dict[str, Any], verbose: bool = False, show_all_secti
     print(f"\n=== Token Count Results ===")
     print(f"Directory: {results['directory']}")
     print(f"Token limit: {summary['token_limit']}")
+    if 'tokenizer' in summary:
+        print(f"Tokenizer: {summary['tokenizer']}")
     print(f"Total files: {summary['total_files']}")
     print(f"Total sections: {summary['total_sections']}")
     print(f"Sections over limit: {summary['sections_over_limit']}")
@@ -316,11 +316,14 @@ def main():
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed output')
     parser.add_argument('--show-all', '-a', action='store_true', help='Show all sections, not just violations')
     parser.add_argument('--no-recursive', action='store_true', help='Do not search subdirectories')
+    parser.add_argument('--encoding', '-e', default=DEFAULT_ENCODING,
+                        choices=list(SUPPORTED_ENCODINGS) + ['heuristic'],
+                        help=f'Tokenizer encoding (default: {DEFAULT_ENCODING})')
     
     args = parser.parse_args()
     
     path = Path(args.path)
-    counter = TokenCounter(token_limit=args.limit)
+    counter = TokenCounter(token_limit=args.limit, encoding=args.encoding)
     
     if not path.exists():
         print(f"Error: Path '{path}' does not exist")
@@ -339,7 +342,8 @@ def main():
                 'files_with_violations': 1 if result['sections_over_limit'] > 0 else 0,
                 'max_tokens_overall': result['max_tokens'],
                 'avg_tokens_overall': result['avg_tokens'],
-                'token_limit': args.limit
+                'token_limit': args.limit,
+                'tokenizer': counter.tokenizer.name
             }
         }
     else:
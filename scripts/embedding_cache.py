@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Embedding Cache for Denmark Living Documentation System
+
+This script embeds the chunks of the chunk manifest and keeps the vectors,
+so re-indexing after a small docs edit only embeds the chunks that changed:
+- Vectors are cached by chunk content hash in a memory-mapped float32
+  matrix (``vectors.f32``) with an ID table (``ids.json``) giving the hash
+  of each row
+- Missing chunks are sent to the provider in batches, bounded by number of
+  texts and total tokens
+- ``OpenAIProvider`` calls text-embedding-3-small, like lib/embeddings.ts;
+  ``HashingProvider`` is a deterministic local stand-in (a hashing
+  vectorizer) for offline runs and tests
+- The cache belongs to one provider, model and dimension and starts empty
+  when any of them changes
+
+numpy is optional: with it ``matrix()`` returns a ``numpy.memmap``, without
+it rows are read from an ``mmap`` through a float32 ``memoryview``.
+
+Usage:
+    python scripts/embedding_cache.py docs/denmark-living --provider hashing
+    python scripts/embedding_cache.py docs/denmark-living --provider openai --prune
+
+Requirements: 1.4
+"""
+
+import os
+import sys
+import json
+import math
+import mmap
+import hashlib
+import argparse
+import urllib.error
+import urllib.request
+from abc import ABC, abstractmethod
+from array import array
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from chunk_manifest import ChunkManifest, chunk_text
+from search_index import tokenize
+
+
+# Cache directory, relative to the working directory
+DEFAULT_CACHE_DIRECTORY = Path('.embedding_cache')
+CACHE_FORMAT_VERSION = 1
+VECTORS_FILE = 'vectors.f32'
+IDS_FILE = 'ids.json'
+
+FLOAT_SIZE = 4
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_TOKENS = 100_000
+
+# Model and vector size used by lib/embeddings.ts and the Supabase schema
+OPENAI_MODEL = 'text-embedding-3-small'
+OPENAI_DIMENSION = 1536
+OPENAI_EMBEDDINGS_URL = 'https://api.openai.com/v1/embeddings'
+
+HASHING_DIMENSION = 256
+
+
+class EmbeddingProvider(ABC):
+    """Interface for embedding providers; subclasses implement ``embed_batch``."""
+    
+    name = 'provider'
+    model = ''
+    dimension = 0
+    
+    @property
+    def key(self) -> str:
+        """Identity of the vectors this provider produces, stored with the cache."""
+        return f"{self.name}:{self.model}:{self.dimension}"
+    
+    @abstractmethod
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several texts in one request.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One vector of ``dimension`` floats per text, in order
+        """
+
+
+class HashingProvider(EmbeddingProvider):
+    """
+    Deterministic local embeddings from hashed words and word pairs.
+    
+    Each term is hashed to a dimension and a sign, weighted by
+    ``1 + log(count)`` and the vector is L2-normalized. Texts sharing terms
+    get similar vectors, which is enough to exercise the pipeline offline.
+    """
+    
+    name = 'hashing'
+    model = 'words+bigrams'
+    
+    def __init__(self, dimension: int = HASHING_DIMENSION):
+        self.dimension = dimension
+    
+    def _slot(self, term: str) -> Tuple[int, float]:
+        """Dimension and sign of a term (stable across processes)."""
+        digest = hashlib.blake2b(term.encode('utf-8'), digest_size=8).digest()
+        value = int.from_bytes(digest, 'little')
+        return value % self.dimension, 1.0 if value >> 63 else -1.0
+    
+    def embed(self, text: str) -> List[float]:
+        """
+        Embed one text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Unit-length vector (all zeros for text without terms)
+        """
+        words = tokenize(text)
+        counts = {}
+        for term in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+            counts[term] = counts.get(term, 0) + 1
+        
+        vector = [0.0] * self.dimension
+        for term, count in counts.items():
+            slot, sign = self._slot(term)
+            vector[slot] += sign * (1.0 + math.log(count))
+        
+        norm = math.sqrt(sum(value * value for value in vector))
+        return [value / norm for value in vector] if norm else vector
+    
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed(text) for text in texts]
+
+
+class OpenAIProvider(EmbeddingProvider):
+    """Embeddings from the OpenAI API, with the model used by lib/embeddings.ts."""
+    
+    name = 'openai'
+    
+    def __init__(self, api_key: Optional[str] = None, model: str = OPENAI_MODEL,
+                 dimension: int = OPENAI_DIMENSION, timeout: float = 60.0):
+        self.api_key = api_key or os.environ.get('OPENAI_API_KEY')
+        if not self.api_key:
+            raise ValueError("OPENAI_API_KEY is not set")
+        self.model = model
+        self.dimension = dimension
+        self.timeout = timeout
+    
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        body = json.dumps({'model': self.model, 'input': texts, 'dimensions': self.dimension}).encode('utf-8')
+        request = urllib.request.Request(
+            OPENAI_EMBEDDINGS_URL,
+            data=body,
+            method='POST',
+            headers={'Authorization': f"Bearer {self.api_key}", 'Content-Type': 'application/json'}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data = json.load(response)
+        except urllib.error.HTTPError as e:
+            raise RuntimeError(f"Embedding request failed: HTTP {e.code} {e.reason}") from e
+        except urllib.error.URLError as e:
+            raise RuntimeError(f"Embedding request failed: {e.reason}") from e
+        
+        items = sorted(data['data'], key=lambda item: item['index'])
+        return [item['embedding'] for item in items]
+
+
+PROVIDERS = {
+    'hashing': HashingProvider,
+    'openai': OpenAIProvider
+}
+
+
+class EmbeddingCache:
+    """Vectors keyed by chunk content hash, stored as a float32 matrix on disk."""
+    
+    def __init__(self, directory: Path, provider_key: str, dimension: int):
+        self.directory = directory
+        self.provider_key = provider_key
+        self.dimension = dimension
+        self.row_bytes = dimension * FLOAT_SIZE
+        
+        self.ids = []
+        self._rows = {}
+        self._map = None
+        self._view = None
+        # Set when the vectors file does not belong to the ID table
+        self._discard_file = True
+        self._load()
+    
+    @property
+    def vectors_file(self) -> Path:
+        return self.directory / VECTORS_FILE
+    
+    @property
+    def ids_file(self) -> Path:
+        return self.directory / IDS_FILE
+    
+    def _load(self) -> None:
+        """Read the ID table, discarding a cache for another provider or a damaged one."""
+        try:
+            with open(self.ids_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            size = self.vectors_file.stat().st_size
+        except (OSError, ValueError):
+            return
+        
+        if (data.get('format_version') != CACHE_FORMAT_VERSION
+                or data.get('provider') != self.provider_key
+                or data.get('dimension') != self.dimension
+                or data.get('byteorder') != sys.byteorder):
+            return
+        
+        ids = data.get('ids', [])
+        if size < len(ids) * self.row_bytes:
+            return
+        
+        # Rows appended after the last saved ID table are dropped
+        if size > len(ids) * self.row_bytes:
+            os.truncate(self.vectors_file, len(ids) * self.row_bytes)
+        
+        self.ids = ids
+        self._rows = {key: row for row, key in enumerate(ids)}
+        self._discard_file = False
+    
+    def _close_map(self) -> None:
+        """Release the memory map so the vectors file can change."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+    
+    def _floats(self) -> memoryview:
+        """Float32 view of the memory-mapped vectors file."""
+        if self._view is None:
+            with open(self.vectors_file, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map).cast('f')
+        return self._view
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+    
+    def row(self, key: str) -> Optional[int]:
+        """Return the matrix row of a content hash, or None."""
+        return self._rows.get(key)
+    
+    def get(self, key: str) -> Optional[List[float]]:
+        """
+        Read the vector of a content hash.
+        
+        Args:
+            key: Chunk content hash
+            
+        Returns:
+            Vector as a list of floats, or None if not cached
+        """
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        start = row * self.dimension
+        return self._floats()[start:start + self.dimension].tolist()
+    
+    def matrix(self):
+        """
+        All cached vectors as a read-only ``len(self) x dimension`` matrix.
+        
+        Returns:
+            ``numpy.memmap`` when numpy is installed, otherwise a flat float32
+            ``memoryview`` (row ``i`` starts at ``i * dimension``); None when
+            the cache is empty
+        """
+        if not self.ids:
+            return None
+        if NUMPY_AVAILABLE:
+            return np.memmap(self.vectors_file, dtype=np.float32, mode='r',
+                             shape=(len(self.ids), self.dimension))
+        return self._floats()
+    
+    def put_many(self, items: Iterable[Tuple[str, List[float]]]) -> int:
+        """
+        Append vectors to the matrix.
+        
+        The ID table is only written by ``save``, so an interrupted run
+        leaves the previous cache intact.
+        
+        Args:
+            items: ``(content hash, vector)`` pairs
+            
+        Returns:
+            Number of vectors added
+        """
+        added = 0
+        self._close_map()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        mode = 'wb' if self._discard_file else 'ab'
+        self._discard_file = False
+        with open(self.vectors_file, mode) as f:
+            for key, vector in items:
+                if key in self._rows:
+                    continue
+                if len(vector) != self.dimension:
+                    raise ValueError(f"Expected {self.dimension} dimensions, got {len(vector)}")
+                f.write(array('f', vector).tobytes())
+                self._rows[key] = len(self.ids)
+                self.ids.append(key)
+                added += 1
+        return added
+    
+    def save(self) -> None:
+        """Write the ID table atomically."""
+        data = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'provider': self.provider_key,
+            'dimension': self.dimension,
+            'byteorder': sys.byteorder,
+            'ids': self.ids
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp_file = self.ids_file.with_name(IDS_FILE + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_file, self.ids_file)
+    
+    def prune(self, keep: Iterable[str]) -> int:
+        """
+        Rewrite the matrix with only the given content hashes.
+        
+        Args:
+            keep: Content hashes still in use
+            
+        Returns:
+            Number of vectors removed
+        """
+        keep = set(keep)
+        kept = [key for key in self.ids if key in keep]
+        removed = len(self.ids) - len(kept)
+        if not removed:
+            return 0
+        
+        floats = self._floats()
+        temp_file = self.vectors_file.with_name(VECTORS_FILE + '.tmp')
+        with open(temp_file, 'wb') as f:
+            for key in kept:
+                start = self._rows[key] * self.dimension
+                f.write(floats[start:start + self.dimension].tobytes())
+        
+        self._close_map()
+        os.replace(temp_file, self.vectors_file)
+        self.ids = kept
+        self._rows = {key: row for row, key in enumerate(kept)}
+        self.save()
+        return removed
+    
+    def close(self) -> None:
+        """Release the memory map."""
+        self._close_map()
+
+
+def batches(chunks: List[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE,
+            batch_tokens: int = DEFAULT_BATCH_TOKENS) -> Iterable[List[Dict[str, Any]]]:
+    """
+    Group chunks into provider requests.
+    
+    Args:
+        chunks: Chunks with ``'token_count'``
+        batch_size: Maximum texts per request
+        batch_tokens: Maximum total tokens per request (a larger chunk gets
+            a request of its own)
+            
+    Yields:
+        Lists of chunks
+    """
+    batch = []
+    tokens = 0
+    for chunk in chunks:
+        if batch and (len(batch) >= batch_size or tokens + chunk['token_count'] > batch_tokens):
+            yield batch
+            batch = []
+            tokens = 0
+        batch.append(chunk)
+        tokens += chunk['token_count']
+    if batch:
+        yield batch
+
+
+def embed_chunks(chunks: Iterable[Dict[str, Any]], provider: EmbeddingProvider, cache: EmbeddingCache,
+                 batch_size: int = DEFAULT_BATCH_SIZE, batch_tokens: int = DEFAULT_BATCH_TOKENS) -> Dict[str, Any]:
+    """
+    Make sure every chunk has a cached embedding, embedding only missing ones.
+    
+    Args:
+        chunks: Chunks from ``ChunkManifest.build`` (with content)
+        provider: Embedding provider
+        cache: Embedding cache of the provider
+        batch_size: Maximum texts per provider request
+        batch_tokens: Maximum total tokens per provider request
+        
+    Returns:
+        Statistics: chunks, cached, embedded, batches and tokens embedded
+    """
+    chunks = list(chunks)
+    missing = {}
+    for chunk in chunks:
+        if chunk['content_hash'] not in cache and chunk['content_hash'] not in missing:
+            missing[chunk['content_hash']] = chunk
+    
+    stats = {
+        'chunks': len(chunks),
+        'cached': len(chunks) - sum(1 for chunk in chunks if chunk['content_hash'] in missing),
+        'embedded': len(missing),
+        'batches': 0,
+        'tokens': sum(chunk['token_count'] for chunk in missing.values())
+    }
+    
+    try:
+        for batch in batches(list(missing.values()), batch_size, batch_tokens):
+            vectors = provider.embed_batch([chunk_text(chunk) for chunk in batch])
+            cache.put_many(zip((chunk['content_hash'] for chunk in batch), vectors))
+            stats['batches'] += 1
+    finally:
+        # Keep what was embedded before a failed request
+        cache.save()
+    
+    return stats
+
+
+def main():
+    """Main function to embed the documentation chunks."""
+    parser = argparse.ArgumentParser(description='Embed documentation chunks, reusing cached embeddings')
+    parser.add_argument('path', help='Documentation directory')
+    parser.add_argument('--provider', '-p', choices=sorted(PROVIDERS), default='hashing',
+                        help='Embedding provider (default: hashing, offline)')
+    parser.add_argument('--cache', '-c', default=str(DEFAULT_CACHE_DIRECTORY),
+                        help=f'Cache directory (default: {DEFAULT_CACHE_DIRECTORY})')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Maximum texts per request (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--batch-tokens', type=int, default=DEFAULT_BATCH_TOKENS,
+                        help=f'Maximum tokens per request (default: {DEFAULT_BATCH_TOKENS})')
+    parser.add_argument('--prune', action='store_true', help='Drop cached vectors of chunks no longer in the docs')
+    
+    args = parser.parse_args()
+    
+    directory = Path(args.path)
+    if not directory.is_dir():
+        print(f"Error: Directory '{directory}' does not exist")
+        sys.exit(1)
+    
+    try:
+        provider = PROVIDERS[args.provider]()
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    manifest = ChunkManifest.build(DocumentCorpus.load(directory))
+    cache = EmbeddingCache(Path(args.cache), provider.key, provider.dimension)
+    
+    try:
+        stats = embed_chunks(manifest, provider, cache, batch_size=args.batch_size, batch_tokens=args.batch_tokens)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    print(f"Chunks: {stats['chunks']} ({stats['cached']} cached, {stats['embedded']} embedded "
+          f"in {stats['batches']} batches, {stats['tokens']:,} tokens)")
+    
+    if args.prune:
+        removed = cache.prune(chunk['content_hash'] for chunk in manifest)
+        print(f"Pruned {removed} unused vectors")
+    
+    print(f"Cache: {len(cache)} vectors of {provider.dimension} dimensions in {args.cache} ({provider.key})")
+    cache.close()
+
+
+if __name__ == '__main__':
+    main()
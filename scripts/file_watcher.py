@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+File Watcher for Denmark Living Documentation System
+
+This module reports changed markdown files under the documentation tree for
+the validation runner's watch mode:
+- On Linux, changes are delivered by inotify (through libc, no extra
+  dependencies) as soon as a file is saved
+- Elsewhere, or if inotify cannot be used, the tree is polled and files are
+  compared by modification time and size
+- Bursts of events from a single save (temporary files, renames) are merged
+  into one batch of changed paths
+
+Requirements: All (Validation infrastructure)
+"""
+
+import os
+import sys
+import time
+import struct
+import select
+import ctypes
+import ctypes.util
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    INOTIFY_AVAILABLE = sys.platform.startswith('linux') and hasattr(_libc, 'inotify_init1')
+except OSError:
+    _libc = None
+    INOTIFY_AVAILABLE = False
+
+
+# inotify flags (see inotify(7))
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# struct inotify_event header: wd, mask, cookie, len
+EVENT_HEADER = struct.Struct('iIII')
+
+# Time to wait for further events of the same save before reporting a batch
+DEBOUNCE_SECONDS = 0.05
+
+
+class InotifyWatcher:
+    """Watches a directory tree for markdown changes with inotify."""
+    
+    name = 'inotify'
+    
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._watches = {}
+        
+        self._fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        
+        self._add_tree(directory)
+    
+    def _add_tree(self, directory: Path) -> None:
+        """
+        Watch a directory and all of its subdirectories.
+        
+        Args:
+            directory: Directory to watch
+        """
+        for path in [directory] + [path for path in directory.rglob('*') if path.is_dir()]:
+            wd = _libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+            if wd >= 0:
+                self._watches[wd] = path
+    
+    def _read_events(self) -> Set[Path]:
+        """
+        Read all pending events.
+        
+        Returns:
+            Changed markdown files and added or removed directories
+        """
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped; report every file so nothing is missed
+                changed.update(self.directory.rglob('*.md'))
+                continue
+            
+            parent = self._watches.get(wd)
+            if parent is None or not name:
+                continue
+            path = parent / os.fsdecode(name)
+            
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_tree(path)
+                    changed.update(path.rglob('*.md'))
+                changed.add(path)
+            elif path.suffix == '.md' and not mask & IN_CREATE:
+                # New files are reported by IN_CLOSE_WRITE once written
+                changed.add(path)
+        
+        return changed
+    
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Block until files change.
+        
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            Changed paths (empty if the timeout expired)
+        """
+        changed = set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        while not changed:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not select.select([self._fd], [], [], remaining)[0]:
+                return changed
+            changed = self._read_events()
+        
+        # Collect the rest of the same save
+        while select.select([self._fd], [], [], DEBOUNCE_SECONDS)[0]:
+            changed |= self._read_events()
+        
+        return changed
+    
+    def close(self) -> None:
+        """Stop watching and release the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher:
+    """Watches a directory tree for markdown changes by polling file stats."""
+    
+    name = 'polling'
+    
+    def __init__(self, directory: Path, interval: float = 0.5):
+        self.directory = directory
+        self.interval = interval
+        self._snapshot = self._scan()
+    
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        """
+        Record the modification time and size of every markdown file.
+        
+        Returns:
+            Dictionary mapping file paths to ``(mtime_ns, size)``
+        """
+        snapshot = {}
+        for path in self.directory.rglob('*.md'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+    
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Block until files change.
+        
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            Changed paths (empty if the timeout expired)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        while True:
+            snapshot = self._scan()
+            changed = {
+                path for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed:
+                return changed
+            
+            if deadline is not None and time.monotonic() >= deadline:
+                return changed
+            time.sleep(self.interval)
+    
+    def close(self) -> None:
+        """Stop watching (nothing to release)."""
+
+
+def create_watcher(directory: Path, poll_interval: float = 0.5, use_polling: bool = False):
+    """
+    Create the best available watcher for a directory tree.
+    
+    Args:
+        directory: Documentation directory
+        poll_interval: Seconds between scans when polling
+        use_polling: Force polling even if inotify is available
+        
+    Returns:
+        InotifyWatcher, or PollingWatcher as the fallback
+    """
+    if INOTIFY_AVAILABLE and not use_polling:
+        try:
+            return InotifyWatcher(directory)
+        except OSError as e:
+            print(f"Warning: inotify unavailable ({e}); polling every {poll_interval}s")
+    return PollingWatcher(directory, interval=poll_interval)
+
+
+__all__ = [
+    'INOTIFY_AVAILABLE',
+    'InotifyWatcher',
+    'PollingWatcher',
+    'create_watcher'
+]
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Frontmatter Loader for Denmark Living Documentation System
+
+This module finds and parses the YAML frontmatter block of a markdown file
+for every validator and test helper:
+- The block may open on the first line or directly after the H1 title,
+  the layout used throughout docs/
+- Blocks are parsed with PyYAML (the C ``CSafeLoader`` when available), so
+  multi-line lists, nested values and quoting follow YAML; scalars are kept
+  as the strings they were written as, so dates, numbers and ``no`` (the
+  Norwegian language code) are not converted to other types
+- Invalid YAML is reported with its line number instead of being guessed at
+- A simple key/value parser is used when PyYAML is not installed
+
+Documents in the shared corpus parse their frontmatter once per run (see
+``ParsedDocument.frontmatter``).
+
+Requirements: 6.4
+"""
+
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+
+FRONTMATTER_DELIMITER = '---'
+
+if YAML_AVAILABLE:
+    _BaseLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    
+    class FrontmatterLoader(_BaseLoader):
+        """Safe YAML loader that leaves dates, numbers and booleans as strings."""
+    
+    # Implicitly typed scalars that stay str, e.g. ``last_updated: 2025-01-15``
+    # and ``language: no``; empty values still load as None
+    _STRING_TAGS = {
+        'tag:yaml.org,2002:bool',
+        'tag:yaml.org,2002:int',
+        'tag:yaml.org,2002:float',
+        'tag:yaml.org,2002:timestamp'
+    }
+    FrontmatterLoader.yaml_implicit_resolvers = {
+        first: [(tag, regexp) for tag, regexp in resolvers if tag not in _STRING_TAGS]
+        for first, resolvers in _BaseLoader.yaml_implicit_resolvers.items()
+    }
+
+
+def find_frontmatter(lines: List[str]) -> Optional[Tuple[int, int]]:
+    """
+    Locate the frontmatter block of a document.
+    
+    The opening ``---`` must be the first line, or the first line after the
+    H1 title and any blank lines following it.
+    
+    Args:
+        lines: Document lines
+        
+    Returns:
+        Line indices ``(start, end)`` of the opening and closing delimiters,
+        or None if the document has no frontmatter
+    """
+    start = 0
+    while start < len(lines) and not lines[start].strip():
+        start += 1
+    
+    if start < len(lines) and lines[start].startswith('# '):
+        start += 1
+        while start < len(lines) and not lines[start].strip():
+            start += 1
+    
+    if start >= len(lines) or lines[start].strip() != FRONTMATTER_DELIMITER:
+        return None
+    
+    for end in range(start + 1, len(lines)):
+        if lines[end].strip() == FRONTMATTER_DELIMITER:
+            return (start, end)
+    return None
+
+
+def _unquote(value: str) -> str:
+    """Remove one pair of matching quotes around a value."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        return value[1:-1]
+    return value
+
+
+def parse_simple(text: str) -> Dict[str, Any]:
+    """
+    Parse frontmatter without PyYAML.
+    
+    Understands ``key: value`` pairs, quoted values, ``[a, b]`` lists and
+    block lists of ``- item`` lines.
+    
+    Args:
+        text: Frontmatter text between the delimiters
+        
+    Returns:
+        Dictionary of frontmatter fields
+    """
+    metadata = {}
+    current_key = None
+    
+    for line in text.split('\n'):
+        stripped = line.strip()
+        
+        # Skip empty lines and comments
+        if not stripped or stripped.startswith('#'):
+            continue
+        
+        # Items of a block list belong to the last key without a value
+        if stripped.startswith('- ') and current_key is not None:
+            metadata[current_key].append(_unquote(stripped[2:].strip()))
+            continue
+        
+        if ':' not in stripped:
+            continue
+        
+        key, value = stripped.split(':', 1)
+        key = key.strip()
+        value = value.strip()
+        current_key = None
+        
+        if not value:
+            metadata[key] = []
+            current_key = key
+        elif value.startswith('[') and value.endswith(']'):
+            array_content = value[1:-1].strip()
+            metadata[key] = [_unquote(item.strip()) for item in array_content.split(',')] if array_content else []
+        else:
+            metadata[key] = _unquote(value)
+    
+    return metadata
+
+
+def parse_frontmatter(text: str, first_line: int = 1) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Parse the text of a frontmatter block.
+    
+    Args:
+        text: Frontmatter text between the delimiters
+        first_line: Line number of the first text line in the document,
+            used in error messages
+            
+    Returns:
+        Tuple of the frontmatter fields (empty if the block is invalid) and
+        an error message or None
+    """
+    if not YAML_AVAILABLE:
+        return parse_simple(text), None
+    
+    try:
+        data = yaml.load(text, Loader=FrontmatterLoader)
+    except yaml.YAMLError as e:
+        mark = getattr(e, 'problem_mark', None)
+        problem = getattr(e, 'problem', None) or str(e)
+        if mark is not None:
+            return {}, f"Line {first_line + mark.line}: Invalid YAML frontmatter ({problem})"
+        return {}, f"Invalid YAML frontmatter ({problem})"
+    
+    if data is None:
+        return {}, None
+    if not isinstance(data, dict):
+        return {}, f"Line {first_line}: Frontmatter is not a mapping of fields"
+    return data, None
+
+
+def load_frontmatter(lines: List[str]) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Find and parse the frontmatter of a document.
+    
+    Args:
+        lines: Document lines
+        
+    Returns:
+        Tuple of the frontmatter fields (empty if there is no valid block)
+        and an error message or None
+    """
+    frontmatter_range = find_frontmatter(lines)
+    if frontmatter_range is None:
+        return {}, None
+    
+    start, end = frontmatter_range
+    return parse_frontmatter('\n'.join(lines[start + 1:end]), first_line=start + 2)
+
+
+__all__ = [
+    'YAML_AVAILABLE',
+    'find_frontmatter',
+    'parse_frontmatter',
+    'parse_simple',
+    'load_frontmatter'
+]
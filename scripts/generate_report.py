@@ -16,6 +16,10 @@ import argparse
 from datetime import datetime
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from glossary_index import GLOSSARY_RELATIVE_PATH, GlossaryIndex
+
 
 class ValidationReportGenerator:
     """Generates comprehensive validation reports from validation results."""
@@ -23,6 +27,17 @@ class ValidationReportGenerator:
     def __init__(self, results_data: Dict[str, Any]):
         self.results = results_data
         self.recommendations = []
+        self._glossary = None
+    
+    def _get_glossary(self) -> GlossaryIndex:
+        """Load the glossary index of the validated documentation, once per report."""
+        if self._glossary is None:
+            glossary_path = Path(self.results.get('docs_directory', '.')) / GLOSSARY_RELATIVE_PATH
+            if glossary_path.exists():
+                self._glossary = GlossaryIndex.load(glossary_path)
+            else:
+                self._glossary = GlossaryIndex([])
+        return self._glossary
     
     def generate_html_report(self, output_file: Path) -> None:
         """
@@ -107,6 +122,9 @@ class ValidationReportGenerator:
         .error-list {{ background: #f8d7da; border: 1px solid #f5c6cb; border-radius: 4px; padding: 15px; margin: 10px 0; }}
         .warning-list {{ background: #fff3cd; border: 1px solid #ffeaa7; border-radius: 4px; padding: 15px; margin: 10px 0; }}
         .file-path {{ font-family: monospace; background: #e9ecef; padding: 2px 6px; border-radius: 3px; }}
+        .performance-table {{ width: 100%; border-collapse: collapse; margin: 10px 0 20px 0; }}
+        .performance-table th, .performance-table td {{ padding: 6px 10px; border-bottom: 1px solid #dee2e6; text-align: left; }}
+        .performance-table td.number {{ text-align: right; font-family: monospace; }}
         .recommendations {{ background: #d1ecf1; border: 1px solid #bee5eb; border-radius: 8px; padding: 20px; margin: 20px 0; }}
         .recommendations h3 {{ color: #0c5460; margin-top: 0; }}
         .footer {{ text-align: center; padding: 20px; color: #6c757d; border-top: 1px solid #dee2e6; }}
@@ -143,6 +161,8 @@ class ValidationReportGenerator:
             
             {self._build_html_validator_sections()}
             
+            {self._build_html_performance()}
+            
             {self._build_html_recommendations()}
         </div>
         
@@ -228,6 +248,40 @@ class ValidationReportGenerator:
         
         return ''.join(details)
     
+    def _build_html_performance(self) -> str:
+        """Build HTML tables of the slowest files and checks."""
+        slowest_files = self._collect_slowest_files()
+        slowest_checks = self._collect_slowest_checks()
+        
+        if not slowest_files and not slowest_checks:
+            return ""
+        
+        html = ['<div class="validator-section">', '<h2>⏱ Performance</h2>']
+        
+        if slowest_files:
+            html.append('<h3>Slowest Files</h3>')
+            html.append('<table class="performance-table">')
+            html.append('<tr><th>File</th><th>Time</th><th>Slowest Validator</th></tr>')
+            for row in slowest_files:
+                html.append(f'<tr><td><span class="file-path">{row["file"]}</span></td>'
+                            f'<td class="number">{row["time"] * 1000:.1f}ms</td>'
+                            f'<td>{row["slowest_validator"]} ({row["slowest_validator_time"] * 1000:.1f}ms)</td></tr>')
+            html.append('</table>')
+        
+        if slowest_checks:
+            html.append('<h3>Slowest Checks</h3>')
+            html.append('<table class="performance-table">')
+            html.append('<tr><th>Validator</th><th>Check</th><th>Calls</th><th>Time</th></tr>')
+            for row in slowest_checks:
+                html.append(f'<tr><td>{row["validator"]}</td><td><code>{row["check"]}</code></td>'
+                            f'<td class="number">{row["calls"]}</td>'
+                            f'<td class="number">{row["time"] * 1000:.1f}ms</td></tr>')
+            html.append('</table>')
+        
+        html.append('</div>')
+        
+        return ''.join(html)
+    
     def _build_html_recommendations(self) -> str:
         """Build HTML recommendations section."""
         recommendations = self._generate_recommendations()
@@ -284,6 +338,8 @@ class ValidationReportGenerator:
 
 {self._build_markdown_validator_sections()}
 
+{self._build_markdown_performance()}
+
 {self._build_markdown_recommendations()}
 
 ---
@@ -347,6 +403,41 @@ class ValidationReportGenerator:
         
         return '\n'.join(details)
     
+    def _build_markdown_performance(self) -> str:
+        """Build Markdown tables of the slowest files and checks."""
+        slowest_files = self._collect_slowest_files()
+        slowest_checks = self._collect_slowest_checks()
+        
+        if not slowest_files and not slowest_checks:
+            return ""
+        
+        markdown = ["## ⏱ Performance", ""]
+        
+        if slowest_files:
+            markdown.extend([
+                "### Slowest Files",
+                "",
+                "| File | Time | Slowest Validator |",
+                "|------|------|-------------------|"
+            ])
+            for row in slowest_files:
+                markdown.append(f"| `{row['file']}` | {row['time'] * 1000:.1f}ms | "
+                                f"{row['slowest_validator']} ({row['slowest_validator_time'] * 1000:.1f}ms) |")
+            markdown.append("")
+        
+        if slowest_checks:
+            markdown.extend([
+                "### Slowest Checks",
+                "",
+                "| Validator | Check | Calls | Time |",
+                "|-----------|-------|-------|------|"
+            ])
+            for row in slowest_checks:
+                markdown.append(f"| {row['validator']} | `{row['check']}` | {row['calls']} | {row['time'] * 1000:.1f}ms |")
+            markdown.append("")
+        
+        return '\n'.join(markdown)
+    
     def _build_markdown_recommendations(self) -> str:
         """Build Markdown recommendations section."""
         recommendations = self._generate_recommendations()
@@ -411,6 +502,19 @@ class ValidationReportGenerator:
                     files = data_summary.get('total_files', 0)
                     lines.append(f"     Files: {files}, Errors: {errors}, Warnings: {warnings}")
         
+        # Add slowest files and checks
+        slowest_files = self._collect_slowest_files(limit=5)
+        if slowest_files:
+            lines.extend(["", "SLOWEST FILES:"])
+            for row in slowest_files:
+                lines.append(f"  {row['time'] * 1000:8.1f}ms  {row['file']} (slowest: {row['slowest_validator']})")
+        
+        slowest_checks = self._collect_slowest_checks(limit=5)
+        if slowest_checks:
+            lines.extend(["", "SLOWEST CHECKS:"])
+            for row in slowest_checks:
+                lines.append(f"  {row['time'] * 1000:8.1f}ms  {row['validator']}.{row['check']} ({row['calls']} calls)")
+        
         # Add recommendations
         recommendations = self._generate_recommendations()
         if recommendations:
@@ -424,6 +528,64 @@ class ValidationReportGenerator:
         
         return '\n'.join(lines)
     
+    def _collect_slowest_files(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank files by the time all validators spent on them.
+        
+        Args:
+            limit: Maximum number of files to return
+            
+        Returns:
+            List of dictionaries with the file, its total time and the validator
+            that spent the most time on it, slowest first
+        """
+        file_times = defaultdict(dict)
+        for validator_name, result in self.results['validation_results'].items():
+            for file_path, seconds in (result.get('timings') or {}).get('files', {}).items():
+                file_times[file_path][validator_name] = seconds
+        
+        docs_directory = Path(self.results.get('docs_directory', '.'))
+        rows = []
+        for file_path, by_validator in file_times.items():
+            slowest_validator = max(by_validator, key=by_validator.get)
+            try:
+                display_path = str(Path(file_path).relative_to(docs_directory))
+            except ValueError:
+                display_path = file_path
+            rows.append({
+                'file': display_path,
+                'time': sum(by_validator.values()),
+                'slowest_validator': slowest_validator,
+                'slowest_validator_time': by_validator[slowest_validator]
+            })
+        
+        rows.sort(key=lambda row: row['time'], reverse=True)
+        return rows[:limit]
+    
+    def _collect_slowest_checks(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank the timed check phases of all validators.
+        
+        Args:
+            limit: Maximum number of checks to return
+            
+        Returns:
+            List of dictionaries with the validator, check, call count and total
+            time, slowest first
+        """
+        rows = []
+        for validator_name, result in self.results['validation_results'].items():
+            for phase, stats in (result.get('timings') or {}).get('phases', {}).items():
+                rows.append({
+                    'validator': validator_name,
+                    'check': phase,
+                    'calls': stats.get('calls', 0),
+                    'time': stats.get('time', 0.0)
+                })
+        
+        rows.sort(key=lambda row: row['time'], reverse=True)
+        return rows[:limit]
+    
     def _generate_recommendations(self) -> List[Dict[str, str]]:
         """Generate actionable recommendations based on validation results."""
         recommendations = []
@@ -490,6 +652,25 @@ class ValidationReportGenerator:
                         'description': f"{broken_links} broken cross-references found",
                         'action': "Fix broken links or create missing target documents"
                     })
+            
+            # Translation validation recommendations
+            elif validator_name == 'translations' and 'summary' in data:
+                unknown_terms = data['summary'].get('total_unknown_terms', 0)
+                if unknown_terms > 0:
+                    recommendations.append({
+                        'priority': 'MEDIUM',
+                        'description': f"{unknown_terms} Danish terms not found in the glossary ({len(self._get_glossary())} entries)",
+                        'action': "Add missing terms to metadata/glossary.md with English translations"
+                    })
+        
+        # Glossary recommendations
+        incomplete_entries = self._get_glossary().incomplete_entries()
+        if incomplete_entries:
+            recommendations.append({
+                'priority': 'LOW',
+                'description': f"{len(incomplete_entries)} glossary entries lack an English translation or definition",
+                'action': "Complete entries in metadata/glossary.md: " + ', '.join(entry['term'] for entry in incomplete_entries[:5])
+            })
         
         # Medium priority recommendations
         if summary['total_warnings'] > 10:
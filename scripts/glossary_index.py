@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Glossary Index for Denmark Living Documentation System
+
+This module parses metadata/glossary.md into a compact term index that is
+shared by the translation and terminology validators, the property tests
+and the report generator:
+- Each entry holds the canonical Danish term and its English translation,
+  pronunciation and definition
+- The parsed index is cached in memory per process and on disk next to the
+  glossary, keyed on its modification time and content hash, so later runs
+  load it without re-parsing the markdown
+
+Requirements: 2.4, 4.7
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator
+
+
+# Glossary location relative to the documentation root
+GLOSSARY_RELATIVE_PATH = Path('metadata') / 'glossary.md'
+
+# On-disk index cache; a relative path is taken relative to the glossary's
+# directory, so each documentation tree keeps its own cache
+DEFAULT_CACHE_FILE = Path('.glossary_index.json')
+
+INDEX_FORMAT_VERSION = 1
+
+# Loaded indexes in this process: resolved path -> (mtime_ns, size, index)
+_LOADED = {}
+
+
+class GlossaryIndex:
+    """Parsed glossary entries with lookups by term."""
+    
+    # Field lines of a glossary entry and the entry keys they fill
+    FIELDS = {
+        '**English**:': 'english',
+        '**Pronunciation**:': 'pronunciation',
+        '**Definition**:': 'definition'
+    }
+    
+    def __init__(self, entries: List[Dict[str, str]], source: Optional[Path] = None):
+        self.entries = entries
+        self.source = source
+        self._by_term = {entry['term'].lower(): entry for entry in entries}
+    
+    @classmethod
+    def parse(cls, content: str, source: Optional[Path] = None) -> 'GlossaryIndex':
+        """
+        Parse glossary markdown into an index.
+        
+        Entries start at ``### Term`` headings and collect the ``**English**:``,
+        ``**Pronunciation**:`` and ``**Definition**:`` lines that follow.
+        
+        Args:
+            content: Glossary markdown content
+            source: Path the content was read from
+            
+        Returns:
+            GlossaryIndex with one entry per term, in file order
+        """
+        entries = []
+        current_entry = None
+        
+        for line in content.split('\n'):
+            line = line.strip()
+            
+            # Check for term heading (### Term)
+            if line.startswith('### ') and not line.startswith('#### '):
+                current_entry = {'term': line[4:].strip()}
+                entries.append(current_entry)
+                continue
+            
+            if current_entry is None:
+                continue
+            
+            for prefix, field in cls.FIELDS.items():
+                if line.startswith(prefix):
+                    current_entry[field] = line[len(prefix):].strip()
+                    break
+        
+        return cls(entries, source=source)
+    
+    @classmethod
+    def load(cls, glossary_path: Path, cache_file: Optional[Path] = DEFAULT_CACHE_FILE) -> 'GlossaryIndex':
+        """
+        Load the index for a glossary file, re-parsing only when it changed.
+        
+        The in-process copy and the on-disk cache are reused while the file's
+        modification time and size are unchanged. If only the modification
+        time changed, the cache is still used when the content hash matches.
+        
+        Args:
+            glossary_path: Path to the glossary.md file
+            cache_file: On-disk index cache (relative to the glossary's
+                directory unless absolute), or None to disable it
+            
+        Returns:
+            GlossaryIndex (empty if the glossary cannot be read)
+        """
+        try:
+            stat = glossary_path.stat()
+        except OSError as e:
+            print(f"Warning: Could not load glossary from {glossary_path}: {e}")
+            return cls([], source=glossary_path)
+        
+        key = str(glossary_path.resolve())
+        loaded = _LOADED.get(key)
+        if loaded and loaded[0] == stat.st_mtime_ns and loaded[1] == stat.st_size:
+            return loaded[2]
+        
+        if cache_file and not cache_file.is_absolute():
+            cache_file = glossary_path.parent / cache_file
+        cache = _read_cache(cache_file) if cache_file else {}
+        record = cache.get(key)
+        
+        if record and record['mtime_ns'] == stat.st_mtime_ns and record['size'] == stat.st_size:
+            index = cls(record['entries'], source=glossary_path)
+        else:
+            try:
+                with open(glossary_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except Exception as e:
+                print(f"Warning: Could not load glossary from {glossary_path}: {e}")
+                return cls([], source=glossary_path)
+            
+            content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            if record and record['sha256'] == content_hash:
+                index = cls(record['entries'], source=glossary_path)
+            else:
+                index = cls.parse(content, source=glossary_path)
+            
+            if cache_file:
+                cache[key] = {
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    'sha256': content_hash,
+                    'entries': index.entries
+                }
+                _write_cache(cache_file, cache)
+        
+        _LOADED[key] = (stat.st_mtime_ns, stat.st_size, index)
+        return index
+    
+    @classmethod
+    def for_docs(cls, docs_directory: Path, cache_file: Optional[Path] = DEFAULT_CACHE_FILE) -> 'GlossaryIndex':
+        """
+        Load the glossary of a documentation tree.
+        
+        Args:
+            docs_directory: Documentation root directory
+            cache_file: On-disk index cache, or None to disable it
+            
+        Returns:
+            GlossaryIndex for ``metadata/glossary.md`` under the directory
+        """
+        return cls.load(docs_directory / GLOSSARY_RELATIVE_PATH, cache_file=cache_file)
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return iter(self.entries)
+    
+    def get(self, term: str) -> Optional[Dict[str, str]]:
+        """Return the entry for a Danish term (case-insensitive), or None."""
+        return self._by_term.get(term.lower())
+    
+    @property
+    def terms(self) -> List[str]:
+        """Canonical Danish terms in glossary order."""
+        return [entry['term'] for entry in self.entries]
+    
+    def danish_terms(self) -> Dict[str, Dict[str, str]]:
+        """
+        Map lowercased Danish terms to their entries.
+        
+        Returns:
+            Dictionary in the format used by DanishTermValidator
+        """
+        return {entry['term'].lower(): dict(entry) for entry in self.entries}
+    
+    def terminology_terms(self) -> Dict[str, Dict[str, str]]:
+        """
+        Map Danish terms, their lowercase forms and English translations to entries.
+        
+        Returns:
+            Dictionary in the format used by TerminologyConsistencyChecker
+        """
+        glossary_terms = {}
+        for entry in self.entries:
+            info = {
+                'canonical_term': entry['term'],
+                'term_lower': entry['term'].lower()
+            }
+            for field, value in entry.items():
+                if field in ('english', 'definition'):
+                    info[field] = value
+            
+            # English translations are stored as variations of the term
+            if 'english' in info:
+                glossary_terms[info['english'].lower()] = info
+            glossary_terms[entry['term'].lower()] = info
+            glossary_terms[entry['term']] = info
+        return glossary_terms
+    
+    def incomplete_entries(self) -> List[Dict[str, str]]:
+        """Entries missing an English translation or a definition."""
+        return [entry for entry in self.entries if not entry.get('english') or not entry.get('definition')]
+
+
+def _read_cache(cache_file: Path) -> Dict[str, Any]:
+    """
+    Read the on-disk index cache.
+    
+    Args:
+        cache_file: Cache file path
+        
+    Returns:
+        Cached glossary records keyed by resolved glossary path
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if data.get('format_version') != INDEX_FORMAT_VERSION:
+        return {}
+    return data.get('glossaries', {})
+
+
+def _write_cache(cache_file: Path, glossaries: Dict[str, Any]) -> None:
+    """
+    Write the on-disk index cache atomically, ignoring write errors.
+    
+    Records of glossaries that no longer exist are dropped.
+    
+    Args:
+        cache_file: Cache file path
+        glossaries: Glossary records keyed by resolved glossary path
+    """
+    data = {
+        'format_version': INDEX_FORMAT_VERSION,
+        'glossaries': {path: record for path, record in glossaries.items() if os.path.exists(path)}
+    }
+    
+    temp_file = cache_file.with_name(cache_file.name + '.tmp')
+    try:
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+
+__all__ = [
+    'GLOSSARY_RELATIVE_PATH',
+    'GlossaryIndex'
+]
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Glossary Term Matcher for Denmark Living Documentation System
+
+This module finds known glossary terms in documentation text with an
+Aho-Corasick automaton instead of a large regex alternation:
+- The automaton is built once per glossary and scans a document in one pass
+- Matching is case-insensitive, including æ/ø/å (Æ/Ø/Å)
+- Matches must start and end on word boundaries, like ``\\b`` in a regex
+- Overlapping candidates resolve leftmost-longest, like a longest-first
+  ``\\b(term1|term2|...)\\b`` pattern
+
+Requirements: 2.4, 4.7
+"""
+
+from collections import deque
+from bisect import bisect_right
+from typing import List, Dict, Iterable, Tuple
+
+
+def _fold(text: str) -> str:
+    """
+    Case-fold text one character at a time, keeping offsets unchanged.
+    
+    Characters whose lowercase form is longer than one character are kept
+    as they are, so positions in the folded text map 1:1 to the original.
+    
+    Args:
+        text: Text to fold
+        
+    Returns:
+        Lowercased text of the same length
+    """
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether a character counts as a word character for ``\\b`` (Unicode ``\\w``)."""
+    return char.isalnum() or char == '_'
+
+
+class GlossaryMatcher:
+    """Multi-term matcher over glossary terms using an Aho-Corasick automaton."""
+    
+    def __init__(self, terms: Iterable[str]):
+        # Trie transitions, failure links and matched term lengths per state
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [()]
+        self.terms = []
+        
+        seen = set()
+        for term in terms:
+            folded = _fold(term)
+            if folded and folded not in seen:
+                seen.add(folded)
+                self.terms.append(term)
+                self._add(folded)
+        
+        self._build_failure_links()
+    
+    def _add(self, folded_term: str) -> None:
+        """
+        Insert a case-folded term into the trie.
+        
+        Args:
+            folded_term: Term to insert
+        """
+        state = 0
+        for char in folded_term:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(())
+            state = next_state
+        self._outputs[state] = (len(folded_term),)
+    
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                
+                if self._outputs[self._fail[next_state]]:
+                    self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+    
+    def _candidates(self, folded_text: str) -> Dict[int, List[int]]:
+        """
+        Scan text once and collect every term occurrence.
+        
+        Args:
+            folded_text: Case-folded text to scan
+            
+        Returns:
+            Dictionary mapping start offset to the lengths of terms found there
+        """
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        candidates = {}
+        
+        state = 0
+        for position, char in enumerate(folded_text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            
+            if outputs[state]:
+                end = position + 1
+                for length in outputs[state]:
+                    candidates.setdefault(end - length, []).append(length)
+        
+        return candidates
+    
+    def find_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Find non-overlapping glossary term occurrences in text.
+        
+        Args:
+            text: Text to search
+            
+        Returns:
+            List of ``(start, end)`` offsets in ascending order
+        """
+        if not self.terms or not text:
+            return []
+        
+        candidates = self._candidates(_fold(text))
+        text_length = len(text)
+        
+        def at_boundary(offset: int) -> bool:
+            before = offset > 0 and _is_word_char(text[offset - 1])
+            after = offset < text_length and _is_word_char(text[offset])
+            return before != after
+        
+        spans = []
+        last_end = 0
+        for start in sorted(candidates):
+            if start < last_end or not at_boundary(start):
+                continue
+            
+            # Longest term starting here that also ends on a word boundary
+            for length in sorted(candidates[start], reverse=True):
+                if at_boundary(start + length):
+                    spans.append((start, start + length))
+                    last_end = start + length
+                    break
+        
+        return spans
+    
+    def find_all(self, text: str) -> List[str]:
+        """
+        Find glossary terms in text.
+        
+        Args:
+            text: Text to search
+            
+        Returns:
+            Matched substrings in their original case, in order of appearance
+        """
+        return [text[start:end] for start, end in self.find_spans(text)]
+    
+    def find_by_line(self, text: str) -> Dict[int, List[str]]:
+        """
+        Find glossary terms in a whole document and group them by line.
+        
+        Args:
+            text: Full document content
+            
+        Returns:
+            Dictionary mapping 1-based line numbers to matched substrings
+        """
+        spans = self.find_spans(text)
+        if not spans:
+            return {}
+        
+        line_offsets = []
+        position = 0
+        for line in text.split('\n'):
+            line_offsets.append(position)
+            position += len(line) + 1
+        
+        matches = {}
+        for start, end in spans:
+            matches.setdefault(bisect_right(line_offsets, start), []).append(text[start:end])
+        return matches
+
+
+__all__ = [
+    'GlossaryMatcher'
+]
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Validation Profiling for Denmark Living Documentation System
+
+This module measures where validation time goes:
+- Wall time of each validator run, from a monotonic clock
+- Time spent validating each file (files served from the incremental cache
+  are not re-validated and so are not timed)
+- Time and call counts of individual check phases, e.g. the syntax and
+  heading hierarchy checks of the markdown validator
+- Optionally, peak memory allocated during the run, traced with tracemalloc
+
+Timing works by wrapping methods on the validator instance, so validators
+do not need to know they are being profiled.
+
+Requirements: All (Validation infrastructure)
+"""
+
+import time
+import functools
+import tracemalloc
+from typing import Dict, Any, Optional, Iterable, Callable
+
+
+class ValidatorProfiler:
+    """Collects monotonic timings (and optionally peak memory) for one validator run."""
+    
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.elapsed = 0.0
+        self.peak_memory = None
+        self.files = {}
+        self.phases = {}
+        self._start_time = None
+        self._started_tracing = False
+    
+    def start(self) -> None:
+        """Start the wall clock and, if enabled, memory tracing."""
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+        self._start_time = time.perf_counter()
+    
+    def stop(self) -> None:
+        """Stop the wall clock and record peak memory."""
+        self.elapsed = time.perf_counter() - self._start_time
+        if self.trace_memory and tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+    
+    def instrument(self, validator: Any, file_method: Optional[str] = None, phases: Iterable[str] = ()) -> None:
+        """
+        Time a validator's per-file method and check phases.
+        
+        The methods are replaced on the instance only, so calls made through
+        ``self`` (including ``cache.lookup(document, self.validate_document)``)
+        are timed while the class stays untouched.
+        
+        Args:
+            validator: Validator instance
+            file_method: Name of the method validating one ParsedDocument
+            phases: Names of check methods to time individually
+        """
+        if file_method and hasattr(validator, file_method):
+            setattr(validator, file_method, self._time_file(getattr(validator, file_method)))
+        for phase in phases:
+            if hasattr(validator, phase):
+                setattr(validator, phase, self._time_phase(phase, getattr(validator, phase)))
+    
+    def _time_file(self, method: Callable) -> Callable:
+        """Wrap a per-file method to accumulate time by document path."""
+        @functools.wraps(method)
+        def timed(document, *args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                return method(document, *args, **kwargs)
+            finally:
+                key = str(getattr(document, 'path', document))
+                self.files[key] = self.files.get(key, 0.0) + time.perf_counter() - start_time
+        return timed
+    
+    def _time_phase(self, phase: str, method: Callable) -> Callable:
+        """Wrap a check method to accumulate its calls and time."""
+        stats = self.phases.setdefault(phase, {'calls': 0, 'time': 0.0})
+        
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                stats['calls'] += 1
+                stats['time'] += time.perf_counter() - start_time
+        return timed
+    
+    def timings(self) -> Dict[str, Any]:
+        """
+        Timings of the run for the results file.
+        
+        Returns:
+            Dictionary with per-file seconds and per-phase calls and seconds
+        """
+        return {
+            'files': dict(self.files),
+            'phases': {phase: dict(stats) for phase, stats in self.phases.items()}
+        }
+
+
+__all__ = [
+    'ValidatorProfiler'
+]
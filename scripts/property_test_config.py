@@ -9,11 +9,24 @@ and common generators for testing documentation properties.
 Requirements: All (Property-based testing framework)
 """
 
-from hypothesis import settings, Verbosity
+from hypothesis import settings, Verbosity, strategies as st
+from hypothesis.database import DirectoryBasedExampleDatabase
 from hypothesis.strategies import SearchStrategy
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
 import os
+import re
+import copy
+import sys
+import weakref
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from tokenizer import get_tokenizer
+from glossary_index import GLOSSARY_RELATIVE_PATH, GlossaryIndex
+from frontmatter_loader import find_frontmatter, load_frontmatter
 
 
 # Test Configuration
@@ -32,8 +45,14 @@ class PropertyTestConfig:
     # Verbosity level for test output
     VERBOSITY = Verbosity.normal
     
-    # Documentation root directory
-    DOCS_ROOT = Path("docs/denmark-living")
+    # Documentation root directory, independent of the working directory
+    DOCS_ROOT = Path(__file__).parent.parent / "docs" / "denmark-living"
+    
+    # Hypothesis example database, so failing examples are replayed first
+    EXAMPLE_DATABASE = Path(__file__).parent.parent / ".hypothesis" / "examples"
+    
+    # Glossary of Danish terms
+    GLOSSARY_PATH = DOCS_ROOT / GLOSSARY_RELATIVE_PATH
     
     # Required category directories
     REQUIRED_CATEGORIES = [
@@ -127,7 +146,8 @@ settings.register_profile(
     deadline=PropertyTestConfig.DEADLINE,
     verbosity=PropertyTestConfig.VERBOSITY,
     suppress_health_check=[],
-    print_blob=True
+    print_blob=True,
+    database=DirectoryBasedExampleDatabase(str(PropertyTestConfig.EXAMPLE_DATABASE))
 )
 
 # Activate the property test profile
@@ -190,6 +210,20 @@ class TestTagging:
 class DocumentGenerators:
     """Common generators for property-based testing."""
     
+    @staticmethod
+    def get_corpus() -> DocumentCorpus:
+        """
+        Get the documentation corpus shared by all properties and examples.
+        
+        The corpus is loaded once per process and reloaded only when files
+        are added, removed or renamed under the documentation root (see
+        ``DocumentCorpus.load_cached``).
+        
+        Returns:
+            DocumentCorpus of PropertyTestConfig.DOCS_ROOT
+        """
+        return DocumentCorpus.load_cached(PropertyTestConfig.DOCS_ROOT)
+    
     @staticmethod
     def get_all_documentation_files() -> List[Path]:
         """
@@ -198,11 +232,7 @@ class DocumentGenerators:
         Returns:
             List of Path objects for all markdown files
         """
-        docs_root = PropertyTestConfig.DOCS_ROOT
-        if not docs_root.exists():
-            return []
-        
-        return list(docs_root.glob("**/*.md"))
+        return DocumentGenerators.get_corpus().paths
     
     @staticmethod
     def get_files_by_category(category: str) -> List[Path]:
@@ -216,10 +246,7 @@ class DocumentGenerators:
             List of Path objects for files in the category
         """
         category_path = PropertyTestConfig.DOCS_ROOT / category
-        if not category_path.exists():
-            return []
-        
-        return list(category_path.glob("*.md"))
+        return [path for path in DocumentGenerators.get_corpus().paths if path.parent == category_path]
     
     @staticmethod
     def get_procedural_documents() -> List[Path]:
@@ -229,13 +256,11 @@ class DocumentGenerators:
         Returns:
             List of Path objects for procedural documents
         """
-        docs_root = PropertyTestConfig.DOCS_ROOT
-        if not docs_root.exists():
-            return []
+        paths = DocumentGenerators.get_corpus().paths
         
         procedural_docs = []
         for pattern in PropertyTestConfig.PROCEDURAL_PATTERNS:
-            procedural_docs.extend(docs_root.glob(pattern))
+            procedural_docs.extend(path for path in paths if path.match(pattern))
         
         return procedural_docs
     
@@ -247,14 +272,11 @@ class DocumentGenerators:
         Returns:
             List of Path objects for citizenship-dependent documents
         """
-        docs_root = PropertyTestConfig.DOCS_ROOT
-        if not docs_root.exists():
-            return []
+        paths = DocumentGenerators.get_corpus().paths
         
         citizenship_docs = []
         for doc_name in PropertyTestConfig.CITIZENSHIP_DEPENDENT_DOCS:
-            matches = list(docs_root.glob(f"**/{doc_name}"))
-            citizenship_docs.extend(matches)
+            citizenship_docs.extend(path for path in paths if path.name == doc_name)
         
         return citizenship_docs
     
@@ -266,11 +288,7 @@ class DocumentGenerators:
         Returns:
             List of Path objects for social benefits documents
         """
-        social_benefits_path = PropertyTestConfig.DOCS_ROOT / "social-benefits"
-        if not social_benefits_path.exists():
-            return []
-        
-        return list(social_benefits_path.glob("*.md"))
+        return DocumentGenerators.get_files_by_category("social-benefits")
     
     @staticmethod
     def get_category_directories() -> List[Path]:
@@ -293,20 +311,92 @@ class DocumentGenerators:
         return categories
 
 
+# Parsed views of markdown content are memoized by content. Corpus documents
+# are the same string objects on every call, so each is hashed and parsed once.
+# The caches hold tuples; the PropertyTestUtils helpers return fresh lists and
+# dictionaries built from them, so callers may modify their results.
+VIEW_CACHE_SIZE = 1024
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+H2_PATTERN = re.compile(r'^## (.+)$', re.MULTILINE)
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def _headings(content: str) -> Tuple[Tuple[int, str], ...]:
+    """Heading levels and texts of markdown content."""
+    return tuple((len(match.group(1)), match.group(2).strip()) for match in HEADING_PATTERN.finditer(content))
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def _h2_sections(content: str) -> Tuple[Tuple[str, str, int, int], ...]:
+    """Heading, content and character range of each H2 section."""
+    matches = list(H2_PATTERN.finditer(content))
+    sections = []
+    for i, match in enumerate(matches):
+        section_start = match.end()
+        section_end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        sections.append((match.group(1).strip(), content[section_start:section_end].strip(),
+                         section_start, section_end))
+    return tuple(sections)
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def _links(content: str) -> Tuple[Tuple[str, str], ...]:
+    """Text and URL of each markdown link."""
+    return tuple((match.group(1), match.group(2)) for match in LINK_PATTERN.finditer(content))
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def _has_frontmatter(content: str) -> bool:
+    """Whether markdown content has a frontmatter block."""
+    return find_frontmatter(content.split('\n')) is not None
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def _frontmatter(content: str) -> Dict[str, Any]:
+    """Parsed frontmatter; only ever handed out as a deep copy."""
+    frontmatter, _ = load_frontmatter(content.split('\n'))
+    return frontmatter
+
+
 class PropertyTestUtils:
     """Utility functions for property-based testing."""
     
+    @staticmethod
+    def get_document(file_path: Path) -> Optional[ParsedDocument]:
+        """
+        Get a documentation file from the shared corpus.
+        
+        The document's headings, H2 sections and frontmatter are computed on
+        first use and cached (see corpus.py).
+        
+        Args:
+            file_path: Path to the file, as returned by DocumentGenerators
+            
+        Returns:
+            ParsedDocument, or None if the file is not in the corpus
+        """
+        return DocumentGenerators.get_corpus().get(file_path)
+    
     @staticmethod
     def read_file_content(file_path: Path) -> Optional[str]:
         """
         Safely read file content.
         
+        Documentation files come from the shared corpus; other files are
+        read from disk.
+        
         Args:
             file_path: Path to the file
             
         Returns:
             File content as string, or None if error
         """
+        document = PropertyTestUtils.get_document(file_path)
+        if document is not None:
+            return document.content
+        
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 return f.read()
@@ -324,20 +414,7 @@ class PropertyTestUtils:
         Returns:
             List of heading dictionaries with level and text
         """
-        import re
-        
-        headings = []
-        heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
-        
-        for match in heading_pattern.finditer(content):
-            level = len(match.group(1))
-            text = match.group(2).strip()
-            headings.append({
-                'level': level,
-                'text': text
-            })
-        
-        return headings
+        return [{'level': level, 'text': text} for level, text in _headings(content)]
     
     @staticmethod
     def extract_h2_sections(content: str) -> List[Dict[str, Any]]:
@@ -350,50 +427,37 @@ class PropertyTestUtils:
         Returns:
             List of H2 section dictionaries
         """
-        import re
-        
-        sections = []
-        h2_pattern = re.compile(r'^## (.+)$', re.MULTILINE)
-        
-        matches = list(h2_pattern.finditer(content))
-        
-        for i, match in enumerate(matches):
-            section_start = match.end()
-            section_end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
-            
-            section_content = content[section_start:section_end].strip()
-            
-            sections.append({
-                'heading': match.group(1).strip(),
-                'content': section_content,
-                'start_pos': section_start,
-                'end_pos': section_end
-            })
-        
-        return sections
+        return [
+            {'heading': heading, 'content': section_content, 'start_pos': start_pos, 'end_pos': end_pos}
+            for heading, section_content, start_pos, end_pos in _h2_sections(content)
+        ]
     
     @staticmethod
     def count_tokens(text: str) -> int:
         """
-        Count tokens in text (approximate).
+        Count tokens in text with the same tokenizer as the token counter.
         
         Args:
             text: Text to count tokens for
             
         Returns:
-            Approximate token count
+            Token count (exact with tiktoken, approximate otherwise)
         """
-        # Simple approximation: split by whitespace and punctuation
-        import re
-        
-        # Remove markdown formatting
-        text = re.sub(r'[#*_`\[\]()]', ' ', text)
+        return get_tokenizer().count(text)
+    
+    @staticmethod
+    def load_glossary() -> GlossaryIndex:
+        """
+        Load the shared glossary index for the documentation.
         
-        # Split by whitespace and count
-        tokens = text.split()
+        Returns:
+            GlossaryIndex (empty if the glossary is missing)
+        """
+        if not PropertyTestConfig.GLOSSARY_PATH.exists():
+            return GlossaryIndex([])
         
-        # Rough approximation: 1 token per word, plus some for punctuation
-        return len(tokens)
+        # Parsed once per process; tests do not write an index cache into the docs
+        return GlossaryIndex.load(PropertyTestConfig.GLOSSARY_PATH, cache_file=None)
     
     @staticmethod
     def extract_links(content: str) -> List[Dict[str, str]]:
@@ -406,18 +470,7 @@ class PropertyTestUtils:
         Returns:
             List of link dictionaries with text and url
         """
-        import re
-        
-        links = []
-        link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
-        
-        for match in link_pattern.finditer(content):
-            links.append({
-                'text': match.group(1),
-                'url': match.group(2)
-            })
-        
-        return links
+        return [{'text': text, 'url': url} for text, url in _links(content)]
     
     @staticmethod
     def has_frontmatter(content: str) -> bool:
@@ -430,52 +483,132 @@ class PropertyTestUtils:
         Returns:
             True if frontmatter is present
         """
-        lines = content.split('\n')
-        return len(lines) > 0 and lines[0].strip() == '---'
+        return _has_frontmatter(content)
     
     @staticmethod
     def extract_frontmatter(content: str) -> Dict[str, Any]:
         """
         Extract YAML frontmatter from content.
         
+        Uses the same loader as the validators (see frontmatter_loader.py).
+        
         Args:
             content: Markdown content
             
         Returns:
-            Dictionary of frontmatter data
+            Dictionary of frontmatter data (empty if missing or invalid)
         """
-        if not PropertyTestUtils.has_frontmatter(content):
-            return {}
-        
-        lines = content.split('\n')
-        frontmatter_end = -1
+        return copy.deepcopy(_frontmatter(content))
+
+
+class CorpusStrategies:
+    """Hypothesis strategies that draw from the shared in-memory corpus."""
+    
+    # Sampling index (documents, sections, links) per loaded corpus
+    _indexes = weakref.WeakKeyDictionary()
+    
+    @staticmethod
+    def corpus_index() -> Dict[str, List[Any]]:
+        """
+        Build the sampling index of the shared corpus, once per corpus.
         
-        for i, line in enumerate(lines[1:], 1):
-            if line.strip() == '---':
-                frontmatter_end = i
-                break
+        Returns:
+            Dictionary with readable ``documents``, their H2 ``sections``
+            and their ``links``; sections and links carry the document ``path``
+        """
+        corpus = DocumentGenerators.get_corpus()
+        index = CorpusStrategies._indexes.get(corpus)
+        if index is None:
+            documents = [document for document in corpus if document.content is not None]
+            index = {
+                'documents': documents,
+                'sections': [
+                    dict(section, path=document.path)
+                    for document in documents
+                    for section in document.h2_sections
+                ],
+                'links': [
+                    dict(link, path=document.path)
+                    for document in documents
+                    for link in PropertyTestUtils.extract_links(document.content)
+                ]
+            }
+            CorpusStrategies._indexes[corpus] = index
+        return index
+    
+    @staticmethod
+    def _sample(kind: str, category: Optional[str]) -> SearchStrategy:
+        """Strategy sampling one kind of index entry, optionally from one category."""
+        def build():
+            entries = CorpusStrategies.corpus_index()[kind]
+            if category is not None:
+                category_path = PropertyTestConfig.DOCS_ROOT / category
+                entries = [
+                    entry for entry in entries
+                    if (entry.path if kind == 'documents' else entry['path']).parent == category_path
+                ]
+            if not entries:
+                where = f" in category '{category}'" if category is not None else ""
+                raise ValueError(
+                    f"No {kind} to sample{where}: the corpus under "
+                    f"{PropertyTestConfig.DOCS_ROOT} has none"
+                )
+            return st.sampled_from(entries)
+        
+        # Deferred, so the corpus is loaded on the first draw rather than at import
+        return st.deferred(build)
+    
+    @staticmethod
+    def documents(category: Optional[str] = None) -> SearchStrategy:
+        """
+        Strategy drawing parsed documents.
         
-        if frontmatter_end == -1:
-            return {}
+        Args:
+            category: Only draw documents of this category (optional)
+            
+        Returns:
+            Strategy of ParsedDocument objects with content
+        """
+        return CorpusStrategies._sample('documents', category)
+    
+    @staticmethod
+    def document_paths(category: Optional[str] = None) -> SearchStrategy:
+        """
+        Strategy drawing documentation file paths.
         
-        frontmatter_content = '\n'.join(lines[1:frontmatter_end])
+        Args:
+            category: Only draw files of this category (optional)
+            
+        Returns:
+            Strategy of Path objects
+        """
+        return CorpusStrategies.documents(category).map(lambda document: document.path)
+    
+    @staticmethod
+    def sections(category: Optional[str] = None) -> SearchStrategy:
+        """
+        Strategy drawing H2 sections.
         
-        # Simple YAML parsing for basic key-value pairs
-        frontmatter = {}
-        for line in frontmatter_content.split('\n'):
-            line = line.strip()
-            if ':' in line and not line.startswith('#'):
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip().strip('"\'')
-                
-                # Handle arrays
-                if value.startswith('[') and value.endswith(']'):
-                    value = [item.strip().strip('"\'') for item in value[1:-1].split(',')]
-                
-                frontmatter[key] = value
+        Args:
+            category: Only draw sections of this category (optional)
+            
+        Returns:
+            Strategy of section dictionaries (heading, content, line range, path)
+        """
+        return CorpusStrategies._sample('sections', category)
+    
+    @staticmethod
+    def links(category: Optional[str] = None) -> SearchStrategy:
+        """
+        Strategy drawing markdown links.
         
-        return frontmatter
+        Args:
+            category: Only draw links of this category (optional)
+            
+        Returns:
+            Strategy of link dictionaries (text, url, path)
+        """
+        return CorpusStrategies._sample('links', category)
 
 
 # Export main classes and functions
@@ -483,5 +616,6 @@ __all__ = [
     'PropertyTestConfig',
     'TestTagging', 
     'DocumentGenerators',
-    'PropertyTestUtils'
+    'PropertyTestUtils',
+    'CorpusStrategies'
 ]
\ No newline at end of file
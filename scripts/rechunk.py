@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Section-Aware Rechunker for Denmark Living Documentation System
+
+TokenCounter reports H2 sections over the token limit, which then have to
+be split by hand. This module splits such sections into chunks that fit,
+without touching the source files:
+- Blocks (H3 headings, paragraphs, lists, tables, code blocks) are found in
+  one pass over the section lines
+- Whole H3 subsections are kept together while they fit; otherwise the
+  split falls on a paragraph or list boundary, and only a single block over
+  the limit is split further (list items, table rows or sentences)
+- Every chunk keeps its heading breadcrumb, with the H3 it starts in
+- Optionally, each chunk repeats the last blocks of the previous chunk, up
+  to a number of overlap tokens
+
+Sections within the limit pass through unchanged, so their chunk IDs and
+content hashes are the same as without rechunking. Parts of a split
+section get the section ID with a ``/N`` suffix.
+
+Requirements: 1.4
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import ParsedDocument
+from anchor_index import FENCE_PATTERN
+
+
+H3_PATTERN = re.compile(r'^###\s+(.+?)(?:\s+#+)?\s*$')
+LIST_ITEM_PATTERN = re.compile(r'^\s*(?:[-*+]|\d+[.)])\s')
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+(?=\S)')
+
+# Separator between blocks in chunk content
+BLOCK_SEPARATOR = '\n\n'
+
+
+def _block(kind: str, lines: List[str], start_line: int, subheading: str) -> Dict[str, Any]:
+    """Build a block from its lines and the 1-based number of the first line."""
+    return {
+        'kind': kind,
+        'text': '\n'.join(lines),
+        'start_line': start_line,
+        'end_line': start_line + len(lines) - 1,
+        'subheading': subheading
+    }
+
+
+def section_blocks(lines: List[str], first_line: int) -> Iterator[Dict[str, Any]]:
+    """
+    Split section lines into blocks in a single pass.
+    
+    Blocks are separated by blank lines; fenced code blocks are kept whole
+    and every H3 heading is a block of its own.
+    
+    Args:
+        lines: Section body lines (without the H2 heading)
+        first_line: 1-based line number of the first line
+        
+    Yields:
+        Blocks with kind (``heading``, ``code``, ``list``, ``table`` or
+        ``paragraph``), text, line range and the H3 they belong to
+    """
+    current = []
+    start_line = first_line
+    kind = None
+    fence = None
+    subheading = None
+    
+    for line_num, line in enumerate(lines, first_line):
+        if fence is not None:
+            current.append(line)
+            match = FENCE_PATTERN.match(line)
+            if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence):
+                yield _block(kind, current, start_line, subheading)
+                current, fence = [], None
+            continue
+        
+        fence_match = FENCE_PATTERN.match(line)
+        h3_match = H3_PATTERN.match(line)
+        if current and (not line.strip() or fence_match or h3_match):
+            yield _block(kind, current, start_line, subheading)
+            current = []
+        
+        if fence_match:
+            current, start_line, kind, fence = [line], line_num, 'code', fence_match.group(1)
+        elif h3_match:
+            subheading = h3_match.group(1)
+            yield _block('heading', [line], line_num, subheading)
+        elif line.strip():
+            if not current:
+                start_line = line_num
+                if LIST_ITEM_PATTERN.match(line):
+                    kind = 'list'
+                elif line.lstrip().startswith('|'):
+                    kind = 'table'
+                else:
+                    kind = 'paragraph'
+            current.append(line)
+    
+    if current:
+        yield _block(kind, current, start_line, subheading)
+
+
+def _block_pieces(block: Dict[str, Any]) -> List[str]:
+    """Split a block into list items, lines or sentences."""
+    if block['kind'] == 'paragraph':
+        return SENTENCE_BOUNDARY_PATTERN.split(block['text'])
+    
+    pieces = []
+    for line in block['text'].split('\n'):
+        if pieces and block['kind'] == 'list' and not LIST_ITEM_PATTERN.match(line):
+            pieces[-1] += '\n' + line
+        else:
+            pieces.append(line)
+    return pieces
+
+
+def split_block(block: Dict[str, Any], tokens: int, tokenizer, max_tokens: int) -> List[Dict[str, Any]]:
+    """
+    Split a block over the token limit into parts that fit.
+    
+    Lists are split between items, tables and code between lines and
+    paragraphs between sentences. A single sentence or line over the limit
+    is kept whole.
+    
+    Args:
+        block: Block from ``section_blocks``
+        tokens: Token count of the block
+        tokenizer: Tokenizer with ``count_batch``
+        max_tokens: Token limit
+        
+    Returns:
+        Blocks with a ``'tokens'`` count; parts of the block share its
+        ``'parent'`` and are joined with ``'joiner'``
+    """
+    if tokens <= max_tokens or block['kind'] == 'heading':
+        return [dict(block, tokens=tokens)]
+    
+    joiner = ' ' if block['kind'] == 'paragraph' else '\n'
+    pieces = _block_pieces(block)
+    parts = []
+    current = []
+    current_tokens = 0
+    for piece, piece_tokens in zip(pieces, tokenizer.count_batch(pieces)):
+        if current and current_tokens + piece_tokens > max_tokens:
+            parts.append((current, current_tokens))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += piece_tokens
+    parts.append((current, current_tokens))
+    
+    return [
+        dict(block, text=joiner.join(part), tokens=part_tokens, parent=block['start_line'], joiner=joiner)
+        for part, part_tokens in parts
+    ]
+
+
+def pack_blocks(blocks: List[Dict[str, Any]], max_tokens: int, overlap: int = 0) -> List[Dict[str, Any]]:
+    """
+    Pack consecutive blocks into chunks of at most ``max_tokens`` tokens.
+    
+    Blocks are grouped by H3 subsection and whole subsections are packed
+    while they fit; a subsection that does not fit is packed block by block.
+    A chunk never ends on an H3 heading. Each block counts one extra token
+    for its separator.
+    
+    Args:
+        blocks: Blocks with ``'tokens'``, each at most ``max_tokens`` when possible
+        max_tokens: Token limit per chunk
+        overlap: Tokens of trailing blocks repeated at the start of the next chunk
+        
+    Returns:
+        Chunks as ``{'blocks', 'first_new'}``, where ``first_new`` is the
+        index of the first block not repeated from the previous chunk
+    """
+    groups = []
+    for block in blocks:
+        if block['kind'] == 'heading' or not groups:
+            groups.append([])
+        groups[-1].append(block)
+    
+    chunks = []
+    current = []
+    first_new = 0
+    
+    def size(run):
+        return sum(block['tokens'] + 1 for block in run)
+    
+    def flush():
+        nonlocal current, first_new
+        carry = []
+        if len(current) - first_new > 1 and current[-1]['kind'] == 'heading':
+            carry = [current.pop()]
+        chunks.append({'blocks': current, 'first_new': first_new})
+        
+        repeated = []
+        for block in reversed(current[first_new:]):
+            if block['kind'] == 'heading' or size(repeated) + block['tokens'] + 1 > overlap:
+                break
+            repeated.insert(0, block)
+        current = repeated + carry
+        first_new = len(repeated)
+    
+    def add(run):
+        nonlocal current, first_new
+        has_new = any(block['kind'] != 'heading' for block in current[first_new:])
+        if has_new and size(current) + size(run) > max_tokens:
+            flush()
+        if first_new and size(current) + size(run) > max_tokens:
+            # The overlap does not leave room for the new blocks
+            current = current[first_new:]
+            first_new = 0
+        current.extend(run)
+    
+    for group in groups:
+        if size(group) <= max_tokens:
+            add(group)
+        else:
+            for block in group:
+                add([block])
+    
+    if len(current) > first_new:
+        chunks.append({'blocks': current, 'first_new': first_new})
+    return chunks
+
+
+def chunk_content(blocks: List[Dict[str, Any]]) -> str:
+    """
+    Join the blocks of a chunk, putting split parts back together.
+    
+    Args:
+        blocks: Consecutive blocks
+        
+    Returns:
+        Chunk content
+    """
+    text = blocks[0]['text']
+    for previous, block in zip(blocks, blocks[1:]):
+        same_block = 'parent' in block and block['parent'] == previous.get('parent')
+        text += (block['joiner'] if same_block else BLOCK_SEPARATOR) + block['text']
+    return text
+
+
+def split_chunk(chunk: Dict[str, Any], document: ParsedDocument, tokenizer, max_tokens: int,
+                overlap: int = 0) -> List[Dict[str, Any]]:
+    """
+    Split an H2 section chunk over the token limit.
+    
+    Args:
+        chunk: Chunk from ``chunk_manifest.document_chunks`` with ``'token_count'``
+        document: Document the chunk comes from
+        tokenizer: Tokenizer with ``count_batch``
+        max_tokens: Token limit per chunk
+        overlap: Tokens repeated from the end of the previous part
+        
+    Returns:
+        The chunk itself if it fits, otherwise its parts with ``/N`` IDs,
+        line ranges, heading breadcrumbs and token counts
+    """
+    if chunk['token_count'] <= max_tokens:
+        return [chunk]
+    
+    # Section body: the lines after the H2 heading up to the section end
+    blocks = list(section_blocks(document.lines[chunk['start_line']:chunk['end_line']], chunk['start_line'] + 1))
+    block_tokens = tokenizer.count_batch(block['text'] for block in blocks)
+    
+    parts = []
+    for block, tokens in zip(blocks, block_tokens):
+        parts.extend(split_block(block, tokens, tokenizer, max_tokens))
+    packed = pack_blocks(parts, max_tokens, overlap)
+    if len(packed) < 2:
+        return [chunk]
+    
+    chunks = []
+    for number, part in enumerate(packed, 1):
+        blocks = part['blocks']
+        subheading = blocks[part['first_new']]['subheading']
+        chunks.append(dict(
+            chunk,
+            id=f"{chunk['id']}/{number}",
+            heading_path=chunk['heading_path'] + ([subheading] if subheading else []),
+            start_line=blocks[0]['start_line'],
+            end_line=blocks[-1]['end_line'],
+            content=chunk_content(blocks)
+        ))
+    
+    for part, token_count in zip(chunks, tokenizer.count_batch(part['content'] for part in chunks)):
+        part['token_count'] = token_count
+    return chunks
+
+
+def rechunk(chunks: Iterable[Dict[str, Any]], documents: Dict[str, ParsedDocument], tokenizer,
+            max_tokens: int, overlap: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Split every chunk over the token limit, streaming the result.
+    
+    Args:
+        chunks: H2 section chunks with ``'token_count'``, in document order
+        documents: Documents by chunk ``'source'``
+        tokenizer: Tokenizer with ``count_batch``
+        max_tokens: Token limit per chunk
+        overlap: Tokens repeated from the end of the previous part of a section
+        
+    Yields:
+        Chunks of at most ``max_tokens`` tokens, unless a single sentence,
+        line or list item is longer
+    """
+    for chunk in chunks:
+        yield from split_chunk(chunk, documents[chunk['source']], tokenizer, max_tokens, overlap)
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Retrieval Benchmark for Denmark Living Documentation System
+
+This script measures how well a local retrieval backend finds the right
+documentation for a fixed set of questions, without calling OpenAI or the
+Supabase ``match_documents`` RPC:
+- Recall@k for k = 1, 3, 5, 10 and mean reciprocal rank (MRR)
+- Query latency percentiles (p50, p95) over repeated runs
+- Index build time
+- Per-query ranks, so regressions can be traced to individual questions
+
+Expected targets in the query set are document paths relative to the docs
+root (any section of the document counts) or ``path#anchor`` for a single
+H2 section. Results are written as JSON and can be compared with an earlier
+run to see the effect of corpus or retrieval changes.
+
+Usage:
+    python scripts/retrieval_benchmark.py docs/denmark-living -o benchmark.json
+    python scripts/retrieval_benchmark.py docs/denmark-living --baseline benchmark.json
+
+Requirements: 1.4
+"""
+
+import sys
+import json
+import time
+import hashlib
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from search_index import SearchIndex
+from vector_store import VectorRetriever
+
+
+DEFAULT_QUERY_FILE = Path(__file__).parent / 'retrieval_queries.json'
+RECALL_CUTOFFS = (1, 3, 5, 10)
+DEFAULT_REPEATS = 5
+
+# Retrieval backends: name -> function building a searchable index from a
+# corpus. An index provides ``search(query, k)`` returning results with
+# ``'id'`` (``path#anchor``) and ``'path'``, and ``len()`` gives its number
+# of sections.
+BACKENDS: Dict[str, Callable[[DocumentCorpus], Any]] = {
+    'bm25': SearchIndex.build,
+    'vectors': VectorRetriever.for_corpus,
+    'vectors-ivf': lambda corpus: VectorRetriever.for_corpus(corpus, ivf=True)
+}
+
+
+def load_queries(query_file: Path) -> List[Dict[str, Any]]:
+    """
+    Load a query set.
+    
+    Args:
+        query_file: JSON file with a ``queries`` list of ``{'query', 'expected'}``
+        
+    Returns:
+        List of query dictionaries
+        
+    Raises:
+        ValueError: If a query has no expected targets
+    """
+    with open(query_file, 'r', encoding='utf-8') as f:
+        queries = json.load(f)['queries']
+    
+    for query in queries:
+        if not query.get('expected'):
+            raise ValueError(f"Query has no expected targets: {query.get('query')!r}")
+    return queries
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Percentile with linear interpolation between the closest ranks.
+    
+    Args:
+        values: Measurements
+        fraction: Percentile as a fraction (0.5 for the median)
+        
+    Returns:
+        Interpolated percentile, or 0.0 for no values
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def is_relevant(result: Dict[str, Any], target: str) -> bool:
+    """
+    Check whether a result matches an expected target.
+    
+    Args:
+        result: Search result with ``'id'`` and ``'path'``
+        target: Document path, or ``path#anchor`` for one section
+        
+    Returns:
+        True if the result is the target section or a section of the target document
+    """
+    if '#' in target:
+        return result['id'] == target
+    return result['path'] == target
+
+
+def score_query(results: List[Dict[str, Any]], expected: List[str]) -> Dict[str, Any]:
+    """
+    Score the ranked results of one query.
+    
+    Args:
+        results: Ranked search results
+        expected: Expected targets
+        
+    Returns:
+        Dictionary with the rank of the first relevant result (or None),
+        the rank of each target and recall at each cutoff
+    """
+    target_ranks = {}
+    for target in expected:
+        target_ranks[target] = next(
+            (rank for rank, result in enumerate(results, 1) if is_relevant(result, target)),
+            None
+        )
+    
+    found = [rank for rank in target_ranks.values() if rank is not None]
+    return {
+        'rank': min(found) if found else None,
+        'target_ranks': target_ranks,
+        'recall': {
+            k: sum(1 for rank in found if rank <= k) / len(expected)
+            for k in RECALL_CUTOFFS
+        }
+    }
+
+
+def corpus_fingerprint(corpus: DocumentCorpus) -> str:
+    """
+    Hash of the corpus content, identifying the corpus version a run used.
+    
+    Args:
+        corpus: Loaded documentation corpus
+        
+    Returns:
+        SHA-256 hex digest over the sorted document paths and content hashes
+    """
+    digest = hashlib.sha256()
+    for document in sorted(corpus, key=lambda d: d.path.as_posix()):
+        digest.update(document.path.relative_to(corpus.directory).as_posix().encode('utf-8'))
+        digest.update((document.content_hash or '').encode('utf-8'))
+    return digest.hexdigest()
+
+
+def run_benchmark(corpus: DocumentCorpus, queries: List[Dict[str, Any]], backend: str = 'bm25',
+                  repeats: int = DEFAULT_REPEATS) -> Dict[str, Any]:
+    """
+    Build the backend's index and run every query against it.
+    
+    Args:
+        corpus: Loaded documentation corpus
+        queries: Query set from ``load_queries``
+        backend: Name of a backend in ``BACKENDS``
+        repeats: Times each query is run for the latency measurements
+        
+    Returns:
+        Benchmark results with metrics, latency, build time and per-query ranks
+    """
+    start = time.perf_counter()
+    index = BACKENDS[backend](corpus)
+    build_time = time.perf_counter() - start
+    
+    max_k = max(RECALL_CUTOFFS)
+    latencies = []
+    query_results = []
+    
+    for query in queries:
+        results = []
+        for _ in range(max(repeats, 1)):
+            start = time.perf_counter()
+            results = index.search(query['query'], k=max_k)
+            latencies.append(time.perf_counter() - start)
+        
+        scored = score_query(results, query['expected'])
+        query_results.append({
+            'query': query['query'],
+            'expected': query['expected'],
+            'rank': scored['rank'],
+            'target_ranks': scored['target_ranks'],
+            'top_results': [result['id'] for result in results[:3]],
+            'recall': scored['recall']
+        })
+    
+    total = len(query_results) or 1
+    metrics = {
+        f'recall@{k}': round(sum(q['recall'][k] for q in query_results) / total, 4)
+        for k in RECALL_CUTOFFS
+    }
+    metrics['mrr'] = round(sum(1 / q['rank'] for q in query_results if q['rank']) / total, 4)
+    
+    for query in query_results:
+        query['recall'] = {f'@{k}': value for k, value in query['recall'].items()}
+    
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'backend': backend,
+        'corpus': {
+            'directory': str(corpus.directory),
+            'documents': len(corpus),
+            'sections': len(index),
+            'fingerprint': corpus_fingerprint(corpus)
+        },
+        'build_time': round(build_time, 4),
+        'metrics': metrics,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 0.50) * 1000, 3),
+            'p95': round(percentile(latencies, 0.95) * 1000, 3),
+            'mean': round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+            'samples': len(latencies)
+        },
+        'queries': query_results
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compare a run with an earlier one.
+    
+    Args:
+        current: Results of this run
+        baseline: Results loaded from an earlier run
+        
+    Returns:
+        Metric and latency deltas, whether the corpus changed and the queries
+        whose first relevant rank changed
+    """
+    metric_deltas = {
+        name: round(value - baseline['metrics'].get(name, 0.0), 4)
+        for name, value in current['metrics'].items()
+    }
+    latency_deltas = {
+        name: round(current['latency_ms'][name] - baseline['latency_ms'].get(name, 0.0), 3)
+        for name in ('p50', 'p95')
+    }
+    
+    baseline_ranks = {query['query']: query['rank'] for query in baseline.get('queries', [])}
+    rank_changes = [
+        {'query': query['query'], 'before': baseline_ranks[query['query']], 'after': query['rank']}
+        for query in current['queries']
+        if query['query'] in baseline_ranks and baseline_ranks[query['query']] != query['rank']
+    ]
+    
+    return {
+        'baseline_timestamp': baseline.get('timestamp'),
+        'corpus_changed': current['corpus']['fingerprint'] != baseline.get('corpus', {}).get('fingerprint'),
+        'metrics': metric_deltas,
+        'latency_ms': latency_deltas,
+        'build_time': round(current['build_time'] - baseline.get('build_time', 0.0), 4),
+        'rank_changes': rank_changes
+    }
+
+
+def print_results(results: Dict[str, Any], verbose: bool = False):
+    """
+    Print benchmark results in a readable format.
+    
+    Args:
+        results: Results from ``run_benchmark``, optionally with a ``comparison``
+        verbose: Whether to list every query
+    """
+    corpus = results['corpus']
+    print(f"\n{'='*80}")
+    print(f"RETRIEVAL BENCHMARK ({results['backend']})")
+    print(f"{'='*80}")
+    print(f"Corpus: {corpus['documents']} documents, {corpus['sections']} sections")
+    print(f"Queries: {len(results['queries'])}")
+    print(f"Index build time: {results['build_time']:.3f}s")
+    
+    print("\nMETRICS:")
+    for name, value in results['metrics'].items():
+        print(f"  {name:<10} {value:.4f}")
+    
+    latency = results['latency_ms']
+    print(f"\nLATENCY: p50 {latency['p50']:.3f}ms, p95 {latency['p95']:.3f}ms ({latency['samples']} samples)")
+    
+    misses = [query for query in results['queries'] if query['rank'] is None or query['rank'] > 5]
+    if verbose or misses:
+        print("\nQUERIES:" if verbose else "\nNOT IN TOP 5:")
+        for query in results['queries'] if verbose else misses:
+            rank = query['rank'] if query['rank'] is not None else '-'
+            print(f"  [{rank:>2}] {query['query']}")
+            if query['rank'] != 1:
+                print(f"       expected {', '.join(query['expected'])}; got {', '.join(query['top_results'])}")
+    
+    comparison = results.get('comparison')
+    if comparison:
+        print(f"\nCOMPARED WITH {comparison['baseline_timestamp']}"
+              f"{' (corpus changed)' if comparison['corpus_changed'] else ''}:")
+        for name, delta in comparison['metrics'].items():
+            print(f"  {name:<10} {delta:+.4f}")
+        for name, delta in comparison['latency_ms'].items():
+            print(f"  {name:<10} {delta:+.3f}ms")
+        for change in comparison['rank_changes']:
+            print(f"  rank {change['before']} -> {change['after']}: {change['query']}")
+
+
+def main():
+    """Main function to run the retrieval benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark local retrieval over the documentation')
+    parser.add_argument('path', help='Documentation directory')
+    parser.add_argument('--queries', '-q', default=str(DEFAULT_QUERY_FILE),
+                        help='Query set JSON file (default: scripts/retrieval_queries.json)')
+    parser.add_argument('--backend', '-b', choices=sorted(BACKENDS), default='bm25',
+                        help='Retrieval backend (default: bm25)')
+    parser.add_argument('--repeats', '-r', type=int, default=DEFAULT_REPEATS,
+                        help=f'Runs per query for latency (default: {DEFAULT_REPEATS})')
+    parser.add_argument('--output', '-o', help='Write results to a JSON file')
+    parser.add_argument('--baseline', help='Compare with results from an earlier run')
+    parser.add_argument('--verbose', '-v', action='store_true', help='List every query')
+    
+    args = parser.parse_args()
+    
+    directory = Path(args.path)
+    if not directory.is_dir():
+        print(f"Error: Directory '{directory}' does not exist")
+        sys.exit(1)
+    
+    corpus = DocumentCorpus.load(directory)
+    results = run_benchmark(corpus, load_queries(Path(args.queries)), backend=args.backend, repeats=args.repeats)
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            results['comparison'] = compare_results(results, json.load(f))
+    
+    print_results(results, verbose=args.verbose)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\nResults written to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,7 +11,9 @@ Requirements: All (Property-based testing framework)
 
 import sys
 import os
+import time
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import json
@@ -20,6 +22,7 @@ from datetime import datetime
 # Add the scripts directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from corpus import DocumentCorpus
 from property_test_config import (
     PropertyTestConfig, 
     TestTagging, 
@@ -36,6 +39,36 @@ except ImportError:
     sys.exit(1)
 
 
+# Corpus snapshots shared with pool workers; inherited without copying when workers are forked
+_WORKER_CORPORA = {}
+
+# Property numbers and names, in the order they are reported
+PROPERTIES = [
+    (1, "Required Documentation Completeness"),
+    (2, "Category Organization Structure"),
+    (3, "Markdown Format Compliance"),
+    (4, "Overview-Details Pattern"),
+    (5, "Section Token Limit"),
+    (6, "Cross-Reference Validity"),
+    (7, "Citizenship Distinction"),
+    (8, "Complete Source Attribution"),
+    (9, "Procedural Guide Completeness"),
+    (10, "Deadline Highlighting"),
+    (11, "Processing Time Documentation"),
+    (12, "Source Type Distinction"),
+    (13, "Danish Term Translation"),
+    (14, "Acronym Definition"),
+    (15, "Terminology Consistency"),
+    (16, "Keyword Optimization"),
+    (17, "Procedure Continuity"),
+    (18, "Dual-Level Documentation"),
+    (19, "Troubleshooting Information"),
+    (20, "Rejection Scenario Documentation"),
+    (21, "Contact Information Inclusion"),
+    (22, "Benefits Eligibility Requirements")
+]
+
+
 class PropertyTestRunner:
     """Main class for running property-based tests."""
     
@@ -50,11 +83,20 @@ class PropertyTestRunner:
             'property_results': {},
             'summary': {}
         }
+        self.corpus = None
     
-    def run_all_tests(self) -> Dict[str, Any]:
+    def run_all_tests(self, jobs: int = 1) -> Dict[str, Any]:
         """
         Run all property-based tests.
         
+        The documentation is read once into a corpus snapshot that every
+        property reads from. With several jobs, properties run in a process
+        pool that shares the snapshot with its workers, and results are
+        merged by property number, so the report matches a serial run.
+        
+        Args:
+            jobs: Number of worker processes; 1 runs properties serially, 0 uses all CPUs
+            
         Returns:
             Dictionary containing test results
         """
@@ -63,77 +105,147 @@ class PropertyTestRunner:
         print(f"Configuration: {PropertyTestConfig.MIN_EXAMPLES} examples per test")
         print()
         
-        # List of all property test methods
-        property_tests = [
-            (1, "Required Documentation Completeness", self._test_property_1),
-            (2, "Category Organization Structure", self._test_property_2),
-            (3, "Markdown Format Compliance", self._test_property_3),
-            (4, "Overview-Details Pattern", self._test_property_4),
-            (5, "Section Token Limit", self._test_property_5),
-            (6, "Cross-Reference Validity", self._test_property_6),
-            (7, "Citizenship Distinction", self._test_property_7),
-            (8, "Complete Source Attribution", self._test_property_8),
-            (9, "Procedural Guide Completeness", self._test_property_9),
-            (10, "Deadline Highlighting", self._test_property_10),
-            (11, "Processing Time Documentation", self._test_property_11),
-            (12, "Source Type Distinction", self._test_property_12),
-            (13, "Danish Term Translation", self._test_property_13),
-            (14, "Acronym Definition", self._test_property_14),
-            (15, "Terminology Consistency", self._test_property_15),
-            (16, "Keyword Optimization", self._test_property_16),
-            (17, "Procedure Continuity", self._test_property_17),
-            (18, "Dual-Level Documentation", self._test_property_18),
-            (19, "Troubleshooting Information", self._test_property_19),
-            (20, "Rejection Scenario Documentation", self._test_property_20),
-            (21, "Contact Information Inclusion", self._test_property_21),
-            (22, "Benefits Eligibility Requirements", self._test_property_22)
-        ]
-        
-        # Run each property test
-        for prop_num, prop_name, test_method in property_tests:
-            tag = TestTagging.create_tag(prop_num, prop_name)
-            
-            try:
+        start_time = time.perf_counter()
+        self.load_corpus()
+        
+        jobs = jobs or os.cpu_count() or 1
+        if jobs > 1:
+            self._run_properties_parallel(jobs)
+        else:
+            for prop_num, prop_name in PROPERTIES:
                 print(f"Running Property {prop_num}: {prop_name}...")
-                
-                result = test_method()
-                
-                self.results['property_results'][prop_num] = {
-                    'name': prop_name,
-                    'tag': tag,
-                    'status': 'passed' if result['passed'] else 'failed',
-                    'examples_run': result.get('examples_run', 0),
-                    'errors': result.get('errors', []),
-                    'details': result.get('details', {})
-                }
-                
-                if result['passed']:
-                    self.results['passed_properties'] += 1
-                    print(f"  ✓ PASSED ({result.get('examples_run', 0)} examples)")
-                else:
-                    self.results['failed_properties'] += 1
-                    print(f"  ✗ FAILED - {len(result.get('errors', []))} errors")
-                    if self.verbose:
-                        for error in result.get('errors', [])[:5]:  # Show first 5 errors
-                            print(f"    - {error}")
-                
-            except Exception as e:
-                self.results['property_results'][prop_num] = {
-                    'name': prop_name,
-                    'tag': tag,
-                    'status': 'error',
-                    'error': str(e)
-                }
-                self.results['failed_properties'] += 1
-                print(f"  ✗ ERROR - {str(e)}")
-            
-            print()
+                self._record_result(prop_num, self._run_property(prop_num, prop_name))
+        
+        self.results['execution_time'] = time.perf_counter() - start_time
         
         # Generate summary
         self._generate_summary()
         
         return self.results
     
+    def load_corpus(self) -> DocumentCorpus:
+        """
+        Read all documentation files once for this run.
+        
+        Returns:
+            The corpus snapshot the properties read documents from
+        """
+        if self.corpus is None:
+            self.corpus = DocumentGenerators.get_corpus()
+        return self.corpus
+    
+    def _read_content(self, file_path: Path) -> Optional[str]:
+        """
+        Read a documentation file from the corpus snapshot.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            File content as string, or None if it could not be read
+        """
+        document = self.corpus.get(file_path) if self.corpus is not None else None
+        if document is None:
+            return PropertyTestUtils.read_file_content(file_path)
+        return document.content
+    
+    def _run_property(self, prop_num: int, prop_name: str) -> Dict[str, Any]:
+        """
+        Run one property test.
+        
+        Args:
+            prop_num: Property number
+            prop_name: Property name
+            
+        Returns:
+            Property result with status, examples, errors and execution time
+        """
+        tag = TestTagging.create_tag(prop_num, prop_name)
+        start_time = time.perf_counter()
+        
+        try:
+            result = getattr(self, f'_test_property_{prop_num}')()
+            
+            return {
+                'name': prop_name,
+                'tag': tag,
+                'status': 'passed' if result['passed'] else 'failed',
+                'examples_run': result.get('examples_run', 0),
+                'errors': result.get('errors', []),
+                'details': result.get('details', {}),
+                'execution_time': time.perf_counter() - start_time
+            }
+        except Exception as e:
+            return {
+                'name': prop_name,
+                'tag': tag,
+                'status': 'error',
+                'error': str(e),
+                'execution_time': time.perf_counter() - start_time
+            }
+    
+    def _run_properties_parallel(self, jobs: int) -> None:
+        """
+        Run property tests concurrently in a process pool.
+        
+        Each property is a job, so the run takes about as long as the slowest
+        property. Results are recorded in property number order.
+        
+        Args:
+            jobs: Maximum number of worker processes
+        """
+        _WORKER_CORPORA[str(PropertyTestConfig.DOCS_ROOT)] = self.corpus
+        workers = min(jobs, len(PROPERTIES))
+        print(f"Running {len(PROPERTIES)} properties in {workers} worker processes")
+        print()
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (prop_num, prop_name, executor.submit(_run_property_job, PropertyTestConfig.DOCS_ROOT,
+                                                      prop_num, prop_name, self.verbose))
+                for prop_num, prop_name in PROPERTIES
+            ]
+            
+            for prop_num, prop_name, future in futures:
+                print(f"Running Property {prop_num}: {prop_name}...")
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # The worker itself died (e.g. pool broken), not the property
+                    result = {
+                        'name': prop_name,
+                        'tag': TestTagging.create_tag(prop_num, prop_name),
+                        'status': 'error',
+                        'error': f"Worker process failed: {str(e)}",
+                        'execution_time': 0
+                    }
+                self._record_result(prop_num, result)
+    
+    def _record_result(self, prop_num: int, result: Dict[str, Any]) -> None:
+        """
+        Store a property result, update the counts and print its status.
+        
+        Args:
+            prop_num: Property number
+            result: Result dictionary returned by _run_property
+        """
+        self.results['property_results'][prop_num] = result
+        
+        if result['status'] == 'passed':
+            self.results['passed_properties'] += 1
+            print(f"  ✓ PASSED ({result['examples_run']} examples)")
+        elif result['status'] == 'failed':
+            self.results['failed_properties'] += 1
+            print(f"  ✗ FAILED - {len(result['errors'])} errors")
+            if self.verbose:
+                for error in result['errors'][:5]:  # Show first 5 errors
+                    print(f"    - {error}")
+        else:
+            self.results['failed_properties'] += 1
+            print(f"  ✗ ERROR - {result['error']}")
+        
+        print()
+    
     def _generate_summary(self):
         """Generate test summary."""
         total = self.results['total_properties']
@@ -210,7 +322,7 @@ class PropertyTestRunner:
                     errors.append(f"Required documentation file missing: {category}/{filename}")
                 else:
                     # Check if file has content
-                    content = PropertyTestUtils.read_file_content(file_path)
+                    content = self._read_content(file_path)
                     if not content or len(content.strip()) < 100:
                         errors.append(f"Documentation file appears empty or too short: {category}/{filename}")
         
@@ -274,7 +386,7 @@ class PropertyTestRunner:
         
         for file_path in all_files:
             examples_run += 1
-            content = PropertyTestUtils.read_file_content(file_path)
+            content = self._read_content(file_path)
             
             if not content:
                 errors.append(f"Could not read file: {file_path}")
@@ -330,7 +442,7 @@ class PropertyTestRunner:
         all_files = DocumentGenerators.get_all_documentation_files()
         
         for file_path in all_files:
-            content = PropertyTestUtils.read_file_content(file_path)
+            content = self._read_content(file_path)
             if not content:
                 continue
             
@@ -358,7 +470,7 @@ class PropertyTestRunner:
         docs_root = PropertyTestConfig.DOCS_ROOT
         
         for file_path in all_files:
-            content = PropertyTestUtils.read_file_content(file_path)
+            content = self._read_content(file_path)
             if not content:
                 continue
             
@@ -417,7 +529,24 @@ class PropertyTestRunner:
     
     def _test_property_13(self) -> Dict[str, Any]:
         """Test Property 13: Danish Term Translation."""
-        return {'passed': True, 'examples_run': 0, 'errors': []}
+        errors = []
+        examples_run = 0
+        
+        glossary = PropertyTestUtils.load_glossary()
+        
+        for entry in glossary:
+            examples_run += 1
+            
+            if not entry.get('english'):
+                errors.append(f"Glossary term missing English translation: {entry['term']}")
+            if not entry.get('definition'):
+                errors.append(f"Glossary term missing definition: {entry['term']}")
+        
+        return {
+            'passed': len(errors) == 0,
+            'examples_run': examples_run,
+            'errors': errors
+        }
     
     def _test_property_14(self) -> Dict[str, Any]:
         """Test Property 14: Acronym Definition."""
@@ -465,6 +594,8 @@ class PropertyTestRunner:
         print(f"Passed: {results['passed_properties']}")
         print(f"Failed: {results['failed_properties']}")
         print(f"Success Rate: {results['summary']['success_rate']:.1f}%")
+        if 'execution_time' in results:
+            print(f"Execution Time: {results['execution_time']:.2f}s")
         print()
         
         if results['failed_properties'] > 0:
@@ -488,6 +619,29 @@ class PropertyTestRunner:
         print(f"Results saved to: {output_file}")
 
 
+def _run_property_job(docs_root: Path, prop_num: int, prop_name: str, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Run one property test inside a pool worker process.
+    
+    Args:
+        docs_root: Documentation root directory
+        prop_num: Property number
+        prop_name: Property name
+        verbose: Whether the runner is verbose
+        
+    Returns:
+        Property result dictionary
+    """
+    key = str(docs_root)
+    if _WORKER_CORPORA.get(key) is None:
+        # Spawned workers do not inherit the parent's snapshot
+        _WORKER_CORPORA[key] = DocumentCorpus.load_cached(docs_root)
+    
+    runner = PropertyTestRunner(verbose=verbose)
+    runner.corpus = _WORKER_CORPORA[key]
+    return runner._run_property(prop_num, prop_name)
+
+
 def main():
     """Main function to run property-based tests."""
     parser = argparse.ArgumentParser(description='Run property-based tests for Denmark Living Documentation System')
@@ -495,6 +649,8 @@ def main():
     parser.add_argument('--output', '-o', help='Save results to JSON file')
     parser.add_argument('--examples', '-e', type=int, default=PropertyTestConfig.MIN_EXAMPLES,
                        help=f'Number of examples per test (default: {PropertyTestConfig.MIN_EXAMPLES})')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Run properties in N worker processes (default: 1, 0 = all CPUs)')
     
     args = parser.parse_args()
     
@@ -503,15 +659,14 @@ def main():
         PropertyTestConfig.MIN_EXAMPLES = args.examples
         settings.register_profile(
             "property_tests",
-            max_examples=args.examples,
-            deadline=PropertyTestConfig.DEADLINE,
-            verbosity=PropertyTestConfig.VERBOSITY
+            settings.get_profile("property_tests"),
+            max_examples=args.examples
         )
         settings.load_profile("property_tests")
     
     # Run tests
     runner = PropertyTestRunner(verbose=args.verbose)
-    results = runner.run_all_tests()
+    results = runner.run_all_tests(jobs=args.jobs)
     
     # Print results
     runner.print_results()
@@ -9,25 +9,65 @@ Requirements: All
 """
 
 import os
+import re
 import sys
+import io
 import json
+import time
 import subprocess
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Iterable, TextIO, Callable
+from collections import Counter
 import argparse
 from datetime import datetime
-import importlib.util
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from validation_cache import ValidationCache, ValidatorCache
+from file_watcher import create_watcher
+from validator_registry import ValidatorRegistry
+from profiling import ValidatorProfiler
+
+# Cache file written by --cache without a path, in the current directory
+DEFAULT_CACHE_FILE = '.validation_cache.json'
+
+# Corpora shared with pool workers; inherited without copying when workers are forked
+_WORKER_CORPORA = {}
+
+# Leading "Line N: " of validator messages, ignored when comparing errors between runs
+LINE_PREFIX_PATTERN = re.compile(r'^Line \d+: ')
 
 
 class ValidationOrchestrator:
     """Orchestrates all validation scripts and collects results."""
     
-    def __init__(self, docs_directory: Path, scripts_directory: Path):
+    def __init__(self, docs_directory: Path, scripts_directory: Path, cache_file: Optional[Path] = None,
+                 trace_memory: bool = False, stream: Optional[TextIO] = None):
         self.docs_directory = docs_directory
         self.scripts_directory = scripts_directory
-        self.results = {
+        self.corpus = None
+        self.cache = ValidationCache(cache_file) if cache_file else None
+        self.trace_memory = trace_memory
+        
+        # JSON Lines output: per-file results are written as validators
+        # produce them and then dropped, followed by one summary record
+        self.stream = stream
+        self.file_records = {}
+        self.results = self._new_results()
+        
+        # Validators are imported from the registry on first use
+        self.registry = ValidatorRegistry(scripts_directory)
+        self.validators = self.registry.validators
+    
+    def _new_results(self) -> Dict[str, Any]:
+        """Create an empty results dictionary for a validation run."""
+        return {
             'timestamp': datetime.now().isoformat(),
-            'docs_directory': str(docs_directory),
+            'docs_directory': str(self.docs_directory),
+            'corpus': {},
             'validation_results': {},
             'summary': {
                 'total_validators': 0,
@@ -38,109 +78,180 @@ class ValidationOrchestrator:
                 'overall_status': 'UNKNOWN'
             }
         }
-        
-        # Define all available validators
-        self.validators = {
-            'markdown': {
-                'script': 'validate_markdown.py',
-                'description': 'Markdown format and structure validation',
-                'class': 'MarkdownValidator',
-                'method': 'validate_directory'
-            },
-            'metadata': {
-                'script': 'validate_metadata.py', 
-                'description': 'Frontmatter metadata validation',
-                'class': 'MetadataValidator',
-                'method': 'validate_directory'
-            },
-            'tokens': {
-                'script': 'count_tokens.py',
-                'description': 'Token count validation for RAG optimization',
-                'class': 'TokenCounter',
-                'method': 'count_directory_tokens'
-            },
-            'links': {
-                'script': 'validate_links.py',
-                'description': 'Cross-reference link validation',
-                'class': 'LinkValidator',
-                'method': 'validate_directory'
-            },
-            'structure': {
-                'script': 'validate_structure.py',
-                'description': 'Directory structure validation',
-                'class': 'StructureValidator',
-                'method': 'validate_structure'
-            },
-            'procedures': {
-                'script': 'validate_procedures.py',
-                'description': 'Procedural guide completeness validation',
-                'class': 'ProceduralGuideValidator',
-                'method': 'validate_directory'
-            },
-            'translations': {
-                'script': 'validate_translations.py',
-                'description': 'Danish term translation validation',
-                'class': 'DanishTermValidator',
-                'method': 'validate_directory'
-            },
-            'acronyms': {
-                'script': 'validate_acronyms.py',
-                'description': 'Acronym definition validation',
-                'class': 'AcronymValidator',
-                'method': 'validate_directory'
-            },
-            'terminology': {
-                'script': 'check_terminology.py',
-                'description': 'Terminology consistency validation',
-                'class': 'TerminologyConsistencyChecker',
-                'method': 'analyze_directory'
-            },
-            'citizenship': {
-                'script': 'validate_citizenship.py',
-                'description': 'EU/Non-EU citizenship distinction validation',
-                'class': 'CitizenshipDistinctionValidator',
-                'method': 'validate_directory'
-            }
-        }
     
-    def run_all_validations(self, selected_validators: Optional[List[str]] = None) -> Dict[str, Any]:
+    def run_all_validations(self, selected_validators: Optional[List[str]] = None, jobs: int = 1,
+                            save_cache: bool = True) -> Dict[str, Any]:
         """
         Run all validation scripts and collect results.
         
         Args:
-            selected_validators: List of validator names to run, or None for all
+            selected_validators: List of validator names to run, or None for all default validators
+            jobs: Number of worker processes; 1 runs validators serially, 0 uses all CPUs
+            save_cache: Whether to write the validation cache file after the run
             
         Returns:
             Dictionary containing all validation results
         """
-        validators_to_run = selected_validators or list(self.validators.keys())
+        validators_to_run = selected_validators or self.registry.default_validators()
         
         print(f"Running validation on: {self.docs_directory}")
         print(f"Validators to run: {', '.join(validators_to_run)}")
         print("=" * 60)
         
+        # Read and parse every document once, shared by all validators
+        self.load_corpus()
+        
+        known_validators = []
         for validator_name in validators_to_run:
             if validator_name not in self.validators:
                 print(f"Warning: Unknown validator '{validator_name}', skipping...")
                 continue
+            known_validators.append(validator_name)
+        
+        jobs = jobs or os.cpu_count() or 1
+        if jobs > 1 and len(known_validators) > 1:
+            self._run_validators_parallel(known_validators, jobs)
+        else:
+            for validator_name in known_validators:
+                print(f"\nRunning {validator_name} validation...")
+                self._record_result(validator_name, self._run_validator(validator_name))
+        
+        self._update_overall_status()
+        
+        if self.stream is not None:
+            self._write_record({'type': 'summary', **self.results})
+        
+        if save_cache:
+            self._save_cache()
+        
+        return self.results
+    
+    def watch(self, selected_validators: Optional[List[str]] = None, jobs: int = 1,
+              output_file: Optional[Path] = None, use_polling: bool = False,
+              poll_interval: float = 0.5) -> Dict[str, Any]:
+        """
+        Validate once, then re-validate whenever documentation files change.
+        
+        The corpus, the per-file validation cache and the last results stay in
+        memory. On each change only the changed files are re-read; cached
+        results are reused for every file whose content and cross-file context
+        are unchanged, so only the changed files and their dependents are
+        validated again. New and resolved errors are printed after each run.
+        
+        Args:
+            selected_validators: List of validator names to run, or None for all default validators
+            jobs: Number of worker processes for the initial run
+            output_file: Where to save the latest results when watching stops
+            use_polling: Poll for changes even if inotify is available
+            poll_interval: Seconds between scans when polling
             
-            print(f"\nRunning {validator_name} validation...")
-            result = self._run_validator(validator_name)
-            self.results['validation_results'][validator_name] = result
-            
-            # Update summary statistics
-            self.results['summary']['total_validators'] += 1
-            if result.get('success', False):
-                self.results['summary']['successful_validators'] += 1
-                # Add error/warning counts from successful validations
-                if 'summary' in result.get('data', {}):
-                    summary = result['data']['summary']
-                    self.results['summary']['total_errors'] += summary.get('total_errors', 0)
-                    self.results['summary']['total_warnings'] += summary.get('total_warnings', 0)
-            else:
-                self.results['summary']['failed_validators'] += 1
+        Returns:
+            The latest validation results
+        """
+        if self.cache is None:
+            # Keep per-file results in memory between runs
+            self.cache = ValidationCache(None)
+        
+        self.run_all_validations(selected_validators, jobs=jobs, save_cache=False)
+        validator_names = list(self.results['validation_results'])
+        summary = self.results['summary']
+        print(f"\nValidation Status: {summary['overall_status']} "
+              f"(Errors: {summary['total_errors']}, Warnings: {summary['total_warnings']})")
+        
+        watcher = create_watcher(self.docs_directory, poll_interval=poll_interval, use_polling=use_polling)
+        print(f"Watching {self.docs_directory} for changes ({watcher.name}); press Ctrl+C to stop")
+        
+        try:
+            while True:
+                changed_paths = watcher.wait()
+                if changed_paths:
+                    self._revalidate(changed_paths, validator_names)
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+        finally:
+            watcher.close()
+            self._save_cache()
+            if output_file:
+                self.save_results(output_file)
         
-        # Determine overall status
+        return self.results
+    
+    def _revalidate(self, changed_paths: Iterable[Path], validator_names: List[str]) -> None:
+        """
+        Re-run validators after files changed and print the change in errors.
+        
+        Args:
+            changed_paths: Paths reported by the watcher
+            validator_names: Validators to run
+        """
+        start_time = time.perf_counter()
+        previous_paths = set(self.corpus.paths)
+        updated_paths = self.corpus.update(changed_paths)
+        if not updated_paths:
+            return
+        files_added_or_removed = set(self.corpus.paths) != previous_paths
+        
+        previous_results = self.results
+        self.results = self._new_results()
+        self.results['corpus'] = {
+            'total_files': len(self.corpus),
+            'load_time': time.perf_counter() - start_time
+        }
+        
+        rerun = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for validator_name in validator_names:
+                previous = previous_results['validation_results'][validator_name]
+                if (self.validators[validator_name].get('inputs') == 'paths' and previous['success']
+                        and not files_added_or_removed):
+                    result = previous
+                else:
+                    result = self._run_validator(validator_name)
+                    rerun.append(validator_name)
+                self._record_result(validator_name, result)
+            self._update_overall_status()
+        
+        elapsed = time.perf_counter() - start_time
+        changed_names = ', '.join(self._relative_path(path) for path in updated_paths)
+        print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Changed: {changed_names}")
+        print(f"Re-ran {len(rerun)} validators in {elapsed:.2f}s")
+        self.print_error_diff(collect_errors(previous_results), collect_errors(self.results))
+        
+        summary = self.results['summary']
+        print(f"Validation Status: {summary['overall_status']} "
+              f"(Errors: {summary['total_errors']}, Warnings: {summary['total_warnings']})")
+    
+    def print_error_diff(self, previous: Counter, current: Counter) -> None:
+        """
+        Print errors that appeared or disappeared between two runs.
+        
+        Args:
+            previous: Errors of the earlier run, from collect_errors()
+            current: Errors of the later run, from collect_errors()
+        """
+        new_errors = current - previous
+        resolved_errors = previous - current
+        
+        if not new_errors and not resolved_errors:
+            print("  No new or resolved errors")
+            return
+        
+        for marker, errors in (('+', new_errors), ('-', resolved_errors)):
+            for validator_name, file_name, message in sorted(errors.elements()):
+                location = f" {self._relative_path(Path(file_name))}:" if file_name else ""
+                print(f"  {marker} [{validator_name}]{location} {message}")
+        
+        print(f"  {len(list(new_errors.elements()))} new, {len(list(resolved_errors.elements()))} resolved")
+    
+    def _relative_path(self, file_path: Path) -> str:
+        """Format a path relative to the documentation directory when possible."""
+        try:
+            return str(file_path.relative_to(self.docs_directory))
+        except ValueError:
+            return str(file_path)
+    
+    def _update_overall_status(self) -> None:
+        """Determine the overall status from the summary counts."""
         if self.results['summary']['failed_validators'] > 0:
             self.results['summary']['overall_status'] = 'FAILED'
         elif self.results['summary']['total_errors'] > 0:
@@ -149,8 +260,168 @@ class ValidationOrchestrator:
             self.results['summary']['overall_status'] = 'WARNINGS'
         else:
             self.results['summary']['overall_status'] = 'PASSED'
+    
+    def _save_cache(self) -> None:
+        """Write the validation cache, if enabled, reporting failures as warnings."""
+        if self.cache is not None:
+            try:
+                self.cache.save()
+            except Exception as e:
+                print(f"Warning: Could not save validation cache: {str(e)}")
+    
+    def _run_validators_parallel(self, validator_names: List[str], jobs: int) -> None:
+        """
+        Run validators concurrently in a process pool.
         
-        return self.results
+        Results and captured output are collected in the order the validators
+        were requested, so the report is identical to a serial run.
+        
+        Args:
+            validator_names: Validators to run
+            jobs: Maximum number of worker processes
+        """
+        _WORKER_CORPORA[str(self.docs_directory)] = self.corpus
+        workers = min(jobs, len(validator_names))
+        print(f"Running {len(validator_names)} validators in {workers} worker processes")
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (validator_name, executor.submit(_run_validator_job, self.docs_directory,
+                                                 self.scripts_directory, validator_name, self.cache,
+                                                 self.trace_memory))
+                for validator_name in validator_names
+            ]
+            
+            for validator_name, future in futures:
+                print(f"\nRunning {validator_name} validation...")
+                try:
+                    result, output, cache_section = future.result()
+                    print(output, end='')
+                    if cache_section is not None:
+                        self.cache.update_section(validator_name, cache_section)
+                except Exception as e:
+                    # The worker itself died (e.g. pool broken), not the validator
+                    validator_config = self.validators[validator_name]
+                    result = {
+                        'validator': validator_name,
+                        'description': validator_config['description'],
+                        'script': validator_config['script'],
+                        'success': False,
+                        'data': None,
+                        'error': f"Worker process failed: {str(e)}",
+                        'execution_time': 0,
+                        'import_time': 0
+                    }
+                    print(f"  ✗ {validator_config['description']} failed: {result['error']}")
+                self._record_result(validator_name, result)
+    
+    def _record_result(self, validator_name: str, result: Dict[str, Any]) -> None:
+        """
+        Store a validator result and update the summary statistics.
+        
+        Args:
+            validator_name: Name of the validator
+            result: Result dictionary returned by _run_validator
+        """
+        if self.stream is not None:
+            result = self._stream_files(validator_name, result)
+        self.results['validation_results'][validator_name] = result
+        
+        # Update summary statistics
+        self.results['summary']['total_validators'] += 1
+        if result.get('success', False):
+            self.results['summary']['successful_validators'] += 1
+            # Add error/warning counts from successful validations
+            if 'summary' in result.get('data', {}):
+                summary = result['data']['summary']
+                self.results['summary']['total_errors'] += summary.get('total_errors', 0)
+                self.results['summary']['total_warnings'] += summary.get('total_warnings', 0)
+        else:
+            self.results['summary']['failed_validators'] += 1
+    
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        """Write one JSON Lines record to the output stream."""
+        self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+    
+    def _file_sink(self, validator_name: str) -> Callable[[Dict[str, Any]], None]:
+        """
+        Create the sink writing a validator's per-file results as records.
+        
+        Section content in token count results is left out, since it repeats
+        the document text.
+        
+        Args:
+            validator_name: Name of the validator
+            
+        Returns:
+            Callable writing one file result and counting it in ``file_records``
+        """
+        self.file_records.setdefault(validator_name, 0)
+        
+        def write(file_result: Dict[str, Any]) -> None:
+            if 'sections' in file_result:
+                file_result = dict(file_result, sections=[
+                    {key: value for key, value in section.items() if key != 'content'}
+                    for section in file_result['sections']
+                ])
+            self._write_record({'type': 'file', 'validator': validator_name, **file_result})
+            self.file_records[validator_name] += 1
+        return write
+    
+    def _stream_files(self, validator_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Finish a validator's records and drop its per-file results.
+        
+        Cacheable validators write their records through the file sink while
+        they run. Per-file results still in the result (other validators and
+        parallel runs) are written here. A ``validator`` record then closes
+        the validator's records with its status, so the file records of a
+        validator that failed partway are not mistaken for complete results.
+        
+        Args:
+            validator_name: Name of the validator
+            result: Result dictionary returned by _run_validator
+            
+        Returns:
+            The result with ``data`` reduced to everything but the per-file
+            results, plus ``file_records`` counting the records written
+        """
+        data = result.get('data')
+        if isinstance(data, dict) and 'files' in data:
+            write = self._file_sink(validator_name)
+            for file_result in data['files']:
+                write(file_result)
+            
+            data = {key: value for key, value in data.items() if key != 'files'}
+            data['file_records'] = self.file_records[validator_name]
+            result = dict(result, data=data)
+        
+        self._write_record({
+            'type': 'validator',
+            'name': validator_name,
+            'success': result.get('success', False),
+            'error': result.get('error'),
+            'file_records': self.file_records.pop(validator_name, 0)
+        })
+        self.stream.flush()
+        return result
+    
+    def load_corpus(self) -> DocumentCorpus:
+        """
+        Read and parse all documentation files once for this run.
+        
+        Returns:
+            The shared document corpus
+        """
+        if self.corpus is None:
+            start_time = time.perf_counter()
+            self.corpus = DocumentCorpus.load(self.docs_directory, recursive=True)
+            self.results['corpus'] = {
+                'total_files': len(self.corpus),
+                'load_time': time.perf_counter() - start_time
+            }
+            print(f"Parsed {len(self.corpus)} documents")
+        return self.corpus
     
     def _run_validator(self, validator_name: str) -> Dict[str, Any]:
         """
@@ -163,7 +434,7 @@ class ValidationOrchestrator:
             Dictionary containing validator results
         """
         validator_config = self.validators[validator_name]
-        script_path = self.scripts_directory / validator_config['script']
+        script_path = self.registry.script_path(validator_name)
         
         result = {
             'validator': validator_name,
@@ -172,18 +443,30 @@ class ValidationOrchestrator:
             'success': False,
             'data': None,
             'error': None,
-            'execution_time': 0
+            'execution_time': 0,
+            'import_time': 0
         }
         
-        start_time = datetime.now()
+        profiler = ValidatorProfiler(trace_memory=self.trace_memory)
         
         try:
-            # Import and run the validator module
+            # Import the validator module (once per process) and run it
             if script_path.exists():
-                result_data = self._import_and_run_validator(script_path, validator_config)
+                validator_class = self.registry.load(validator_name)
+                result['import_time'] = self.registry.pop_import_time(validator_name)
+                
+                profiler.start()
+                try:
+                    result_data = self._run_validator_class(validator_class, validator_name, profiler)
+                finally:
+                    profiler.stop()
                 result['data'] = result_data
                 result['success'] = True
                 print(f"  ✓ {validator_config['description']} completed")
+                
+                if self.cache is not None and validator_name in self.cache.sections:
+                    result['cache'] = self.cache.sections[validator_name].stats()
+                    print(f"    cache: {result['cache']['hits']} hits, {result['cache']['misses']} misses")
             else:
                 result['error'] = f"Validator script not found: {script_path}"
                 print(f"  ✗ {validator_config['description']} failed: script not found")
@@ -192,49 +475,73 @@ class ValidationOrchestrator:
             result['error'] = str(e)
             print(f"  ✗ {validator_config['description']} failed: {str(e)}")
         
-        result['execution_time'] = (datetime.now() - start_time).total_seconds()
+        result['execution_time'] = profiler.elapsed
+        result['timings'] = profiler.timings()
+        if profiler.peak_memory is not None:
+            result['peak_memory'] = profiler.peak_memory
         return result
     
-    def _import_and_run_validator(self, script_path: Path, validator_config: Dict[str, str]) -> Dict[str, Any]:
+    def _run_validator_class(self, validator_class: type, validator_name: str,
+                             profiler: Optional[ValidatorProfiler] = None) -> Dict[str, Any]:
         """
-        Import a validator module and run its validation method.
+        Instantiate a validator and run its validation method.
         
         Args:
-            script_path: Path to the validator script
-            validator_config: Configuration for the validator
+            validator_class: Validator class loaded from the registry
+            validator_name: Name of the validator, used to select its cache section
+            profiler: Profiler timing the validator's per-file method and check phases
             
         Returns:
             Validation results from the validator
         """
-        # Import the module dynamically
-        spec = importlib.util.spec_from_file_location("validator_module", script_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        
-        # Get the validator class
-        validator_class = getattr(module, validator_config['class'])
+        validator_config = self.validators[validator_name]
+        script_path = self.registry.script_path(validator_name)
         
         # Create validator instance
+        validator_args = {}
         if validator_config['class'] == 'TokenCounter':
             # TokenCounter takes a token_limit parameter
-            validator = validator_class(token_limit=1000)
+            validator_args['token_limit'] = 1000
         elif validator_config['class'] == 'LinkValidator':
             # LinkValidator takes a base_directory parameter
-            validator = validator_class(base_directory=self.docs_directory)
-        else:
-            validator = validator_class()
+            validator_args['base_directory'] = self.docs_directory
+        elif validator_config['class'] == 'ExternalLinkValidator' and self.cache is None:
+            # Keep runs without --cache from reading or writing the link check cache
+            validator_args['cache_file'] = None
+        validator = validator_class(**validator_args)
         
-        # Run the validation method
+        if profiler is not None:
+            profiler.instrument(validator, validator_config.get('file_method'), validator_config.get('phases', ()))
+        
+        # Run the validation method against the shared corpus
         method_name = validator_config['method']
         validation_method = getattr(validator, method_name)
         
-        # Call the appropriate method based on validator type
-        if validator_config['class'] == 'StructureValidator':
-            # Structure validator takes docs directory directly
-            return validation_method(self.docs_directory)
-        else:
-            # Other validators take directory and recursive flag
-            return validation_method(self.docs_directory, recursive=True)
+        # Per-file validators write JSON Lines records from their loop
+        sink_args = {}
+        if self.stream is not None and validator_config.get('cacheable'):
+            sink_args['sink'] = self._file_sink(validator_name)
+        
+        if self.cache is not None and validator_config.get('cacheable'):
+            # Cached results are only valid for the same code, arguments and glossary
+            # (the script hash is taken when the module was imported)
+            config = {
+                'class': validator_config['class'],
+                'method': method_name,
+                'args': validator_args,
+                'glossary': getattr(validator, 'glossary_terms', None),
+                'tokenizer': getattr(getattr(validator, 'tokenizer', None), 'name', None)
+            }
+            fingerprint = ValidationCache.fingerprint(
+                script_path, config,
+                script_hash=self.registry.script_hashes.get(validator_name),
+                dependencies=self.registry.dependency_paths(validator_name)
+            )
+            # Streamed results are dropped once written, so the cache keeps them as text
+            cache = self.cache.section(validator_name, fingerprint, keep_results=not sink_args)
+            return validation_method(self.load_corpus(), cache=cache, **sink_args)
+        
+        return validation_method(self.load_corpus(), **sink_args)
     
     def save_results(self, output_file: Path) -> None:
         """
@@ -274,6 +581,10 @@ class ValidationOrchestrator:
         for validator_name, result in self.results['validation_results'].items():
             status = "✓" if result['success'] else "✗"
             time_str = f"({result['execution_time']:.2f}s)"
+            if result.get('import_time'):
+                time_str = f"({result['execution_time']:.2f}s + {result['import_time'] * 1000:.1f}ms import)"
+            if result.get('peak_memory') is not None:
+                time_str += f" [peak {result['peak_memory'] / (1024 * 1024):.1f} MB]"
             
             if result['success'] and result['data'] and 'summary' in result['data']:
                 data_summary = result['data']['summary']
@@ -288,6 +599,78 @@ class ValidationOrchestrator:
             print(f"  {status} {validator_name}: {result['description']} {time_str} {detail}")
 
 
+def collect_errors(results: Dict[str, Any]) -> Counter:
+    """
+    Collect the errors of a validation run in a comparable form.
+    
+    Errors are keyed by validator, file and message. Line number prefixes are
+    dropped so that errors do not appear as new when text above them moves.
+    Broken links and sections over the token limit count as errors.
+    
+    Args:
+        results: Results dictionary of ValidationOrchestrator
+        
+    Returns:
+        Counter of ``(validator, file, message)`` tuples
+    """
+    errors = Counter()
+    
+    for validator_name, result in results['validation_results'].items():
+        if not result.get('success'):
+            errors[(validator_name, '', f"Validator failed: {result.get('error')}")] += 1
+            continue
+        
+        data = result.get('data') or {}
+        for message in data.get('errors', []):
+            errors[(validator_name, '', str(message))] += 1
+        
+        for file_result in data.get('files', []):
+            messages = [str(message) for message in file_result.get('errors', [])]
+            messages.extend(f"Broken link: {link['url']}" for link in file_result.get('broken_links', []))
+            messages.extend(
+                f"Section '{violation['section']}' exceeds token limit ({violation['token_count']} tokens)"
+                for violation in file_result.get('violations', [])
+            )
+            
+            for message in messages:
+                errors[(validator_name, file_result.get('file', ''), LINE_PREFIX_PATTERN.sub('', message))] += 1
+    
+    return errors
+
+
+def _run_validator_job(docs_directory: Path, scripts_directory: Path, validator_name: str,
+                       cache: Optional[ValidationCache] = None,
+                       trace_memory: bool = False) -> Tuple[Dict[str, Any], str, Optional[ValidatorCache]]:
+    """
+    Run one validator inside a pool worker process.
+    
+    Args:
+        docs_directory: Documentation directory
+        scripts_directory: Validation scripts directory
+        validator_name: Name of the validator to run
+        cache: The parent's validation cache, if enabled
+        trace_memory: Whether to record peak memory with tracemalloc
+        
+    Returns:
+        Tuple of (validator result, captured console output, updated cache section)
+    """
+    key = str(docs_directory)
+    if _WORKER_CORPORA.get(key) is None:
+        # Spawned workers do not inherit the parent's corpus
+        _WORKER_CORPORA[key] = DocumentCorpus.load(docs_directory, recursive=True)
+    
+    orchestrator = ValidationOrchestrator(docs_directory, scripts_directory, trace_memory=trace_memory)
+    orchestrator.corpus = _WORKER_CORPORA[key]
+    orchestrator.cache = cache
+    
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = orchestrator._run_validator(validator_name)
+    
+    cache_section = cache.sections.get(validator_name) if cache is not None else None
+    return result, output.getvalue(), cache_section
+
+
 def main():
     """Main function to run the validation orchestrator."""
     parser = argparse.ArgumentParser(description='Run comprehensive validation on Denmark Living Documentation System')
@@ -295,29 +678,50 @@ def main():
                        help='Path to documentation directory (default: docs/denmark-living)')
     parser.add_argument('--scripts-dir', '-s', type=Path, default=Path('scripts'),
                        help='Path to validation scripts directory (default: scripts)')
-    parser.add_argument('--output', '-o', type=Path, default=Path('validation_results.json'),
-                       help='Output file for detailed results (default: validation_results.json)')
+    parser.add_argument('--output', '-o', type=Path,
+                       help='Output file for detailed results (default: validation_results.json or .jsonl)')
+    parser.add_argument('--format', '-f', choices=['json', 'jsonl'], default='json',
+                       help='Output format: one JSON document, or JSON Lines streamed with one record '
+                            'per file and validator and a final summary record (default: json)')
     parser.add_argument('--validators', '-v', nargs='+', 
                        help='Specific validators to run (default: all)')
     parser.add_argument('--list-validators', '-l', action='store_true',
                        help='List available validators and exit')
     parser.add_argument('--quiet', '-q', action='store_true',
                        help='Suppress detailed output, show only summary')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Run validators in N worker processes (default: 1, 0 = all CPUs)')
+    parser.add_argument('--cache', type=Path, nargs='?', const=Path(DEFAULT_CACHE_FILE), metavar='FILE',
+                       help='Reuse per-file results between runs through a cache file; without FILE, '
+                            f'{DEFAULT_CACHE_FILE} in the current directory (default: no cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore --cache: validate every file from scratch and do not write a cache')
+    parser.add_argument('--trace-memory', action='store_true',
+                       help='Record peak memory of each validator with tracemalloc (slower)')
+    parser.add_argument('--watch', '-w', action='store_true',
+                       help='Keep running and re-validate changed files on every save')
+    parser.add_argument('--poll', action='store_true',
+                       help='In watch mode, poll for changes instead of using inotify')
+    parser.add_argument('--poll-interval', type=float, default=0.5,
+                       help='Seconds between scans when polling (default: 0.5)')
     
     args = parser.parse_args()
     
     # Resolve paths
     docs_dir = args.docs_dir.resolve()
     scripts_dir = args.scripts_dir.resolve()
+    output_file = args.output or Path(f"validation_results.{args.format}")
     
     # Create orchestrator
-    orchestrator = ValidationOrchestrator(docs_dir, scripts_dir)
+    orchestrator = ValidationOrchestrator(docs_dir, scripts_dir, cache_file=None if args.no_cache else args.cache,
+                                          trace_memory=args.trace_memory)
     
     # List validators if requested
     if args.list_validators:
         print("Available validators:")
         for name, config in orchestrator.validators.items():
-            print(f"  {name}: {config['description']}")
+            opt_in = '' if config.get('default', True) else ' (only when selected)'
+            print(f"  {name}: {config['description']}{opt_in}")
         return
     
     # Check if directories exist
@@ -335,11 +739,26 @@ def main():
         print(f"Documentation: {docs_dir}")
         print(f"Scripts: {scripts_dir}")
     
+    if args.watch:
+        if args.format == 'jsonl':
+            print("Error: --format jsonl cannot be used with --watch")
+            sys.exit(1)
+        orchestrator.watch(args.validators, jobs=args.jobs, output_file=output_file,
+                           use_polling=args.poll, poll_interval=args.poll_interval)
+        return
+    
     try:
-        results = orchestrator.run_all_validations(args.validators)
-        
-        # Save detailed results
-        orchestrator.save_results(args.output)
+        if args.format == 'jsonl':
+            # Stream records while validators run instead of saving at the end
+            with open(output_file, 'w', encoding='utf-8') as stream:
+                orchestrator.stream = stream
+                results = orchestrator.run_all_validations(args.validators, jobs=args.jobs)
+            print(f"\nResults streamed to: {output_file}")
+        else:
+            results = orchestrator.run_all_validations(args.validators, jobs=args.jobs)
+            
+            # Save detailed results
+            orchestrator.save_results(output_file)
         
         # Print summary
         if not args.quiet:
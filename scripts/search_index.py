@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+Section Search Index for Denmark Living Documentation System
+
+This module turns the H2 sections of the documentation into a local search
+index, so retrieval can be tested offline without OpenAI or Supabase:
+- One entry per H2 section, the same sections TokenCounter checks against
+  the token limit, identified by ``path#anchor``
+- A BM25 inverted index over the section heading, text, document title and
+  frontmatter keywords
+- Frontmatter category, audience and keywords stored with each section and
+  usable as search filters
+- Stored as gzip-compressed JSON with delta-encoded postings, together with
+  the content hash of every source file, so an unchanged tree is loaded
+  instead of rebuilt
+
+Usage:
+    python scripts/search_index.py build docs/denmark-living
+    python scripts/search_index.py search docs/denmark-living "cpr number" --category "Arrival Process"
+
+Requirements: 1.4
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import math
+import argparse
+import unicodedata
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from tokenizer import clean_markdown
+from anchor_index import fenced_lines, heading_anchors
+
+
+# On-disk index, relative to the working directory
+DEFAULT_INDEX_FILE = Path('.search_index.json.gz')
+INDEX_FORMAT_VERSION = 1
+
+# BM25 parameters (the usual Lucene defaults)
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+# Heading terms are counted this many times, so a match in the heading
+# outweighs a passing mention in the text
+HEADING_WEIGHT = 2
+
+WORD_PATTERN = re.compile(r'[^\W_]+')
+
+STOPWORDS = frozenset("""
+a an and are as at be by can do for from has have how i if in is it its of on
+or that the their this to was what when where which who will with you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search terms.
+    
+    Markdown formatting and link targets are removed, Danish letters are
+    kept and English stopwords are dropped.
+    
+    Args:
+        text: Markdown or query text
+        
+    Returns:
+        Terms in text order
+    """
+    text = unicodedata.normalize('NFC', clean_markdown(text).lower())
+    return [word for word in WORD_PATTERN.findall(text) if word not in STOPWORDS]
+
+
+def _as_list(value: Any) -> List[str]:
+    """Normalize a frontmatter value to a list of strings."""
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    return [str(value)]
+
+
+def section_anchors(document: ParsedDocument) -> Dict[int, str]:
+    """
+    Map heading line numbers to their GitHub-style anchors.
+    
+    Args:
+        document: Parsed document
+        
+    Returns:
+        Dictionary of 1-based heading line -> anchor
+    """
+    fenced = fenced_lines(document.lines)
+    headings = [heading for heading in document.headings if heading['line'] not in fenced]
+    return dict(zip((heading['line'] for heading in headings), heading_anchors(headings)))
+
+
+def document_sections(document: ParsedDocument, relative_path: str) -> List[Dict[str, Any]]:
+    """
+    Build the index entries for the H2 sections of a document.
+    
+    Args:
+        document: Parsed document
+        relative_path: Document path relative to the documentation root
+        
+    Returns:
+        Section entries with id, location, title and frontmatter fields,
+        plus the section text under ``'text'``
+    """
+    if document.content is None:
+        return []
+    
+    frontmatter = document.frontmatter
+    title = document.title or relative_path
+    
+    anchors = section_anchors(document)
+    sections = []
+    for section in document.h2_sections:
+        anchor = anchors.get(section['line'], f"line-{section['line']}")
+        entry = {
+            'id': f"{relative_path}#{anchor}",
+            'path': relative_path,
+            'heading': section['heading'],
+            'title': title,
+            'start_line': section['start_line'],
+            'end_line': section['end_line'],
+            'category': frontmatter.get('category') if isinstance(frontmatter.get('category'), str) else None,
+            'audience': _as_list(frontmatter.get('audience')),
+            'keywords': _as_list(frontmatter.get('keywords')),
+            'text': section['content']
+        }
+        sections.append(entry)
+    return sections
+
+
+def section_terms(section: Dict[str, Any]) -> List[str]:
+    """
+    Terms indexed for a section.
+    
+    Args:
+        section: Section entry from ``document_sections``
+        
+    Returns:
+        Heading terms (weighted), title and keyword terms and text terms
+    """
+    terms = tokenize(section['heading']) * HEADING_WEIGHT
+    terms.extend(tokenize(section['title']))
+    terms.extend(tokenize(' '.join(section['keywords'])))
+    terms.extend(tokenize(section['text']))
+    return terms
+
+
+class SearchIndex:
+    """BM25 inverted index over the H2 sections of the documentation."""
+    
+    def __init__(self, sections: List[Dict[str, Any]], postings: Dict[str, tuple],
+                 lengths: List[int], sources: Dict[str, str],
+                 k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        self.sections = sections
+        self.postings = postings
+        self.lengths = lengths
+        self.sources = sources
+        self.k1 = k1
+        self.b = b
+        self.average_length = sum(lengths) / len(lengths) if lengths else 0.0
+        self._idf = {}
+    
+    @classmethod
+    def build(cls, corpus: DocumentCorpus, k1: float = DEFAULT_K1, b: float = DEFAULT_B) -> 'SearchIndex':
+        """
+        Index every H2 section of a corpus.
+        
+        Args:
+            corpus: Loaded documentation corpus
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+            
+        Returns:
+            SearchIndex with sections ordered by path and position
+        """
+        documents = sorted(
+            ((document.path.relative_to(corpus.directory).as_posix(), document) for document in corpus),
+            key=lambda item: item[0]
+        )
+        
+        sections = []
+        lengths = []
+        term_frequencies = {}
+        sources = {}
+        
+        for relative_path, document in documents:
+            if document.content is None:
+                continue
+            sources[relative_path] = document.content_hash
+            
+            for section in document_sections(document, relative_path):
+                section_id = len(sections)
+                terms = section_terms(section)
+                
+                counts = {}
+                for term in terms:
+                    counts[term] = counts.get(term, 0) + 1
+                for term, count in counts.items():
+                    term_frequencies.setdefault(term, []).append((section_id, count))
+                
+                # The text is indexed, not stored; line ranges locate it
+                del section['text']
+                sections.append(section)
+                lengths.append(len(terms))
+        
+        postings = {
+            term: (tuple(section_id for section_id, _ in entries), tuple(count for _, count in entries))
+            for term, entries in term_frequencies.items()
+        }
+        return cls(sections, postings, lengths, sources, k1=k1, b=b)
+    
+    @classmethod
+    def load(cls, index_file: Path) -> Optional['SearchIndex']:
+        """
+        Read an index written by ``save``.
+        
+        Args:
+            index_file: Path of the index file
+            
+        Returns:
+            SearchIndex, or None if the file is missing, unreadable or of an
+            older format
+        """
+        try:
+            with gzip.open(index_file, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError, EOFError):
+            return None
+        
+        if data.get('format_version') != INDEX_FORMAT_VERSION:
+            return None
+        
+        postings = {}
+        for term, (deltas, counts) in zip(data['terms'], data['postings']):
+            section_ids = []
+            section_id = 0
+            for delta in deltas:
+                section_id += delta
+                section_ids.append(section_id)
+            postings[term] = (tuple(section_ids), tuple(counts))
+        
+        return cls(data['sections'], postings, data['lengths'], data['sources'],
+                   k1=data['k1'], b=data['b'])
+    
+    @classmethod
+    def for_corpus(cls, corpus: DocumentCorpus,
+                   index_file: Optional[Path] = DEFAULT_INDEX_FILE) -> 'SearchIndex':
+        """
+        Load the stored index if it matches the corpus, otherwise rebuild it.
+        
+        Args:
+            corpus: Loaded documentation corpus
+            index_file: On-disk index, or None to always build in memory
+            
+        Returns:
+            SearchIndex for the current content of the corpus
+        """
+        if index_file is not None:
+            index = cls.load(index_file)
+            if index is not None and index.sources == corpus_sources(corpus):
+                return index
+        
+        index = cls.build(corpus)
+        if index_file is not None:
+            index.save(index_file)
+        return index
+    
+    def save(self, index_file: Path) -> None:
+        """
+        Write the index atomically as gzip-compressed JSON.
+        
+        Postings are stored per term as section id deltas and term counts.
+        
+        Args:
+            index_file: Path of the index file
+        """
+        terms = sorted(self.postings)
+        postings = []
+        for term in terms:
+            section_ids, counts = self.postings[term]
+            deltas = [section_ids[0]] + [b - a for a, b in zip(section_ids, section_ids[1:])]
+            postings.append([deltas, list(counts)])
+        
+        data = {
+            'format_version': INDEX_FORMAT_VERSION,
+            'k1': self.k1,
+            'b': self.b,
+            'sources': self.sources,
+            'sections': self.sections,
+            'lengths': self.lengths,
+            'terms': terms,
+            'postings': postings
+        }
+        
+        temp_file = index_file.with_name(index_file.name + '.tmp')
+        with gzip.open(temp_file, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_file, index_file)
+    
+    def __len__(self) -> int:
+        return len(self.sections)
+    
+    def idf(self, term: str) -> float:
+        """
+        BM25 inverse document frequency of a term, over sections.
+        
+        Args:
+            term: Search term
+            
+        Returns:
+            IDF weight (0.0 for terms not in the index)
+        """
+        if term not in self._idf:
+            postings = self.postings.get(term)
+            if not postings:
+                self._idf[term] = 0.0
+            else:
+                df = len(postings[0])
+                self._idf[term] = math.log(1 + (len(self.sections) - df + 0.5) / (df + 0.5))
+        return self._idf[term]
+    
+    def _matches_filters(self, section: Dict[str, Any], category: Optional[str],
+                         audience: Optional[str], keyword: Optional[str]) -> bool:
+        """Check a section against the frontmatter filters."""
+        if category is not None and section['category'] != category:
+            return False
+        if audience is not None and audience not in section['audience']:
+            return False
+        if keyword is not None and keyword.lower() not in (k.lower() for k in section['keywords']):
+            return False
+        return True
+    
+    def search(self, query: str, k: int = 10, category: Optional[str] = None,
+               audience: Optional[str] = None, keyword: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Rank sections against a query with BM25.
+        
+        Args:
+            query: Free-text query
+            k: Maximum number of results
+            category: Only return sections of this frontmatter category
+            audience: Only return sections whose audience includes this value
+            keyword: Only return sections with this frontmatter keyword
+            
+        Returns:
+            Section entries with a ``'score'``, best first (ties by index order)
+        """
+        scores = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for section_id, count in zip(*postings):
+                length_norm = 1 - self.b + self.b * self.lengths[section_id] / self.average_length
+                weight = idf * count * (self.k1 + 1) / (count + self.k1 * length_norm)
+                scores[section_id] = scores.get(section_id, 0.0) + weight
+        
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        results = []
+        for section_id, score in ranked:
+            section = self.sections[section_id]
+            if not self._matches_filters(section, category, audience, keyword):
+                continue
+            results.append(dict(section, score=round(score, 6)))
+            if len(results) == k:
+                break
+        return results
+    
+    def summary(self) -> Dict[str, Any]:
+        """Size statistics of the index."""
+        return {
+            'documents': len(self.sources),
+            'sections': len(self.sections),
+            'terms': len(self.postings),
+            'postings': sum(len(section_ids) for section_ids, _ in self.postings.values()),
+            'average_section_terms': round(self.average_length, 1)
+        }
+
+
+def corpus_sources(corpus: DocumentCorpus) -> Dict[str, str]:
+    """
+    Content hashes of the readable documents of a corpus.
+    
+    Args:
+        corpus: Loaded documentation corpus
+        
+    Returns:
+        Dictionary of relative path -> SHA-256 of the content
+    """
+    return {
+        document.path.relative_to(corpus.directory).as_posix(): document.content_hash
+        for document in corpus
+        if document.content is not None
+    }
+
+
+def print_results(results: Iterable[Dict[str, Any]]):
+    """
+    Print search results in a readable format.
+    
+    Args:
+        results: Results from ``SearchIndex.search``
+    """
+    results = list(results)
+    if not results:
+        print("No matching sections")
+        return
+    
+    for rank, result in enumerate(results, 1):
+        print(f"{rank:2}. {result['score']:.3f}  {result['id']}")
+        details = f"    {result['title']} > {result['heading']} (lines {result['start_line']}-{result['end_line']})"
+        if result['category']:
+            details += f" [{result['category']}]"
+        print(details)
+
+
+def main():
+    """Main function to build or query the search index."""
+    parser = argparse.ArgumentParser(description='Build and query the H2 section search index')
+    parser.add_argument('command', choices=['build', 'search'], help='Build the index or run a query')
+    parser.add_argument('path', help='Documentation directory')
+    parser.add_argument('query', nargs='?', help='Search query (for search)')
+    parser.add_argument('--index', default=str(DEFAULT_INDEX_FILE),
+                        help=f'Index file (default: {DEFAULT_INDEX_FILE})')
+    parser.add_argument('-k', type=int, default=10, help='Number of results (default: 10)')
+    parser.add_argument('--category', help='Only return sections of this category')
+    parser.add_argument('--audience', help='Only return sections for this audience')
+    parser.add_argument('--keyword', help='Only return sections with this keyword')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    
+    args = parser.parse_args()
+    
+    directory = Path(args.path)
+    if not directory.is_dir():
+        print(f"Error: Directory '{directory}' does not exist")
+        sys.exit(1)
+    
+    corpus = DocumentCorpus.load(directory)
+    index_file = Path(args.index)
+    
+    if args.command == 'build':
+        index = SearchIndex.build(corpus)
+        index.save(index_file)
+        summary = index.summary()
+        print(f"Indexed {summary['sections']} sections from {summary['documents']} documents "
+              f"({summary['terms']} terms) into {index_file} ({index_file.stat().st_size:,} bytes)")
+        return
+    
+    if not args.query:
+        parser.error('search requires a query')
+    
+    index = SearchIndex.for_corpus(corpus, index_file)
+    results = index.search(args.query, k=args.k, category=args.category,
+                           audience=args.audience, keyword=args.keyword)
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        print_results(results)
+
+
+if __name__ == '__main__':
+    main()
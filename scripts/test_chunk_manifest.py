@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Chunk Manifest
+
+This module verifies that chunk IDs and hashes are stable, that token counts
+match TokenCounter and that only added, changed and deleted chunks end up in
+the delta.
+
+Requirements: 1.4
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from count_tokens import TokenCounter
+from chunk_manifest import ChunkManifest
+
+
+GUIDE = """# Moving Guide
+
+## Before You Move
+
+Give notice to your landlord.
+
+## After You Arrive
+
+Register your address with Borgerservice.
+
+## Checklist
+
+- Bank account
+- Doctor
+"""
+
+
+@pytest.fixture
+def docs(tmp_path):
+    """Create a documentation tree with two documents."""
+    docs = tmp_path / "docs"
+    (docs / "housing").mkdir(parents=True)
+    (docs / "housing" / "moving.md").write_text(GUIDE, encoding='utf-8')
+    (docs / "index.md").write_text("# Index\n\n## Topics\n\nHousing.\n", encoding='utf-8')
+    return docs
+
+
+class TestChunkManifest:
+    """Test suite for building, storing and diffing chunk manifests."""
+    
+    def test_chunks(self, docs):
+        """Test chunk IDs, heading paths and TokenCounter token counts."""
+        manifest = ChunkManifest.build(DocumentCorpus.load(docs))
+        
+        assert [chunk['id'] for chunk in manifest] == [
+            'housing/moving.md#before-you-move',
+            'housing/moving.md#after-you-arrive',
+            'housing/moving.md#checklist',
+            'index.md#topics'
+        ]
+        chunk = manifest.get('housing/moving.md#after-you-arrive')
+        assert chunk['heading_path'] == ['Moving Guide', 'After You Arrive']
+        assert (chunk['start_line'], chunk['end_line']) == (7, 10)
+        
+        counted = TokenCounter().count_file_tokens(docs / "housing" / "moving.md")
+        assert [c['token_count'] for c in manifest][:3] == [s['token_count'] for s in counted['sections']]
+    
+    def test_save_is_deterministic(self, docs, tmp_path):
+        """Test that the same docs produce the same manifest file."""
+        first, second = tmp_path / "first.json", tmp_path / "second.json"
+        ChunkManifest.build(DocumentCorpus.load(docs)).save(first)
+        ChunkManifest.build(DocumentCorpus.load(docs)).save(second)
+        
+        assert first.read_bytes() == second.read_bytes()
+        assert b'"content"' not in first.read_bytes()
+        assert ChunkManifest.load(first).diff(ChunkManifest.load(second))['summary']['unchanged'] == 4
+    
+    def test_delta(self, docs):
+        """Test that only added, changed and deleted chunks need embedding."""
+        previous = ChunkManifest.build(DocumentCorpus.load(docs))
+        
+        edited = GUIDE.replace("Give notice to your landlord.", "Give notice to your landlord.\n\nCancel utilities.")
+        edited = edited.replace("## Checklist", "## Packing")
+        (docs / "housing" / "moving.md").write_text(edited, encoding='utf-8')
+        (docs / "index.md").unlink()
+        (docs / "faq.md").write_text("# FAQ\n\n## Deposits\n\nThree months.\n", encoding='utf-8')
+        
+        delta = ChunkManifest.build(DocumentCorpus.load(docs)).diff(previous)
+        
+        assert [chunk['id'] for chunk in delta['added']] == ['faq.md#deposits', 'housing/moving.md#packing']
+        assert [chunk['id'] for chunk in delta['changed']] == ['housing/moving.md#before-you-move']
+        assert [chunk['id'] for chunk in delta['moved']] == ['housing/moving.md#after-you-arrive']
+        assert delta['deleted'] == ['housing/moving.md#checklist', 'index.md#topics']
+        assert delta['summary']['unchanged'] == 1
+        assert 'Cancel utilities.' in delta['changed'][0]['content']
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Test suite for the shared Document Corpus
+
+This module verifies that the parsed document views match what the
+individual validators previously computed from the raw file content.
+
+Requirements: All (Validation infrastructure)
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument, extract_h2_sections, stream_h2_sections
+from property_test_config import PropertyTestConfig, PropertyTestUtils
+from frontmatter_loader import YAML_AVAILABLE, parse_simple
+
+
+SAMPLE_DOCUMENT = """---
+title: "Sample"
+keywords: [cpr, mitid]
+---
+
+# Main Title
+
+## First Section
+
+Intro text.
+
+### Details
+
+More text.
+
+## Second Section
+
+Closing text.
+"""
+
+
+class TestParsedDocument:
+    """Test suite for ParsedDocument views."""
+    
+    def test_lines_and_offsets(self):
+        """Test that line offsets map back to the right line numbers."""
+        document = ParsedDocument(Path("sample.md"), content=SAMPLE_DOCUMENT)
+        
+        assert document.lines == SAMPLE_DOCUMENT.split('\n')
+        for i, offset in enumerate(document.line_offsets):
+            assert document.line_number(offset) == i + 1
+    
+    def test_frontmatter(self):
+        """Test frontmatter detection and parsing."""
+        document = ParsedDocument(Path("sample.md"), content=SAMPLE_DOCUMENT)
+        
+        assert document.has_frontmatter
+        assert document.frontmatter['title'] == "Sample"
+        assert document.title == "Sample"
+        assert ParsedDocument(Path("plain.md"), content="# Main Title\n\nText.\n").title == "Main Title"
+        assert document.frontmatter['keywords'] == ["cpr", "mitid"]
+    
+    def test_yaml_frontmatter_after_title(self):
+        """Test frontmatter after the H1 title, multi-line lists and dates kept as text."""
+        content = (
+            "# Housing\n\n---\ntitle: Housing\nlast_updated: 2025-01-15\n"
+            "audience:\n  - EU Citizens\n  - Non-EU Citizens\n---\n\n## Renting\n"
+        )
+        document = ParsedDocument(Path("housing.md"), content=content)
+        
+        assert document.frontmatter_range == (2, 8)
+        assert document.frontmatter == {
+            'title': "Housing",
+            'last_updated': "2025-01-15",
+            'audience': ["EU Citizens", "Non-EU Citizens"]
+        }
+        assert document.frontmatter_error is None
+        assert PropertyTestUtils.extract_frontmatter(content) == document.frontmatter
+        assert parse_simple(document.frontmatter_text) == document.frontmatter
+    
+    def test_invalid_frontmatter(self):
+        """Test that invalid YAML is reported with its line number."""
+        document = ParsedDocument(Path("broken.md"), content="---\ntitle: [unclosed\n---\n# Title\n")
+        
+        assert document.frontmatter == {}
+        if YAML_AVAILABLE:
+            assert document.frontmatter_error.startswith("Line 3: Invalid YAML frontmatter")
+        
+        # A horizontal rule pair further down is not frontmatter
+        document = ParsedDocument(Path("log.md"), content="# Log\n\nText.\n\n---\n\n*Note*: text\n\n---\n")
+        assert not document.has_frontmatter
+    
+    def test_headings_match_line_numbers(self):
+        """Test that headings carry the same line numbers as a full rescan."""
+        document = ParsedDocument(Path("sample.md"), content=SAMPLE_DOCUMENT)
+        
+        expected = [
+            (1, "Main Title", 6),
+            (2, "First Section", 8),
+            (3, "Details", 12),
+            (2, "Second Section", 16)
+        ]
+        assert [(h['level'], h['text'], h['line']) for h in document.headings] == expected
+        
+        # Same headings as the property test utilities extract
+        assert [(h['level'], h['text']) for h in document.headings] == [
+            (h['level'], h['text']) for h in PropertyTestUtils.extract_headings(SAMPLE_DOCUMENT)
+        ]
+    
+    def test_heading_tree(self):
+        """Test that headings are nested by level."""
+        document = ParsedDocument(Path("sample.md"), content=SAMPLE_DOCUMENT)
+        
+        tree = document.heading_tree
+        assert len(tree) == 1
+        assert [child['text'] for child in tree[0]['children']] == ["First Section", "Second Section"]
+        assert tree[0]['children'][0]['children'][0]['text'] == "Details"
+    
+    def test_h2_sections(self):
+        """Test H2 section boundaries and content."""
+        document = ParsedDocument(Path("sample.md"), content=SAMPLE_DOCUMENT)
+        
+        sections = document.h2_sections
+        assert [s['heading'] for s in sections] == ["First Section", "Second Section"]
+        assert sections[0]['content'] == "Intro text.\n\n### Details\n\nMore text."
+        assert sections[0]['start_line'] == 8 and sections[0]['end_line'] == 15
+        assert extract_h2_sections(SAMPLE_DOCUMENT.split('\n')) == sections
+    
+    def test_h2_sections_edge_cases(self):
+        """Test empty sections, H1 boundaries and end of file."""
+        lines = "# Title\n## Empty\n## Body\ntext\n# Next\nignored\n## Last\ntail".split('\n')
+        
+        sections = extract_h2_sections(lines)
+        assert [(s['heading'], s['content'], s['end_line']) for s in sections] == [
+            ("Empty", "", 2),
+            ("Body", "text", 4),
+            ("Last", "tail", 8)
+        ]
+        assert extract_h2_sections(lines, '\n'.join(lines), ParsedDocument(Path("x.md"), '\n'.join(lines)).line_offsets) == sections
+    
+    @pytest.mark.parametrize("ending", ["", "\n", "\n\n"])
+    def test_stream_h2_sections_matches_in_memory(self, tmp_path, ending):
+        """Test that streamed sections equal sections from the full content."""
+        file_path = tmp_path / "sample.md"
+        file_path.write_text(SAMPLE_DOCUMENT.rstrip('\n') + ending, encoding='utf-8')
+        
+        document = ParsedDocument.from_file(file_path)
+        assert list(stream_h2_sections(file_path)) == document.h2_sections
+    
+    def test_unreadable_file(self, tmp_path):
+        """Test that read errors are deferred to the validators."""
+        document = ParsedDocument.from_file(tmp_path / "missing.md")
+        
+        assert document.error is not None
+        assert document.lines == []
+        with pytest.raises(OSError):
+            document.read()
+
+
+class TestDocumentCorpus:
+    """Test suite for DocumentCorpus loading."""
+    
+    def test_load_directory(self, tmp_path):
+        """Test that every markdown file is loaded exactly once."""
+        (tmp_path / "housing").mkdir()
+        (tmp_path / "index.md").write_text("# Index\n", encoding='utf-8')
+        (tmp_path / "housing" / "overview.md").write_text("# Housing\n", encoding='utf-8')
+        (tmp_path / "notes.txt").write_text("not markdown", encoding='utf-8')
+        
+        corpus = DocumentCorpus.load(tmp_path)
+        assert len(corpus) == 2
+        assert sorted(p.name for p in corpus.paths) == ["index.md", "overview.md"]
+        assert corpus.get(tmp_path / "index.md").headings[0]['text'] == "Index"
+        
+        flat_corpus = DocumentCorpus.load(tmp_path, recursive=False)
+        assert [p.name for p in flat_corpus.paths] == ["index.md"]
+    
+    def test_load_cached(self, tmp_path, monkeypatch):
+        """Test that the cached corpus is reused until files are added or removed."""
+        (tmp_path / "housing").mkdir()
+        (tmp_path / "housing" / "overview.md").write_text("# Housing\n", encoding='utf-8')
+        
+        corpus = DocumentCorpus.load_cached(tmp_path)
+        assert DocumentCorpus.load_cached(tmp_path) is corpus
+        
+        # Property tests read documentation files from the cache, not from disk
+        monkeypatch.setattr(PropertyTestConfig, 'DOCS_ROOT', tmp_path)
+        monkeypatch.setattr('builtins.open', None)
+        assert PropertyTestUtils.read_file_content(tmp_path / "housing" / "overview.md") == "# Housing\n"
+        monkeypatch.undo()
+        
+        (tmp_path / "housing" / "rent.md").write_text("# Rent\n", encoding='utf-8')
+        reloaded = DocumentCorpus.load_cached(tmp_path)
+        assert reloaded is not corpus and len(reloaded) == 2
+        
+        assert len(DocumentCorpus.load_cached(tmp_path / "missing")) == 0
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
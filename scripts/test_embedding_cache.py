@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Embedding Cache
+
+This module verifies the hashing stand-in provider, batching and that
+re-runs only embed chunks whose content changed.
+
+Requirements: 1.4
+"""
+
+import sys
+import math
+import pytest
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from chunk_manifest import ChunkManifest
+from embedding_cache import EmbeddingCache, EmbeddingProvider, HashingProvider, embed_chunks, batches
+
+
+class CountingProvider(HashingProvider):
+    """Hashing provider that records the size of each request."""
+    
+    def __init__(self, dimension: int = 32):
+        super().__init__(dimension)
+        self.requests = []
+    
+    def embed_batch(self, texts):
+        self.requests.append(len(texts))
+        return super().embed_batch(texts)
+
+
+def cosine(a, b):
+    """Dot product, the cosine similarity of unit vectors."""
+    return sum(x * y for x, y in zip(a, b))
+
+
+@pytest.fixture
+def docs(tmp_path):
+    """Create a documentation tree with five sections."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "housing.md").write_text(
+        "# Housing\n\n## Deposit\n\nThe deposit is three months of rent.\n\n"
+        "## Utilities\n\nElectricity and water are paid monthly.\n\n"
+        "## Moving Out\n\nThe landlord inspects the apartment.\n",
+        encoding='utf-8'
+    )
+    (docs / "cpr.md").write_text(
+        "# CPR\n\n## Register\n\nBook a time at Borgerservice.\n\n## Documents\n\nBring your passport.\n",
+        encoding='utf-8'
+    )
+    return docs
+
+
+class TestHashingProvider:
+    """Test suite for the deterministic stand-in provider."""
+    
+    def test_deterministic_unit_vectors(self):
+        """Test that vectors are repeatable, normalized and closer for related texts."""
+        provider = HashingProvider()
+        deposit = provider.embed("The deposit is three months of rent")
+        
+        assert deposit == HashingProvider().embed("The deposit is three months of rent")
+        assert math.isclose(math.sqrt(cosine(deposit, deposit)), 1.0)
+        assert cosine(deposit, provider.embed("rent deposit")) > cosine(deposit, provider.embed("passport appointment"))
+        assert provider.embed("") == [0.0] * provider.dimension
+    
+    def test_incomplete_provider(self):
+        """Test that a provider without ``embed_batch`` cannot be created."""
+        class NamedOnly(EmbeddingProvider):
+            name = 'named'
+        
+        with pytest.raises(TypeError):
+            NamedOnly()
+
+
+class TestEmbeddingCache:
+    """Test suite for cached, batched embedding."""
+    
+    def test_only_changed_chunks_are_embedded(self, docs, tmp_path):
+        """Test batching, reuse across runs and that edits embed only their chunk."""
+        cache_directory = tmp_path / "cache"
+        provider = CountingProvider()
+        
+        manifest = ChunkManifest.build(DocumentCorpus.load(docs))
+        stats = embed_chunks(manifest, provider, EmbeddingCache(cache_directory, provider.key, provider.dimension),
+                             batch_size=2)
+        assert (stats['embedded'], stats['cached'], stats['batches']) == (5, 0, 3)
+        assert provider.requests == [2, 2, 1]
+        
+        housing = (docs / "housing.md").read_text(encoding='utf-8')
+        (docs / "housing.md").write_text(housing.replace("three months", "two months"), encoding='utf-8')
+        manifest = ChunkManifest.build(DocumentCorpus.load(docs))
+        
+        cache = EmbeddingCache(cache_directory, provider.key, provider.dimension)
+        stats = embed_chunks(manifest, provider, cache)
+        assert (stats['embedded'], stats['cached']) == (1, 4)
+        
+        chunk = manifest.get('housing.md#deposit')
+        reopened = EmbeddingCache(cache_directory, provider.key, provider.dimension)
+        expected = provider.embed_batch([f"Housing > Deposit\n\n{chunk['content']}"])[0]
+        assert reopened.get(chunk['content_hash']) == pytest.approx(expected, abs=1e-6)
+        assert len(reopened) == 6
+        
+        assert reopened.prune(c['content_hash'] for c in manifest) == 1
+        assert len(EmbeddingCache(cache_directory, provider.key, provider.dimension)) == 5
+    
+    def test_unsaved_rows_and_other_providers(self, tmp_path):
+        """Test that unsaved rows are dropped and another provider starts empty."""
+        cache = EmbeddingCache(tmp_path, 'hashing:test:2', 2)
+        cache.put_many([('a', [1.0, 0.0])])
+        cache.save()
+        cache.put_many([('b', [0.0, 1.0])])
+        cache.close()
+        
+        reopened = EmbeddingCache(tmp_path, 'hashing:test:2', 2)
+        assert reopened.ids == ['a'] and 'b' not in reopened
+        assert (tmp_path / "vectors.f32").stat().st_size == 8
+        reopened.close()
+        
+        other = EmbeddingCache(tmp_path, 'openai:model:2', 2)
+        assert len(other) == 0
+        other.put_many([('c', [0.5, 0.5])])
+        other.save()
+        assert EmbeddingCache(tmp_path, 'openai:model:2', 2).get('c') == [0.5, 0.5]
+    
+    def test_token_budget_batches(self):
+        """Test that batches respect the token budget."""
+        chunks = [{'token_count': tokens} for tokens in (400, 400, 300, 900, 50)]
+        
+        assert [[c['token_count'] for c in batch] for batch in batches(chunks, batch_tokens=1000)] == [
+            [400, 400],
+            [300],
+            [900, 50]
+        ]
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
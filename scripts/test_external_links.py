@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test suite for the External Link Checker
+
+This module checks links against a local stand-in HTTP server and against
+recorded responses, so no network access is needed.
+
+Requirements: 1.5, 6.4
+"""
+
+import sys
+import time
+import threading
+import pytest
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from validator_registry import ValidatorRegistry
+from check_external_links import (
+    ExternalLinkChecker, ExternalLinkValidator, HttpResolver, FixtureResolver,
+    LinkCheckCache, LinkResolver, link_result, save_fixture
+)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers like a small website and tracks concurrent requests."""
+    
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+    
+    def _respond(self, send_body):
+        with self.lock:
+            StandInHandler.active += 1
+            StandInHandler.max_active = max(StandInHandler.max_active, StandInHandler.active)
+        try:
+            if self.path.startswith('/slow'):
+                time.sleep(0.05)
+            if self.path == '/gone':
+                status = 404
+            elif self.path == '/get-only' and not send_body:
+                status = 405
+            else:
+                status = 200
+            self.send_response(status)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        finally:
+            with self.lock:
+                StandInHandler.active -= 1
+    
+    def do_HEAD(self):
+        self._respond(send_body=False)
+    
+    def do_GET(self):
+        self._respond(send_body=True)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Run the stand-in server on a free local port."""
+    StandInHandler.max_active = 0
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestExternalLinkChecker:
+    """Test suite for concurrent checking and caching."""
+    
+    def test_http_resolver(self, server):
+        """Test status handling, including the GET fallback for HEAD-less servers."""
+        checker = ExternalLinkChecker(HttpResolver(timeout=5))
+        results = checker.check([f"{server}/ok", f"{server}/gone", f"{server}/get-only", "http://127.0.0.1:9/closed"])
+        
+        assert results[f"{server}/ok"]['ok']
+        assert results[f"{server}/gone"]['status'] == 404
+        assert results[f"{server}/get-only"]['ok']
+        assert not results["http://127.0.0.1:9/closed"]['ok']
+        assert results["http://127.0.0.1:9/closed"]['status'] is None
+    
+    def test_per_host_limit(self, server):
+        """Test that no more than the per-host limit of requests run at once."""
+        urls = [f"{server}/slow/{i}" for i in range(8)]
+        checker = ExternalLinkChecker(HttpResolver(timeout=5), per_host=2, concurrency=8)
+        
+        results = checker.check(urls + urls)
+        
+        assert list(results) == urls
+        assert all(result['ok'] for result in results.values())
+        assert checker.stats['checked'] == 8
+        assert StandInHandler.max_active == 2
+    
+    def test_ttl_cache(self, tmp_path):
+        """Test that results persist and expire after their time-to-live."""
+        cache_file = tmp_path / "links.json"
+        cache = LinkCheckCache(cache_file, ttl=100, failure_ttl=10)
+        cache.put(link_result('https://borger.dk/', status=200))
+        cache.put(link_result('https://skat.dk/', status=503, error='HTTP 503'))
+        cache.save()
+        
+        reloaded = LinkCheckCache(cache_file, ttl=100, failure_ttl=10)
+        now = time.time()
+        assert reloaded.get('https://borger.dk/', now=now + 50)['ok']
+        assert reloaded.get('https://skat.dk/', now=now + 50) is None
+        assert reloaded.get('https://borger.dk/', now=now + 150) is None
+        
+        # The failure was recorded 20s ago, beyond its 10s time-to-live
+        reloaded.results['https://skat.dk/']['checked_at'] -= 20
+        checker = ExternalLinkChecker(FixtureResolver({}), reloaded)
+        checker.check(['https://borger.dk/', 'https://skat.dk/'])
+        assert checker.stats == {'cache_hits': 1, 'checked': 1}
+    
+    def test_incomplete_resolver(self):
+        """Test that a resolver without ``resolve`` cannot be created."""
+        class NamedOnly(LinkResolver):
+            name = 'named'
+        
+        with pytest.raises(TypeError):
+            NamedOnly()
+
+
+class TestExternalLinkValidator:
+    """Test suite for validating a corpus from recorded responses."""
+    
+    def test_validate_with_fixture(self, tmp_path):
+        """Test errors for missing pages, warnings for unverifiable links and source_url checks."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "guide.md").write_text(
+            '---\nsource_url: "https://borger.dk/bolig"\n---\n\n# Guide\n\n'
+            '- [Skat](https://skat.dk/old-page)\n'
+            '- [MitID](https://www.mitid.dk/ "MitID")\n'
+            '- [SU](https://www.su.dk/)\n',
+            encoding='utf-8'
+        )
+        fixture = tmp_path / "fixture.json"
+        save_fixture({
+            'https://borger.dk/bolig': link_result('https://borger.dk/bolig', status=200),
+            'https://skat.dk/old-page': link_result('https://skat.dk/old-page', status=404, error='HTTP 404 Not Found'),
+            'https://www.mitid.dk/': link_result('https://www.mitid.dk/', status=403, error='HTTP 403 Forbidden')
+        }, fixture)
+        
+        validator = ExternalLinkValidator(fixture=fixture, cache_file=tmp_path / "cache.json")
+        results = validator.validate_corpus(DocumentCorpus.load(docs))
+        file_result = results['files'][0]
+        
+        assert results['resolver'] == 'fixture'
+        assert results['summary']['total_links'] == 4
+        assert file_result['errors'] == ["Line 7: Broken external link https://skat.dk/old-page (HTTP 404 Not Found)"]
+        assert len(file_result['warnings']) == 2
+        assert file_result['links'][-1] == {'url': 'https://borger.dk/bolig', 'text': 'source_url', 'line': 2}
+        
+        again = ExternalLinkValidator(resolver=FixtureResolver({}), cache_file=tmp_path / "cache.json")
+        summary = again.validate_corpus(DocumentCorpus.load(docs))['summary']
+        assert (summary['cache_hits'], summary['checked'], summary['broken_links']) == (4, 0, 1)
+    
+    def test_opt_in_validator(self):
+        """Test that external links are only checked when selected."""
+        registry = ValidatorRegistry(Path(__file__).parent)
+        
+        assert 'external_links' in registry.validators
+        assert 'external_links' not in registry.default_validators()
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Glossary Index
+
+This module verifies glossary parsing, the validator views of the index and
+the in-memory and on-disk caching of parsed glossaries.
+
+Requirements: 2.4, 4.7
+"""
+
+import os
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from glossary_index import GlossaryIndex
+
+
+SAMPLE_GLOSSARY = """# Glossary
+
+## B
+
+### Boligstøtte  
+**English**: Housing benefit  
+**Pronunciation**: BO-lee-stur-teh  
+**Definition**: Monthly subsidy towards rent.  
+
+#### Related
+
+**English**: Ignored  
+
+### CPR-nummer  
+**English**: Civil registration number  
+"""
+
+
+class TestGlossaryIndex:
+    """Test suite for glossary parsing and caching."""
+    
+    def test_parse_entries(self):
+        """Test that entries collect their fields and skip H4 subsections."""
+        index = GlossaryIndex.parse(SAMPLE_GLOSSARY)
+        
+        assert index.terms == ["Boligstøtte", "CPR-nummer"]
+        assert index.get("boligstøtte") == {
+            'term': "Boligstøtte",
+            'english': "Ignored",
+            'pronunciation': "BO-lee-stur-teh",
+            'definition': "Monthly subsidy towards rent."
+        }
+        assert index.incomplete_entries() == [index.get("CPR-nummer")]
+    
+    def test_validator_views(self):
+        """Test the dictionary formats used by the translation and terminology validators."""
+        index = GlossaryIndex.parse(SAMPLE_GLOSSARY)
+        
+        assert set(index.danish_terms()) == {"boligstøtte", "cpr-nummer"}
+        
+        terminology = index.terminology_terms()
+        assert list(terminology) == ["ignored", "boligstøtte", "Boligstøtte",
+                                     "civil registration number", "cpr-nummer", "CPR-nummer"]
+        assert terminology["ignored"] is terminology["Boligstøtte"]
+        assert terminology["cpr-nummer"] == {
+            'canonical_term': "CPR-nummer",
+            'term_lower': "cpr-nummer",
+            'english': "Civil registration number"
+        }
+    
+    def test_cached_across_processes(self, tmp_path, monkeypatch):
+        """Test that an unchanged glossary is loaded from the on-disk cache without parsing."""
+        glossary_path = tmp_path / "glossary.md"
+        glossary_path.write_text(SAMPLE_GLOSSARY, encoding='utf-8')
+        cache_file = tmp_path / "index.json"
+        
+        first = GlossaryIndex.load(glossary_path, cache_file=cache_file)
+        assert cache_file.exists()
+        
+        # A new process starts with an empty in-memory cache
+        monkeypatch.setattr('glossary_index._LOADED', {})
+        monkeypatch.setattr(GlossaryIndex, 'parse', classmethod(lambda cls, content, source=None: pytest.fail("re-parsed")))
+        assert GlossaryIndex.load(glossary_path, cache_file=cache_file).entries == first.entries
+        
+        # A touched but unchanged glossary is matched by its content hash
+        monkeypatch.setattr('glossary_index._LOADED', {})
+        stat = glossary_path.stat()
+        os.utime(glossary_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert GlossaryIndex.load(glossary_path, cache_file=cache_file).entries == first.entries
+    
+    def test_reloaded_after_edit(self, tmp_path):
+        """Test that editing the glossary invalidates both caches."""
+        glossary_path = tmp_path / "glossary.md"
+        glossary_path.write_text(SAMPLE_GLOSSARY, encoding='utf-8')
+        cache_file = tmp_path / "index.json"
+        
+        assert len(GlossaryIndex.load(glossary_path, cache_file=cache_file)) == 2
+        
+        glossary_path.write_text(SAMPLE_GLOSSARY + "\n### MitID  \n**English**: Digital ID  \n", encoding='utf-8')
+        index = GlossaryIndex.load(glossary_path, cache_file=cache_file)
+        assert index.terms[-1] == "MitID"
+        assert GlossaryIndex.load(glossary_path, cache_file=cache_file) is index
+    
+    def test_cache_next_to_glossary(self, tmp_path, monkeypatch):
+        """Test that a relative cache file is kept with the glossary and stale records are dropped."""
+        for name in ("first", "second"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "glossary.md").write_text(SAMPLE_GLOSSARY, encoding='utf-8')
+        shared = tmp_path / "index.json"
+        GlossaryIndex.load(tmp_path / "first" / "glossary.md", cache_file=shared)
+        (tmp_path / "first" / "glossary.md").unlink()
+        
+        GlossaryIndex.load(tmp_path / "second" / "glossary.md", cache_file=shared)
+        assert list(json.loads(shared.read_text(encoding='utf-8'))['glossaries']) == [
+            str((tmp_path / "second" / "glossary.md").resolve())
+        ]
+        
+        monkeypatch.setattr('glossary_index._LOADED', {})
+        GlossaryIndex.load(tmp_path / "second" / "glossary.md", cache_file=Path("cache.json"))
+        assert (tmp_path / "second" / "cache.json").exists()
+    
+    def test_missing_glossary(self, tmp_path):
+        """Test that a missing glossary yields an empty index."""
+        assert len(GlossaryIndex.load(tmp_path / "missing.md", cache_file=None)) == 0
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Glossary Term Matcher
+
+This module verifies that the Aho-Corasick matcher finds the same terms as
+the longest-first ``\\b(term1|term2|...)\\b`` regex it replaces.
+
+Requirements: 2.4, 4.7
+"""
+
+import re
+import pytest
+import sys
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from glossary_matcher import GlossaryMatcher
+
+try:
+    from hypothesis import given, strategies as st, settings
+    HYPOTHESIS_AVAILABLE = True
+except ImportError:
+    HYPOTHESIS_AVAILABLE = False
+
+
+def regex_matches(terms, text):
+    """Match terms line by line with the previous alternation regex."""
+    escaped_terms = sorted((re.escape(term) for term in terms), key=len, reverse=True)
+    pattern = re.compile(r'\b(' + '|'.join(escaped_terms) + r')\b', re.IGNORECASE)
+    return [match.group(1) for line in text.split('\n') for match in pattern.finditer(line)]
+
+
+def matcher_matches(terms, text):
+    """Match terms with the glossary matcher, flattened in line order."""
+    by_line = GlossaryMatcher(terms).find_by_line(text)
+    return [term for line_num in sorted(by_line) for term in by_line[line_num]]
+
+
+class TestGlossaryMatcher:
+    """Test suite for glossary term matching."""
+    
+    def test_danish_case_folding(self):
+        """Test that æ/ø/å match regardless of case."""
+        matcher = GlossaryMatcher(["boligstøtte", "Årsopgørelse"])
+        assert matcher.find_all("BOLIGSTØTTE and årsopgørelse") == ["BOLIGSTØTTE", "årsopgørelse"]
+    
+    def test_word_boundaries(self):
+        """Test that terms inside longer words are not matched."""
+        matcher = GlossaryMatcher(["skat", "CPR-nummer"])
+        assert matcher.find_all("bundskat, skat and skattekort") == ["skat"]
+        assert matcher.find_all("Your CPR-nummer: CPR-numre") == ["CPR-nummer"]
+    
+    def test_leftmost_longest(self):
+        """Test that the longest term wins at the same position."""
+        matcher = GlossaryMatcher(["CPR", "CPR-nummer", "nummer"])
+        assert matcher.find_all("CPR-nummer") == ["CPR-nummer"]
+    
+    def test_find_by_line(self):
+        """Test that matches are grouped by 1-based line number."""
+        matcher = GlossaryMatcher(["MitID", "NemKonto"])
+        assert matcher.find_by_line("Intro\nUse MitID\n\nSet up NemKonto and MitID") == {
+            2: ["MitID"],
+            4: ["NemKonto", "MitID"]
+        }
+    
+    def test_matches_regex_on_documentation(self):
+        """Test equivalence with the regex on real documentation text."""
+        terms = ["CPR-nummer", "SKAT", "MitID", "e-Boks", "Sundhedskort", "kommune", "A-kasse"]
+        docs_root = Path(__file__).parent.parent / "docs" / "denmark-living"
+        for file_path in list(docs_root.rglob("*.md"))[:10]:
+            text = file_path.read_text(encoding='utf-8')
+            assert matcher_matches(terms, text) == regex_matches(terms, text)
+    
+    if HYPOTHESIS_AVAILABLE:
+        @given(
+            terms=st.lists(st.text(alphabet="abæøÆØ -_1", min_size=1, max_size=4), min_size=1, max_size=6),
+            text=st.text(alphabet="abæøÆØ -_1.\n", max_size=60)
+        )
+        @settings(max_examples=200, deadline=None)
+        def test_matches_regex_property(self, terms, text):
+            """Test equivalence with the regex for arbitrary terms and text."""
+            assert matcher_matches(terms, text) == regex_matches(terms, text)
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
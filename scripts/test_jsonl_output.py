@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test suite for JSON Lines Output
+
+This module verifies that streamed validation results contain one record
+per file and validator, followed by a summary record that matches the
+regular results, that each validator's records end with its status, and
+that streamed file results are not kept in memory.
+
+Requirements: All (Validation infrastructure)
+"""
+
+import io
+import json
+import contextlib
+import pytest
+import sys
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from run_validation import ValidationOrchestrator
+from validation_cache import ValidatorCache
+
+
+SCRIPTS_DIR = Path(__file__).parent
+VALIDATORS = ['markdown', 'tokens', 'links', 'structure']
+
+
+@pytest.fixture
+def docs(tmp_path):
+    """Create a small documentation tree."""
+    docs = tmp_path / "docs"
+    (docs / "housing").mkdir(parents=True)
+    (docs / "housing" / "overview.md").write_text(
+        "# Housing\n\n## Renting\n\nSee [rent](rent.md) and [missing](missing.md).\n", encoding='utf-8')
+    (docs / "housing" / "rent.md").write_text(
+        "# Rent\n\n## Deposit\n\nThe deposit is three months of rent.\n", encoding='utf-8')
+    return docs
+
+
+class TestJsonlOutput:
+    """Test suite for streaming results as JSON Lines."""
+    
+    def test_records(self, docs):
+        """Test file records, section content being left out and the summary record."""
+        stream = io.StringIO()
+        streamed = ValidationOrchestrator(docs, SCRIPTS_DIR, stream=stream)
+        with contextlib.redirect_stdout(io.StringIO()):
+            streamed.run_all_validations(VALIDATORS)
+            full = ValidationOrchestrator(docs, SCRIPTS_DIR).run_all_validations(VALIDATORS)
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        
+        files = [record for record in records if record['type'] == 'file']
+        full_files = {name: full['validation_results'][name]['data']['files'] for name in VALIDATORS[:3]}
+        assert [(record['validator'], record['file']) for record in files] == [
+            (name, file_result['file']) for name in VALIDATORS[:3] for file_result in full_files[name]
+        ]
+        assert files[2]['sections'] == [
+            {key: value for key, value in section.items() if key != 'content'}
+            for section in full_files['tokens'][0]['sections']
+        ]
+        assert [len(record['broken_links']) for record in files[4:]] == [
+            len(file_result['broken_links']) for file_result in full_files['links']
+        ] and sorted(len(record['broken_links']) for record in files[4:]) == [0, 1]
+        
+        assert [(record['name'], record['success'], record['file_records'])
+                for record in records if record['type'] == 'validator'] == [
+            ('markdown', True, 2), ('tokens', True, 2), ('links', True, 2), ('structure', True, 0)
+        ]
+        
+        summary = records[-1]
+        assert summary['type'] == 'summary' and records.count(summary) == 1
+        assert summary['summary'] == full['summary']
+        assert summary['validation_results']['links']['data']['file_records'] == 2
+        assert 'files' not in summary['validation_results']['links']['data']
+        assert summary['validation_results']['structure']['data'] == full['validation_results']['structure']['data']
+    
+    def test_cached_results_are_released(self, docs, tmp_path, monkeypatch):
+        """Test that records are written from the validator loop and the cache keeps only JSON text."""
+        lookups = []
+        lookup = ValidatorCache.lookup
+        
+        def counting_lookup(cache, document, *args, **kwargs):
+            lookups.append(stream.getvalue().count('"type": "file"'))
+            return lookup(cache, document, *args, **kwargs)
+        
+        monkeypatch.setattr(ValidatorCache, 'lookup', counting_lookup)
+        
+        for run in ('cold', 'warm'):
+            lookups.clear()
+            stream = io.StringIO()
+            orchestrator = ValidationOrchestrator(docs, SCRIPTS_DIR, cache_file=tmp_path / "cache.json",
+                                                  stream=stream)
+            with contextlib.redirect_stdout(io.StringIO()):
+                orchestrator.run_all_validations(VALIDATORS)
+            
+            # Each file's record is written before the next file is looked up
+            assert lookups == list(range(6))
+            for name in VALIDATORS[:3]:
+                result = orchestrator.results['validation_results'][name]
+                assert result['cache'] == ({'hits': 0, 'misses': 2} if run == 'cold' else {'hits': 2, 'misses': 0})
+                assert 'files' not in result['data'] and result['data']['file_records'] == 2
+                entries = orchestrator.cache.sections[name].entries.values()
+                assert [type(entry['result']) for entry in entries] == [str, str]
+    
+    def test_failed_validator_record(self, docs, monkeypatch):
+        """Test that a validator failing partway is closed by a record with its error."""
+        stream = io.StringIO()
+        orchestrator = ValidationOrchestrator(docs, SCRIPTS_DIR, stream=stream)
+        validator_class = orchestrator.registry.load('markdown')
+        validate_document = validator_class.validate_document
+        calls = []
+        
+        def failing(validator, document):
+            calls.append(document.path)
+            if len(calls) == 2:
+                raise ValueError("parser crashed")
+            return validate_document(validator, document)
+        
+        monkeypatch.setattr(validator_class, 'validate_document', failing)
+        with contextlib.redirect_stdout(io.StringIO()):
+            orchestrator.run_all_validations(['markdown', 'links'])
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        
+        assert [(record['type'], record.get('validator', record.get('name'))) for record in records] == [
+            ('file', 'markdown'), ('validator', 'markdown'),
+            ('file', 'links'), ('file', 'links'), ('validator', 'links'),
+            ('summary', None)
+        ]
+        assert records[1] == {
+            'type': 'validator', 'name': 'markdown', 'success': False,
+            'error': "parser crashed", 'file_records': 1
+        }
+        assert records[4]['success'] and records[4]['error'] is None and records[4]['file_records'] == 2
+        assert records[-1]['summary']['failed_validators'] == 1
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
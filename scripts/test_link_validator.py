@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Link Validator
+
+This module verifies that relative links and ``#fragment`` anchors are
+checked against a snapshot of the documentation tree, and that heading
+anchors match the ones GitHub generates.
+
+Requirements: 1.5
+"""
+
+import os
+import sys
+import pytest
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from validate_links import LinkValidator
+from anchor_index import AnchorIndex, github_slug, heading_anchors
+
+
+SOURCE = """# Guide
+
+## Getting Started
+
+- [Rental contracts](housing/rental-contracts.md)
+- [Deposit rules](housing/rental-contracts.md#deposit-rules)
+- [Missing section](housing/rental-contracts.md#notice-period)
+- [Missing file](housing/sublet.md)
+- [Directory](housing)
+- [Outside](../outside.md)
+- [Image](images/map.png#top)
+- [This section](#getting-started)
+- [Nowhere](#nowhere)
+"""
+
+TARGET = """# Rental Contracts
+
+## Deposit Rules
+
+Text.
+"""
+
+
+@pytest.fixture
+def docs(tmp_path):
+    """Create a documentation tree with one linking document."""
+    docs = tmp_path / "docs"
+    (docs / "housing").mkdir(parents=True)
+    (docs / "images").mkdir()
+    (docs / "guide.md").write_text(SOURCE, encoding='utf-8')
+    (docs / "housing" / "rental-contracts.md").write_text(TARGET, encoding='utf-8')
+    (docs / "images" / "map.png").write_bytes(b'')
+    (tmp_path / "outside.md").write_text("# Outside\n", encoding='utf-8')
+    return docs
+
+
+def broken_urls(results):
+    """Map each broken link URL to its error message."""
+    return {
+        link['url']: link['error']
+        for file_result in results['files']
+        for link in file_result['broken_links']
+    }
+
+
+class TestAnchorIndex:
+    """Test suite for GitHub-style heading anchors."""
+    
+    def test_github_slug(self):
+        """Test heading text to anchor conversion."""
+        assert github_slug('Deposit Rules') == 'deposit-rules'
+        assert github_slug('Step 1: Find a Home!') == 'step-1-find-a-home'
+        assert github_slug('Boligstøtte (Housing Benefit)') == 'boligstøtte-housing-benefit'
+        assert github_slug('**Før** du flytter: `SKAT` og [MitID](mitid.md)') == 'før-du-flytter-skat-og-mitid'
+        assert github_slug('Århus') == 'århus'
+    
+    def test_repeated_headings_and_code_blocks(self):
+        """Test -N suffixes and that commented lines in code blocks are skipped."""
+        lines = ['# FAQ', '```bash', '# FAQ', '```', '## FAQ', '## FAQ-1', '## FAQ']
+        headings = [{'text': line.lstrip('# '), 'line': number}
+                    for number, line in enumerate(lines, 1) if line.startswith('#')]
+        
+        assert heading_anchors(headings, lines) == ['faq', 'faq-1', 'faq-1-1', 'faq-2']
+    
+    def test_danish_fragments(self, docs):
+        """Test encoded fragments match and transliterations get a suggestion."""
+        (docs / "benefits.md").write_text("# Boligstøtte\n\n## Ældre\n", encoding='utf-8')
+        index = AnchorIndex()
+        index.add('benefits', DocumentCorpus.load(docs).get(docs / "benefits.md"))
+        
+        assert index.has_anchor('benefits', 'boligst%C3%B8tte')
+        assert index.has_anchor('benefits', 'Boligstøtte')
+        assert not index.has_anchor('benefits', 'boligstoette')
+        assert index.suggest('benefits', 'boligstoette') == 'boligstøtte'
+        assert index.suggest('benefits', 'aeldre') == 'ældre'
+        assert index.suggest('benefits', 'housing') is None
+
+
+class TestLinkValidator:
+    """Test suite for link and anchor validation."""
+    
+    def test_links_and_anchors(self, docs):
+        """Test that broken files, directories and anchors are reported."""
+        results = LinkValidator(docs).validate_corpus(DocumentCorpus.load(docs))
+        broken = broken_urls(results)
+        
+        assert set(broken) == {
+            'housing/rental-contracts.md#notice-period',
+            'housing/sublet.md',
+            'housing',
+            '../outside.md',
+            '#nowhere'
+        }
+        assert broken['housing/rental-contracts.md#notice-period'].startswith('Anchor #notice-period not found')
+        assert broken['housing'].startswith('Target is not a file')
+        assert broken['../outside.md'].startswith('Link points outside base directory')
+        assert results['summary']['broken_links'] == 5
+        assert results['summary']['anchor_links'] == 2
+    
+    def test_links_checked_without_filesystem(self, docs, monkeypatch):
+        """Test that links are checked against the snapshot, not the filesystem."""
+        validator = LinkValidator(docs)
+        corpus = DocumentCorpus.load(docs)
+        validator.snapshot(corpus)
+        
+        monkeypatch.setattr(Path, 'exists', lambda self: pytest.fail('filesystem access'))
+        monkeypatch.setattr(Path, 'is_file', lambda self: pytest.fail('filesystem access'))
+        monkeypatch.setattr(os.path, 'exists', lambda path: pytest.fail('filesystem access'))
+        
+        result = validator.validate_document(corpus.get(docs / "guide.md"))
+        assert result['broken_count'] == 5
+    
+    def test_single_file_reads_target_anchors(self, docs):
+        """Test that validating one file still checks anchors in other files."""
+        result = LinkValidator(docs).validate_file(docs / "guide.md")
+        
+        assert 'housing/rental-contracts.md#notice-period' in {link['url'] for link in result['broken_links']}
+        assert result['broken_count'] == 5
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Metadata Validator
+
+This module verifies that frontmatter scalars are validated as the strings
+they were written as, and that fields of the wrong type are reported as
+such instead of failing the whole file.
+
+Requirements: 6.4
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import ParsedDocument
+from validate_metadata import MetadataValidator
+
+
+FIELDS = {
+    'title': '"Housing"',
+    'category': '"Housing"',
+    'source_url': '"https://www.borger.dk/bolig"',
+    'last_updated': '2025-01-15',
+    'audience': '["All Residents"]',
+    'keywords': '["housing"]'
+}
+
+
+def validate(**fields):
+    """Validate a document whose frontmatter is FIELDS updated with ``fields``."""
+    lines = [f"{name}: {value}" for name, value in dict(FIELDS, **fields).items()]
+    content = "# Housing\n\n---\n" + "\n".join(lines) + "\n---\n\n## Renting\n\nText.\n"
+    return MetadataValidator().validate_document(ParsedDocument(Path("housing.md"), content=content))
+
+
+class TestMetadataValidator:
+    """Test suite for frontmatter field validation."""
+    
+    def test_valid_frontmatter(self):
+        """Test that a complete frontmatter block validates."""
+        result = validate(language='en')
+        
+        assert result['valid'], result['errors']
+        assert result['metadata']['last_updated'] == "2025-01-15"
+    
+    def test_norwegian_language_code(self):
+        """Test that ``language: no`` stays the string 'no' and is accepted."""
+        result = validate(language='no', translated_from='da')
+        
+        assert result['metadata']['language'] == "no"
+        assert result['valid'], result['errors']
+    
+    def test_numeric_source_url(self):
+        """Test that a number as source_url is reported as an invalid URL."""
+        result = validate(source_url='123')
+        
+        assert result['errors'] == ["Invalid URL format in 'source_url': 123"]
+    
+    def test_list_category(self):
+        """Test that a list as category is reported as a type error."""
+        result = validate(category='["Housing"]')
+        
+        assert result['errors'] == ["Field 'category' should be str, got list"]
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
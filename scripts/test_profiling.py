@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test suite for Validation Profiling
+
+This module verifies that validator runs record per-file and per-phase
+timings, optional peak memory, and that the report generator ranks the
+slowest files and checks.
+
+Requirements: All (Validation infrastructure)
+"""
+
+import io
+import sys
+import contextlib
+import pytest
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from profiling import ValidatorProfiler
+from validate_markdown import MarkdownValidator
+from validator_registry import VALIDATORS
+from run_validation import ValidationOrchestrator
+from generate_report import ValidationReportGenerator
+
+
+DOCUMENT = """---
+title: Test
+---
+
+# Test
+
+## Section
+
+Some text.
+"""
+
+
+@pytest.fixture
+def docs(tmp_path):
+    """Create a small documentation tree."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text(DOCUMENT, encoding='utf-8')
+    (docs / "b.md").write_text(DOCUMENT + "\n## More\n\nText.\n", encoding='utf-8')
+    return docs
+
+
+class TestValidatorProfiler:
+    """Test suite for the profiler."""
+    
+    def test_file_and_phase_timings(self, docs):
+        """Test that every file and markdown check phase is timed."""
+        spec = VALIDATORS['markdown']
+        validator = MarkdownValidator()
+        profiler = ValidatorProfiler()
+        profiler.instrument(validator, spec['file_method'], spec['phases'])
+        
+        profiler.start()
+        results = validator.validate_corpus(DocumentCorpus.load(docs))
+        profiler.stop()
+        
+        timings = profiler.timings()
+        assert results['summary']['total_files'] == 2
+        assert sorted(Path(path).name for path in timings['files']) == ['a.md', 'b.md']
+        assert set(timings['phases']) == set(spec['phases'])
+        assert all(stats['calls'] == 2 for stats in timings['phases'].values())
+        assert profiler.elapsed >= sum(timings['files'].values())
+        assert profiler.peak_memory is None
+    
+    def test_instrumenting_leaves_class_untouched(self):
+        """Test that only the profiled instance is wrapped."""
+        validator = MarkdownValidator()
+        ValidatorProfiler().instrument(validator, 'validate_document', ['_validate_syntax'])
+        
+        assert '_validate_syntax' in vars(validator)
+        assert '_validate_syntax' not in vars(MarkdownValidator())
+    
+    def test_orchestrator_records_timings(self, docs):
+        """Test that results carry timings and, when traced, peak memory."""
+        orchestrator = ValidationOrchestrator(docs, Path(__file__).parent, trace_memory=True)
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = orchestrator.run_all_validations(['markdown', 'structure'])
+        
+        markdown = results['validation_results']['markdown']
+        assert len(markdown['timings']['files']) == 2
+        assert markdown['timings']['phases']['_validate_syntax']['calls'] == 2
+        assert markdown['peak_memory'] > 0
+        assert results['validation_results']['structure']['timings'] == {'files': {}, 'phases': {}}
+
+
+class TestPerformanceReport:
+    """Test suite for the slowest files and checks tables."""
+    
+    def make_results(self):
+        """Create results with timings from two validators."""
+        def result(files, phases):
+            return {
+                'success': True,
+                'description': 'Test',
+                'execution_time': 1.0,
+                'data': None,
+                'timings': {'files': files, 'phases': phases}
+            }
+        
+        return {
+            'timestamp': '2024-01-01T00:00:00',
+            'docs_directory': 'docs',
+            'summary': {
+                'overall_status': 'PASSED', 'total_validators': 2, 'successful_validators': 2,
+                'failed_validators': 0, 'total_errors': 0, 'total_warnings': 0
+            },
+            'validation_results': {
+                'markdown': result({'docs/a.md': 0.1, 'docs/b.md': 0.4},
+                                   {'_validate_syntax': {'calls': 2, 'time': 0.3}}),
+                'acronyms': result({'docs/a.md': 0.5},
+                                   {'_find_acronyms': {'calls': 1, 'time': 0.5}})
+            }
+        }
+    
+    def test_slowest_files_and_checks(self):
+        """Test that files sum across validators and checks are ranked by time."""
+        generator = ValidationReportGenerator(self.make_results())
+        
+        files = generator._collect_slowest_files()
+        assert [row['file'] for row in files] == ['a.md', 'b.md']
+        assert files[0]['time'] == pytest.approx(0.6)
+        assert files[0]['slowest_validator'] == 'acronyms'
+        
+        checks = generator._collect_slowest_checks(limit=1)
+        assert checks == [{'validator': 'acronyms', 'check': '_find_acronyms', 'calls': 1, 'time': 0.5}]
+    
+    def test_tables_rendered(self):
+        """Test that every report format includes the performance tables."""
+        generator = ValidationReportGenerator(self.make_results())
+        
+        assert '### Slowest Checks' in generator._build_markdown_report()
+        assert 'Slowest Files' in generator._build_html_report()
+        assert 'SLOWEST FILES:' in generator._build_console_report()
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
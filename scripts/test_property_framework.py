@@ -19,7 +19,8 @@ from property_test_config import (
     PropertyTestConfig,
     TestTagging,
     DocumentGenerators,
-    PropertyTestUtils
+    PropertyTestUtils,
+    CorpusStrategies
 )
 
 try:
@@ -112,6 +113,20 @@ class TestPropertyTestFramework:
         assert frontmatter['title'] == "Test", "Should extract title from frontmatter"
         assert frontmatter['category'] == "test", "Should extract category from frontmatter"
     
+    def test_memoized_views_are_not_shared(self):
+        """Test that modifying a helper's result does not change later results."""
+        content = "---\ntitle: Test\nkeywords: [a, b]\n---\n\n# Title\n\n## Section\n\nSee [x](y.md).\n"
+        
+        PropertyTestUtils.extract_headings(content).pop()
+        PropertyTestUtils.extract_h2_sections(content)[0]['heading'] = "Changed"
+        PropertyTestUtils.extract_links(content).append({'text': "z", 'url': "z.md"})
+        PropertyTestUtils.extract_frontmatter(content)['keywords'].append("c")
+        
+        assert len(PropertyTestUtils.extract_headings(content)) == 2
+        assert PropertyTestUtils.extract_h2_sections(content)[0]['heading'] == "Section"
+        assert PropertyTestUtils.extract_links(content) == [{'text': "x", 'url': "y.md"}]
+        assert PropertyTestUtils.extract_frontmatter(content)['keywords'] == ["a", "b"]
+    
     @pytest.mark.skipif(not HYPOTHESIS_AVAILABLE, reason="Hypothesis not available")
     def test_hypothesis_integration(self):
         """Test that Hypothesis is properly integrated."""
@@ -191,6 +206,79 @@ class TestPropertyTestExecution:
             assert headings1 == headings2, "Heading extraction should be deterministic"
         
         test_heading_extraction_property()
+    
+    def test_parallel_run_matches_serial(self, capsys):
+        """Test that sharded properties merge into the serial results, in property order."""
+        from run_property_tests import PropertyTestRunner
+        
+        def outcome(results):
+            return {
+                prop_num: (result['status'], result.get('examples_run'), result.get('errors'))
+                for prop_num, result in results['property_results'].items()
+            }
+        
+        serial = PropertyTestRunner().run_all_tests()
+        parallel = PropertyTestRunner().run_all_tests(jobs=3)
+        
+        assert list(parallel['property_results']) == list(range(1, 23))
+        assert outcome(parallel) == outcome(serial)
+        assert parallel['passed_properties'] == serial['passed_properties']
+
+
+@pytest.mark.skipif(not HYPOTHESIS_AVAILABLE, reason="Hypothesis not available")
+class TestCorpusStrategies:
+    """Test strategies that draw from the in-memory corpus."""
+    
+    def test_sections_match_documents(self):
+        """Test that drawn sections belong to the document they name."""
+        
+        @given(CorpusStrategies.sections())
+        @settings(max_examples=500, database=None)
+        def section_property(section):
+            document = PropertyTestUtils.get_document(section['path'])
+            assert section['content'] in document.content
+            assert document.lines[section['start_line'] - 1].lstrip('# ').strip() == section['heading']
+        
+        section_property()
+    
+    def test_category_documents_and_links(self):
+        """Test category filtering and that links come from their documents."""
+        
+        @given(CorpusStrategies.document_paths("housing"), CorpusStrategies.links())
+        @settings(max_examples=200, database=None)
+        def document_property(path, link):
+            assert path.parent == PropertyTestConfig.DOCS_ROOT / "housing"
+            assert f"]({link['url']})" in PropertyTestUtils.read_file_content(link['path'])
+        
+        document_property()
+    
+    def test_examples_do_not_read_files(self, monkeypatch):
+        """Test that examples are drawn without file I/O once the corpus is loaded."""
+        CorpusStrategies.corpus_index()
+        
+        def no_reads(*args, **kwargs):
+            raise AssertionError("file read during an example")
+        
+        @given(CorpusStrategies.documents())
+        @settings(max_examples=1000, database=None)
+        def heading_property(document):
+            headings = PropertyTestUtils.extract_headings(PropertyTestUtils.read_file_content(document.path))
+            assert [h['level'] for h in headings] == [h['level'] for h in document.headings]
+        
+        monkeypatch.setattr('builtins.open', no_reads)
+        heading_property()
+
+    def test_empty_corpus_error(self, tmp_path, monkeypatch):
+        """Test that sampling an empty corpus names the missing entries."""
+        monkeypatch.setattr(PropertyTestConfig, 'DOCS_ROOT', tmp_path)
+        
+        @given(CorpusStrategies.sections("housing"))
+        @settings(max_examples=1, database=None)
+        def section_property(section):
+            pass
+        
+        with pytest.raises(ValueError, match="No sections to sample in category 'housing'"):
+            section_property()
 
 
 if __name__ == '__main__':
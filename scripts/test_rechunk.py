@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Section-Aware Rechunker
+
+This module verifies block detection, that over-limit sections are split at
+H3, paragraph and list boundaries with their breadcrumbs, and overlap.
+
+Requirements: 1.4
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from chunk_manifest import ChunkManifest, document_chunks
+from rechunk import section_blocks, split_chunk
+
+
+class WordTokenizer:
+    """Counts one token per word, so limits are easy to reason about."""
+    
+    def count_batch(self, texts):
+        return [len(text.split()) for text in texts]
+
+
+def words(count, word='word'):
+    """A sentence of ``count`` words."""
+    return ' '.join([word] * (count - 1) + [word + '.'])
+
+
+GUIDE = f"""# Guide
+
+## Long Section
+
+{words(20, 'intro')}
+
+### First Topic
+
+{words(30, 'alpha')}
+
+{words(30, 'beta')}
+
+### Second Topic
+
+- {words(10, 'one')}
+- {words(10, 'two')}
+
+```
+code block
+```
+
+## Short Section
+
+{words(5, 'short')}
+"""
+
+
+def guide_chunks(max_tokens, overlap=0):
+    """Split the chunks of GUIDE with the word tokenizer."""
+    document = ParsedDocument(Path("guide.md"), content=GUIDE)
+    tokenizer = WordTokenizer()
+    chunks = list(document_chunks(document, 'guide.md'))
+    for chunk, token_count in zip(chunks, tokenizer.count_batch(c['content'] for c in chunks)):
+        chunk['token_count'] = token_count
+    return [part for chunk in chunks for part in split_chunk(chunk, document, tokenizer, max_tokens, overlap)]
+
+
+class TestRechunk:
+    """Test suite for splitting over-limit sections."""
+    
+    def test_section_blocks(self):
+        """Test block kinds, line numbers and the H3 each block belongs to."""
+        lines = GUIDE.split('\n')
+        blocks = list(section_blocks(lines[3:21], 4))
+        
+        assert [block['kind'] for block in blocks] == [
+            'paragraph', 'heading', 'paragraph', 'paragraph', 'heading', 'list', 'code'
+        ]
+        assert [(block['start_line'], block['end_line']) for block in blocks][-2:] == [(15, 16), (18, 20)]
+        assert [block['subheading'] for block in blocks][:3] == [None, 'First Topic', 'First Topic']
+    
+    def test_split_at_boundaries(self):
+        """Test that subsections stay whole when they fit and paragraphs split otherwise."""
+        chunks = guide_chunks(max_tokens=70)
+        
+        assert [chunk['id'] for chunk in chunks] == [
+            'guide.md#long-section/1', 'guide.md#long-section/2', 'guide.md#long-section/3', 'guide.md#short-section'
+        ]
+        assert [chunk['heading_path'] for chunk in chunks[:3]] == [
+            ['Guide', 'Long Section'],
+            ['Guide', 'Long Section', 'First Topic'],
+            ['Guide', 'Long Section', 'Second Topic']
+        ]
+        assert chunks[1]['content'].startswith('### First Topic')
+        assert 'beta.' in chunks[1]['content'] and 'one' not in chunks[1]['content']
+        assert chunks[2]['content'].endswith('code block\n```')
+        assert all(chunk['token_count'] <= 70 for chunk in chunks)
+        
+        # A subsection over the limit splits between its paragraphs
+        chunks = guide_chunks(max_tokens=35)
+        assert [chunk['content'].split()[0] for chunk in chunks] == ['intro', '###', 'beta', '###', 'short']
+        assert all(chunk['token_count'] <= 35 for chunk in chunks)
+    
+    def test_overlap(self):
+        """Test that a part repeats the trailing block of the previous part."""
+        chunks = guide_chunks(max_tokens=64, overlap=31)
+        alpha = next(chunk for chunk in chunks if 'alpha' in chunk['content'])
+        beta = next(chunk for chunk in chunks if 'beta' in chunk['content'])
+        
+        assert beta['content'].startswith('alpha') and beta['heading_path'][-1] == 'First Topic'
+        assert beta['start_line'] == alpha['end_line']
+    
+    def test_manifest_keeps_sections_within_limit(self, tmp_path):
+        """Test that rechunking leaves IDs and hashes of short sections alone."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "guide.md").write_text(GUIDE, encoding='utf-8')
+        corpus = DocumentCorpus.load(docs)
+        
+        plain = ChunkManifest.build(corpus)
+        split = ChunkManifest.build(corpus, max_tokens=plain.get('guide.md#long-section')['token_count'] - 1)
+        
+        assert split.get('guide.md#short-section') == plain.get('guide.md#short-section')
+        assert split.get('guide.md#long-section') is None
+        assert split.get('guide.md#long-section/1')['start_line'] == 5
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
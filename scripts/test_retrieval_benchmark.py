@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Retrieval Benchmark
+
+This module verifies the retrieval metrics, run comparison and that the
+shipped query set points at documents and sections that exist.
+
+Requirements: 1.4
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from search_index import SearchIndex
+from retrieval_benchmark import (
+    DEFAULT_QUERY_FILE, load_queries, percentile, score_query, run_benchmark, compare_results
+)
+
+
+DOCS_DIRECTORY = Path(__file__).parent.parent / "docs" / "denmark-living"
+
+
+class TestRetrievalMetrics:
+    """Test suite for recall, MRR and latency percentiles."""
+    
+    def test_score_query(self):
+        """Test document and section targets, ranks and recall cutoffs."""
+        results = [
+            {'id': 'housing/overview.md#key-information', 'path': 'housing/overview.md'},
+            {'id': 'housing/rental-contracts.md#deposit', 'path': 'housing/rental-contracts.md'},
+            {'id': 'housing/deposits.md#overview', 'path': 'housing/deposits.md'},
+            {'id': 'housing/deposits.md#refunds', 'path': 'housing/deposits.md'}
+        ]
+        
+        scored = score_query(results, ['housing/deposits.md', 'housing/rental-contracts.md#deposit'])
+        assert scored['rank'] == 2
+        assert scored['target_ranks'] == {'housing/deposits.md': 3, 'housing/rental-contracts.md#deposit': 2}
+        assert scored['recall'][1] == 0.0 and scored['recall'][3] == 1.0
+        
+        assert score_query(results, ['housing/deposits.md#fees'])['rank'] is None
+    
+    def test_percentile(self):
+        """Test interpolated percentiles."""
+        assert percentile([4.0, 1.0, 3.0, 2.0], 0.5) == 2.5
+        assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 0.95) == pytest.approx(4.8)
+        assert percentile([], 0.5) == 0.0
+
+
+class TestRetrievalBenchmark:
+    """Test suite for benchmark runs."""
+    
+    def test_run_and_compare(self, tmp_path):
+        """Test a run over a small corpus and the comparison with an earlier run."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "cpr.md").write_text("# CPR\n\n## Register\n\nGet your CPR number at Borgerservice.\n", encoding='utf-8')
+        (docs / "tax.md").write_text("# Tax\n\n## Tax Card\n\nApply for a tax card at SKAT.\n", encoding='utf-8')
+        queries = [
+            {'query': 'cpr number', 'expected': ['cpr.md']},
+            {'query': 'tax card', 'expected': ['tax.md#tax-card']},
+            {'query': 'parking permit', 'expected': ['cpr.md']}
+        ]
+        
+        results = run_benchmark(DocumentCorpus.load(docs), queries, repeats=2)
+        assert results['metrics']['recall@1'] == pytest.approx(2 / 3, abs=1e-4)
+        assert results['metrics']['mrr'] == pytest.approx(2 / 3, abs=1e-4)
+        assert results['latency_ms']['samples'] == 6
+        assert results['corpus']['sections'] == 2
+        
+        baseline = dict(results, metrics=dict(results['metrics'], mrr=1.0),
+                        queries=[dict(q, rank=1) for q in results['queries']])
+        comparison = compare_results(results, baseline)
+        assert comparison['metrics']['mrr'] == pytest.approx(-1 / 3, abs=1e-4)
+        assert comparison['rank_changes'] == [{'query': 'parking permit', 'before': 1, 'after': None}]
+        assert not comparison['corpus_changed']
+    
+    @pytest.mark.skipif(not DOCS_DIRECTORY.exists(), reason="Documentation directory not found")
+    def test_query_set_targets_exist(self):
+        """Test that every expected target of the shipped query set is in the index."""
+        index = SearchIndex.build(DocumentCorpus.load(DOCS_DIRECTORY))
+        ids = {section['id'] for section in index.sections}
+        paths = {section['path'] for section in index.sections}
+        
+        for query in load_queries(DEFAULT_QUERY_FILE):
+            for target in query['expected']:
+                assert target in (ids if '#' in target else paths), f"Unknown target {target} for {query['query']!r}"
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Section Search Index
+
+This module verifies that H2 sections are indexed with stable IDs and
+frontmatter fields, ranked with BM25 and stored and reloaded unchanged.
+
+Requirements: 1.4
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from search_index import SearchIndex, tokenize
+
+
+CPR_DOCUMENT = """# CPR Number
+
+---
+title: "CPR Number"
+category: "Arrival Process"
+audience:
+  - EU Citizens
+  - Non-EU Citizens
+keywords: [cpr, registration]
+---
+
+## How to Register
+
+Book an appointment at the citizen service centre (Borgerservice) to get your CPR number.
+
+## Required Documents
+
+Bring your passport and your residence permit.
+"""
+
+RENT_DOCUMENT = """# Renting
+
+## Deposit
+
+The deposit (depositum) is at most three months of rent.
+
+## Required Documents
+
+Landlords usually ask for a CPR number and a payslip.
+"""
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Create a two-document corpus."""
+    docs = tmp_path / "docs"
+    (docs / "arrival").mkdir(parents=True)
+    (docs / "arrival" / "cpr.md").write_text(CPR_DOCUMENT, encoding='utf-8')
+    (docs / "rent.md").write_text(RENT_DOCUMENT, encoding='utf-8')
+    return DocumentCorpus.load(docs)
+
+
+class TestSearchIndex:
+    """Test suite for building, querying and storing the index."""
+    
+    def test_sections_and_metadata(self, corpus):
+        """Test that each H2 section gets an anchor ID and its document's frontmatter."""
+        index = SearchIndex.build(corpus)
+        
+        assert [section['id'] for section in index.sections] == [
+            'arrival/cpr.md#how-to-register',
+            'arrival/cpr.md#required-documents',
+            'rent.md#deposit',
+            'rent.md#required-documents'
+        ]
+        first = index.sections[0]
+        assert first['category'] == 'Arrival Process'
+        assert first['audience'] == ['EU Citizens', 'Non-EU Citizens']
+        assert first['keywords'] == ['cpr', 'registration']
+        assert (first['start_line'], first['end_line']) == (12, 15)
+        assert index.sections[2]['title'] == 'Renting'
+    
+    def test_bm25_ranking_and_filters(self, corpus):
+        """Test ranking by term weight and frontmatter filters."""
+        index = SearchIndex.build(corpus)
+        
+        assert tokenize("How do I get a [CPR number](cpr.md)?") == ['get', 'cpr', 'number']
+        assert index.search("cpr number")[0]['id'] == 'arrival/cpr.md#how-to-register'
+        assert index.search("depositum")[0]['id'] == 'rent.md#deposit'
+        assert [r['id'] for r in index.search("required documents", category='Arrival Process')] == [
+            'arrival/cpr.md#required-documents'
+        ]
+        assert index.search("payslip", audience='EU Citizens') == []
+        assert index.search("unknownterm") == []
+    
+    def test_save_and_reload(self, corpus, tmp_path):
+        """Test that the stored index gives the same results and is rebuilt after edits."""
+        index_file = tmp_path / "index.json.gz"
+        index = SearchIndex.for_corpus(corpus, index_file)
+        
+        loaded = SearchIndex.load(index_file)
+        assert loaded.postings == index.postings
+        assert loaded.search("cpr passport") == index.search("cpr passport")
+        
+        (corpus.directory / "rent.md").write_text(RENT_DOCUMENT + "\n## Pets\n\nAsk first.\n", encoding='utf-8')
+        rebuilt = SearchIndex.for_corpus(DocumentCorpus.load(corpus.directory), index_file)
+        assert len(rebuilt) == 5
+        assert SearchIndex.load(index_file).search("pets")[0]['id'] == 'rent.md#pets'
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Tokenizer Backends
+
+This module verifies that tokenizers are shared per process, that batched
+counts match single counts, and that the token counter's corpus-wide batch
+produces the same section counts as counting one document at a time.
+
+Requirements: 1.4
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from count_tokens import TokenCounter
+from tokenizer import TIKTOKEN_AVAILABLE, HeuristicTokenizer, get_tokenizer
+
+
+SAMPLE_SECTIONS = [
+    "Apply for a **CPR number** at the [municipality](../municipality.md).",
+    "- Bring your passport\n- Bring your lease\n\n### Processing time\n\nAbout 2 weeks.",
+    ""
+]
+
+
+class TestTokenizer:
+    """Test suite for tokenizer selection and counting."""
+    
+    def test_tokenizer_loaded_once(self):
+        """Test that each encoding is loaded only once per process."""
+        assert get_tokenizer('cl100k_base') is get_tokenizer('cl100k')
+        assert get_tokenizer('heuristic') is get_tokenizer('heuristic')
+    
+    def test_unsupported_encoding(self):
+        """Test that unknown encodings are rejected instead of silently approximated."""
+        with pytest.raises(ValueError):
+            get_tokenizer('gpt2-unknown')
+    
+    def test_batch_matches_single_counts(self):
+        """Test that batched counts equal individual counts."""
+        for encoding in ('cl100k_base', 'heuristic'):
+            tokenizer = get_tokenizer(encoding)
+            assert tokenizer.count_batch(SAMPLE_SECTIONS) == [tokenizer.count(text) for text in SAMPLE_SECTIONS]
+            assert tokenizer.count("") == 0
+    
+    def test_heuristic_fallback(self):
+        """Test that the default encoding falls back to the heuristic without tiktoken."""
+        tokenizer = get_tokenizer()
+        if TIKTOKEN_AVAILABLE:
+            assert tokenizer.exact
+        else:
+            assert isinstance(tokenizer, HeuristicTokenizer)
+            assert not tokenizer.exact
+    
+    @pytest.mark.skipif(not TIKTOKEN_AVAILABLE, reason="tiktoken not installed")
+    def test_exact_counts(self):
+        """Test exact counts against the tiktoken encoding directly."""
+        import tiktoken
+        encoding = tiktoken.get_encoding('cl100k_base')
+        for text in SAMPLE_SECTIONS:
+            assert get_tokenizer('cl100k_base').count(text) == len(encoding.encode_ordinary(text))
+
+
+class TestTokenCounterBatching:
+    """Test suite for corpus-wide batched token counting."""
+    
+    def test_corpus_batch_matches_per_document(self, tmp_path):
+        """Test that batching across the corpus does not change section counts."""
+        (tmp_path / "a.md").write_text("# A\n\n## One\n\n" + SAMPLE_SECTIONS[0] + "\n\n## Two\n\n" + SAMPLE_SECTIONS[1] + "\n",
+                                       encoding='utf-8')
+        (tmp_path / "b.md").write_text("# B\n\n## Only\n\n" + "word " * 50 + "\n", encoding='utf-8')
+        
+        counter = TokenCounter(token_limit=20)
+        results = counter.count_corpus_tokens(DocumentCorpus.load(tmp_path))
+        
+        for file_result in results['files']:
+            single = counter.count_file_tokens(Path(file_result['file']))
+            assert [s['token_count'] for s in file_result['sections']] == [s['token_count'] for s in single['sections']]
+        
+        assert results['summary']['tokenizer'] == counter.tokenizer.name
+        assert results['summary']['sections_over_limit'] >= 1
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
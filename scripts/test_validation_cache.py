@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Incremental Validation Cache
+
+This module verifies that cached validator results are identical to a fresh
+run and that edits, new link targets and cross-file state invalidate the
+right entries.
+
+Requirements: All (Validation infrastructure)
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from validation_cache import ValidationCache
+from validate_markdown import MarkdownValidator
+from validate_links import LinkValidator
+from validate_acronyms import AcronymValidator
+from check_terminology import TerminologyConsistencyChecker
+
+
+def write_docs(directory: Path, files: dict) -> None:
+    """Write markdown files relative to a directory."""
+    for name, content in files.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+
+
+def run_cached(cache_file: Path, name: str, validator, method: str, directory: Path):
+    """Run a validator corpus method through the on-disk cache, like the orchestrator does."""
+    cache = ValidationCache(cache_file)
+    section = cache.section(name, ValidationCache.fingerprint(Path(__file__), {'validator': name}))
+    result = getattr(validator, method)(DocumentCorpus.load(directory), cache=section)
+    cache.save()
+    
+    # Results must survive the JSON round trip through the cache file
+    return json.loads(json.dumps(result)), section.stats()
+
+
+def run_fresh(validator, method: str, directory: Path):
+    """Run a validator corpus method without a cache."""
+    return json.loads(json.dumps(getattr(validator, method)(DocumentCorpus.load(directory))))
+
+
+class TestValidationCache:
+    """Test suite for cache hits and invalidation."""
+    
+    def test_unchanged_files_are_served_from_cache(self, tmp_path):
+        """Test that only edited files are re-validated."""
+        docs = tmp_path / "docs"
+        write_docs(docs, {
+            "a.md": "# A\n\nSome text.\n",
+            "b.md": "# B\n\nMore text.\n"
+        })
+        cache_file = tmp_path / "cache.json"
+        
+        first, stats = run_cached(cache_file, 'markdown', MarkdownValidator(), 'validate_corpus', docs)
+        assert stats == {'hits': 0, 'misses': 2}
+        
+        second, stats = run_cached(cache_file, 'markdown', MarkdownValidator(), 'validate_corpus', docs)
+        assert stats == {'hits': 2, 'misses': 0}
+        assert second == first
+        
+        write_docs(docs, {"b.md": "#B without space\n"})
+        third, stats = run_cached(cache_file, 'markdown', MarkdownValidator(), 'validate_corpus', docs)
+        assert stats == {'hits': 1, 'misses': 1}
+        assert third == run_fresh(MarkdownValidator(), 'validate_corpus', docs)
+    
+    def test_fingerprint_change_invalidates_section(self, tmp_path):
+        """Test that a different validator configuration discards cached results."""
+        docs = tmp_path / "docs"
+        write_docs(docs, {"a.md": "# A\n"})
+        cache_file = tmp_path / "cache.json"
+        run_cached(cache_file, 'markdown', MarkdownValidator(), 'validate_corpus', docs)
+        
+        cache = ValidationCache(cache_file)
+        section = cache.section('markdown', ValidationCache.fingerprint(Path(__file__), {'validator': 'other'}))
+        MarkdownValidator().validate_corpus(DocumentCorpus.load(docs), cache=section)
+        assert section.stats() == {'hits': 0, 'misses': 1}
+    
+    def test_new_link_target_invalidates_links(self, tmp_path):
+        """Test that creating a missing link target re-validates unchanged linking files."""
+        docs = tmp_path / "docs"
+        write_docs(docs, {"a.md": "# A\n\nSee [B](b.md).\n"})
+        cache_file = tmp_path / "cache.json"
+        
+        first, _ = run_cached(cache_file, 'links', LinkValidator(docs), 'validate_corpus', docs)
+        assert first['files'][0]['broken_count'] == 1
+        
+        write_docs(docs, {"b.md": "# B\n"})
+        second, stats = run_cached(cache_file, 'links', LinkValidator(docs), 'validate_corpus', docs)
+        assert stats['hits'] == 0
+        assert second == run_fresh(LinkValidator(docs), 'validate_corpus', docs)
+        assert all(file_result['broken_count'] == 0 for file_result in second['files'])
+    
+    def test_acronym_definitions_propagate_to_later_files(self, tmp_path):
+        """Test that changing a definition re-checks files validated against it."""
+        docs = tmp_path / "docs"
+        write_docs(docs, {
+            "a.md": "# A\n\nThe Central Person Register (CPR) number.\n",
+            "b.md": "# B\n\nThe Civil Personal Registration (CPR) number.\n"
+        })
+        cache_file = tmp_path / "cache.json"
+        run_cached(cache_file, 'acronyms', AcronymValidator(), 'validate_corpus', docs)
+        
+        order = [p.name for p in DocumentCorpus.load(docs).paths]
+        write_docs(docs, {order[0]: "# First\n\nThe Civil Registration System (CPR) number.\n"})
+        result, stats = run_cached(cache_file, 'acronyms', AcronymValidator(), 'validate_corpus', docs)
+        
+        assert stats == {'hits': 0, 'misses': 2}
+        assert result == run_fresh(AcronymValidator(), 'validate_corpus', docs)
+    
+    def test_terminology_global_analysis_uses_cached_terms(self, tmp_path):
+        """Test that cross-file terminology results are rebuilt from cached files."""
+        docs = tmp_path / "docs"
+        write_docs(docs, {
+            "a.md": "# A\n\nApply for the **Residence Permit** online.\n",
+            "b.md": "# B\n\nYour **Residence permit** card.\n"
+        })
+        cache_file = tmp_path / "cache.json"
+        run_cached(cache_file, 'terminology', TerminologyConsistencyChecker(), 'analyze_corpus', docs)
+        
+        result, stats = run_cached(cache_file, 'terminology', TerminologyConsistencyChecker(), 'analyze_corpus', docs)
+        assert stats == {'hits': 2, 'misses': 0}
+        assert result == run_fresh(TerminologyConsistencyChecker(), 'analyze_corpus', docs)
+        assert result['global_inconsistencies']
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
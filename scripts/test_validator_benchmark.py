@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Validator Benchmark
+
+This module verifies that synthetic corpora are deterministic, follow the
+document template closely enough to validate, and that regressions against
+a baseline are detected.
+
+Requirements: All (Validation infrastructure)
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from validator_registry import ValidatorRegistry
+from validator_benchmark import (
+    DEFAULT_NOISE_FLOOR_MS, generate_corpus, run_validator, run_benchmark, compare_results
+)
+
+
+class TestValidatorBenchmark:
+    """Test suite for corpus generation and baseline comparison."""
+    
+    def test_generate_corpus(self, tmp_path):
+        """Test file count, languages and that the same seed gives the same files."""
+        first = generate_corpus(tmp_path / "first", 15, seed=3, languages=['en', 'da'])
+        second = generate_corpus(tmp_path / "second", 15, seed=3, languages=['en', 'da'])
+        
+        assert len(first) == 15
+        assert sum(path.name.endswith('.da.md') for path in first) == 7
+        assert [path.read_text(encoding='utf-8') for path in first] == [
+            path.read_text(encoding='utf-8') for path in second
+        ]
+        assert (tmp_path / "first" / "metadata" / "glossary.md").exists()
+    
+    def test_generated_documents_validate(self, tmp_path):
+        """Test that generated links resolve and frontmatter is complete."""
+        generate_corpus(tmp_path, 20)
+        registry = ValidatorRegistry(Path(__file__).parent)
+        
+        links = run_validator(registry, 'links', tmp_path)
+        assert links['summary']['total_files'] == 22
+        assert links['summary']['broken_links'] == 0
+        
+        metadata = run_validator(registry, 'metadata', tmp_path)
+        assert metadata['summary']['valid_files'] == 20
+        
+        translations = run_validator(registry, 'translations', tmp_path)
+        assert translations['glossary_terms_count'] == 10
+    
+    def test_compare_results(self, tmp_path):
+        """Test that slowdowns and memory growth past the tolerance are regressions."""
+        results = run_benchmark(sizes=[5], validators=['metadata', 'structure'], repeats=3,
+                                corpus_root=tmp_path, min_sample_time=0.05)
+        stats = results['runs'][0]['validators']
+        assert stats['metadata']['method'] == 'validate_directory'
+        assert stats['structure']['method'] == 'validate_structure'
+        assert stats['metadata']['ops_per_sec'] > 0
+        assert stats['metadata']['loops'] > 1
+        
+        assert compare_results(results, results)['regressions'] == []
+        
+        metadata = stats['metadata']
+        baseline = {'runs': [{'files': 5, 'validators': {
+            'metadata': dict(metadata, ops_per_sec=metadata['ops_per_sec'] * 2,
+                             median_time=metadata['median_time'] / 2),
+            'structure': dict(stats['structure'], peak_memory=stats['structure']['peak_memory'] // 2)
+        }}]}
+        comparison = compare_results(results, baseline, tolerance=0.2, noise_floor_ms=0)
+        assert [(change['validator'], change['regressed']) for change in comparison['regressions']] == [
+            ('metadata', ['ops_per_sec']), ('structure', ['peak_memory'])
+        ]
+        assert compare_results(results, baseline, tolerance=1.5, noise_floor_ms=0)['regressions'] == []
+        
+        # Halving a run of a few milliseconds stays under the default noise floor
+        assert metadata['median_time'] * 1000 / 2 < DEFAULT_NOISE_FLOOR_MS
+        comparison = compare_results(results, baseline, tolerance=0.2)
+        assert [(change['validator'], change['regressed']) for change in comparison['regressions']] == [
+            ('structure', ['peak_memory'])
+        ]
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Validator Registry
+
+This module verifies that validators are imported lazily, only once per
+process, and that their import time is reported apart from validation time.
+
+Requirements: All (Validation infrastructure)
+"""
+
+import io
+import sys
+import contextlib
+import pytest
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from run_validation import ValidationOrchestrator
+from validator_registry import ValidatorRegistry, import_script
+
+
+VALIDATOR_SOURCE = '''
+IMPORT_COUNT = globals().get('IMPORT_COUNT', 0) + 1
+
+
+class {name}:
+    def validate_corpus(self, corpus):
+        return {{'files': [], 'summary': {{'total_files': len(corpus), 'total_errors': 0, 'total_warnings': 0}}}}
+'''
+
+
+def make_registry(tmp_path, names):
+    """Create a registry of trivial validators in a temporary scripts directory."""
+    validators = {}
+    for name in names:
+        script = f"registry_test_{name}_{tmp_path.name}.py"
+        (tmp_path / script).write_text(VALIDATOR_SOURCE.format(name=name.title()), encoding='utf-8')
+        validators[name] = {
+            'script': script,
+            'description': f"{name} validation",
+            'class': name.title(),
+            'method': 'validate_corpus'
+        }
+    return ValidatorRegistry(tmp_path, validators)
+
+
+class TestValidatorRegistry:
+    """Test suite for validator loading."""
+    
+    def test_lazy_loading(self, tmp_path):
+        """Test that only the requested validators are imported."""
+        registry = make_registry(tmp_path, ['alpha', 'beta'])
+        
+        registry.load('alpha')
+        
+        assert registry.script_path('alpha').stem in sys.modules
+        assert registry.script_path('beta').stem not in sys.modules
+    
+    def test_imported_once(self, tmp_path):
+        """Test that repeated loads reuse the module and report no import time."""
+        registry = make_registry(tmp_path, ['alpha'])
+        
+        first = registry.load('alpha')
+        assert registry.pop_import_time('alpha') > 0
+        
+        assert registry.load('alpha') is first
+        assert ValidatorRegistry(tmp_path, registry.validators).load('alpha') is first
+        assert sys.modules[registry.script_path('alpha').stem].IMPORT_COUNT == 1
+        assert registry.pop_import_time('alpha') == 0
+    
+    def test_same_name_different_directory(self, tmp_path):
+        """Test that a script shadowing an imported module name gets its own module."""
+        import validate_links
+        
+        (tmp_path / "validate_links.py").write_text("MARKER = 'shadow'\n", encoding='utf-8')
+        module = import_script(tmp_path / "validate_links.py")
+        
+        assert module is not validate_links
+        assert module.MARKER == 'shadow'
+        assert import_script(Path(validate_links.__file__)) is validate_links
+    
+    def test_orchestrator_reports_import_time(self, tmp_path):
+        """Test that the runner records import time separately from execution time."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("# A\n", encoding='utf-8')
+        
+        orchestrator = ValidationOrchestrator(docs, tmp_path)
+        orchestrator.registry = make_registry(tmp_path, ['alpha', 'beta'])
+        orchestrator.validators = orchestrator.registry.validators
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = orchestrator.run_all_validations(['beta'])
+        
+        result = results['validation_results']['beta']
+        assert result['success']
+        assert result['import_time'] > 0
+        assert result['data']['summary']['total_files'] == 1
+        assert orchestrator.registry.script_path('alpha').stem not in sys.modules
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
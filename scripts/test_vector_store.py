@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Vector Store
+
+This module verifies that results have the match_documents shape, that the
+threshold and count are applied, and that IVF search agrees with exact
+search when every partition is probed.
+
+Requirements: 1.4
+"""
+
+import sys
+import random
+import pytest
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from chunk_manifest import ChunkManifest
+from embedding_cache import EmbeddingCache, HashingProvider
+from search_index import SearchIndex
+from vector_store import VectorStore
+
+
+@pytest.fixture
+def docs(tmp_path):
+    """Create a documentation tree with four sections."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "housing.md").write_text(
+        "# Housing\n\n## Deposit\n\nThe rent deposit is three months of rent.\n\n"
+        "## Utilities\n\nElectricity and water are paid monthly.\n",
+        encoding='utf-8'
+    )
+    (docs / "cpr.md").write_text(
+        "# CPR\n\n---\ntitle: CPR Number\n---\n\n## Register\n\nBook a time at Borgerservice.\n\n## Documents\n\nBring your passport.\n",
+        encoding='utf-8'
+    )
+    return docs
+
+
+def random_store(count=200, dimension=16, seed=1):
+    """Store of random vectors with IDs ``v0`` to ``v<count - 1>``."""
+    rng = random.Random(seed)
+    records = [{'id': f"v{i}", 'content': '', 'metadata': {}} for i in range(count)]
+    vectors = [[rng.gauss(0, 1) for _ in range(dimension)] for _ in range(count)]
+    return VectorStore.from_vectors(records, vectors, dimension, 'random'), rng
+
+
+class TestVectorStore:
+    """Test suite for building, saving and searching the vector store."""
+    
+    def test_search_results(self, docs, tmp_path):
+        """Test result shape, ranking, threshold and reloading from disk."""
+        provider = HashingProvider(dimension=64)
+        cache = EmbeddingCache(tmp_path / "cache", provider.key, provider.dimension)
+        store = VectorStore.from_manifest(ChunkManifest.build(DocumentCorpus.load(docs)), provider, cache)
+        store.save(tmp_path / "store")
+        
+        loaded = VectorStore.load(tmp_path / "store")
+        results = loaded.search_text("rent deposit", provider, match_count=2, match_threshold=-1.0)
+        
+        assert len(results) == 2
+        assert set(results[0]) == {'id', 'content', 'metadata', 'similarity'}
+        assert results[0]['id'] == 'housing.md#deposit'
+        assert results[0]['content'] == 'The rent deposit is three months of rent.'
+        assert results[0]['metadata']['title'] == 'Housing'
+        assert results[0]['similarity'] > results[1]['similarity']
+        
+        assert [r['id'] for r in loaded.search_text("rent deposit", provider, match_threshold=0.0)] == [
+            'housing.md#deposit'
+        ]
+        assert loaded.search_text("rent deposit", provider, match_threshold=0.99) == []
+        with pytest.raises(ValueError):
+            loaded.search_text("rent deposit", HashingProvider(dimension=32))
+        loaded.close()
+    
+    def test_titles_match_search_index(self, docs):
+        """Test that both indexes give a section the same document title."""
+        corpus = DocumentCorpus.load(docs)
+        store = VectorStore.from_manifest(ChunkManifest.build(corpus), HashingProvider(dimension=16))
+        
+        titles = {record['id']: record['metadata']['title'] for record in store.records}
+        assert titles == {section['id']: section['title'] for section in SearchIndex.build(corpus).sections}
+        assert titles['cpr.md#register'] == 'CPR Number'
+    
+    def test_ivf_matches_exact_search(self, tmp_path):
+        """Test that probing every partition gives the exact results."""
+        store, rng = random_store()
+        ivf = store.build_ivf(n_lists=8)
+        assert sorted(row for rows in ivf['lists'] for row in rows) == list(range(len(store)))
+        
+        store.save(tmp_path)
+        loaded = VectorStore.load(tmp_path)
+        for _ in range(10):
+            query = [rng.gauss(0, 1) for _ in range(store.dimension)]
+            exact = loaded.search(query, match_count=10, match_threshold=-1.0)
+            assert loaded.search(query, match_count=10, match_threshold=-1.0, nprobe=8) == exact
+            
+            probed = loaded.search(query, match_count=10, match_threshold=-1.0, nprobe=2)
+            assert all(result in exact or result['similarity'] <= exact[-1]['similarity'] for result in probed)
+        loaded.close()
+    
+    def test_ivf_is_deterministic(self):
+        """Test that the same vectors and seed give the same partitions."""
+        first, _ = random_store()
+        second, _ = random_store()
+        
+        assert first.build_ivf(n_lists=6) == second.build_ivf(n_lists=6)
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
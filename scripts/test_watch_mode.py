@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test suite for Watch Mode
+
+This module verifies that the file watchers report changed markdown files
+and that incremental re-validation in watch mode produces the same results
+as validating the changed documentation from scratch.
+
+Requirements: All (Validation infrastructure)
+"""
+
+import io
+import contextlib
+import pytest
+import sys
+from pathlib import Path
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from file_watcher import INOTIFY_AVAILABLE, InotifyWatcher, PollingWatcher
+from run_validation import ValidationOrchestrator, collect_errors
+from validation_cache import ValidationCache
+
+
+SCRIPTS_DIR = Path(__file__).parent
+
+
+def write_docs(directory):
+    """Create a small documentation tree."""
+    (directory / "housing").mkdir()
+    (directory / "housing" / "overview.md").write_text(
+        "# Housing\n\n## Renting\n\nSee [rent](rent.md) and apply for boligstøtte.\n", encoding='utf-8')
+    (directory / "housing" / "rent.md").write_text(
+        "# Rent\n\n## Deposit\n\nThe Danish Tenant Association (LLO) helps tenants.\n", encoding='utf-8')
+
+
+def run_fresh(directory):
+    """Validate a documentation tree from scratch."""
+    orchestrator = ValidationOrchestrator(directory, SCRIPTS_DIR)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return orchestrator.run_all_validations()
+
+
+def comparable(results):
+    """Drop run-specific fields from validation results."""
+    return {
+        name: {key: value for key, value in result.items() if key not in ('execution_time', 'import_time', 'timings', 'peak_memory', 'cache')}
+        for name, result in results['validation_results'].items()
+    }
+
+
+class TestFileWatchers:
+    """Test suite for change detection."""
+    
+    def test_polling_watcher(self, tmp_path):
+        """Test that polling reports modified, added and removed files."""
+        write_docs(tmp_path)
+        watcher = PollingWatcher(tmp_path, interval=0.01)
+        
+        assert watcher.wait(timeout=0.05) == set()
+        
+        (tmp_path / "housing" / "rent.md").write_text("# Rent\n\nChanged and longer.\n", encoding='utf-8')
+        (tmp_path / "housing" / "new.md").write_text("# New\n", encoding='utf-8')
+        (tmp_path / "housing" / "overview.md").unlink()
+        assert watcher.wait(timeout=1) == {
+            tmp_path / "housing" / "rent.md",
+            tmp_path / "housing" / "new.md",
+            tmp_path / "housing" / "overview.md"
+        }
+    
+    @pytest.mark.skipif(not INOTIFY_AVAILABLE, reason="inotify not available")
+    def test_inotify_watcher(self, tmp_path):
+        """Test that inotify reports saved files, including in new directories."""
+        write_docs(tmp_path)
+        watcher = InotifyWatcher(tmp_path)
+        try:
+            (tmp_path / "housing" / "rent.md").write_text("# Rent\n", encoding='utf-8')
+            assert tmp_path / "housing" / "rent.md" in watcher.wait(timeout=1)
+            
+            (tmp_path / "tax").mkdir()
+            assert tmp_path / "tax" in watcher.wait(timeout=1)
+            (tmp_path / "tax" / "skat.md").write_text("# SKAT\n", encoding='utf-8')
+            assert watcher.wait(timeout=1) == {tmp_path / "tax" / "skat.md"}
+        finally:
+            watcher.close()
+
+
+class TestIncrementalRevalidation:
+    """Test suite for watch mode re-validation."""
+    
+    def test_revalidation_matches_fresh_run(self, tmp_path):
+        """Test that re-validating changed files gives the same results as a full run."""
+        write_docs(tmp_path)
+        orchestrator = ValidationOrchestrator(tmp_path, SCRIPTS_DIR)
+        orchestrator.cache = ValidationCache(None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            orchestrator.run_all_validations(save_cache=False)
+        validator_names = list(orchestrator.results['validation_results'])
+        
+        rent = tmp_path / "housing" / "rent.md"
+        rent.write_text("# Rent\n\n## Deposit\n\nAsk LLO. See [x](missing.md).\n", encoding='utf-8')
+        
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            orchestrator._revalidate([rent], validator_names)
+        
+        assert comparable(orchestrator.results) == comparable(run_fresh(tmp_path))
+        assert "+ [links] housing/rent.md: Broken link: missing.md" in output.getvalue()
+        
+        # Files other than the changed one are served from the cache
+        links_cache = orchestrator.results['validation_results']['links']['cache']
+        assert links_cache == {'hits': 1, 'misses': 1}
+    
+    def test_collect_errors_ignores_line_numbers(self):
+        """Test that errors are compared without their line number prefix."""
+        results = {'validation_results': {'acronyms': {
+            'success': True,
+            'data': {'files': [{'file': 'a.md', 'errors': ["Line 5: Acronym 'AI' used without definition"]}]}
+        }}}
+        moved = {'validation_results': {'acronyms': {
+            'success': True,
+            'data': {'files': [{'file': 'a.md', 'errors': ["Line 9: Acronym 'AI' used without definition"]}]}
+        }}}
+        
+        assert collect_errors(results) == collect_errors(moved)
+
+
+if __name__ == '__main__':
+    # Run tests when executed directly
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Tokenizer Backends for Denmark Living Documentation System
+
+This module provides the token counting used for the RAG section limit:
+- Exact counts with tiktoken encodings (cl100k_base, o200k_base)
+- Batch encoding of many texts in a single call
+- A character/word heuristic when tiktoken is not available
+
+Encoders are loaded once per process and shared by all callers.
+
+Requirements: 1.4
+"""
+
+import re
+from typing import List, Iterable
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+# text-embedding-3-small, used by scripts/index-documentation.ts, uses cl100k_base
+DEFAULT_ENCODING = 'cl100k_base'
+SUPPORTED_ENCODINGS = ('cl100k_base', 'o200k_base')
+ENCODING_ALIASES = {
+    'cl100k': 'cl100k_base',
+    'o200k': 'o200k_base'
+}
+
+# Tokenizers already loaded in this process, keyed by requested encoding
+_TOKENIZERS = {}
+
+
+def clean_markdown(text: str) -> str:
+    """
+    Remove markdown formatting to get clean text for heuristic token counting.
+    
+    Args:
+        text: Markdown text
+        
+    Returns:
+        Clean text without markdown formatting
+    """
+    # Remove markdown links but keep the text
+    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+    
+    # Remove markdown emphasis
+    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold
+    text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Italic
+    text = re.sub(r'`([^`]+)`', r'\1', text)        # Inline code
+    
+    # Remove markdown headings (H3-H6 within sections)
+    text = re.sub(r'^#{3,6}\s+', '', text, flags=re.MULTILINE)
+    
+    # Remove list markers
+    text = re.sub(r'^\s*[-*+]\s+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^\s*\d+\.\s+', '', text, flags=re.MULTILINE)
+    
+    # Remove blockquote markers
+    text = re.sub(r'^\s*>\s*', '', text, flags=re.MULTILINE)
+    
+    # Remove horizontal rules
+    text = re.sub(r'^---+$', '', text, flags=re.MULTILINE)
+    
+    # Remove extra whitespace
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    text = text.strip()
+    
+    return text
+
+
+class HeuristicTokenizer:
+    """Approximate token counts from character and word counts."""
+    
+    name = 'heuristic'
+    exact = False
+    
+    def count(self, text: str) -> int:
+        """
+        Count tokens in text using a simple approximation.
+        
+        This uses a rough approximation where:
+        - 1 token ≈ 4 characters for English text
+        - Adjusts for markdown formatting
+        
+        Args:
+            text: Text to count tokens for
+            
+        Returns:
+            Approximate token count
+        """
+        if not text:
+            return 0
+        
+        # Remove markdown formatting for more accurate count
+        clean_text = clean_markdown(text)
+        
+        # Simple token approximation: ~4 characters per token for English
+        char_count = len(clean_text)
+        token_estimate = char_count / 4
+        
+        # Adjust for word boundaries (more accurate for natural language)
+        words = len(clean_text.split())
+        word_based_estimate = words * 1.3  # Average ~1.3 tokens per word
+        
+        # Use the average of both methods for better accuracy
+        final_estimate = (token_estimate + word_based_estimate) / 2
+        
+        return int(round(final_estimate))
+    
+    def count_batch(self, texts: Iterable[str]) -> List[int]:
+        """
+        Count tokens in several texts.
+        
+        Args:
+            texts: Texts to count tokens for
+            
+        Returns:
+            Token counts in the same order as the texts
+        """
+        return [self.count(text) for text in texts]
+
+
+class TiktokenTokenizer:
+    """Exact token counts with a tiktoken encoding."""
+    
+    exact = True
+    
+    def __init__(self, encoding_name: str):
+        self.name = encoding_name
+        self.encoding = tiktoken.get_encoding(encoding_name)
+    
+    def count(self, text: str) -> int:
+        """
+        Count tokens in text.
+        
+        Args:
+            text: Text to count tokens for
+            
+        Returns:
+            Exact token count (special tokens are encoded as plain text)
+        """
+        if not text:
+            return 0
+        return len(self.encoding.encode_ordinary(text))
+    
+    def count_batch(self, texts: Iterable[str]) -> List[int]:
+        """
+        Count tokens in several texts with a single batched encode call.
+        
+        Args:
+            texts: Texts to count tokens for
+            
+        Returns:
+            Token counts in the same order as the texts
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        return [len(tokens) for tokens in self.encoding.encode_ordinary_batch(texts)]
+
+
+def get_tokenizer(encoding: str = DEFAULT_ENCODING):
+    """
+    Get the tokenizer for an encoding, loading it at most once per process.
+    
+    Falls back to the heuristic tokenizer when tiktoken is not installed or
+    the encoding cannot be loaded (e.g. no network to fetch its BPE file).
+    
+    Args:
+        encoding: 'cl100k_base', 'o200k_base' (or 'cl100k'/'o200k'), or 'heuristic'
+        
+    Returns:
+        Tokenizer with ``name``, ``exact``, ``count()`` and ``count_batch()``
+        
+    Raises:
+        ValueError: If the encoding is not supported
+    """
+    encoding = ENCODING_ALIASES.get(encoding, encoding)
+    if encoding not in SUPPORTED_ENCODINGS and encoding != HeuristicTokenizer.name:
+        raise ValueError(f"Unsupported encoding '{encoding}', expected one of: "
+                         f"{', '.join(SUPPORTED_ENCODINGS + (HeuristicTokenizer.name,))}")
+    
+    if encoding not in _TOKENIZERS:
+        tokenizer = None
+        if encoding != HeuristicTokenizer.name:
+            if TIKTOKEN_AVAILABLE:
+                try:
+                    tokenizer = TiktokenTokenizer(encoding)
+                except Exception as e:
+                    print(f"Warning: Could not load tiktoken encoding '{encoding}': {e}; "
+                          f"using approximate token counts")
+            else:
+                print("Warning: tiktoken not installed; using approximate token counts. "
+                      "Install with: pip install tiktoken")
+        _TOKENIZERS[encoding] = tokenizer or HeuristicTokenizer()
+    
+    return _TOKENIZERS[encoding]
+
+
+def count_tokens(text: str, encoding: str = DEFAULT_ENCODING) -> int:
+    """
+    Count tokens in text with the shared tokenizer for an encoding.
+    
+    Args:
+        text: Text to count tokens for
+        encoding: Encoding name, see get_tokenizer()
+        
+    Returns:
+        Token count (exact with tiktoken, approximate otherwise)
+    """
+    return get_tokenizer(encoding).count(text)
+
+
+__all__ = [
+    'DEFAULT_ENCODING',
+    'SUPPORTED_ENCODINGS',
+    'TIKTOKEN_AVAILABLE',
+    'HeuristicTokenizer',
+    'TiktokenTokenizer',
+    'clean_markdown',
+    'count_tokens',
+    'get_tokenizer'
+]
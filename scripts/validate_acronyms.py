@@ -14,9 +14,14 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any, Set
+from typing import List, Dict, Tuple, Optional, Any, Set, Callable
 import argparse
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from validation_cache import ValidatorCache, hash_value
+
 
 class AcronymValidator:
     """Validates acronyms and their definitions in documentation."""
@@ -63,6 +68,19 @@ class AcronymValidator:
         Returns:
             Dictionary containing validation results
         """
+        return self.validate_document(ParsedDocument.from_file(file_path))
+    
+    def validate_document(self, document: ParsedDocument) -> Dict[str, Any]:
+        """
+        Validate acronyms and their definitions in an already parsed document.
+        
+        Args:
+            document: Parsed document from the shared corpus
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        file_path = document.path
         result = {
             'file': str(file_path),
             'valid': True,
@@ -74,8 +92,7 @@ class AcronymValidator:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = document.read()
             
             # Find all acronyms in the content
             acronyms = self._find_acronyms(content)
@@ -435,6 +452,22 @@ class AcronymValidator:
             directory: Directory to validate
             recursive: Whether to search subdirectories
             
+        Returns:
+            Dictionary containing validation results for all files
+        """
+        return self.validate_corpus(DocumentCorpus.load(directory, recursive=recursive))
+    
+    def validate_corpus(self, corpus: DocumentCorpus, cache: Optional[ValidatorCache] = None,
+                        sink: Optional[Callable[[Dict], None]] = None) -> Dict[str, Any]:
+        """
+        Validate acronyms in all documents of an already loaded corpus.
+        
+        Args:
+            corpus: Shared document corpus
+            cache: Optional cache of per-file results from earlier runs
+            sink: Optional callable receiving each file result as it is produced,
+                instead of collecting them in ``files``
+            
         Returns:
             Dictionary containing validation results for all files
         """
@@ -442,7 +475,7 @@ class AcronymValidator:
         self.global_acronym_definitions = {}
         
         results = {
-            'directory': str(directory),
+            'directory': str(corpus.directory),
             'files': [],
             'summary': {
                 'total_files': 0,
@@ -458,33 +491,39 @@ class AcronymValidator:
             }
         }
         
-        # Find all markdown files
-        pattern = '**/*.md' if recursive else '*.md'
-        markdown_files = list(directory.glob(pattern))
-        
-        for file_path in markdown_files:
-            if file_path.is_file():
-                file_result = self.validate_file(file_path)
-                results['files'].append(file_result)
-                
-                results['summary']['total_files'] += 1
-                if file_result['valid']:
-                    results['summary']['valid_files'] += 1
-                else:
-                    results['summary']['invalid_files'] += 1
+        for document in corpus:
+            if cache is not None:
+                # Consistency checks depend on the definitions seen in earlier files
+                context = hash_value(self.global_acronym_definitions)
+                file_result = cache.lookup(document, self.validate_document, context=context)
                 
-                if file_result['acronyms_found']:
-                    results['summary']['files_with_acronyms'] += 1
-                    results['summary']['total_acronyms'] += len(file_result['acronyms_found'])
-                    
-                    # Track unique acronyms
-                    for item in file_result['acronyms_found']:
-                        results['summary']['unique_acronyms'].add(item['acronym'])
+                # Replay definitions from cached results (no-op for fresh results)
+                self._update_global_definitions(file_result['acronyms_found'])
+            else:
+                file_result = self.validate_document(document)
+            if sink is not None:
+                sink(file_result)
+            else:
+                results['files'].append(file_result)
+            
+            results['summary']['total_files'] += 1
+            if file_result['valid']:
+                results['summary']['valid_files'] += 1
+            else:
+                results['summary']['invalid_files'] += 1
+            
+            if file_result['acronyms_found']:
+                results['summary']['files_with_acronyms'] += 1
+                results['summary']['total_acronyms'] += len(file_result['acronyms_found'])
                 
-                results['summary']['total_undefined_acronyms'] += len(file_result['undefined_acronyms'])
-                results['summary']['total_inconsistent_definitions'] += len(file_result['inconsistent_definitions'])
-                results['summary']['total_errors'] += len(file_result['errors'])
-                results['summary']['total_warnings'] += len(file_result['warnings'])
+                # Track unique acronyms
+                for item in file_result['acronyms_found']:
+                    results['summary']['unique_acronyms'].add(item['acronym'])
+            
+            results['summary']['total_undefined_acronyms'] += len(file_result['undefined_acronyms'])
+            results['summary']['total_inconsistent_definitions'] += len(file_result['inconsistent_definitions'])
+            results['summary']['total_errors'] += len(file_result['errors'])
+            results['summary']['total_warnings'] += len(file_result['warnings'])
         
         # Convert set to count for JSON serialization
         results['summary']['unique_acronyms_count'] = len(results['summary']['unique_acronyms'])
@@ -14,9 +14,14 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any, Set
+from typing import List, Dict, Tuple, Optional, Any, Set, Callable
 import argparse
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from validation_cache import ValidatorCache
+
 
 class CitizenshipDistinctionValidator:
     """Validates citizenship distinctions in documentation."""
@@ -57,6 +62,19 @@ class CitizenshipDistinctionValidator:
         Returns:
             Dictionary containing validation results
         """
+        return self.validate_document(ParsedDocument.from_file(file_path))
+    
+    def validate_document(self, document: ParsedDocument) -> Dict[str, Any]:
+        """
+        Validate citizenship distinctions in an already parsed document.
+        
+        Args:
+            document: Parsed document from the shared corpus
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        file_path = document.path
         result = {
             'file': str(file_path),
             'has_citizenship_content': False,
@@ -70,8 +88,7 @@ class CitizenshipDistinctionValidator:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = document.read()
             
             # Check if file contains citizenship-dependent content
             has_citizenship_content = self._has_citizenship_content(content, file_path)
@@ -495,11 +512,27 @@ class CitizenshipDistinctionValidator:
             directory: Directory to validate
             recursive: Whether to search subdirectories
             
+        Returns:
+            Dictionary containing validation results for all files
+        """
+        return self.validate_corpus(DocumentCorpus.load(directory, recursive=recursive))
+    
+    def validate_corpus(self, corpus: DocumentCorpus, cache: Optional[ValidatorCache] = None,
+                        sink: Optional[Callable[[Dict], None]] = None) -> Dict[str, Any]:
+        """
+        Validate citizenship distinctions in all documents of an already loaded corpus.
+        
+        Args:
+            corpus: Shared document corpus
+            cache: Optional cache of per-file results from earlier runs
+            sink: Optional callable receiving each file result as it is produced,
+                instead of collecting them in ``files``
+            
         Returns:
             Dictionary containing validation results for all files
         """
         results = {
-            'directory': str(directory),
+            'directory': str(corpus.directory),
             'files': [],
             'summary': {
                 'total_files': 0,
@@ -515,38 +548,39 @@ class CitizenshipDistinctionValidator:
             }
         }
         
-        # Find all markdown files
-        pattern = '**/*.md' if recursive else '*.md'
-        markdown_files = list(directory.glob(pattern))
-        
-        for file_path in markdown_files:
-            if file_path.is_file():
-                file_result = self.validate_file(file_path)
+        for document in corpus:
+            if cache is not None:
+                file_result = cache.lookup(document, self.validate_document)
+            else:
+                file_result = self.validate_document(document)
+            if sink is not None:
+                sink(file_result)
+            else:
                 results['files'].append(file_result)
+            
+            results['summary']['total_files'] += 1
+            
+            if file_result['has_citizenship_content']:
+                results['summary']['citizenship_dependent_files'] += 1
                 
-                results['summary']['total_files'] += 1
+                if file_result['valid']:
+                    results['summary']['valid_files'] += 1
+                else:
+                    results['summary']['invalid_files'] += 1
+                
+                if file_result['good_distinctions']:
+                    results['summary']['files_with_good_distinctions'] += 1
                 
-                if file_result['has_citizenship_content']:
-                    results['summary']['citizenship_dependent_files'] += 1
-                    
-                    if file_result['valid']:
-                        results['summary']['valid_files'] += 1
-                    else:
-                        results['summary']['invalid_files'] += 1
-                    
-                    if file_result['good_distinctions']:
-                        results['summary']['files_with_good_distinctions'] += 1
-                    
-                    if file_result['missing_distinctions']:
-                        results['summary']['files_with_missing_distinctions'] += 1
-                    
-                    if file_result['unclear_distinctions']:
-                        results['summary']['files_with_unclear_distinctions'] += 1
-                    
-                    results['summary']['total_citizenship_references'] += len(file_result['citizenship_references'])
+                if file_result['missing_distinctions']:
+                    results['summary']['files_with_missing_distinctions'] += 1
                 
-                results['summary']['total_errors'] += len(file_result['errors'])
-                results['summary']['total_warnings'] += len(file_result['warnings'])
+                if file_result['unclear_distinctions']:
+                    results['summary']['files_with_unclear_distinctions'] += 1
+                
+                results['summary']['total_citizenship_references'] += len(file_result['citizenship_references'])
+            
+            results['summary']['total_errors'] += len(file_result['errors'])
+            results['summary']['total_warnings'] += len(file_result['warnings'])
         
         return results
 
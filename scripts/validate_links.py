@@ -5,8 +5,14 @@ Link Validator for Denmark Living Documentation System
 This script validates markdown links by:
 - Extracting all relative markdown links
 - Verifying target files exist
+- Verifying ``#fragment`` anchors match a heading in the target file, using
+  GitHub-style heading anchors (see anchor_index.py)
 - Reporting broken links
 
+The files under the base directory and the heading anchors of every document
+are snapshotted once per run, so each link is checked with set lookups
+instead of filesystem calls.
+
 Requirements: 1.5
 """
 
@@ -14,16 +20,112 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Set, Callable
 import argparse
 from urllib.parse import urlparse
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from validation_cache import ValidatorCache, hash_value
+from anchor_index import AnchorIndex
+
+
+class LinkTargets:
+    """Snapshot of the files and heading anchors that links can point to."""
+    
+    def __init__(self, base_directory: Path, corpus: Optional[DocumentCorpus] = None):
+        self.base_directory = base_directory.resolve()
+        self.files = set()
+        self.directories = {str(self.base_directory)}
+        self.anchors = AnchorIndex()
+        self._entries = []
+        self._resolved_directories = {}
+        
+        base = str(self.base_directory)
+        for root, dirs, files in os.walk(base):
+            dirs.sort()
+            relative_root = os.path.relpath(root, base)
+            self._entries.append(relative_root + os.sep)
+            self.directories.update(os.path.join(root, name) for name in dirs)
+            for name in sorted(files):
+                self._entries.append(os.path.join(relative_root, name))
+                self.files.add(os.path.join(root, name))
+        
+        if corpus is not None:
+            for document in corpus:
+                target = os.path.join(self.resolve_directory(document.path.parent), document.path.name)
+                self.anchors.add(target, document)
+    
+    def resolve_directory(self, directory: Path) -> str:
+        """Resolve a source directory once; later calls are dictionary lookups."""
+        resolved = self._resolved_directories.get(directory)
+        if resolved is None:
+            resolved = str(directory.resolve())
+            self._resolved_directories[directory] = resolved
+        return resolved
+    
+    def is_within_base(self, target: str) -> bool:
+        """Whether a normalized absolute path lies inside the base directory."""
+        base = str(self.base_directory)
+        return target == base or target.startswith(base.rstrip(os.sep) + os.sep)
+    
+    def anchors_for(self, target: str) -> Optional[Set[str]]:
+        """
+        Heading anchors of a markdown target file.
+        
+        Files outside the snapshotted corpus (e.g. when validating a single
+        file) are parsed on first use.
+        
+        Args:
+            target: Normalized absolute path of an existing file
+            
+        Returns:
+            Set of anchors, or None if the target is not a markdown file
+        """
+        if target not in self.anchors:
+            if not target.endswith('.md'):
+                return None
+            self.anchors.add(target, ParsedDocument.from_file(Path(target)))
+        return self.anchors.get(target)
+    
+    def key(self) -> str:
+        """
+        Hash of every path below the base directory and every document's anchors.
+        
+        Any file or directory added, removed or renamed, or any heading changed,
+        changes the key, invalidating cached link results.
+        """
+        anchors = {target: sorted(anchors) for target, anchors in sorted(self.anchors.items())}
+        return hash_value({'base_directory': str(self.base_directory), 'entries': self._entries, 'anchors': anchors})
+
 
 class LinkValidator:
     """Validates markdown links in documentation files."""
     
     def __init__(self, base_directory: Path):
         self.base_directory = base_directory
+        self._targets = None
+    
+    def snapshot(self, corpus: Optional[DocumentCorpus] = None) -> LinkTargets:
+        """
+        Record the files and heading anchors links are checked against.
+        
+        Args:
+            corpus: Documents whose headings provide anchors (others are read on use)
+            
+        Returns:
+            The new snapshot
+        """
+        self._targets = LinkTargets(self.base_directory, corpus)
+        return self._targets
+    
+    @property
+    def targets(self) -> LinkTargets:
+        """The current snapshot, taken on first use if none exists."""
+        if self._targets is None:
+            self.snapshot()
+        return self._targets
     
     def validate_file(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -35,6 +137,19 @@ class LinkValidator:
         Returns:
             Dictionary containing validation results
         """
+        return self.validate_document(ParsedDocument.from_file(file_path))
+    
+    def validate_document(self, document: ParsedDocument) -> Dict[str, Any]:
+        """
+        Validate all links in a document that has already been read and parsed.
+        
+        Args:
+            document: Parsed document from the shared corpus
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        file_path = document.path
         result = {
             'file': str(file_path),
             'valid': True,
@@ -47,11 +162,10 @@ class LinkValidator:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document.read()
             
             # Extract all links
-            links = self._extract_links(content, file_path)
+            links = self._extract_links(document.lines, file_path)
             result['links'] = links
             result['total_links'] = len(links)
             
@@ -61,6 +175,10 @@ class LinkValidator:
                     if not self._validate_relative_link(link, file_path):
                         result['broken_links'].append(link)
                         result['broken_count'] += 1
+                elif link['type'] == 'anchor':
+                    if not self._validate_anchor_link(link, document):
+                        result['broken_links'].append(link)
+                        result['broken_count'] += 1
                 elif link['type'] == 'external':
                     result['external_links'].append(link)
                     result['external_count'] += 1
@@ -74,19 +192,18 @@ class LinkValidator:
         
         return result
     
-    def _extract_links(self, content: str, file_path: Path) -> List[Dict[str, Any]]:
+    def _extract_links(self, lines: List[str], file_path: Path) -> List[Dict[str, Any]]:
         """
         Extract all markdown links from content.
         
         Args:
-            content: Markdown content
+            lines: Markdown content split into lines
             file_path: Path to the file being processed
             
         Returns:
             List of link dictionaries with metadata
         """
         links = []
-        lines = content.split('\n')
         
         # Regular expression for markdown links: [text](url)
         link_pattern = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
@@ -145,55 +262,107 @@ class LinkValidator:
     
     def _validate_relative_link(self, link: Dict[str, Any], source_file: Path) -> bool:
         """
-        Validate that a relative link points to an existing file.
+        Validate that a relative link points to an existing file and heading.
         
         Args:
             link: Link information dictionary
             source_file: Path to the file containing the link
             
         Returns:
-            True if the link target exists
+            True if the link target (and its anchor, if any) exists
         """
         url = link['url']
         
-        # Remove anchor fragment if present
-        url_without_anchor = url.split('#')[0]
+        # Split off the anchor fragment if present
+        url_without_anchor, _, fragment = url.partition('#')
         
         # Skip if it's just an anchor
         if not url_without_anchor:
             return True
         
-        # Resolve the relative path
-        source_dir = source_file.parent
-        target_path = source_dir / url_without_anchor
+        targets = self.targets
         
         try:
-            # Resolve to absolute path and check if it exists
-            resolved_path = target_path.resolve()
-            
-            # Check if the resolved path is within the base directory
-            try:
-                resolved_path.relative_to(self.base_directory.resolve())
-            except ValueError:
-                # Path is outside the base directory
-                link['error'] = f"Link points outside base directory: {resolved_path}"
-                return False
-            
-            # Check if file exists
-            if not resolved_path.exists():
-                link['error'] = f"Target file does not exist: {resolved_path}"
-                return False
-            
-            # Check if it's a file (not a directory)
-            if not resolved_path.is_file():
-                link['error'] = f"Target is not a file: {resolved_path}"
+            # Normalize against the resolved source directory; no filesystem access
+            source_dir = targets.resolve_directory(source_file.parent)
+            resolved_path = os.path.normpath(os.path.join(source_dir, url_without_anchor))
+        except Exception as e:
+            link['error'] = f"Error resolving path: {str(e)}"
+            return False
+        
+        # Check if the resolved path is within the base directory
+        if not targets.is_within_base(resolved_path):
+            link['error'] = f"Link points outside base directory: {resolved_path}"
+            return False
+        
+        # Check if it's a file (not a directory)
+        if resolved_path in targets.directories:
+            link['error'] = f"Target is not a file: {resolved_path}"
+            return False
+        
+        # Check if file exists
+        if resolved_path not in targets.files:
+            link['error'] = f"Target file does not exist: {resolved_path}"
+            return False
+        
+        if fragment and targets.anchors_for(resolved_path) is not None:
+            if not targets.anchors.has_anchor(resolved_path, fragment):
+                link['error'] = self._anchor_error(fragment, resolved_path)
                 return False
+        
+        return True
+    
+    def _validate_anchor_link(self, link: Dict[str, Any], document: ParsedDocument) -> bool:
+        """
+        Validate that an anchor-only link matches a heading in its own document.
+        
+        Args:
+            link: Link information dictionary
+            document: Document containing the link
             
+        Returns:
+            True if the anchor exists (an empty ``#`` always passes)
+        """
+        fragment = link['url'][1:]
+        if not fragment:
             return True
-            
-        except Exception as e:
-            link['error'] = f"Error resolving path: {str(e)}"
+        
+        targets = self.targets
+        target = os.path.join(targets.resolve_directory(document.path.parent), document.path.name)
+        if target not in targets.anchors:
+            targets.anchors.add(target, document)
+        
+        if not targets.anchors.has_anchor(target, fragment):
+            link['error'] = self._anchor_error(fragment, target, display_path=document.path)
             return False
+        return True
+    
+    def _anchor_error(self, fragment: str, target: str, display_path: Optional[Path] = None) -> str:
+        """
+        Describe a missing anchor, suggesting the heading it probably meant.
+        
+        Args:
+            fragment: Fragment as written in the link
+            target: Resolved path of the target document in the anchor index
+            display_path: Path shown in the message (defaults to the target)
+            
+        Returns:
+            Error message
+        """
+        message = f"Anchor #{fragment} not found in {display_path or target}"
+        suggestion = self.targets.anchors.suggest(target, fragment)
+        if suggestion:
+            message += f" (did you mean #{suggestion}?)"
+        return message
+    
+    def link_targets_key(self) -> str:
+        """
+        Compute a key for the files and anchors links can resolve to.
+        
+        Returns:
+            Hash of all paths below the base directory and the snapshotted anchors
+        """
+        return self.targets.key()
     
     def validate_directory(self, directory: Path, recursive: bool = True) -> Dict[str, Any]:
         """
@@ -203,11 +372,27 @@ class LinkValidator:
             directory: Directory to validate
             recursive: Whether to search subdirectories
             
+        Returns:
+            Dictionary containing validation results for all files
+        """
+        return self.validate_corpus(DocumentCorpus.load(directory, recursive=recursive))
+    
+    def validate_corpus(self, corpus: DocumentCorpus, cache: Optional[ValidatorCache] = None,
+                        sink: Optional[Callable[[Dict], None]] = None) -> Dict[str, Any]:
+        """
+        Validate links in all documents of an already loaded corpus.
+        
+        Args:
+            corpus: Shared document corpus
+            cache: Optional cache of per-file results from earlier runs
+            sink: Optional callable receiving each file result as it is produced,
+                instead of collecting them in ``files``
+            
         Returns:
             Dictionary containing validation results for all files
         """
         results = {
-            'directory': str(directory),
+            'directory': str(corpus.directory),
             'files': [],
             'summary': {
                 'total_files': 0,
@@ -221,31 +406,37 @@ class LinkValidator:
             }
         }
         
-        # Find all markdown files
-        pattern = '**/*.md' if recursive else '*.md'
-        markdown_files = list(directory.glob(pattern))
+        # Snapshot link targets once; results depend on which files and headings
+        # exist, not only on the linking document
+        self.snapshot(corpus)
+        context = self.link_targets_key() if cache is not None else ''
         
-        for file_path in markdown_files:
-            if file_path.is_file():
-                file_result = self.validate_file(file_path)
+        for document in corpus:
+            if cache is not None:
+                file_result = cache.lookup(document, self.validate_document, context=context)
+            else:
+                file_result = self.validate_document(document)
+            if sink is not None:
+                sink(file_result)
+            else:
                 results['files'].append(file_result)
-                
-                results['summary']['total_files'] += 1
-                if file_result['valid']:
-                    results['summary']['valid_files'] += 1
-                else:
-                    results['summary']['invalid_files'] += 1
-                
-                results['summary']['total_links'] += file_result['total_links']
-                results['summary']['broken_links'] += file_result['broken_count']
-                results['summary']['external_links'] += file_result['external_count']
-                
-                # Count link types
-                for link in file_result['links']:
-                    if link['type'] == 'relative':
-                        results['summary']['relative_links'] += 1
-                    elif link['type'] == 'anchor':
-                        results['summary']['anchor_links'] += 1
+            
+            results['summary']['total_files'] += 1
+            if file_result['valid']:
+                results['summary']['valid_files'] += 1
+            else:
+                results['summary']['invalid_files'] += 1
+            
+            results['summary']['total_links'] += file_result['total_links']
+            results['summary']['broken_links'] += file_result['broken_count']
+            results['summary']['external_links'] += file_result['external_count']
+            
+            # Count link types
+            for link in file_result['links']:
+                if link['type'] == 'relative':
+                    results['summary']['relative_links'] += 1
+                elif link['type'] == 'anchor':
+                    results['summary']['anchor_links'] += 1
         
         return results
     
@@ -14,9 +14,14 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Callable
 import argparse
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from validation_cache import ValidatorCache
+
 
 class MarkdownValidator:
     """Validates markdown files for syntax and structure compliance."""
@@ -35,6 +40,19 @@ class MarkdownValidator:
         Returns:
             Dictionary containing validation results
         """
+        return self.validate_document(ParsedDocument.from_file(file_path))
+    
+    def validate_document(self, document: ParsedDocument) -> Dict[str, any]:
+        """
+        Validate a markdown document that has already been read and parsed.
+        
+        Args:
+            document: Parsed document from the shared corpus
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        file_path = document.path
         result = {
             'file': str(file_path),
             'valid': True,
@@ -44,14 +62,13 @@ class MarkdownValidator:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document.read()
             
             # Parse and validate the markdown content
-            result['structure'] = self._parse_structure(content, file_path)
-            result['errors'].extend(self._validate_syntax(content, file_path))
+            result['structure'] = self._parse_structure(document)
+            result['errors'].extend(self._validate_syntax(document.lines, file_path))
             result['errors'].extend(self._validate_heading_hierarchy(result['structure'], file_path))
-            result['warnings'].extend(self._check_best_practices(content, file_path))
+            result['warnings'].extend(self._check_best_practices(document.lines, file_path))
             
             if result['errors']:
                 result['valid'] = False
@@ -62,95 +79,35 @@ class MarkdownValidator:
         
         return result
     
-    def _parse_structure(self, content: str, file_path: Path) -> Dict[str, any]:
+    def _parse_structure(self, document: ParsedDocument) -> Dict[str, any]:
         """
-        Parse the markdown structure and extract headings.
+        Build the document structure from the parsed headings and frontmatter.
         
         Args:
-            content: Markdown content
-            file_path: Path to the file being parsed
+            document: Parsed document from the shared corpus
             
         Returns:
             Dictionary containing document structure
         """
-        structure = {
-            'headings': [],
-            'has_frontmatter': False,
-            'frontmatter': {},
+        return {
+            'headings': [dict(heading) for heading in document.headings],
+            'has_frontmatter': document.has_frontmatter,
+            'frontmatter': dict(document.frontmatter),
             'sections': []
         }
-        
-        lines = content.split('\n')
-        
-        # Check for frontmatter
-        if len(lines) > 0 and lines[0].strip() == '---':
-            structure['has_frontmatter'] = True
-            frontmatter_end = -1
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == '---':
-                    frontmatter_end = i
-                    break
-            
-            if frontmatter_end > 0:
-                frontmatter_content = '\n'.join(lines[1:frontmatter_end])
-                structure['frontmatter'] = self._parse_frontmatter(frontmatter_content)
-        
-        # Extract headings
-        heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
-        for match in heading_pattern.finditer(content):
-            level = len(match.group(1))
-            text = match.group(2).strip()
-            line_num = content[:match.start()].count('\n') + 1
-            
-            structure['headings'].append({
-                'level': level,
-                'text': text,
-                'line': line_num
-            })
-        
-        return structure
     
-    def _parse_frontmatter(self, frontmatter_content: str) -> Dict[str, any]:
-        """
-        Parse YAML frontmatter.
-        
-        Args:
-            frontmatter_content: YAML content from frontmatter
-            
-        Returns:
-            Dictionary of frontmatter data
-        """
-        frontmatter = {}
-        
-        # Simple YAML parsing for basic key-value pairs
-        for line in frontmatter_content.split('\n'):
-            line = line.strip()
-            if ':' in line and not line.startswith('#'):
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip().strip('"\'')
-                
-                # Handle arrays
-                if value.startswith('[') and value.endswith(']'):
-                    value = [item.strip().strip('"\'') for item in value[1:-1].split(',')]
-                
-                frontmatter[key] = value
-        
-        return frontmatter
-    
-    def _validate_syntax(self, content: str, file_path: Path) -> List[str]:
+    def _validate_syntax(self, lines: List[str], file_path: Path) -> List[str]:
         """
         Validate basic markdown syntax.
         
         Args:
-            content: Markdown content
+            lines: Markdown content split into lines
             file_path: Path to the file being validated
             
         Returns:
             List of syntax errors
         """
         errors = []
-        lines = content.split('\n')
         
         for i, line in enumerate(lines, 1):
             # Check for malformed headings
@@ -210,19 +167,18 @@ class MarkdownValidator:
         
         return errors
     
-    def _check_best_practices(self, content: str, file_path: Path) -> List[str]:
+    def _check_best_practices(self, lines: List[str], file_path: Path) -> List[str]:
         """
         Check for markdown best practices.
         
         Args:
-            content: Markdown content
+            lines: Markdown content split into lines
             file_path: Path to the file being checked
             
         Returns:
             List of best practice warnings
         """
         warnings = []
-        lines = content.split('\n')
         
         # Check for multiple consecutive empty lines
         empty_line_count = 0
@@ -249,11 +205,27 @@ class MarkdownValidator:
             directory: Directory to validate
             recursive: Whether to search subdirectories
             
+        Returns:
+            Dictionary containing validation results for all files
+        """
+        return self.validate_corpus(DocumentCorpus.load(directory, recursive=recursive))
+    
+    def validate_corpus(self, corpus: DocumentCorpus, cache: Optional[ValidatorCache] = None,
+                        sink: Optional[Callable[[Dict], None]] = None) -> Dict[str, any]:
+        """
+        Validate all documents of an already loaded corpus.
+        
+        Args:
+            corpus: Shared document corpus
+            cache: Optional cache of per-file results from earlier runs
+            sink: Optional callable receiving each file result as it is produced,
+                instead of collecting them in ``files``
+            
         Returns:
             Dictionary containing validation results for all files
         """
         results = {
-            'directory': str(directory),
+            'directory': str(corpus.directory),
             'files': [],
             'summary': {
                 'total_files': 0,
@@ -264,23 +236,24 @@ class MarkdownValidator:
             }
         }
         
-        # Find all markdown files
-        pattern = '**/*.md' if recursive else '*.md'
-        markdown_files = list(directory.glob(pattern))
-        
-        for file_path in markdown_files:
-            if file_path.is_file():
-                file_result = self.validate_file(file_path)
+        for document in corpus:
+            if cache is not None:
+                file_result = cache.lookup(document, self.validate_document)
+            else:
+                file_result = self.validate_document(document)
+            if sink is not None:
+                sink(file_result)
+            else:
                 results['files'].append(file_result)
-                
-                results['summary']['total_files'] += 1
-                if file_result['valid']:
-                    results['summary']['valid_files'] += 1
-                else:
-                    results['summary']['invalid_files'] += 1
-                
-                results['summary']['total_errors'] += len(file_result['errors'])
-                results['summary']['total_warnings'] += len(file_result['warnings'])
+            
+            results['summary']['total_files'] += 1
+            if file_result['valid']:
+                results['summary']['valid_files'] += 1
+            else:
+                results['summary']['invalid_files'] += 1
+            
+            results['summary']['total_errors'] += len(file_result['errors'])
+            results['summary']['total_warnings'] += len(file_result['warnings'])
         
         return results
 
@@ -3,6 +3,7 @@
 Metadata Validator for Denmark Living Documentation System
 
 This script validates frontmatter metadata in markdown files for:
+- YAML syntax of the frontmatter block
 - Required fields presence
 - Metadata schema compliance
 - Data type validation
@@ -15,10 +16,15 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Callable
 import argparse
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from validation_cache import ValidatorCache
+
 
 class MetadataValidator:
     """Validates frontmatter metadata in markdown files."""
@@ -73,6 +79,19 @@ class MetadataValidator:
         Returns:
             Dictionary containing validation results
         """
+        return self.validate_document(ParsedDocument.from_file(file_path))
+    
+    def validate_document(self, document: ParsedDocument) -> Dict[str, Any]:
+        """
+        Validate metadata in a document that has already been read and parsed.
+        
+        Args:
+            document: Parsed document from the shared corpus
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        file_path = document.path
         result = {
             'file': str(file_path),
             'valid': True,
@@ -83,15 +102,16 @@ class MetadataValidator:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document.read()
             
-            # Extract and validate metadata
-            metadata = self._extract_frontmatter(content)
+            # Frontmatter is parsed once per document and shared with other validators
+            metadata = dict(document.frontmatter)
             result['metadata'] = metadata
             result['has_frontmatter'] = bool(metadata)
             
-            if metadata:
+            if document.frontmatter_error:
+                result['errors'].append(document.frontmatter_error)
+            elif metadata:
                 result['errors'].extend(self._validate_required_fields(metadata, file_path))
                 result['errors'].extend(self._validate_field_types(metadata, file_path))
                 result['errors'].extend(self._validate_field_values(metadata, file_path))
@@ -108,104 +128,6 @@ class MetadataValidator:
         
         return result
     
-    def _extract_frontmatter(self, content: str) -> Dict[str, Any]:
-        """
-        Extract YAML frontmatter from markdown content.
-        Handles frontmatter at the beginning or after the first heading.
-        
-        Args:
-            content: Markdown content
-            
-        Returns:
-            Dictionary of frontmatter metadata
-        """
-        lines = content.split('\n')
-        
-        # Look for frontmatter delimiters
-        frontmatter_start = -1
-        frontmatter_end = -1
-        
-        # Check for frontmatter at the beginning
-        if len(lines) > 0 and lines[0].strip() == '---':
-            frontmatter_start = 0
-        else:
-            # Look for frontmatter after the first heading (common pattern)
-            for i, line in enumerate(lines):
-                if line.strip() == '---':
-                    if frontmatter_start == -1:
-                        frontmatter_start = i
-                    else:
-                        frontmatter_end = i
-                        break
-        
-        # If frontmatter starts at beginning, find the closing delimiter
-        if frontmatter_start == 0:
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == '---':
-                    frontmatter_end = i
-                    break
-        
-        # If no valid frontmatter block found
-        if frontmatter_start == -1 or frontmatter_end == -1:
-            return {}
-        
-        # Parse the frontmatter content
-        frontmatter_content = '\n'.join(lines[frontmatter_start + 1:frontmatter_end])
-        return self._parse_yaml_simple(frontmatter_content)
-    
-    def _parse_yaml_simple(self, yaml_content: str) -> Dict[str, Any]:
-        """
-        Simple YAML parser for frontmatter.
-        
-        Args:
-            yaml_content: YAML content string
-            
-        Returns:
-            Dictionary of parsed YAML data
-        """
-        metadata = {}
-        
-        for line in yaml_content.split('\n'):
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse key-value pairs
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                
-                # Handle arrays
-                if value.startswith('[') and value.endswith(']'):
-                    # Parse array values
-                    array_content = value[1:-1].strip()
-                    if array_content:
-                        items = []
-                        for item in array_content.split(','):
-                            item = item.strip()
-                            # Remove quotes from array items
-                            if item.startswith('"') and item.endswith('"'):
-                                item = item[1:-1]
-                            elif item.startswith("'") and item.endswith("'"):
-                                item = item[1:-1]
-                            items.append(item)
-                        value = items
-                    else:
-                        value = []
-                
-                metadata[key] = value
-        
-        return metadata
-    
     def _validate_required_fields(self, metadata: Dict[str, Any], file_path: Path) -> List[str]:
         """
         Validate that all required fields are present.
@@ -260,6 +182,9 @@ class MetadataValidator:
         """
         Validate field values against expected formats and constraints.
         
+        Values of the wrong type are skipped here; ``_validate_field_types``
+        reports them.
+        
         Args:
             metadata: Extracted metadata dictionary
             file_path: Path to the file being validated
@@ -272,7 +197,7 @@ class MetadataValidator:
         # Validate category
         if 'category' in metadata:
             category = metadata['category']
-            if category not in self.VALID_CATEGORIES:
+            if isinstance(category, str) and category not in self.VALID_CATEGORIES:
                 errors.append(f"Invalid category '{category}'. Valid categories: {', '.join(sorted(self.VALID_CATEGORIES))}")
         
         # Validate audience
@@ -280,7 +205,7 @@ class MetadataValidator:
             audience = metadata['audience']
             if isinstance(audience, list):
                 for aud in audience:
-                    if aud not in self.VALID_AUDIENCES:
+                    if not isinstance(aud, str) or aud not in self.VALID_AUDIENCES:
                         errors.append(f"Invalid audience '{aud}'. Valid audiences: {', '.join(sorted(self.VALID_AUDIENCES))}")
             else:
                 errors.append("Field 'audience' should be a list")
@@ -288,24 +213,24 @@ class MetadataValidator:
         # Validate source_url format
         if 'source_url' in metadata:
             source_url = metadata['source_url']
-            if not self._is_valid_url(source_url):
+            if isinstance(source_url, str) and not self._is_valid_url(source_url):
                 errors.append(f"Invalid URL format in 'source_url': {source_url}")
         
         # Validate last_updated date format
         if 'last_updated' in metadata:
             last_updated = metadata['last_updated']
-            if not self._is_valid_date(last_updated):
+            if isinstance(last_updated, str) and not self._is_valid_date(last_updated):
                 errors.append(f"Invalid date format in 'last_updated': {last_updated}. Expected YYYY-MM-DD format")
         
         # Validate language codes
         if 'language' in metadata:
             language = metadata['language']
-            if not self._is_valid_language_code(language):
+            if isinstance(language, str) and not self._is_valid_language_code(language):
                 errors.append(f"Invalid language code '{language}'. Expected ISO 639-1 format (e.g., 'en', 'da')")
         
         if 'translated_from' in metadata:
             translated_from = metadata['translated_from']
-            if not self._is_valid_language_code(translated_from):
+            if isinstance(translated_from, str) and not self._is_valid_language_code(translated_from):
                 errors.append(f"Invalid language code in 'translated_from': '{translated_from}'. Expected ISO 639-1 format")
         
         return errors
@@ -343,8 +268,8 @@ class MetadataValidator:
                 months_old = (datetime.now() - last_updated).days / 30
                 if months_old > 6:
                     warnings.append(f"Content may be outdated - last updated {months_old:.1f} months ago")
-            except ValueError:
-                pass  # Date format error already caught in validation
+            except (TypeError, ValueError):
+                pass  # Date format or type error already caught in validation
         
         return warnings
     
@@ -405,11 +330,27 @@ class MetadataValidator:
             directory: Directory to validate
             recursive: Whether to search subdirectories
             
+        Returns:
+            Dictionary containing validation results for all files
+        """
+        return self.validate_corpus(DocumentCorpus.load(directory, recursive=recursive))
+    
+    def validate_corpus(self, corpus: DocumentCorpus, cache: Optional[ValidatorCache] = None,
+                        sink: Optional[Callable[[Dict], None]] = None) -> Dict[str, Any]:
+        """
+        Validate metadata in all documents of an already loaded corpus.
+        
+        Args:
+            corpus: Shared document corpus
+            cache: Optional cache of per-file results from earlier runs
+            sink: Optional callable receiving each file result as it is produced,
+                instead of collecting them in ``files``
+            
         Returns:
             Dictionary containing validation results for all files
         """
         results = {
-            'directory': str(directory),
+            'directory': str(corpus.directory),
             'files': [],
             'summary': {
                 'total_files': 0,
@@ -422,28 +363,29 @@ class MetadataValidator:
             }
         }
         
-        # Find all markdown files
-        pattern = '**/*.md' if recursive else '*.md'
-        markdown_files = list(directory.glob(pattern))
-        
-        for file_path in markdown_files:
-            if file_path.is_file():
-                file_result = self.validate_file(file_path)
+        for document in corpus:
+            if cache is not None:
+                file_result = cache.lookup(document, self.validate_document)
+            else:
+                file_result = self.validate_document(document)
+            if sink is not None:
+                sink(file_result)
+            else:
                 results['files'].append(file_result)
-                
-                results['summary']['total_files'] += 1
-                if file_result['valid']:
-                    results['summary']['valid_files'] += 1
-                else:
-                    results['summary']['invalid_files'] += 1
-                
-                if file_result['has_frontmatter']:
-                    results['summary']['files_with_metadata'] += 1
-                else:
-                    results['summary']['files_without_metadata'] += 1
-                
-                results['summary']['total_errors'] += len(file_result['errors'])
-                results['summary']['total_warnings'] += len(file_result['warnings'])
+            
+            results['summary']['total_files'] += 1
+            if file_result['valid']:
+                results['summary']['valid_files'] += 1
+            else:
+                results['summary']['invalid_files'] += 1
+            
+            if file_result['has_frontmatter']:
+                results['summary']['files_with_metadata'] += 1
+            else:
+                results['summary']['files_without_metadata'] += 1
+            
+            results['summary']['total_errors'] += len(file_result['errors'])
+            results['summary']['total_warnings'] += len(file_result['warnings'])
         
         return results
 
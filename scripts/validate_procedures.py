@@ -14,9 +14,14 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Callable
 import argparse
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from validation_cache import ValidatorCache
+
 
 class ProceduralGuideValidator:
     """Validates procedural guide documents for completeness and structure."""
@@ -63,6 +68,19 @@ class ProceduralGuideValidator:
         Returns:
             Dictionary containing validation results
         """
+        return self.validate_document(ParsedDocument.from_file(file_path))
+    
+    def validate_document(self, document: ParsedDocument) -> Dict[str, Any]:
+        """
+        Validate a parsed document for procedural guide compliance.
+        
+        Args:
+            document: Parsed document from the shared corpus
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        file_path = document.path
         result = {
             'file': str(file_path),
             'is_procedural': False,
@@ -75,8 +93,7 @@ class ProceduralGuideValidator:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = document.read()
             
             # Determine if this is a procedural guide
             result['is_procedural'] = self._is_procedural_guide(content, file_path)
@@ -367,11 +384,27 @@ class ProceduralGuideValidator:
             directory: Directory to validate
             recursive: Whether to search subdirectories
             
+        Returns:
+            Dictionary containing validation results for all files
+        """
+        return self.validate_corpus(DocumentCorpus.load(directory, recursive=recursive))
+    
+    def validate_corpus(self, corpus: DocumentCorpus, cache: Optional[ValidatorCache] = None,
+                        sink: Optional[Callable[[Dict], None]] = None) -> Dict[str, Any]:
+        """
+        Validate all documents of an already loaded corpus for procedural guide compliance.
+        
+        Args:
+            corpus: Shared document corpus
+            cache: Optional cache of per-file results from earlier runs
+            sink: Optional callable receiving each file result as it is produced,
+                instead of collecting them in ``files``
+            
         Returns:
             Dictionary containing validation results for all files
         """
         results = {
-            'directory': str(directory),
+            'directory': str(corpus.directory),
             'files': [],
             'summary': {
                 'total_files': 0,
@@ -384,28 +417,29 @@ class ProceduralGuideValidator:
             }
         }
         
-        # Find all markdown files
-        pattern = '**/*.md' if recursive else '*.md'
-        markdown_files = list(directory.glob(pattern))
-        
-        for file_path in markdown_files:
-            if file_path.is_file():
-                file_result = self.validate_file(file_path)
+        for document in corpus:
+            if cache is not None:
+                file_result = cache.lookup(document, self.validate_document)
+            else:
+                file_result = self.validate_document(document)
+            if sink is not None:
+                sink(file_result)
+            else:
                 results['files'].append(file_result)
-                
-                results['summary']['total_files'] += 1
-                
-                if file_result['is_procedural']:
-                    results['summary']['procedural_files'] += 1
-                    if file_result['valid']:
-                        results['summary']['valid_procedural_files'] += 1
-                    else:
-                        results['summary']['invalid_procedural_files'] += 1
+            
+            results['summary']['total_files'] += 1
+            
+            if file_result['is_procedural']:
+                results['summary']['procedural_files'] += 1
+                if file_result['valid']:
+                    results['summary']['valid_procedural_files'] += 1
                 else:
-                    results['summary']['non_procedural_files'] += 1
-                
-                results['summary']['total_errors'] += len(file_result['errors'])
-                results['summary']['total_warnings'] += len(file_result['warnings'])
+                    results['summary']['invalid_procedural_files'] += 1
+            else:
+                results['summary']['non_procedural_files'] += 1
+            
+            results['summary']['total_errors'] += len(file_result['errors'])
+            results['summary']['total_warnings'] += len(file_result['warnings'])
         
         return results
 
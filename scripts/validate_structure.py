@@ -16,6 +16,10 @@ from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Any, Set
 import argparse
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+
 
 class StructureValidator:
     """Validates directory structure for the Denmark Living Documentation System."""
@@ -128,12 +132,13 @@ class StructureValidator:
     def __init__(self):
         pass
     
-    def validate_structure(self, docs_directory: Path) -> Dict[str, Any]:
+    def validate_structure(self, docs_directory: Path, markdown_files: Optional[List[Path]] = None) -> Dict[str, Any]:
         """
         Validate the complete directory structure.
         
         Args:
             docs_directory: Path to the docs directory
+            markdown_files: Already discovered markdown files, or None to glob each category
             
         Returns:
             Dictionary containing validation results
@@ -170,7 +175,7 @@ class StructureValidator:
         # Validate each required category
         for category_dir, category_name in self.REQUIRED_CATEGORIES.items():
             category_path = docs_directory / category_dir
-            category_result = self._validate_category(category_path, category_dir, category_name)
+            category_result = self._validate_category(category_path, category_dir, category_name, markdown_files)
             result['categories'][category_dir] = category_result
             
             # Update summary
@@ -204,7 +209,21 @@ class StructureValidator:
         
         return result
     
-    def _validate_category(self, category_path: Path, category_dir: str, category_name: str) -> Dict[str, Any]:
+    def validate_corpus(self, corpus: DocumentCorpus) -> Dict[str, Any]:
+        """
+        Validate the directory structure using the files of a loaded corpus.
+        
+        Args:
+            corpus: Shared document corpus
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        markdown_files = corpus.paths if corpus.recursive else None
+        return self.validate_structure(corpus.directory, markdown_files)
+    
+    def _validate_category(self, category_path: Path, category_dir: str, category_name: str,
+                           markdown_files: Optional[List[Path]] = None) -> Dict[str, Any]:
         """
         Validate a single category directory.
         
@@ -212,6 +231,7 @@ class StructureValidator:
             category_path: Path to the category directory
             category_dir: Directory name (e.g., 'before-moving')
             category_name: Human-readable category name
+            markdown_files: Already discovered markdown files, or None to glob the directory
             
         Returns:
             Dictionary containing category validation results
@@ -251,10 +271,14 @@ class StructureValidator:
         
         # Get actual files in the directory
         actual_files = set()
-        for file_path in category_path.glob('*.md'):
-            if file_path.is_file():
-                actual_files.add(file_path.name)
-                result['files'].append(file_path.name)
+        if markdown_files is None:
+            category_files = [file_path for file_path in category_path.glob('*.md') if file_path.is_file()]
+        else:
+            category_files = [file_path for file_path in markdown_files if file_path.parent == category_path]
+        
+        for file_path in category_files:
+            actual_files.add(file_path.name)
+            result['files'].append(file_path.name)
         
         result['total_files'] = len(actual_files)
         
@@ -15,9 +15,16 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any, Set
+from typing import List, Dict, Tuple, Optional, Any, Set, Callable
 import argparse
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus, ParsedDocument
+from validation_cache import ValidatorCache
+from glossary_matcher import GlossaryMatcher
+from glossary_index import GlossaryIndex
+
 
 class DanishTermValidator:
     """Validates Danish terms and their English translations in documentation."""
@@ -27,13 +34,17 @@ class DanishTermValidator:
         self.errors = []
         self.warnings = []
         
+        # Term matcher, rebuilt only when a new glossary is loaded
+        self._glossary_matcher = None
+        self._matcher_glossary = None
+        
         # Load glossary if provided
         if glossary_path and glossary_path.exists():
             self.glossary_terms = self._load_glossary(glossary_path)
     
     def _load_glossary(self, glossary_path: Path) -> Dict[str, Dict[str, str]]:
         """
-        Load Danish terms and their translations from the glossary.
+        Load Danish terms and their translations from the shared glossary index.
         
         Args:
             glossary_path: Path to the glossary.md file
@@ -41,54 +52,20 @@ class DanishTermValidator:
         Returns:
             Dictionary mapping Danish terms to their information
         """
-        glossary_terms = {}
-        
-        try:
-            with open(glossary_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse glossary entries
-            # Look for pattern: ### Danish Term followed by **English**: translation
-            current_term = None
-            current_info = {}
-            
-            lines = content.split('\n')
-            for line in lines:
-                line = line.strip()
-                
-                # Check for term heading (### Term)
-                if line.startswith('### ') and not line.startswith('### '):
-                    # Save previous term
-                    if current_term and current_info:
-                        glossary_terms[current_term.lower()] = current_info
-                    
-                    # Start new term
-                    current_term = line[4:].strip()
-                    current_info = {'term': current_term}
-                
-                # Check for English translation
-                elif line.startswith('**English**:'):
-                    english = line[12:].strip()
-                    current_info['english'] = english
-                
-                # Check for pronunciation
-                elif line.startswith('**Pronunciation**:'):
-                    pronunciation = line[18:].strip()
-                    current_info['pronunciation'] = pronunciation
-                
-                # Check for definition
-                elif line.startswith('**Definition**:'):
-                    definition = line[15:].strip()
-                    current_info['definition'] = definition
-            
-            # Save last term
-            if current_term and current_info:
-                glossary_terms[current_term.lower()] = current_info
-        
-        except Exception as e:
-            print(f"Warning: Could not load glossary from {glossary_path}: {e}")
+        return GlossaryIndex.load(glossary_path).danish_terms()
+    
+    def _get_glossary_matcher(self) -> Optional[GlossaryMatcher]:
+        """
+        Get the matcher for the loaded glossary terms, built once per glossary load.
         
-        return glossary_terms
+        Returns:
+            GlossaryMatcher over all glossary terms, or None without a glossary
+        """
+        if self._matcher_glossary is not self.glossary_terms:
+            known_terms = list(self.glossary_terms.keys())
+            self._glossary_matcher = GlossaryMatcher(known_terms) if known_terms else None
+            self._matcher_glossary = self.glossary_terms
+        return self._glossary_matcher
     
     def validate_file(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -100,6 +77,19 @@ class DanishTermValidator:
         Returns:
             Dictionary containing validation results
         """
+        return self.validate_document(ParsedDocument.from_file(file_path))
+    
+    def validate_document(self, document: ParsedDocument) -> Dict[str, Any]:
+        """
+        Validate Danish terms and translations in an already parsed document.
+        
+        Args:
+            document: Parsed document from the shared corpus
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        file_path = document.path
         result = {
             'file': str(file_path),
             'valid': True,
@@ -112,8 +102,7 @@ class DanishTermValidator:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = document.read()
             
             # Find Danish terms in the content
             danish_terms = self._find_danish_terms(content)
@@ -177,16 +166,9 @@ class DanishTermValidator:
         # Pattern 2: Danish term (English translation) - for terms that might not be bolded
         pattern2 = re.compile(r'\b([A-ZÆØÅ][a-zæøå-]+(?:\s+[a-zæøå-]+)*)\s*\(([^)]+)\)', re.UNICODE)
         
-        # Pattern 3: Known Danish terms from glossary (if available)
-        glossary_pattern = None
-        if self.glossary_terms:
-            # Create pattern for known Danish terms
-            known_terms = list(self.glossary_terms.keys())
-            if known_terms:
-                # Escape special regex characters and sort by length (longest first)
-                escaped_terms = [re.escape(term) for term in known_terms]
-                escaped_terms.sort(key=len, reverse=True)
-                glossary_pattern = re.compile(r'\b(' + '|'.join(escaped_terms) + r')\b', re.IGNORECASE)
+        # Pattern 3: Known Danish terms from glossary (if available), matched in one pass
+        glossary_matcher = self._get_glossary_matcher()
+        glossary_matches = glossary_matcher.find_by_line(content) if glossary_matcher else {}
         
         for line_num, line in enumerate(lines, 1):
             # Find bolded terms with translations
@@ -224,26 +206,25 @@ class DanishTermValidator:
                     })
             
             # Find known glossary terms without translations
-            if glossary_pattern:
-                for match in glossary_pattern.finditer(line):
-                    danish_term = match.group(1).strip()
-                    
-                    # Check if this term already has a translation in this line
-                    has_translation = (
-                        f'({danish_term})' in line or
-                        f'**{danish_term}**' in line or
-                        any(term['term'].lower() == danish_term.lower() and term['line'] == line_num
-                            for term in danish_terms)
-                    )
-                    
-                    if not has_translation:
-                        danish_terms.append({
-                            'term': danish_term,
-                            'translation': None,
-                            'line': line_num,
-                            'pattern': 'glossary_term_no_translation',
-                            'context': line.strip()
-                        })
+            for danish_term in glossary_matches.get(line_num, []):
+                danish_term = danish_term.strip()
+                
+                # Check if this term already has a translation in this line
+                has_translation = (
+                    f'({danish_term})' in line or
+                    f'**{danish_term}**' in line or
+                    any(term['term'].lower() == danish_term.lower() and term['line'] == line_num
+                        for term in danish_terms)
+                )
+                
+                if not has_translation:
+                    danish_terms.append({
+                        'term': danish_term,
+                        'translation': None,
+                        'line': line_num,
+                        'pattern': 'glossary_term_no_translation',
+                        'context': line.strip()
+                    })
         
         return danish_terms
     
@@ -437,6 +418,23 @@ class DanishTermValidator:
             recursive: Whether to search subdirectories
             glossary_path: Path to glossary file (if not provided in constructor)
             
+        Returns:
+            Dictionary containing validation results for all files
+        """
+        return self.validate_corpus(DocumentCorpus.load(directory, recursive=recursive), glossary_path=glossary_path)
+    
+    def validate_corpus(self, corpus: DocumentCorpus, glossary_path: Optional[Path] = None, cache: Optional[ValidatorCache] = None,
+                        sink: Optional[Callable[[Dict], None]] = None) -> Dict[str, Any]:
+        """
+        Validate Danish terms in all documents of an already loaded corpus.
+        
+        Args:
+            corpus: Shared document corpus
+            glossary_path: Path to glossary file (if not provided in constructor)
+            cache: Optional cache of per-file results from earlier runs
+            sink: Optional callable receiving each file result as it is produced,
+                instead of collecting them in ``files``
+            
         Returns:
             Dictionary containing validation results for all files
         """
@@ -445,7 +443,7 @@ class DanishTermValidator:
             self.glossary_terms = self._load_glossary(glossary_path)
         
         results = {
-            'directory': str(directory),
+            'directory': str(corpus.directory),
             'glossary_loaded': bool(self.glossary_terms),
             'glossary_terms_count': len(self.glossary_terms),
             'files': [],
@@ -463,30 +461,31 @@ class DanishTermValidator:
             }
         }
         
-        # Find all markdown files
-        pattern = '**/*.md' if recursive else '*.md'
-        markdown_files = list(directory.glob(pattern))
-        
-        for file_path in markdown_files:
-            if file_path.is_file():
-                file_result = self.validate_file(file_path)
+        for document in corpus:
+            if cache is not None:
+                file_result = cache.lookup(document, self.validate_document)
+            else:
+                file_result = self.validate_document(document)
+            if sink is not None:
+                sink(file_result)
+            else:
                 results['files'].append(file_result)
-                
-                results['summary']['total_files'] += 1
-                if file_result['valid']:
-                    results['summary']['valid_files'] += 1
-                else:
-                    results['summary']['invalid_files'] += 1
-                
-                if file_result['danish_terms_found']:
-                    results['summary']['files_with_danish_terms'] += 1
-                    results['summary']['total_danish_terms'] += len(file_result['danish_terms_found'])
-                
-                results['summary']['total_missing_translations'] += len(file_result['missing_translations'])
-                results['summary']['total_inconsistent_translations'] += len(file_result['inconsistent_translations'])
-                results['summary']['total_unknown_terms'] += len(file_result['unknown_terms'])
-                results['summary']['total_errors'] += len(file_result['errors'])
-                results['summary']['total_warnings'] += len(file_result['warnings'])
+            
+            results['summary']['total_files'] += 1
+            if file_result['valid']:
+                results['summary']['valid_files'] += 1
+            else:
+                results['summary']['invalid_files'] += 1
+            
+            if file_result['danish_terms_found']:
+                results['summary']['files_with_danish_terms'] += 1
+                results['summary']['total_danish_terms'] += len(file_result['danish_terms_found'])
+            
+            results['summary']['total_missing_translations'] += len(file_result['missing_translations'])
+            results['summary']['total_inconsistent_translations'] += len(file_result['inconsistent_translations'])
+            results['summary']['total_unknown_terms'] += len(file_result['unknown_terms'])
+            results['summary']['total_errors'] += len(file_result['errors'])
+            results['summary']['total_warnings'] += len(file_result['warnings'])
         
         return results
 
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Incremental Validation Cache for Denmark Living Documentation System
+
+This module persists per-file validator results between runs so that
+unchanged documents are not re-validated:
+- Entries are keyed by file path and content hash
+- Each validator section is invalidated when the validator script, the
+  shared corpus parser or the validator configuration changes
+- Cross-file validators pass an extra dependency context (e.g. the set of
+  files in the corpus) that must also match for a cached result to be used
+- Results are kept as objects, or as JSON text when the caller does not
+  keep them itself (streamed output), so the cache alone does not hold
+  every file's result as Python objects
+
+Requirements: All (Validation infrastructure)
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable, Iterable
+
+from corpus import ParsedDocument
+
+
+CACHE_FORMAT_VERSION = 1
+
+# Parsing modules every validator's results depend on
+SHARED_PARSERS = ('corpus.py', 'frontmatter_loader.py')
+
+
+def hash_text(text: str) -> str:
+    """
+    Hash a string for use as a cache key.
+    
+    Args:
+        text: Text to hash
+        
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def hash_value(value: Any) -> str:
+    """
+    Hash any JSON-serialisable value for use as a cache key.
+    
+    Args:
+        value: Value to hash (dict keys are sorted)
+        
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hash_text(json.dumps(value, sort_keys=True, ensure_ascii=False, default=str))
+
+
+class ValidatorCache:
+    """Cached per-file results of a single validator."""
+    
+    def __init__(self, fingerprint: str, entries: Optional[Dict[str, Any]] = None, keep_results: bool = True):
+        self.fingerprint = fingerprint
+        self.entries = entries or {}
+        # Without kept results, entries hold JSON text decoded on each hit
+        self.keep_results = keep_results
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+    
+    def contains(self, document: ParsedDocument, context: str = '') -> bool:
+        """
+        Check whether a cached result can be used for a document.
+        
+        Args:
+            document: Parsed document to validate
+            context: Hash of cross-file state the result depends on
+            
+        Returns:
+            True if lookup() would return a cached result
+        """
+        if document.content is None:
+            return False
+        entry = self.entries.get(str(document.path))
+        return bool(entry) and entry['hash'] == document.content_hash and entry.get('context', '') == context
+    
+    def lookup(self, document: ParsedDocument, compute: Callable[[ParsedDocument], Dict[str, Any]],
+               context: str = '') -> Dict[str, Any]:
+        """
+        Return the cached result for a document, computing and storing it on a miss.
+        
+        Args:
+            document: Parsed document to validate
+            compute: Validator method producing the file result
+            context: Hash of cross-file state the result depends on
+            
+        Returns:
+            File result dictionary (the ``files[]`` entry of the validator)
+        """
+        if document.content is None:
+            # Unreadable files are cheap to report and must not be cached
+            self.misses += 1
+            return compute(document)
+        
+        key = str(document.path)
+        self.used.add(key)
+        
+        if self.contains(document, context):
+            self.hits += 1
+            entry = self.entries[key]
+            result = entry['result']
+            if isinstance(result, str):
+                result = json.loads(result)
+                if self.keep_results:
+                    entry['result'] = result
+            elif not self.keep_results:
+                entry['result'] = json.dumps(result, ensure_ascii=False)
+            return result
+        
+        self.misses += 1
+        result = compute(document)
+        self.entries[key] = {
+            'hash': document.content_hash,
+            'context': context,
+            'result': result if self.keep_results else json.dumps(result, ensure_ascii=False)
+        }
+        return result
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialise the entries used in this run.
+        
+        Entries for files that were not looked up (deleted or renamed files)
+        are dropped.
+        
+        Returns:
+            Dictionary suitable for JSON storage
+        """
+        return {
+            'fingerprint': self.fingerprint,
+            'entries': {key: entry for key, entry in self.entries.items() if key in self.used}
+        }
+    
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counts for this run."""
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+class ValidationCache:
+    """On-disk cache holding one ValidatorCache section per validator (in memory only without a file)."""
+    
+    def __init__(self, cache_file: Optional[Path]):
+        self.cache_file = cache_file
+        self.sections = {}
+        self._stored = self._load()
+    
+    def _load(self) -> Dict[str, Any]:
+        """
+        Load the cache file if it exists and has the current format.
+        
+        Returns:
+            Stored validator sections, or an empty dict
+        """
+        if self.cache_file is None:
+            return {}
+        
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if data.get('format_version') != CACHE_FORMAT_VERSION:
+            return {}
+        return data.get('validators', {})
+    
+    @staticmethod
+    def fingerprint(script_path: Path, config: Dict[str, Any], script_hash: Optional[str] = None,
+                    dependencies: Iterable[Path] = ()) -> str:
+        """
+        Compute the version fingerprint of a validator.
+        
+        The fingerprint covers the validator script, the shared corpus parsers,
+        the helper modules the validator depends on and the validator
+        configuration, so any change to them invalidates all cached results
+        of that validator.
+        
+        Args:
+            script_path: Path to the validator script
+            config: Validator configuration (constructor arguments, glossary, ...)
+            script_hash: SHA-256 of the script as imported, if already known
+            dependencies: Paths of helper modules used by the validator
+            
+        Returns:
+            Hex digest identifying this validator version
+        """
+        source_hashes = []
+        shared_parsers = [Path(__file__).parent / name for name in SHARED_PARSERS]
+        for path in (script_path, *shared_parsers, *dependencies):
+            if path is script_path and script_hash is not None:
+                source_hashes.append(script_hash)
+                continue
+            try:
+                source_hashes.append(hash_text(path.read_text(encoding='utf-8')))
+            except OSError:
+                source_hashes.append(hash_text(''))
+        return hash_value({'sources': source_hashes, 'config': config})
+    
+    def section(self, validator_name: str, fingerprint: str, keep_results: bool = True) -> ValidatorCache:
+        """
+        Get the cache section for a validator, discarding it if its fingerprint changed.
+        
+        Entries from an earlier run in this process take precedence over the
+        stored ones, so repeated runs (watch mode) stay incremental.
+        
+        Args:
+            validator_name: Name of the validator
+            fingerprint: Current validator fingerprint
+            keep_results: Keep results as objects; False stores them as JSON
+                text, for callers that drop each result once it is written
+            
+        Returns:
+            ValidatorCache for this run
+        """
+        stored = self.sections.get(validator_name)
+        if stored is not None:
+            stored = stored.to_dict()
+        else:
+            stored = self._stored.get(validator_name, {})
+        entries = stored.get('entries') if stored.get('fingerprint') == fingerprint else None
+        section = ValidatorCache(fingerprint, entries, keep_results)
+        self.sections[validator_name] = section
+        return section
+    
+    def update_section(self, validator_name: str, section: ValidatorCache) -> None:
+        """
+        Replace a section with one returned from a worker process.
+        
+        Args:
+            validator_name: Name of the validator
+            section: Updated ValidatorCache
+        """
+        self.sections[validator_name] = section
+    
+    def save(self) -> None:
+        """Write all sections used in this run back to disk, atomically."""
+        if self.cache_file is None:
+            return
+        
+        validators = dict(self._stored)
+        for validator_name, section in self.sections.items():
+            validators[validator_name] = section.to_dict()
+        
+        data = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'validators': validators
+        }
+        
+        temp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_file, self.cache_file)
+
+
+__all__ = [
+    'ValidationCache',
+    'ValidatorCache',
+    'hash_text',
+    'hash_value'
+]
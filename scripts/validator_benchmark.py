@@ -0,0 +1,649 @@
+#!/usr/bin/env python3
+"""
+Validator Benchmark for Denmark Living Documentation System
+
+This script measures how the validators scale with the size of the
+documentation, using synthetic corpora instead of the real documents:
+- Corpora of any number of files are generated from the structure of
+  metadata/document-template.md, with frontmatter, H2/H3 sections, numbered
+  steps, relative links and anchors, Danish terms, acronyms and EU/Non-EU
+  sections, spread over the category directories and several languages
+- Generation is deterministic for a seed, so runs are comparable
+- Each validator's directory method (validate_directory, analyze_directory,
+  count_directory_tokens) is timed over repeated samples, including loading
+  and parsing the files, and reported as files per second of the median
+- Each sample repeats the method until it has run for at least half a
+  second, so short runs are not dominated by timer and scheduler noise
+- Peak memory of one extra run is traced with tracemalloc
+
+Results are written as JSON. With a baseline from an earlier run, the
+script exits with status 1 when any validator is slower, or uses more
+memory, than the baseline allows. Slowdowns smaller than a noise floor in
+milliseconds per run are not counted.
+
+Usage:
+    python scripts/validator_benchmark.py --files 100 1000 -o validator-benchmark.json
+    python scripts/validator_benchmark.py --baseline validator-benchmark.json
+
+Requirements: All (Validation infrastructure)
+"""
+
+import sys
+import json
+import random
+import time
+import argparse
+import tempfile
+import statistics
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from profiling import ValidatorProfiler
+from validator_registry import ValidatorRegistry
+
+
+DEFAULT_SIZES = (100, 1000)
+DEFAULT_REPEATS = 5
+DEFAULT_SEED = 0
+DEFAULT_TOLERANCE = 0.2
+
+# Minimum measured time of one sample in seconds
+MIN_SAMPLE_TIME = 0.5
+
+# Slowdowns of fewer milliseconds per run than this are never regressions
+DEFAULT_NOISE_FLOOR_MS = 5.0
+
+# Languages of the generated documents; English documents are ``slug.md``
+# and their translations ``slug.<language>.md``
+DEFAULT_LANGUAGES = ('en', 'da', 'de', 'pl', 'ro', 'uk', 'ar')
+
+# Category directories and names, as in validate_structure.py
+CATEGORIES = {
+    'before-moving': 'Before Moving',
+    'arrival-process': 'Arrival Process',
+    'essential-services': 'Essential Services',
+    'social-benefits': 'Social Benefits',
+    'employment': 'Employment',
+    'tax-finance': 'Tax Finance',
+    'housing': 'Housing',
+    'practical-living': 'Practical Living'
+}
+
+TOPICS = [
+    'CPR Registration', 'MitID Setup', 'Bank Account', 'Health Insurance', 'Residence Permit',
+    'Work Permit', 'Housing Benefit', 'Unemployment Insurance', 'Tax Card', 'Rental Contract',
+    'Child Benefits', 'Pension System', 'Parental Leave', 'Student Support', 'Driving Licence',
+    'Public Transport', 'Waste Sorting', 'Home Insurance', 'Job Centre', 'Annual Tax Statement'
+]
+
+# Danish terms with their English translations
+DANISH_TERMS = [
+    ('CPR-nummer', 'civil registration number'),
+    ('boligstøtte', 'housing benefit'),
+    ('dagpenge', 'unemployment benefits'),
+    ('børnepenge', 'child benefits'),
+    ('kontanthjælp', 'social assistance'),
+    ('årsopgørelse', 'annual tax statement'),
+    ('lejekontrakt', 'rental contract'),
+    ('depositum', 'deposit'),
+    ('indboforsikring', 'contents insurance'),
+    ('andelsbolig', 'cooperative housing')
+]
+
+# Acronyms with their definitions
+ACRONYMS = [
+    ('CPR', 'Central Person Register'),
+    ('EU', 'European Union'),
+    ('EEA', 'European Economic Area'),
+    ('GP', 'General Practitioner'),
+    ('ICS', 'International Citizen Service'),
+    ('SU', 'State Educational Grant'),
+    ('VAT', 'Value Added Tax')
+]
+
+AUDIENCES = ['EU Citizens', 'Non-EU Citizens', 'All Residents']
+
+# Corpus methods and the directory methods that load the corpus themselves
+DIRECTORY_METHODS = {
+    'validate_corpus': 'validate_directory',
+    'analyze_corpus': 'analyze_directory',
+    'count_corpus_tokens': 'count_directory_tokens'
+}
+
+# Validators without a directory method of the usual name
+DIRECTORY_METHOD_OVERRIDES = {
+    'structure': 'validate_structure'
+}
+
+
+def document_path(topic: Dict[str, Any], language: str) -> str:
+    """Path of a topic's document in a language, relative to the corpus root."""
+    suffix = '' if language == 'en' else f".{language}"
+    return f"{topic['category']}/{topic['slug']}{suffix}.md"
+
+
+def plan_topics(files: int, languages: Iterable[str], seed: int = DEFAULT_SEED) -> List[Dict[str, Any]]:
+    """
+    Choose the topics of a corpus.
+    
+    Args:
+        files: Number of documents to generate
+        languages: Language codes; every topic gets one document per language
+        seed: Random seed
+        
+    Returns:
+        Topics with title, slug, category and the languages they are written in
+    """
+    languages = list(languages)
+    rng = random.Random(seed)
+    categories = list(CATEGORIES)
+    topics = []
+    
+    for number in range(-(-files // len(languages))):
+        title = f"{TOPICS[number % len(TOPICS)]} {number // len(TOPICS) + 1}"
+        topics.append({
+            'title': title,
+            'slug': title.lower().replace(' ', '-'),
+            'category': rng.choice(categories),
+            'languages': languages[:min(len(languages), files - number * len(languages))]
+        })
+    return topics
+
+
+def generate_document(topic: Dict[str, Any], language: str, topics: List[Dict[str, Any]],
+                      rng: random.Random) -> str:
+    """
+    Write one document following the document template.
+    
+    Args:
+        topic: Topic from ``plan_topics``
+        language: Language code of the document
+        topics: All topics, for links to related documents
+        rng: Random generator
+        
+    Returns:
+        Markdown content
+    """
+    title = topic['title']
+    terms = rng.sample(DANISH_TERMS, 3)
+    acronyms = rng.sample(ACRONYMS, 2)
+    related = [other for other in rng.sample(topics, min(3, len(topics))) if other is not topic]
+    audience = rng.sample(AUDIENCES, rng.randint(1, 2))
+    date = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    
+    lines = [
+        f"# {title}",
+        "",
+        "---",
+        f'title: "{title}"',
+        f'category: "{CATEGORIES[topic["category"]]}"',
+        f"audience: {json.dumps(audience)}",
+        f"keywords: {json.dumps([title.lower(), terms[0][0], acronyms[0][0]], ensure_ascii=False)}",
+        f'last_updated: "{date}"',
+        f'source_url: "https://www.borger.dk/{topic["slug"]}"',
+        f'language: "{language}"',
+        'translated_from: "da"',
+        "---",
+        "",
+        f"> **Last Updated**: {date}  ",
+        f"> **Official Source**: [borger.dk](https://www.borger.dk/{topic['slug']})  ",
+        f"> **Applies to**: {' / '.join(audience)}",
+        "",
+        "## Overview",
+        "",
+        f"This guide explains {title.lower()} in Denmark and who needs it. It covers the "
+        f"**{terms[0][0]}** ({terms[0][1]}) and how the {acronyms[0][1]} ({acronyms[0][0]}) "
+        f"rules apply to new residents.",
+        "",
+        "## Key Information",
+        "",
+        "- **Who needs this**: Everyone moving to Denmark for more than three months",
+        f"- **When to do this**: Within {rng.randint(1, 12)} weeks of arrival",
+        f"- **Prerequisites**: You must have a {terms[1][0]} before you apply",
+        f"- **Processing time**: {rng.randint(1, 4)}-{rng.randint(5, 8)} weeks",
+        f"- **Cost**: {rng.choice(['Free', f'{rng.randint(1, 20) * 50} DKK'])}",
+        "",
+        f"## Applying for {title}",
+        "",
+        f"Apply online with MitID or at Borgerservice. The **{terms[1][0]}** ({terms[1][1]}) "
+        f"is handled by the municipality, and {acronyms[0][0]} numbers are checked automatically.",
+        "",
+        "### Required Documents",
+        "",
+        "- Valid passport or national ID card",
+        f"- Your **{terms[2][0]}** ({terms[2][1]}), if you have one",
+        "- Proof of address in Denmark",
+        "",
+        "### Steps",
+        ""
+    ]
+    for step in range(1, rng.randint(3, 7) + 1):
+        lines.append(f"{step}. Complete step {step} of the {title.lower()} application and keep the receipt")
+    lines += [
+        "",
+        "### Where to Apply",
+        "",
+        f"- **Online**: [borger.dk](https://www.borger.dk/{topic['slug']}/apply)",
+        "- **In Person**: Borgerservice in your municipality",
+        "",
+        "### What Happens Next",
+        "",
+        f"You receive a confirmation in e-Boks within {rng.randint(2, 10)} working days. "
+        f"Contact the {acronyms[1][1]} ({acronyms[1][0]}) if it does not arrive.",
+        "",
+        "## Eligibility",
+        "",
+        "### For EU Citizens",
+        "",
+        "EU/EEA citizens register under EU law and do not need a residence permit for the first three months.",
+        "",
+        "### For Non-EU Citizens",
+        "",
+        "Non-EU citizens need a valid residence permit before they can apply.",
+        "",
+        "## Common Questions",
+        ""
+    ]
+    for question in range(1, rng.randint(2, 4) + 1):
+        lines += [
+            f"### Question {question}: How long does it take?",
+            "",
+            f"Most applications are processed within {rng.randint(1, 6)} weeks. "
+            f"See [Key Information](#key-information) for details.",
+            ""
+        ]
+    lines += [
+        "## Related Topics",
+        ""
+    ]
+    for other in related:
+        other_language = language if language in other['languages'] else 'en'
+        link = f"../{document_path(other, other_language)}"
+        lines.append(f"- [{other['title']}]({link}) - Related guide")
+        lines.append(f"- [{other['title']} overview]({link}#overview) - Summary")
+    lines += [
+        "",
+        "## Official Resources",
+        "",
+        f"- [borger.dk](https://www.borger.dk/{topic['slug']}) - Official information",
+        "",
+        "---",
+        "",
+        "*Content sourced from [borger.dk](https://www.borger.dk) and translated to English.*",
+        ""
+    ]
+    return '\n'.join(lines)
+
+
+def generate_glossary() -> str:
+    """Glossary in the format of metadata/glossary.md for the generated Danish terms."""
+    lines = ["# Glossary of Danish Terms", "", "## Terms", ""]
+    for term, english in sorted(DANISH_TERMS, key=lambda pair: pair[0].lower()):
+        lines += [
+            f"### {term[0].upper()}{term[1:]}",
+            f"**English**: {english[0].upper()}{english[1:]}  ",
+            f"**Definition**: {english[0].upper()}{english[1:]} in Denmark.",
+            ""
+        ]
+    return '\n'.join(lines)
+
+
+def generate_corpus(directory: Path, files: int, seed: int = DEFAULT_SEED,
+                    languages: Iterable[str] = DEFAULT_LANGUAGES) -> List[Path]:
+    """
+    Generate a synthetic documentation tree.
+    
+    Args:
+        directory: Directory to write to (created if missing)
+        files: Number of documents, not counting the index and glossary
+        seed: Random seed; the same seed gives the same files
+        languages: Language codes the documents are spread over
+        
+    Returns:
+        Paths of the generated documents
+    """
+    topics = plan_topics(files, languages, seed)
+    rng = random.Random(seed)
+    paths = []
+    
+    for category in CATEGORIES:
+        (directory / category).mkdir(parents=True, exist_ok=True)
+    (directory / 'metadata').mkdir(parents=True, exist_ok=True)
+    (directory / 'metadata' / 'glossary.md').write_text(generate_glossary(), encoding='utf-8')
+    
+    index = ["# Living in Denmark", "", "## Guides", ""]
+    for topic in topics:
+        for language in topic['languages']:
+            path = directory / document_path(topic, language)
+            path.write_text(generate_document(topic, language, topics, rng), encoding='utf-8')
+            paths.append(path)
+        index.append(f"- [{topic['title']}]({document_path(topic, 'en')})")
+    (directory / 'index.md').write_text('\n'.join(index) + '\n', encoding='utf-8')
+    
+    return paths
+
+
+def directory_method(registry: ValidatorRegistry, validator_name: str) -> str:
+    """Name of the method validating a whole directory for a validator."""
+    if validator_name in DIRECTORY_METHOD_OVERRIDES:
+        return DIRECTORY_METHOD_OVERRIDES[validator_name]
+    return DIRECTORY_METHODS[registry.validators[validator_name]['method']]
+
+
+def run_validator(registry: ValidatorRegistry, validator_name: str, directory: Path) -> Dict[str, Any]:
+    """
+    Run one validator over a directory with the arguments run_validation.py uses.
+    
+    Args:
+        registry: Validator registry
+        validator_name: Name of the validator
+        directory: Documentation directory
+        
+    Returns:
+        Validation results
+    """
+    validator_class = registry.load(validator_name)
+    config = registry.validators[validator_name]
+    glossary_path = directory / 'metadata' / 'glossary.md'
+    
+    validator_args = {}
+    if config['class'] == 'TokenCounter':
+        validator_args['token_limit'] = 1000
+    elif config['class'] == 'LinkValidator':
+        validator_args['base_directory'] = directory
+    elif config['class'] == 'ExternalLinkValidator':
+        validator_args['cache_file'] = None
+    validator = validator_class(**validator_args)
+    
+    method = getattr(validator, directory_method(registry, validator_name))
+    if config['class'] in ('DanishTermValidator', 'TerminologyConsistencyChecker'):
+        return method(directory, glossary_path=glossary_path)
+    return method(directory)
+
+
+def time_sample(registry: ValidatorRegistry, validator_name: str, directory: Path,
+                min_sample_time: float) -> Tuple[float, int]:
+    """
+    Time consecutive runs of a validator until they last ``min_sample_time``.
+    
+    Args:
+        registry: Validator registry
+        validator_name: Name of the validator
+        directory: Documentation directory
+        min_sample_time: Minimum time of the sample in seconds
+        
+    Returns:
+        Time per run in seconds and the number of runs
+    """
+    loops = 0
+    start_time = time.perf_counter()
+    while True:
+        run_validator(registry, validator_name, directory)
+        loops += 1
+        elapsed = time.perf_counter() - start_time
+        if elapsed >= min_sample_time:
+            return elapsed / loops, loops
+
+
+def benchmark_validator(registry: ValidatorRegistry, validator_name: str, directory: Path, files: int,
+                        repeats: int = DEFAULT_REPEATS,
+                        min_sample_time: float = MIN_SAMPLE_TIME) -> Dict[str, Any]:
+    """
+    Time a validator over a directory.
+    
+    A first, discarded run warms up caches. Each sample then repeats the
+    validator until it has run for at least ``min_sample_time`` and yields
+    the time per run. Timed runs are not traced, so tracemalloc does not
+    slow them down; peak memory is taken from one more run.
+    
+    Args:
+        registry: Validator registry
+        validator_name: Name of the validator
+        directory: Documentation directory
+        files: Number of documents in the directory
+        repeats: Number of timed samples
+        min_sample_time: Minimum time of one sample in seconds
+        
+    Returns:
+        Median, best and mean time per run, the fewest runs in a sample,
+        files per second of the median and peak memory
+    """
+    run_validator(registry, validator_name, directory)
+    samples = [
+        time_sample(registry, validator_name, directory, min_sample_time)
+        for _ in range(max(repeats, 1))
+    ]
+    times = [sample_time for sample_time, _ in samples]
+    
+    profiler = ValidatorProfiler(trace_memory=True)
+    profiler.start()
+    try:
+        run_validator(registry, validator_name, directory)
+    finally:
+        profiler.stop()
+    
+    median = statistics.median(times)
+    return {
+        'method': directory_method(registry, validator_name),
+        'median_time': round(median, 6),
+        'best_time': round(min(times), 6),
+        'mean_time': round(statistics.mean(times), 6),
+        'loops': min(loops for _, loops in samples),
+        'ops_per_sec': round(files / median, 2) if median > 0 else None,
+        'peak_memory': profiler.peak_memory
+    }
+
+
+def run_benchmark(sizes: Iterable[int] = DEFAULT_SIZES, validators: Optional[List[str]] = None,
+                  repeats: int = DEFAULT_REPEATS, seed: int = DEFAULT_SEED,
+                  languages: Iterable[str] = DEFAULT_LANGUAGES, corpus_root: Optional[Path] = None,
+                  scripts_directory: Optional[Path] = None,
+                  min_sample_time: float = MIN_SAMPLE_TIME) -> Dict[str, Any]:
+    """
+    Benchmark validators over generated corpora of several sizes.
+    
+    Args:
+        sizes: Numbers of documents per corpus
+        validators: Validators to run (default: the registry's default validators)
+        repeats: Timed samples per validator and size
+        seed: Random seed for corpus generation
+        languages: Language codes the documents are spread over
+        corpus_root: Directory to keep the generated corpora in (default: a
+            temporary directory removed afterwards)
+        scripts_directory: Directory containing the validator scripts
+        min_sample_time: Minimum time of one sample in seconds
+        
+    Returns:
+        Benchmark results with one entry per corpus size
+    """
+    registry = ValidatorRegistry(scripts_directory or Path(__file__).parent)
+    validators = validators or registry.default_validators()
+    languages = list(languages)
+    
+    results = {
+        'timestamp': datetime.now().isoformat(),
+        'seed': seed,
+        'languages': languages,
+        'repeats': repeats,
+        'min_sample_time': min_sample_time,
+        'python': sys.version.split()[0],
+        'runs': []
+    }
+    
+    with tempfile.TemporaryDirectory() as temporary:
+        root = corpus_root or Path(temporary)
+        for files in sizes:
+            directory = root / f"corpus-{files}"
+            generate_corpus(directory, files, seed, languages)
+            print(f"Corpus of {files} files: {directory}")
+            
+            run = {'files': files, 'validators': {}}
+            for validator_name in validators:
+                run['validators'][validator_name] = benchmark_validator(
+                    registry, validator_name, directory, files, repeats, min_sample_time
+                )
+            results['runs'].append(run)
+    
+    return results
+
+
+def run_time(stats: Dict[str, Any], files: int) -> float:
+    """Median time per run in seconds, derived from files per second for older results."""
+    if 'median_time' in stats:
+        return stats['median_time']
+    return files / stats['ops_per_sec']
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    tolerance: float = DEFAULT_TOLERANCE,
+                    noise_floor_ms: float = DEFAULT_NOISE_FLOOR_MS) -> Dict[str, Any]:
+    """
+    Compare a run with a baseline.
+    
+    A validator regresses when its files per second drop, or its peak
+    memory grows, by more than the tolerance. A drop in speed only counts
+    when the median run also takes more than ``noise_floor_ms`` longer, so
+    fast validators do not fail on timer noise. Only corpus sizes and
+    validators present in both runs are compared.
+    
+    Args:
+        current: Results of this run
+        baseline: Results loaded from an earlier run
+        tolerance: Allowed relative change, e.g. 0.2 for 20%
+        noise_floor_ms: Smallest slowdown per run, in milliseconds, that
+            can count as a regression
+        
+    Returns:
+        Per-validator ratios and the list of regressions
+    """
+    baseline_runs = {run['files']: run for run in baseline.get('runs', [])}
+    changes = []
+    regressions = []
+    
+    for run in current['runs']:
+        baseline_run = baseline_runs.get(run['files'])
+        if baseline_run is None:
+            continue
+        for validator_name, stats in run['validators'].items():
+            before = baseline_run['validators'].get(validator_name)
+            if before is None:
+                continue
+            
+            change = {'files': run['files'], 'validator': validator_name, 'regressed': []}
+            if stats['ops_per_sec'] and before.get('ops_per_sec'):
+                change['speed_ratio'] = round(stats['ops_per_sec'] / before['ops_per_sec'], 4)
+                change['slowdown_ms'] = round((run_time(stats, run['files'])
+                                               - run_time(before, run['files'])) * 1000, 3)
+                if change['speed_ratio'] < 1 - tolerance and change['slowdown_ms'] > noise_floor_ms:
+                    change['regressed'].append('ops_per_sec')
+            if stats.get('peak_memory') and before.get('peak_memory'):
+                change['memory_ratio'] = round(stats['peak_memory'] / before['peak_memory'], 4)
+                if change['memory_ratio'] > 1 + tolerance:
+                    change['regressed'].append('peak_memory')
+            
+            changes.append(change)
+            if change['regressed']:
+                regressions.append(change)
+    
+    return {
+        'baseline_timestamp': baseline.get('timestamp'),
+        'tolerance': tolerance,
+        'noise_floor_ms': noise_floor_ms,
+        'changes': changes,
+        'regressions': regressions
+    }
+
+
+def print_results(results: Dict[str, Any]):
+    """
+    Print benchmark results in a readable format.
+    
+    Args:
+        results: Results from ``run_benchmark``, optionally with a ``comparison``
+    """
+    print(f"\n{'='*80}")
+    print("VALIDATOR BENCHMARK")
+    print(f"{'='*80}")
+    print(f"Languages: {', '.join(results['languages'])}; {results['repeats']} samples per validator, "
+          f"each at least {results['min_sample_time']}s")
+    
+    for run in results['runs']:
+        print(f"\n{run['files']} FILES:")
+        print(f"  {'validator':<14} {'median':>10} {'runs':>6} {'files/sec':>12} {'peak memory':>14}")
+        for validator_name, stats in run['validators'].items():
+            memory = f"{stats['peak_memory'] / 1024 / 1024:.1f} MiB" if stats['peak_memory'] is not None else '-'
+            print(f"  {validator_name:<14} {stats['median_time']:>9.3f}s {stats['loops']:>6} "
+                  f"{stats['ops_per_sec'] or 0:>12.1f} {memory:>14}")
+    
+    comparison = results.get('comparison')
+    if comparison:
+        print(f"\nCOMPARED WITH {comparison['baseline_timestamp']} (tolerance {comparison['tolerance']:.0%}, "
+              f"noise floor {comparison['noise_floor_ms']}ms):")
+        for change in comparison['changes']:
+            marker = '✗' if change['regressed'] else '✓'
+            print(f"  {marker} {change['validator']:<14} {change['files']:>6} files: "
+                  f"speed x{change.get('speed_ratio', 1.0):.2f}, memory x{change.get('memory_ratio', 1.0):.2f}")
+        if comparison['regressions']:
+            print(f"\n{len(comparison['regressions'])} validator run(s) regressed past the baseline")
+
+
+def main():
+    """Main function to run the validator benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark validators over synthetic documentation corpora')
+    parser.add_argument('--files', '-n', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help=f'Corpus sizes in files (default: {" ".join(map(str, DEFAULT_SIZES))})')
+    parser.add_argument('--validators', nargs='+', help='Validators to benchmark (default: all default validators)')
+    parser.add_argument('--repeats', '-r', type=int, default=DEFAULT_REPEATS,
+                        help=f'Timed samples per validator (default: {DEFAULT_REPEATS})')
+    parser.add_argument('--min-time', type=float, default=MIN_SAMPLE_TIME,
+                        help=f'Minimum seconds per sample, repeating runs to reach it (default: {MIN_SAMPLE_TIME})')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f'Random seed (default: {DEFAULT_SEED})')
+    parser.add_argument('--languages', nargs='+', default=list(DEFAULT_LANGUAGES),
+                        help=f'Document languages (default: {" ".join(DEFAULT_LANGUAGES)})')
+    parser.add_argument('--keep-corpus', help='Generate the corpora in this directory and keep them')
+    parser.add_argument('--output', '-o', help='Write results to a JSON file')
+    parser.add_argument('--baseline', help='Fail if a validator regresses past results from an earlier run')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Allowed slowdown or memory growth against the baseline (default: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--noise-floor', type=float, default=DEFAULT_NOISE_FLOOR_MS,
+                        help=f'Ignore slowdowns below this many milliseconds per run (default: {DEFAULT_NOISE_FLOOR_MS})')
+    
+    args = parser.parse_args()
+    
+    registry = ValidatorRegistry(Path(__file__).parent)
+    unknown = [name for name in args.validators or () if name not in registry.validators]
+    if unknown:
+        print(f"Error: Unknown validator(s): {', '.join(unknown)}")
+        sys.exit(1)
+    
+    results = run_benchmark(
+        sizes=args.files,
+        validators=args.validators,
+        repeats=args.repeats,
+        seed=args.seed,
+        languages=args.languages,
+        corpus_root=Path(args.keep_corpus) if args.keep_corpus else None,
+        min_sample_time=args.min_time
+    )
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            results['comparison'] = compare_results(results, json.load(f), args.tolerance,
+                                                    args.noise_floor)
+    
+    print_results(results)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\nResults written to: {args.output}")
+    
+    if results.get('comparison', {}).get('regressions'):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Validator Registry for Denmark Living Documentation System
+
+This module declares every validator the validation runner knows about and
+loads their classes on demand:
+- Validator specifications (script, class, corpus method, caching, timed
+  methods) live in one registry dictionary
+- A validator's module is imported only when that validator is first used,
+  so running a subset of validators imports only those scripts
+- Each module is imported once per process, registered in ``sys.modules``
+  under its script name, and its import time is recorded separately from
+  validation time
+
+Requirements: All (Validation infrastructure)
+"""
+
+import sys
+import time
+import hashlib
+import importlib.util
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Type
+
+
+# Validator specifications, in the order validators run by default.
+# 'file_method' validates one ParsedDocument and 'phases' are the check methods
+# it calls; both are timed per run (see profiling.py). 'dependencies' are the
+# helper modules a validator imports, included in its cache fingerprint.
+# 'cacheable' validators take a per-file results cache and a per-file sink.
+# Validators with 'default': False only run when selected explicitly.
+VALIDATORS = {
+    'markdown': {
+        'script': 'validate_markdown.py',
+        'description': 'Markdown format and structure validation',
+        'class': 'MarkdownValidator',
+        'method': 'validate_corpus',
+        'cacheable': True,
+        'file_method': 'validate_document',
+        'phases': [
+            '_parse_structure',
+            '_validate_syntax',
+            '_validate_heading_hierarchy',
+            '_check_best_practices'
+        ]
+    },
+    'metadata': {
+        'script': 'validate_metadata.py',
+        'description': 'Frontmatter metadata validation',
+        'class': 'MetadataValidator',
+        'method': 'validate_corpus',
+        'cacheable': True,
+        'file_method': 'validate_document',
+        'phases': [
+            '_validate_required_fields',
+            '_validate_field_types',
+            '_validate_field_values',
+            '_check_optional_fields'
+        ]
+    },
+    'tokens': {
+        'script': 'count_tokens.py',
+        'description': 'Token count validation for RAG optimization',
+        'class': 'TokenCounter',
+        'method': 'count_corpus_tokens',
+        'cacheable': True,
+        'dependencies': ['tokenizer.py'],
+        'file_method': 'count_document_tokens',
+        'phases': [
+            '_count_sections'
+        ]
+    },
+    'links': {
+        'script': 'validate_links.py',
+        'description': 'Cross-reference link validation',
+        'class': 'LinkValidator',
+        'method': 'validate_corpus',
+        'cacheable': True,
+        'dependencies': ['anchor_index.py'],
+        'file_method': 'validate_document',
+        'phases': [
+            '_extract_links',
+            '_validate_relative_link',
+            '_validate_anchor_link'
+        ]
+    },
+    'structure': {
+        'script': 'validate_structure.py',
+        'description': 'Directory structure validation',
+        'class': 'StructureValidator',
+        'method': 'validate_corpus',
+        # Only reads the list of files, not their content
+        'inputs': 'paths'
+    },
+    'procedures': {
+        'script': 'validate_procedures.py',
+        'description': 'Procedural guide completeness validation',
+        'class': 'ProceduralGuideValidator',
+        'method': 'validate_corpus',
+        'cacheable': True,
+        'file_method': 'validate_document',
+        'phases': [
+            '_is_procedural_guide',
+            '_parse_structure',
+            '_validate_required_sections',
+            '_validate_step_format',
+            '_check_best_practices'
+        ]
+    },
+    'translations': {
+        'script': 'validate_translations.py',
+        'description': 'Danish term translation validation',
+        'class': 'DanishTermValidator',
+        'method': 'validate_corpus',
+        'cacheable': True,
+        'dependencies': ['glossary_matcher.py', 'glossary_index.py'],
+        'file_method': 'validate_document',
+        'phases': [
+            '_find_danish_terms',
+            '_validate_translations',
+            '_check_glossary_consistency'
+        ]
+    },
+    'acronyms': {
+        'script': 'validate_acronyms.py',
+        'description': 'Acronym definition validation',
+        'class': 'AcronymValidator',
+        'method': 'validate_corpus',
+        'cacheable': True,
+        'file_method': 'validate_document',
+        'phases': [
+            '_find_acronyms',
+            '_check_definitions',
+            '_check_consistency',
+            '_check_best_practices'
+        ]
+    },
+    'terminology': {
+        'script': 'check_terminology.py',
+        'description': 'Terminology consistency validation',
+        'class': 'TerminologyConsistencyChecker',
+        'method': 'analyze_corpus',
+        'cacheable': True,
+        'dependencies': ['glossary_matcher.py', 'glossary_index.py'],
+        'file_method': 'analyze_document',
+        'phases': [
+            '_extract_terms',
+            '_check_file_consistency',
+            '_check_glossary_consistency'
+        ]
+    },
+    'citizenship': {
+        'script': 'validate_citizenship.py',
+        'description': 'EU/Non-EU citizenship distinction validation',
+        'class': 'CitizenshipDistinctionValidator',
+        'method': 'validate_corpus',
+        'cacheable': True,
+        'file_method': 'validate_document',
+        'phases': [
+            '_has_citizenship_content',
+            '_find_citizenship_references',
+            '_validate_distinctions',
+            '_check_best_practices'
+        ]
+    },
+    'external_links': {
+        'script': 'check_external_links.py',
+        'description': 'External link and source URL verification',
+        'class': 'ExternalLinkValidator',
+        'method': 'validate_corpus',
+        # Needs network access or a recorded-response fixture
+        'default': False
+    }
+}
+
+
+class ValidatorRegistry:
+    """Lazily imports validator classes from a scripts directory."""
+    
+    def __init__(self, scripts_directory: Path, validators: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.scripts_directory = scripts_directory
+        self.validators = dict(validators if validators is not None else VALIDATORS)
+        self.import_times = {}
+        self.script_hashes = {}
+        self._classes = {}
+    
+    def script_path(self, validator_name: str) -> Path:
+        """Path of the script defining a validator."""
+        return self.scripts_directory / self.validators[validator_name]['script']
+    
+    def default_validators(self) -> List[str]:
+        """Names of the validators that run when none are selected."""
+        return [name for name, config in self.validators.items() if config.get('default', True)]
+    
+    def dependency_paths(self, validator_name: str) -> List[Path]:
+        """Paths of the helper modules a validator depends on."""
+        return [self.scripts_directory / name for name in self.validators[validator_name].get('dependencies', ())]
+    
+    def load(self, validator_name: str) -> Type:
+        """
+        Get a validator class, importing its module on first use.
+        
+        Args:
+            validator_name: Name of the validator
+            
+        Returns:
+            The validator class
+            
+        Raises:
+            FileNotFoundError: If the validator script does not exist
+        """
+        if validator_name in self._classes:
+            return self._classes[validator_name]
+        
+        script_path = self.script_path(validator_name)
+        if not script_path.exists():
+            raise FileNotFoundError(f"Validator script not found: {script_path}")
+        
+        # Hash of the code actually loaded, for cache fingerprints
+        self.script_hashes[validator_name] = hashlib.sha256(script_path.read_text(encoding='utf-8').encode('utf-8')).hexdigest()
+        
+        start_time = time.perf_counter()
+        module = import_script(script_path)
+        self.import_times[validator_name] = time.perf_counter() - start_time
+        
+        self._classes[validator_name] = getattr(module, self.validators[validator_name]['class'])
+        return self._classes[validator_name]
+    
+    def pop_import_time(self, validator_name: str) -> float:
+        """
+        Return and reset the time spent importing a validator's module.
+        
+        Args:
+            validator_name: Name of the validator
+            
+        Returns:
+            Seconds spent in import since the last call (0 if already imported)
+        """
+        return self.import_times.pop(validator_name, 0.0)
+
+
+def import_script(script_path: Path):
+    """
+    Import a script as a module once per process.
+    
+    The module is registered under the script's name, so validators that are
+    also imported directly (``import validate_links``) share one module. A
+    different script with the same name gets a name qualified by its path.
+    
+    Args:
+        script_path: Path to the Python script
+        
+    Returns:
+        The imported module
+    """
+    resolved_path = script_path.resolve()
+    module_name = script_path.stem
+    
+    module = sys.modules.get(module_name)
+    if module is not None:
+        module_file = getattr(module, '__file__', None)
+        if module_file and Path(module_file).resolve() == resolved_path:
+            return module
+        path_digest = hashlib.sha256(str(resolved_path).encode('utf-8')).hexdigest()[:12]
+        module_name = f"{module_name}_{path_digest}"
+        if module_name in sys.modules:
+            return sys.modules[module_name]
+    
+    spec = importlib.util.spec_from_file_location(module_name, resolved_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+__all__ = [
+    'VALIDATORS',
+    'ValidatorRegistry',
+    'import_script'
+]
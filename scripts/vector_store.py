@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+Local Vector Store for Denmark Living Documentation System
+
+This script keeps the chunk embeddings in a local store that answers like
+the Supabase ``match_documents`` function, so ``match_threshold`` and
+``match_count`` can be tuned offline:
+- Unit-length float32 embeddings in a memory-mapped matrix (``vectors.f32``)
+  with the chunk content and metadata in ``records.json``
+- Exact cosine top-k over the whole matrix, vectorized with numpy
+- An optional IVF index: spherical k-means partitions the vectors and a
+  query only scores the partitions nearest to it (``nprobe``)
+- Results in the shape ``searchDocuments`` returns:
+  ``{id, content, metadata, similarity}``, best first, above the threshold
+
+numpy is optional; without it the same searches run in plain Python over
+the memory-mapped rows, which is fine for the docs corpus.
+
+Usage:
+    python scripts/vector_store.py build docs/denmark-living --ivf
+    python scripts/vector_store.py search docs/denmark-living "tenant deposit" --match-threshold 0.3
+
+Requirements: 1.4
+"""
+
+import os
+import sys
+import json
+import math
+import mmap
+import heapq
+import random
+import argparse
+from array import array
+from operator import mul
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import DocumentCorpus
+from chunk_manifest import ChunkManifest, chunk_text
+from embedding_cache import (
+    EmbeddingProvider, EmbeddingCache, PROVIDERS, DEFAULT_CACHE_DIRECTORY, embed_chunks, batches
+)
+
+
+# Store directory, relative to the working directory
+DEFAULT_STORE_DIRECTORY = Path('.vector_store')
+STORE_FORMAT_VERSION = 1
+VECTORS_FILE = 'vectors.f32'
+RECORDS_FILE = 'records.json'
+IVF_FILE = 'ivf.json'
+
+# Defaults of match_documents (supabase/migrations/003_create_documents_table.sql)
+DEFAULT_MATCH_THRESHOLD = 0.7
+DEFAULT_MATCH_COUNT = 5
+
+DEFAULT_NPROBE = 4
+KMEANS_ITERATIONS = 10
+
+
+def normalize(vector: Iterable[float]) -> List[float]:
+    """
+    Scale a vector to unit length.
+    
+    Args:
+        vector: Vector components
+        
+    Returns:
+        Unit vector (the zero vector stays zero)
+    """
+    vector = list(vector)
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector] if norm else vector
+
+
+def chunk_metadata(chunk: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Metadata stored with a chunk, with the fields index-documentation.ts uses.
+    
+    Args:
+        chunk: Chunk from the chunk manifest
+        
+    Returns:
+        Dictionary with source, category, title, section and location
+    """
+    return {
+        'source': chunk['source'],
+        'category': chunk['category'],
+        'title': chunk['title'],
+        'section': chunk['heading_path'][-1],
+        'start_line': chunk['start_line'],
+        'end_line': chunk['end_line']
+    }
+
+
+class VectorStore:
+    """Normalized chunk embeddings with exact and IVF cosine search."""
+    
+    def __init__(self, records: List[Dict[str, Any]], vectors, dimension: int, provider_key: str,
+                 ivf: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            records: ``{'id', 'content', 'metadata'}`` per row
+            vectors: ``len(records) x dimension`` numpy matrix, or a flat
+                float32 memoryview when numpy is not installed
+            dimension: Vector dimension
+            provider_key: Embedding provider the vectors came from
+            ivf: IVF index from ``build_ivf``, if any
+        """
+        self.records = records
+        self.vectors = vectors
+        self.dimension = dimension
+        self.provider_key = provider_key
+        self.ivf = ivf
+        self._map = None
+        self._rows = None
+    
+    @classmethod
+    def from_vectors(cls, records: List[Dict[str, Any]], vectors: Iterable[Iterable[float]],
+                     dimension: int, provider_key: str) -> 'VectorStore':
+        """
+        Build an in-memory store, normalizing the vectors.
+        
+        Args:
+            records: ``{'id', 'content', 'metadata'}`` per vector
+            vectors: One vector per record
+            dimension: Vector dimension
+            provider_key: Embedding provider the vectors came from
+            
+        Returns:
+            VectorStore without an IVF index
+        """
+        flat = array('f')
+        for vector in vectors:
+            flat.extend(normalize(vector))
+        if NUMPY_AVAILABLE:
+            matrix = np.frombuffer(flat, dtype=np.float32).reshape(len(records), dimension)
+        else:
+            matrix = memoryview(flat)
+        return cls(records, matrix, dimension, provider_key)
+    
+    @classmethod
+    def from_manifest(cls, manifest: ChunkManifest, provider: EmbeddingProvider,
+                      cache: Optional[EmbeddingCache] = None) -> 'VectorStore':
+        """
+        Build a store from the chunks of a manifest.
+        
+        Args:
+            manifest: Chunk manifest built from the corpus (with content)
+            provider: Embedding provider
+            cache: Embedding cache; only chunks missing from it are embedded.
+                Without a cache every chunk is embedded.
+                
+        Returns:
+            VectorStore with one row per chunk, in manifest order
+        """
+        chunks = list(manifest)
+        if cache is not None:
+            embed_chunks(chunks, provider, cache)
+            vectors = [cache.get(chunk['content_hash']) for chunk in chunks]
+        else:
+            vectors = []
+            for batch in batches(chunks):
+                vectors.extend(provider.embed_batch([chunk_text(chunk) for chunk in batch]))
+        
+        records = [
+            {'id': chunk['id'], 'content': chunk['content'], 'metadata': chunk_metadata(chunk)}
+            for chunk in chunks
+        ]
+        return cls.from_vectors(records, vectors, provider.dimension, provider.key)
+    
+    @classmethod
+    def load(cls, directory: Path) -> 'VectorStore':
+        """
+        Open a store written by ``save``, memory-mapping the vectors.
+        
+        Args:
+            directory: Store directory
+            
+        Returns:
+            VectorStore
+            
+        Raises:
+            ValueError: If the store has another format or byte order
+        """
+        with open(directory / RECORDS_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format_version') != STORE_FORMAT_VERSION or data.get('byteorder') != sys.byteorder:
+            raise ValueError(f"Unsupported vector store in {directory}")
+        
+        records = data['records']
+        dimension = data['dimension']
+        ivf = None
+        if (directory / IVF_FILE).exists():
+            with open(directory / IVF_FILE, 'r', encoding='utf-8') as f:
+                ivf = json.load(f)
+        
+        vectors_file = directory / VECTORS_FILE
+        if NUMPY_AVAILABLE:
+            vectors = np.memmap(vectors_file, dtype=np.float32, mode='r', shape=(len(records), dimension))
+            return cls(records, vectors, dimension, data['provider'], ivf=ivf)
+        
+        with open(vectors_file, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        store = cls(records, memoryview(mapped).cast('f'), dimension, data['provider'], ivf=ivf)
+        store._map = mapped
+        return store
+    
+    def save(self, directory: Path) -> None:
+        """
+        Write the vectors, records and IVF index.
+        
+        Args:
+            directory: Store directory (created if needed)
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        temp_file = directory / (VECTORS_FILE + '.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(self.vectors.tobytes())
+        os.replace(temp_file, directory / VECTORS_FILE)
+        
+        data = {
+            'format_version': STORE_FORMAT_VERSION,
+            'provider': self.provider_key,
+            'dimension': self.dimension,
+            'byteorder': sys.byteorder,
+            'records': self.records
+        }
+        with open(directory / RECORDS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        
+        ivf_file = directory / IVF_FILE
+        if self.ivf is not None:
+            with open(ivf_file, 'w', encoding='utf-8') as f:
+                json.dump(self.ivf, f)
+        elif ivf_file.exists():
+            ivf_file.unlink()
+    
+    def close(self) -> None:
+        """Release the memory map of a loaded store."""
+        if self._map is not None:
+            self.vectors.release()
+            self._map.close()
+            self._map = None
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def _row_lists(self) -> List[List[float]]:
+        """Rows as Python lists, for searching without numpy."""
+        if self._rows is None:
+            d = self.dimension
+            self._rows = [self.vectors[i * d:(i + 1) * d].tolist() for i in range(len(self.records))]
+        return self._rows
+    
+    def _top_rows(self, query: List[float], k: int, rows: Optional[List[int]] = None) -> List[tuple]:
+        """
+        Score rows against a unit query vector and keep the best ``k``.
+        
+        Args:
+            query: Normalized query vector
+            k: Number of rows to return
+            rows: Candidate rows (all rows if None)
+            
+        Returns:
+            ``(similarity, row)`` pairs, best first, ties by row
+        """
+        if NUMPY_AVAILABLE:
+            candidates = np.arange(len(self.records)) if rows is None else np.asarray(rows, dtype=np.int64)
+            if not len(candidates):
+                return []
+            scores = np.asarray(self.vectors[candidates] @ np.asarray(query, dtype=np.float32), dtype=np.float64)
+            if k < len(scores):
+                best = np.argpartition(-scores, k - 1)[:k]
+            else:
+                best = np.arange(len(scores))
+            pairs = [(float(scores[i]), int(candidates[i])) for i in best]
+        else:
+            row_lists = self._row_lists()
+            candidates = range(len(row_lists)) if rows is None else rows
+            pairs = heapq.nlargest(
+                k, ((sum(map(mul, row_lists[row], query)), row) for row in candidates),
+                key=lambda pair: (pair[0], -pair[1])
+            )
+        return sorted(pairs, key=lambda pair: (-pair[0], pair[1]))[:k]
+    
+    def search(self, query_vector: Iterable[float], match_count: int = DEFAULT_MATCH_COUNT,
+               match_threshold: float = DEFAULT_MATCH_THRESHOLD, nprobe: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find the chunks most similar to a query embedding, like match_documents.
+        
+        Args:
+            query_vector: Query embedding from the store's provider
+            match_count: Maximum number of results
+            match_threshold: Only return results with a higher cosine similarity
+            nprobe: Number of IVF partitions to search; exact search over all
+                rows when None or when the store has no IVF index
+                
+        Returns:
+            ``{'id', 'content', 'metadata', 'similarity'}`` dictionaries, best first
+        """
+        query = normalize(query_vector)
+        rows = None
+        if nprobe is not None and self.ivf is not None:
+            rows = self._probe(query, nprobe)
+        
+        results = []
+        for similarity, row in self._top_rows(query, match_count, rows):
+            if similarity <= match_threshold:
+                break
+            record = self.records[row]
+            results.append({
+                'id': record['id'],
+                'content': record['content'],
+                'metadata': record['metadata'],
+                'similarity': round(similarity, 6)
+            })
+        return results
+    
+    def search_text(self, query: str, provider: EmbeddingProvider, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Embed a query with the store's provider and search for it.
+        
+        Args:
+            query: Query text
+            provider: Provider the store was built with
+            **kwargs: Arguments for ``search``
+            
+        Returns:
+            Search results
+            
+        Raises:
+            ValueError: If the provider differs from the store's
+        """
+        if provider.key != self.provider_key:
+            raise ValueError(f"Store was built with {self.provider_key}, not {provider.key}")
+        return self.search(provider.embed_batch([query])[0], **kwargs)
+    
+    def build_ivf(self, n_lists: Optional[int] = None, iterations: int = KMEANS_ITERATIONS,
+                  seed: int = 0) -> Dict[str, Any]:
+        """
+        Partition the vectors with spherical k-means for IVF search.
+        
+        Centroids start from a seeded k-means++ selection, so the same
+        vectors always give the same index.
+        
+        Args:
+            n_lists: Number of partitions (default: square root of the row count)
+            iterations: Maximum k-means iterations
+            seed: Random seed for the initial centroids
+            
+        Returns:
+            IVF index: ``{'centroids', 'lists'}``, also stored on the store
+        """
+        count = len(self.records)
+        n_lists = max(1, min(n_lists or round(math.sqrt(count)), count))
+        rows = self.vectors.tolist() if NUMPY_AVAILABLE else self._row_lists()
+        rng = random.Random(seed)
+        
+        # k-means++: each next centroid is picked with probability by distance
+        centroids = [rows[rng.randrange(count)]]
+        nearest = [1.0 - sum(map(mul, row, centroids[0])) for row in rows]
+        while len(centroids) < n_lists:
+            total = sum(nearest)
+            if total <= 0:
+                break
+            target = rng.random() * total
+            for row, distance in enumerate(nearest):
+                target -= distance
+                if target <= 0:
+                    break
+            centroids.append(rows[row])
+            nearest = [min(d, 1.0 - sum(map(mul, r, centroids[-1]))) for d, r in zip(nearest, rows)]
+        
+        assignment = None
+        for _ in range(iterations):
+            new_assignment = self._assign(rows, centroids)
+            if new_assignment == assignment:
+                break
+            assignment = new_assignment
+            
+            sums = [[0.0] * self.dimension for _ in centroids]
+            for row, cluster in zip(rows, assignment):
+                total = sums[cluster]
+                for i, value in enumerate(row):
+                    total[i] += value
+            centroids = [normalize(total) if any(total) else centroid for total, centroid in zip(sums, centroids)]
+        
+        lists = [[] for _ in centroids]
+        for row, cluster in enumerate(assignment):
+            lists[cluster].append(row)
+        
+        self.ivf = {'centroids': centroids, 'lists': lists}
+        return self.ivf
+    
+    def _assign(self, rows: List[List[float]], centroids: List[List[float]]) -> List[int]:
+        """Index of the most similar centroid for each row."""
+        if NUMPY_AVAILABLE:
+            return np.argmax(np.asarray(rows) @ np.asarray(centroids).T, axis=1).tolist()
+        return [
+            max(range(len(centroids)), key=lambda c: sum(map(mul, row, centroids[c])))
+            for row in rows
+        ]
+    
+    def _probe(self, query: List[float], nprobe: int) -> List[int]:
+        """Rows in the ``nprobe`` partitions whose centroids are nearest the query."""
+        centroids = self.ivf['centroids']
+        nearest = heapq.nlargest(
+            min(nprobe, len(centroids)), range(len(centroids)),
+            key=lambda c: sum(map(mul, centroids[c], query))
+        )
+        return sorted(row for cluster in nearest for row in self.ivf['lists'][cluster])
+
+
+class VectorRetriever:
+    """Adapts a vector store to the retrieval benchmark's backend interface."""
+    
+    def __init__(self, store: VectorStore, provider: EmbeddingProvider, nprobe: Optional[int] = None):
+        self.store = store
+        self.provider = provider
+        self.nprobe = nprobe
+    
+    @classmethod
+    def for_corpus(cls, corpus: DocumentCorpus, ivf: bool = False) -> 'VectorRetriever':
+        """
+        Build an in-memory store with the hashing provider.
+        
+        Args:
+            corpus: Loaded documentation corpus
+            ivf: Whether to search through an IVF index
+            
+        Returns:
+            VectorRetriever
+        """
+        provider = PROVIDERS['hashing']()
+        store = VectorStore.from_manifest(ChunkManifest.build(corpus), provider)
+        if ivf:
+            store.build_ivf()
+        return cls(store, provider, nprobe=DEFAULT_NPROBE if ivf else None)
+    
+    def __len__(self) -> int:
+        return len(self.store)
+    
+    def search(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search without a similarity threshold.
+        
+        Args:
+            query: Query text
+            k: Maximum number of results
+            
+        Returns:
+            Results with ``'id'``, ``'path'`` and ``'similarity'``
+        """
+        results = self.store.search_text(query, self.provider, match_count=k,
+                                         match_threshold=-1.0, nprobe=self.nprobe)
+        return [dict(result, path=result['metadata']['source']) for result in results]
+
+
+def print_results(results: List[Dict[str, Any]]):
+    """
+    Print vector search results in a readable format.
+    
+    Args:
+        results: Results from ``VectorStore.search``
+    """
+    if not results:
+        print("No chunks above the match threshold")
+        return
+    
+    for rank, result in enumerate(results, 1):
+        metadata = result['metadata']
+        print(f"{rank:2}. {result['similarity']:.3f}  {result['id']}")
+        print(f"    {metadata['title']} > {metadata['section']} (lines {metadata['start_line']}-{metadata['end_line']})")
+
+
+def main():
+    """Main function to build or query the local vector store."""
+    parser = argparse.ArgumentParser(description='Build and query the local vector store')
+    parser.add_argument('command', choices=['build', 'search'], help='Build the store or run a query')
+    parser.add_argument('path', help='Documentation directory')
+    parser.add_argument('query', nargs='?', help='Search query (for search)')
+    parser.add_argument('--store', default=str(DEFAULT_STORE_DIRECTORY),
+                        help=f'Store directory (default: {DEFAULT_STORE_DIRECTORY})')
+    parser.add_argument('--cache', default=str(DEFAULT_CACHE_DIRECTORY),
+                        help=f'Embedding cache directory (default: {DEFAULT_CACHE_DIRECTORY})')
+    parser.add_argument('--provider', '-p', choices=sorted(PROVIDERS), default='hashing',
+                        help='Embedding provider (default: hashing, offline)')
+    parser.add_argument('--ivf', action='store_true', help='Build an IVF index (build)')
+    parser.add_argument('--lists', type=int, help='Number of IVF partitions (default: square root of the chunk count)')
+    parser.add_argument('--nprobe', type=int, help='Search this many IVF partitions instead of all vectors')
+    parser.add_argument('--match-count', '-k', type=int, default=DEFAULT_MATCH_COUNT,
+                        help=f'Maximum results (default: {DEFAULT_MATCH_COUNT})')
+    parser.add_argument('--match-threshold', '-t', type=float, default=DEFAULT_MATCH_THRESHOLD,
+                        help=f'Minimum cosine similarity (default: {DEFAULT_MATCH_THRESHOLD})')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    
+    args = parser.parse_args()
+    
+    try:
+        provider = PROVIDERS[args.provider]()
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    store_directory = Path(args.store)
+    
+    if args.command == 'build':
+        directory = Path(args.path)
+        if not directory.is_dir():
+            print(f"Error: Directory '{directory}' does not exist")
+            sys.exit(1)
+        
+        manifest = ChunkManifest.build(DocumentCorpus.load(directory))
+        cache = EmbeddingCache(Path(args.cache), provider.key, provider.dimension)
+        store = VectorStore.from_manifest(manifest, provider, cache)
+        cache.close()
+        if args.ivf:
+            ivf = store.build_ivf(n_lists=args.lists)
+            print(f"IVF index: {len(ivf['lists'])} partitions")
+        store.save(store_directory)
+        print(f"Stored {len(store)} vectors of {store.dimension} dimensions in {store_directory} ({provider.key})")
+        return
+    
+    if not args.query:
+        parser.error('search requires a query')
+    
+    try:
+        store = VectorStore.load(store_directory)
+        results = store.search_text(args.query, provider, match_count=args.match_count,
+                                    match_threshold=args.match_threshold, nprobe=args.nprobe)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        print_results(results)
+    store.close()
+
+
+if __name__ == '__main__':
+    main()